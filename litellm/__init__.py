@@ -5,6 +5,8 @@ warnings.filterwarnings("ignore", message=".*conflict with protected namespace.*
 ### INIT VARIABLES ######################
 import threading
 import os
+import sys
+from collections import defaultdict
 from typing import (
     Callable,
     List,
@@ -266,7 +268,9 @@ ssl_security_level: Optional[str] = None
 ssl_certificate: Optional[str] = None
 ssl_ecdh_curve: Optional[str] = None  # Set to 'X25519' to disable PQC and improve performance
 disable_streaming_logging: bool = False
+lean_streaming: bool = False  # forward OpenAI-shaped stream chunks as-is, assemble the response incrementally for logging
 disable_token_counter: bool = False
+use_token_count_estimator_for_routing: bool = False  # router pre-call checks + usage-based routing use `estimate_token_count` instead of tokenizing
 disable_add_transform_inline_image_block: bool = False
 disable_add_user_agent_to_request_tags: bool = False
 extra_spend_tag_headers: Optional[List[str]] = None
@@ -410,9 +414,12 @@ _key_management_settings: KeyManagementSettings = KeyManagementSettings()
 #### PII MASKING ####
 output_parse_pii: bool = False
 #############################################
-from litellm.litellm_core_utils.get_model_cost_map import get_model_cost_map
+from litellm.litellm_core_utils.get_model_cost_map import (
+    get_model_cost_map,
+    model_cost_map_refresher,
+)
 
-model_cost = get_model_cost_map(url=model_cost_map_url)
+model_cost = model_cost_map_refresher.load(url=model_cost_map_url)
 cost_discount_config: Dict[str, float] = {}  # Provider-specific cost discounts {"vertex_ai": 0.05} = 5% discount
 custom_prompt_dict: Dict[str, dict] = {}
 check_provider_endpoint = False
@@ -565,199 +572,229 @@ def is_openai_finetune_model(key: str) -> bool:
     return key.startswith("ft:") and not key.count(":") > 1
 
 
-def add_known_models():
-    for key, value in model_cost.items():
+def _get_known_models(model_cost_map: dict) -> Dict[str, Set[str]]:
+    """
+    Returns the models of `model_cost_map` to add to each provider model set - {module level set name: model names}
+    """
+    known_models: Dict[str, Set[str]] = defaultdict(set)
+    for key, value in model_cost_map.items():
         if value.get("litellm_provider") == "openai" and not is_openai_finetune_model(
             key
         ):
-            open_ai_chat_completion_models.add(key)
+            known_models["open_ai_chat_completion_models"].add(key)
         elif value.get("litellm_provider") == "text-completion-openai":
-            open_ai_text_completion_models.add(key)
+            known_models["open_ai_text_completion_models"].add(key)
         elif value.get("litellm_provider") == "azure_text":
-            azure_text_models.add(key)
+            known_models["azure_text_models"].add(key)
         elif value.get("litellm_provider") == "cohere":
-            cohere_models.add(key)
+            known_models["cohere_models"].add(key)
         elif value.get("litellm_provider") == "cohere_chat":
-            cohere_chat_models.add(key)
+            known_models["cohere_chat_models"].add(key)
         elif value.get("litellm_provider") == "mistral":
-            mistral_chat_models.add(key)
+            known_models["mistral_chat_models"].add(key)
         elif value.get("litellm_provider") == "anthropic":
-            anthropic_models.add(key)
+            known_models["anthropic_models"].add(key)
         elif value.get("litellm_provider") == "empower":
-            empower_models.add(key)
+            known_models["empower_models"].add(key)
         elif value.get("litellm_provider") == "openrouter":
-            openrouter_models.add(key)
+            known_models["openrouter_models"].add(key)
         elif value.get("litellm_provider") == "vercel_ai_gateway":
-            vercel_ai_gateway_models.add(key)
+            known_models["vercel_ai_gateway_models"].add(key)
         elif value.get("litellm_provider") == "datarobot":
-            datarobot_models.add(key)
+            known_models["datarobot_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-text-models":
-            vertex_text_models.add(key)
+            known_models["vertex_text_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-code-text-models":
-            vertex_code_text_models.add(key)
+            known_models["vertex_code_text_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-language-models":
-            vertex_language_models.add(key)
+            known_models["vertex_language_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-vision-models":
-            vertex_vision_models.add(key)
+            known_models["vertex_vision_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-chat-models":
-            vertex_chat_models.add(key)
+            known_models["vertex_chat_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-code-chat-models":
-            vertex_code_chat_models.add(key)
+            known_models["vertex_code_chat_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-embedding-models":
-            vertex_embedding_models.add(key)
+            known_models["vertex_embedding_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-anthropic_models":
             key = key.replace("vertex_ai/", "")
-            vertex_anthropic_models.add(key)
+            known_models["vertex_anthropic_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-llama_models":
             key = key.replace("vertex_ai/", "")
-            vertex_llama3_models.add(key)
+            known_models["vertex_llama3_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-deepseek_models":
             key = key.replace("vertex_ai/", "")
-            vertex_deepseek_models.add(key)
+            known_models["vertex_deepseek_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-mistral_models":
             key = key.replace("vertex_ai/", "")
-            vertex_mistral_models.add(key)
+            known_models["vertex_mistral_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-ai21_models":
             key = key.replace("vertex_ai/", "")
-            vertex_ai_ai21_models.add(key)
+            known_models["vertex_ai_ai21_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-image-models":
             key = key.replace("vertex_ai/", "")
-            vertex_ai_image_models.add(key)
+            known_models["vertex_ai_image_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-video-models":
             key = key.replace("vertex_ai/", "")
-            vertex_ai_video_models.add(key)
+            known_models["vertex_ai_video_models"].add(key)
         elif value.get("litellm_provider") == "vertex_ai-openai_models":
             key = key.replace("vertex_ai/", "")
-            vertex_openai_models.add(key)
+            known_models["vertex_openai_models"].add(key)
         elif value.get("litellm_provider") == "ai21":
             if value.get("mode") == "chat":
-                ai21_chat_models.add(key)
+                known_models["ai21_chat_models"].add(key)
             else:
-                ai21_models.add(key)
+                known_models["ai21_models"].add(key)
         elif value.get("litellm_provider") == "nlp_cloud":
-            nlp_cloud_models.add(key)
+            known_models["nlp_cloud_models"].add(key)
         elif value.get("litellm_provider") == "aleph_alpha":
-            aleph_alpha_models.add(key)
+            known_models["aleph_alpha_models"].add(key)
         elif value.get(
             "litellm_provider"
         ) == "bedrock" and not is_bedrock_pricing_only_model(key):
-            bedrock_models.add(key)
+            known_models["bedrock_models"].add(key)
         elif value.get("litellm_provider") == "bedrock_converse":
-            bedrock_converse_models.add(key)
+            known_models["bedrock_converse_models"].add(key)
         elif value.get("litellm_provider") == "deepinfra":
-            deepinfra_models.add(key)
+            known_models["deepinfra_models"].add(key)
         elif value.get("litellm_provider") == "perplexity":
-            perplexity_models.add(key)
+            known_models["perplexity_models"].add(key)
         elif value.get("litellm_provider") == "watsonx":
-            watsonx_models.add(key)
+            known_models["watsonx_models"].add(key)
         elif value.get("litellm_provider") == "gemini":
-            gemini_models.add(key)
+            known_models["gemini_models"].add(key)
         elif value.get("litellm_provider") == "fireworks_ai":
             # ignore the 'up-to', '-to-' model names -> not real models. just for cost tracking based on model params.
             if "-to-" not in key and "fireworks-ai-default" not in key:
-                fireworks_ai_models.add(key)
+                known_models["fireworks_ai_models"].add(key)
         elif value.get("litellm_provider") == "fireworks_ai-embedding-models":
             # ignore the 'up-to', '-to-' model names -> not real models. just for cost tracking based on model params.
             if "-to-" not in key:
-                fireworks_ai_embedding_models.add(key)
+                known_models["fireworks_ai_embedding_models"].add(key)
         elif value.get("litellm_provider") == "text-completion-codestral":
-            text_completion_codestral_models.add(key)
+            known_models["text_completion_codestral_models"].add(key)
         elif value.get("litellm_provider") == "xai":
-            xai_models.add(key)
+            known_models["xai_models"].add(key)
         elif value.get("litellm_provider") == "fal_ai":
-            fal_ai_models.add(key)
+            known_models["fal_ai_models"].add(key)
         elif value.get("litellm_provider") == "deepseek":
-            deepseek_models.add(key)
+            known_models["deepseek_models"].add(key)
         elif value.get("litellm_provider") == "meta_llama":
-            llama_models.add(key)
+            known_models["llama_models"].add(key)
         elif value.get("litellm_provider") == "nscale":
-            nscale_models.add(key)
+            known_models["nscale_models"].add(key)
         elif value.get("litellm_provider") == "azure_ai":
-            azure_ai_models.add(key)
+            known_models["azure_ai_models"].add(key)
         elif value.get("litellm_provider") == "voyage":
-            voyage_models.add(key)
+            known_models["voyage_models"].add(key)
         elif value.get("litellm_provider") == "infinity":
-            infinity_models.add(key)
+            known_models["infinity_models"].add(key)
         elif value.get("litellm_provider") == "databricks":
-            databricks_models.add(key)
+            known_models["databricks_models"].add(key)
         elif value.get("litellm_provider") == "cloudflare":
-            cloudflare_models.add(key)
+            known_models["cloudflare_models"].add(key)
         elif value.get("litellm_provider") == "codestral":
-            codestral_models.add(key)
+            known_models["codestral_models"].add(key)
         elif value.get("litellm_provider") == "friendliai":
-            friendliai_models.add(key)
+            known_models["friendliai_models"].add(key)
         elif value.get("litellm_provider") == "palm":
-            palm_models.add(key)
+            known_models["palm_models"].add(key)
         elif value.get("litellm_provider") == "groq":
-            groq_models.add(key)
+            known_models["groq_models"].add(key)
         elif value.get("litellm_provider") == "azure":
-            azure_models.add(key)
+            known_models["azure_models"].add(key)
         elif value.get("litellm_provider") == "anyscale":
-            anyscale_models.add(key)
+            known_models["anyscale_models"].add(key)
         elif value.get("litellm_provider") == "cerebras":
-            cerebras_models.add(key)
+            known_models["cerebras_models"].add(key)
         elif value.get("litellm_provider") == "galadriel":
-            galadriel_models.add(key)
+            known_models["galadriel_models"].add(key)
         elif value.get("litellm_provider") == "nvidia_nim":
-            nvidia_nim_models.add(key)
+            known_models["nvidia_nim_models"].add(key)
         elif value.get("litellm_provider") == "sambanova":
-            sambanova_models.add(key)
+            known_models["sambanova_models"].add(key)
         elif value.get("litellm_provider") == "sambanova-embedding-models":
-            sambanova_embedding_models.add(key)
+            known_models["sambanova_embedding_models"].add(key)
         elif value.get("litellm_provider") == "novita":
-            novita_models.add(key)
+            known_models["novita_models"].add(key)
         elif value.get("litellm_provider") == "nebius-chat-models":
-            nebius_models.add(key)
+            known_models["nebius_models"].add(key)
         elif value.get("litellm_provider") == "nebius-embedding-models":
-            nebius_embedding_models.add(key)
+            known_models["nebius_embedding_models"].add(key)
         elif value.get("litellm_provider") == "aiml":
-            aiml_models.add(key)
+            known_models["aiml_models"].add(key)
         elif value.get("litellm_provider") == "assemblyai":
-            assemblyai_models.add(key)
+            known_models["assemblyai_models"].add(key)
         elif value.get("litellm_provider") == "jina_ai":
-            jina_ai_models.add(key)
+            known_models["jina_ai_models"].add(key)
         elif value.get("litellm_provider") == "snowflake":
-            snowflake_models.add(key)
+            known_models["snowflake_models"].add(key)
         elif value.get("litellm_provider") == "gradient_ai":
-            gradient_ai_models.add(key)
+            known_models["gradient_ai_models"].add(key)
         elif value.get("litellm_provider") == "featherless_ai":
-            featherless_ai_models.add(key)
+            known_models["featherless_ai_models"].add(key)
         elif value.get("litellm_provider") == "deepgram":
-            deepgram_models.add(key)
+            known_models["deepgram_models"].add(key)
         elif value.get("litellm_provider") == "elevenlabs":
-            elevenlabs_models.add(key)
+            known_models["elevenlabs_models"].add(key)
         elif value.get("litellm_provider") == "heroku":
-            heroku_models.add(key)
+            known_models["heroku_models"].add(key)
         elif value.get("litellm_provider") == "dashscope":
-            dashscope_models.add(key)
+            known_models["dashscope_models"].add(key)
         elif value.get("litellm_provider") == "moonshot":
-            moonshot_models.add(key)
+            known_models["moonshot_models"].add(key)
         elif value.get("litellm_provider") == "v0":
-            v0_models.add(key)
+            known_models["v0_models"].add(key)
         elif value.get("litellm_provider") == "morph":
-            morph_models.add(key)
+            known_models["morph_models"].add(key)
         elif value.get("litellm_provider") == "lambda_ai":
-            lambda_ai_models.add(key)
+            known_models["lambda_ai_models"].add(key)
         elif value.get("litellm_provider") == "hyperbolic":
-            hyperbolic_models.add(key)
+            known_models["hyperbolic_models"].add(key)
         elif value.get("litellm_provider") == "recraft":
-            recraft_models.add(key)
+            known_models["recraft_models"].add(key)
         elif value.get("litellm_provider") == "cometapi":
-            cometapi_models.add(key)
+            known_models["cometapi_models"].add(key)
         elif value.get("litellm_provider") == "oci":
-            oci_models.add(key)
+            known_models["oci_models"].add(key)
         elif value.get("litellm_provider") == "volcengine":
-            volcengine_models.add(key)
+            known_models["volcengine_models"].add(key)
         elif value.get("litellm_provider") == "wandb":
-            wandb_models.add(key)
+            known_models["wandb_models"].add(key)
         elif value.get("litellm_provider") == "ovhcloud":
-            ovhcloud_models.add(key)
+            known_models["ovhcloud_models"].add(key)
         elif value.get("litellm_provider") == "ovhcloud-embedding-models":
-            ovhcloud_embedding_models.add(key)
+            known_models["ovhcloud_embedding_models"].add(key)
         elif value.get("litellm_provider") == "lemonade":
-            lemonade_models.add(key)
+            known_models["lemonade_models"].add(key)
+
+    return known_models
 
 
+def add_known_models(model_cost_map: Optional[dict] = None) -> None:
+    """Add the models of `model_cost_map` (default: `model_cost`) to the provider model sets, in place"""
+    module_globals = globals()
+    for set_name, models in _get_known_models(
+        model_cost if model_cost_map is None else model_cost_map
+    ).items():
+        module_globals[set_name].update(models)
+
+
+def _replace_known_models(model_cost_map: dict) -> None:
+    """
+    Like `add_known_models`, but the provider model sets, `model_list`, `model_list_set` and `models_by_provider` are
+    replaced by updated copies instead of being mutated - safe while other threads iterate them.
+    """
+    global model_list, model_list_set, models_by_provider
+    module_globals = globals()
+    for set_name, models in _get_known_models(model_cost_map).items():
+        if not models <= module_globals[set_name]:
+            module_globals[set_name] = module_globals[set_name] | models
+    new_model_list = _get_model_list()
+    model_list_set = set(new_model_list)
+    model_list = new_model_list
+    models_by_provider = _get_models_by_provider()
+
 add_known_models()
 # known openai compatible endpoints - we'll eventually move this list to the model_prices_and_context_window.json dictionary
 
@@ -788,165 +825,173 @@ ollama_models = ["llama2"]
 
 maritalk_models = ["maritalk"]
 
-model_list = list(
-    open_ai_chat_completion_models
-    | open_ai_text_completion_models
-    | cohere_models
-    | cohere_chat_models
-    | anthropic_models
-    | set(replicate_models)
-    | openrouter_models
-    | datarobot_models
-    | set(huggingface_models)
-    | vertex_chat_models
-    | vertex_text_models
-    | ai21_models
-    | ai21_chat_models
-    | set(together_ai_models)
-    | set(baseten_models)
-    | aleph_alpha_models
-    | nlp_cloud_models
-    | set(ollama_models)
-    | bedrock_models
-    | deepinfra_models
-    | perplexity_models
-    | set(maritalk_models)
-    | vertex_language_models
-    | watsonx_models
-    | gemini_models
-    | text_completion_codestral_models
-    | xai_models
-    | fal_ai_models
-    | deepseek_models
-    | azure_ai_models
-    | voyage_models
-    | infinity_models
-    | databricks_models
-    | cloudflare_models
-    | codestral_models
-    | friendliai_models
-    | palm_models
-    | groq_models
-    | azure_models
-    | anyscale_models
-    | cerebras_models
-    | galadriel_models
-    | nvidia_nim_models
-    | sambanova_models
-    | azure_text_models
-    | novita_models
-    | assemblyai_models
-    | jina_ai_models
-    | snowflake_models
-    | gradient_ai_models
-    | llama_models
-    | featherless_ai_models
-    | nscale_models
-    | deepgram_models
-    | elevenlabs_models
-    | dashscope_models
-    | moonshot_models
-    | v0_models
-    | morph_models
-    | lambda_ai_models
-    | recraft_models
-    | cometapi_models
-    | oci_models
-    | heroku_models
-    | vercel_ai_gateway_models
-    | volcengine_models
-    | wandb_models
-    | ovhcloud_models
-    | lemonade_models
-    | set(clarifai_models)
-)
+def _get_model_list() -> list:
+    return list(
+        open_ai_chat_completion_models
+        | open_ai_text_completion_models
+        | cohere_models
+        | cohere_chat_models
+        | anthropic_models
+        | set(replicate_models)
+        | openrouter_models
+        | datarobot_models
+        | set(huggingface_models)
+        | vertex_chat_models
+        | vertex_text_models
+        | ai21_models
+        | ai21_chat_models
+        | set(together_ai_models)
+        | set(baseten_models)
+        | aleph_alpha_models
+        | nlp_cloud_models
+        | set(ollama_models)
+        | bedrock_models
+        | deepinfra_models
+        | perplexity_models
+        | set(maritalk_models)
+        | vertex_language_models
+        | watsonx_models
+        | gemini_models
+        | text_completion_codestral_models
+        | xai_models
+        | fal_ai_models
+        | deepseek_models
+        | azure_ai_models
+        | voyage_models
+        | infinity_models
+        | databricks_models
+        | cloudflare_models
+        | codestral_models
+        | friendliai_models
+        | palm_models
+        | groq_models
+        | azure_models
+        | anyscale_models
+        | cerebras_models
+        | galadriel_models
+        | nvidia_nim_models
+        | sambanova_models
+        | azure_text_models
+        | novita_models
+        | assemblyai_models
+        | jina_ai_models
+        | snowflake_models
+        | gradient_ai_models
+        | llama_models
+        | featherless_ai_models
+        | nscale_models
+        | deepgram_models
+        | elevenlabs_models
+        | dashscope_models
+        | moonshot_models
+        | v0_models
+        | morph_models
+        | lambda_ai_models
+        | recraft_models
+        | cometapi_models
+        | oci_models
+        | heroku_models
+        | vercel_ai_gateway_models
+        | volcengine_models
+        | wandb_models
+        | ovhcloud_models
+        | lemonade_models
+        | set(clarifai_models)
+    )
+
+
+model_list = _get_model_list()
 
 model_list_set = set(model_list)
 
 provider_list: List[Union[LlmProviders, str]] = list(LlmProviders)
 
 
-models_by_provider: dict = {
-    "openai": open_ai_chat_completion_models | open_ai_text_completion_models,
-    "text-completion-openai": open_ai_text_completion_models,
-    "cohere": cohere_models | cohere_chat_models,
-    "cohere_chat": cohere_chat_models,
-    "anthropic": anthropic_models,
-    "replicate": replicate_models,
-    "huggingface": huggingface_models,
-    "together_ai": together_ai_models,
-    "baseten": baseten_models,
-    "openrouter": openrouter_models,
-    "vercel_ai_gateway": vercel_ai_gateway_models,
-    "datarobot": datarobot_models,
-    "vertex_ai": vertex_chat_models
-    | vertex_text_models
-    | vertex_anthropic_models
-    | vertex_vision_models
-    | vertex_language_models
-    | vertex_deepseek_models,
-    "ai21": ai21_models,
-    "bedrock": bedrock_models | bedrock_converse_models,
-    "petals": petals_models,
-    "ollama": ollama_models,
-    "ollama_chat": ollama_models,
-    "deepinfra": deepinfra_models,
-    "perplexity": perplexity_models,
-    "maritalk": maritalk_models,
-    "watsonx": watsonx_models,
-    "gemini": gemini_models,
-    "fireworks_ai": fireworks_ai_models | fireworks_ai_embedding_models,
-    "aleph_alpha": aleph_alpha_models,
-    "text-completion-codestral": text_completion_codestral_models,
-    "xai": xai_models,
-    "fal_ai": fal_ai_models,
-    "deepseek": deepseek_models,
-    "mistral": mistral_chat_models,
-    "azure_ai": azure_ai_models,
-    "voyage": voyage_models,
-    "infinity": infinity_models,
-    "databricks": databricks_models,
-    "cloudflare": cloudflare_models,
-    "codestral": codestral_models,
-    "nlp_cloud": nlp_cloud_models,
-    "friendliai": friendliai_models,
-    "palm": palm_models,
-    "groq": groq_models,
-    "azure": azure_models | azure_text_models,
-    "azure_text": azure_text_models,
-    "anyscale": anyscale_models,
-    "cerebras": cerebras_models,
-    "galadriel": galadriel_models,
-    "nvidia_nim": nvidia_nim_models,
-    "sambanova": sambanova_models | sambanova_embedding_models,
-    "novita": novita_models,
-    "nebius": nebius_models | nebius_embedding_models,
-    "aiml": aiml_models,
-    "assemblyai": assemblyai_models,
-    "jina_ai": jina_ai_models,
-    "snowflake": snowflake_models,
-    "gradient_ai": gradient_ai_models,
-    "meta_llama": llama_models,
-    "nscale": nscale_models,
-    "featherless_ai": featherless_ai_models,
-    "deepgram": deepgram_models,
-    "elevenlabs": elevenlabs_models,
-    "heroku": heroku_models,
-    "dashscope": dashscope_models,
-    "moonshot": moonshot_models,
-    "v0": v0_models,
-    "morph": morph_models,
-    "lambda_ai": lambda_ai_models,
-    "hyperbolic": hyperbolic_models,
-    "recraft": recraft_models,
-    "cometapi": cometapi_models,
-    "oci": oci_models,
-    "volcengine": volcengine_models,
-    "wandb": wandb_models,
-    "ovhcloud": ovhcloud_models | ovhcloud_embedding_models,
-    "lemonade": lemonade_models,
-    "clarifai": clarifai_models,
-}
+def _get_models_by_provider() -> dict:
+    return {
+        "openai": open_ai_chat_completion_models | open_ai_text_completion_models,
+        "text-completion-openai": open_ai_text_completion_models,
+        "cohere": cohere_models | cohere_chat_models,
+        "cohere_chat": cohere_chat_models,
+        "anthropic": anthropic_models,
+        "replicate": replicate_models,
+        "huggingface": huggingface_models,
+        "together_ai": together_ai_models,
+        "baseten": baseten_models,
+        "openrouter": openrouter_models,
+        "vercel_ai_gateway": vercel_ai_gateway_models,
+        "datarobot": datarobot_models,
+        "vertex_ai": vertex_chat_models
+        | vertex_text_models
+        | vertex_anthropic_models
+        | vertex_vision_models
+        | vertex_language_models
+        | vertex_deepseek_models,
+        "ai21": ai21_models,
+        "bedrock": bedrock_models | bedrock_converse_models,
+        "petals": petals_models,
+        "ollama": ollama_models,
+        "ollama_chat": ollama_models,
+        "deepinfra": deepinfra_models,
+        "perplexity": perplexity_models,
+        "maritalk": maritalk_models,
+        "watsonx": watsonx_models,
+        "gemini": gemini_models,
+        "fireworks_ai": fireworks_ai_models | fireworks_ai_embedding_models,
+        "aleph_alpha": aleph_alpha_models,
+        "text-completion-codestral": text_completion_codestral_models,
+        "xai": xai_models,
+        "fal_ai": fal_ai_models,
+        "deepseek": deepseek_models,
+        "mistral": mistral_chat_models,
+        "azure_ai": azure_ai_models,
+        "voyage": voyage_models,
+        "infinity": infinity_models,
+        "databricks": databricks_models,
+        "cloudflare": cloudflare_models,
+        "codestral": codestral_models,
+        "nlp_cloud": nlp_cloud_models,
+        "friendliai": friendliai_models,
+        "palm": palm_models,
+        "groq": groq_models,
+        "azure": azure_models | azure_text_models,
+        "azure_text": azure_text_models,
+        "anyscale": anyscale_models,
+        "cerebras": cerebras_models,
+        "galadriel": galadriel_models,
+        "nvidia_nim": nvidia_nim_models,
+        "sambanova": sambanova_models | sambanova_embedding_models,
+        "novita": novita_models,
+        "nebius": nebius_models | nebius_embedding_models,
+        "aiml": aiml_models,
+        "assemblyai": assemblyai_models,
+        "jina_ai": jina_ai_models,
+        "snowflake": snowflake_models,
+        "gradient_ai": gradient_ai_models,
+        "meta_llama": llama_models,
+        "nscale": nscale_models,
+        "featherless_ai": featherless_ai_models,
+        "deepgram": deepgram_models,
+        "elevenlabs": elevenlabs_models,
+        "heroku": heroku_models,
+        "dashscope": dashscope_models,
+        "moonshot": moonshot_models,
+        "v0": v0_models,
+        "morph": morph_models,
+        "lambda_ai": lambda_ai_models,
+        "hyperbolic": hyperbolic_models,
+        "recraft": recraft_models,
+        "cometapi": cometapi_models,
+        "oci": oci_models,
+        "volcengine": volcengine_models,
+        "wandb": wandb_models,
+        "ovhcloud": ovhcloud_models | ovhcloud_embedding_models,
+        "lemonade": lemonade_models,
+        "clarifai": clarifai_models,
+    }
+
+
+models_by_provider: dict = _get_models_by_provider()
 
 # mapping for those models which have larger equivalents
 longer_context_model_fallback_dict: dict = {
@@ -1047,267 +1092,284 @@ ALL_LITELLM_RESPONSE_TYPES = [
     TextCompletionResponse,
 ]
 
-from .llms.bytez.chat.transformation import BytezChatConfig
-from .llms.custom_llm import CustomLLM
-from .llms.bedrock.chat.converse_transformation import AmazonConverseConfig
-from .llms.openai_like.chat.handler import OpenAILikeChatConfig
-from .llms.aiohttp_openai.chat.transformation import AiohttpOpenAIChatConfig
-from .llms.galadriel.chat.transformation import GaladrielChatConfig
-from .llms.github.chat.transformation import GithubChatConfig
-from .llms.compactifai.chat.transformation import CompactifAIChatConfig
-from .llms.empower.chat.transformation import EmpowerChatConfig
-from .llms.huggingface.chat.transformation import HuggingFaceChatConfig
-from .llms.huggingface.embedding.transformation import HuggingFaceEmbeddingConfig
-from .llms.oobabooga.chat.transformation import OobaboogaConfig
-from .llms.maritalk import MaritalkConfig
-from .llms.openrouter.chat.transformation import OpenrouterConfig
-from .llms.datarobot.chat.transformation import DataRobotConfig
-from .llms.anthropic.chat.transformation import AnthropicConfig
-from .llms.anthropic.common_utils import AnthropicModelInfo
-from .llms.groq.stt.transformation import GroqSTTConfig
-from .llms.anthropic.completion.transformation import AnthropicTextConfig
-from .llms.triton.completion.transformation import TritonConfig
-from .llms.triton.completion.transformation import TritonGenerateConfig
-from .llms.triton.completion.transformation import TritonInferConfig
-from .llms.triton.embedding.transformation import TritonEmbeddingConfig
-from .llms.huggingface.rerank.transformation import HuggingFaceRerankConfig
-from .llms.databricks.chat.transformation import DatabricksConfig
-from .llms.databricks.embed.transformation import DatabricksEmbeddingConfig
-from .llms.predibase.chat.transformation import PredibaseConfig
-from .llms.replicate.chat.transformation import ReplicateConfig
-from .llms.snowflake.chat.transformation import SnowflakeConfig
-from .llms.cohere.rerank.transformation import CohereRerankConfig
-from .llms.cohere.rerank_v2.transformation import CohereRerankV2Config
-from .llms.azure_ai.rerank.transformation import AzureAIRerankConfig
-from .llms.infinity.rerank.transformation import InfinityRerankConfig
-from .llms.jina_ai.rerank.transformation import JinaAIRerankConfig
-from .llms.deepinfra.rerank.transformation import DeepinfraRerankConfig
-from .llms.nvidia_nim.rerank.transformation import NvidiaNimRerankConfig
-from .llms.vertex_ai.rerank.transformation import VertexAIRerankConfig
-from .llms.clarifai.chat.transformation import ClarifaiConfig
-from .llms.ai21.chat.transformation import AI21ChatConfig, AI21ChatConfig as AI21Config
-from .llms.meta_llama.chat.transformation import LlamaAPIConfig
-from .llms.anthropic.experimental_pass_through.messages.transformation import (
-    AnthropicMessagesConfig,
-)
-from .llms.bedrock.messages.invoke_transformations.anthropic_claude3_transformation import (
-    AmazonAnthropicClaudeMessagesConfig,
-)
-from .llms.together_ai.chat import TogetherAIConfig
-from .llms.together_ai.completion.transformation import TogetherAITextCompletionConfig
-from .llms.cloudflare.chat.transformation import CloudflareChatConfig
-from .llms.novita.chat.transformation import NovitaConfig
-from .llms.deprecated_providers.palm import (
-    PalmConfig,
-)  # here to prevent breaking changes
-from .llms.nlp_cloud.chat.handler import NLPCloudConfig
-from .llms.petals.completion.transformation import PetalsConfig
-from .llms.deprecated_providers.aleph_alpha import AlephAlphaConfig
-from .llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini import (
-    VertexGeminiConfig,
-    VertexGeminiConfig as VertexAIConfig,
-)
-from .llms.gemini.common_utils import GeminiModelInfo
-from .llms.gemini.chat.transformation import (
-    GoogleAIStudioGeminiConfig,
-    GoogleAIStudioGeminiConfig as GeminiConfig,  # aliased to maintain backwards compatibility
-)
-
-
-from .llms.vertex_ai.vertex_embeddings.transformation import (
-    VertexAITextEmbeddingConfig,
-)
-
-vertexAITextEmbeddingConfig = VertexAITextEmbeddingConfig()
+### PROVIDER CONFIGS ###
+# imported on first access - see `litellm/_lazy_imports.py`
+if TYPE_CHECKING:
+    from .llms.bytez.chat.transformation import BytezChatConfig
+    from .llms.custom_llm import CustomLLM
+    from .llms.bedrock.chat.converse_transformation import AmazonConverseConfig
+    from .llms.openai_like.chat.handler import OpenAILikeChatConfig
+    from .llms.aiohttp_openai.chat.transformation import AiohttpOpenAIChatConfig
+    from .llms.galadriel.chat.transformation import GaladrielChatConfig
+    from .llms.github.chat.transformation import GithubChatConfig
+    from .llms.compactifai.chat.transformation import CompactifAIChatConfig
+    from .llms.empower.chat.transformation import EmpowerChatConfig
+    from .llms.huggingface.chat.transformation import HuggingFaceChatConfig
+    from .llms.huggingface.embedding.transformation import HuggingFaceEmbeddingConfig
+    from .llms.oobabooga.chat.transformation import OobaboogaConfig
+    from .llms.maritalk import MaritalkConfig
+    from .llms.openrouter.chat.transformation import OpenrouterConfig
+    from .llms.datarobot.chat.transformation import DataRobotConfig
+    from .llms.anthropic.chat.transformation import AnthropicConfig
+    from .llms.anthropic.common_utils import AnthropicModelInfo
+    from .llms.groq.stt.transformation import GroqSTTConfig
+    from .llms.anthropic.completion.transformation import AnthropicTextConfig
+    from .llms.triton.completion.transformation import TritonConfig
+    from .llms.triton.completion.transformation import TritonGenerateConfig
+    from .llms.triton.completion.transformation import TritonInferConfig
+    from .llms.triton.embedding.transformation import TritonEmbeddingConfig
+    from .llms.huggingface.rerank.transformation import HuggingFaceRerankConfig
+    from .llms.databricks.chat.transformation import DatabricksConfig
+    from .llms.databricks.embed.transformation import DatabricksEmbeddingConfig
+    from .llms.predibase.chat.transformation import PredibaseConfig
+    from .llms.replicate.chat.transformation import ReplicateConfig
+    from .llms.snowflake.chat.transformation import SnowflakeConfig
+    from .llms.cohere.rerank.transformation import CohereRerankConfig
+    from .llms.cohere.rerank_v2.transformation import CohereRerankV2Config
+    from .llms.azure_ai.rerank.transformation import AzureAIRerankConfig
+    from .llms.infinity.rerank.transformation import InfinityRerankConfig
+    from .llms.jina_ai.rerank.transformation import JinaAIRerankConfig
+    from .llms.deepinfra.rerank.transformation import DeepinfraRerankConfig
+    from .llms.nvidia_nim.rerank.transformation import NvidiaNimRerankConfig
+    from .llms.vertex_ai.rerank.transformation import VertexAIRerankConfig
+    from .llms.clarifai.chat.transformation import ClarifaiConfig
+    from .llms.ai21.chat.transformation import AI21ChatConfig, AI21ChatConfig as AI21Config
+    from .llms.meta_llama.chat.transformation import LlamaAPIConfig
+    from .llms.anthropic.experimental_pass_through.messages.transformation import (
+        AnthropicMessagesConfig,
+    )
+    from .llms.bedrock.messages.invoke_transformations.anthropic_claude3_transformation import (
+        AmazonAnthropicClaudeMessagesConfig,
+    )
+    from .llms.together_ai.chat import TogetherAIConfig
+    from .llms.together_ai.completion.transformation import TogetherAITextCompletionConfig
+    from .llms.cloudflare.chat.transformation import CloudflareChatConfig
+    from .llms.novita.chat.transformation import NovitaConfig
+    from .llms.deprecated_providers.palm import (
+        PalmConfig,
+    )  # here to prevent breaking changes
+    from .llms.nlp_cloud.chat.handler import NLPCloudConfig
+    from .llms.petals.completion.transformation import PetalsConfig
+    from .llms.deprecated_providers.aleph_alpha import AlephAlphaConfig
+    from .llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini import (
+        VertexGeminiConfig,
+        VertexGeminiConfig as VertexAIConfig,
+    )
+    from .llms.gemini.common_utils import GeminiModelInfo
+    from .llms.gemini.chat.transformation import (
+        GoogleAIStudioGeminiConfig,
+        GoogleAIStudioGeminiConfig as GeminiConfig,  # aliased to maintain backwards compatibility
+    )
+
+    from .llms.vertex_ai.vertex_embeddings.transformation import (
+        VertexAITextEmbeddingConfig,
+    )
+
+    from .llms.vertex_ai.vertex_ai_partner_models.anthropic.transformation import (
+        VertexAIAnthropicConfig,
+    )
+    from .llms.vertex_ai.vertex_ai_partner_models.llama3.transformation import (
+        VertexAILlama3Config,
+    )
+    from .llms.vertex_ai.vertex_ai_partner_models.ai21.transformation import (
+        VertexAIAi21Config,
+    )
+    from .llms.ollama.chat.transformation import OllamaChatConfig
+    from .llms.ollama.completion.transformation import OllamaConfig
+    from .llms.sagemaker.completion.transformation import SagemakerConfig
+    from .llms.sagemaker.chat.transformation import SagemakerChatConfig
+    from .llms.bedrock.chat.invoke_handler import (
+        AmazonCohereChatConfig,
+        bedrock_tool_name_mappings,
+    )
+
+    from .llms.bedrock.common_utils import (
+        AmazonBedrockGlobalConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_ai21_transformation import (
+        AmazonAI21Config,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_nova_transformation import (
+        AmazonInvokeNovaConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_qwen3_transformation import (
+        AmazonQwen3Config,
+    )
+    from .llms.bedrock.chat.invoke_transformations.anthropic_claude2_transformation import (
+        AmazonAnthropicConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.anthropic_claude3_transformation import (
+        AmazonAnthropicClaudeConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_cohere_transformation import (
+        AmazonCohereConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_llama_transformation import (
+        AmazonLlamaConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_deepseek_transformation import (
+        AmazonDeepSeekR1Config,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_mistral_transformation import (
+        AmazonMistralConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_titan_transformation import (
+        AmazonTitanConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.base_invoke_transformation import (
+        AmazonInvokeConfig,
+    )
+
+    from .llms.bedrock.image.amazon_stability1_transformation import AmazonStabilityConfig
+    from .llms.bedrock.image.amazon_stability3_transformation import AmazonStability3Config
+    from .llms.bedrock.image.amazon_nova_canvas_transformation import AmazonNovaCanvasConfig
+    from .llms.bedrock.embed.amazon_titan_g1_transformation import AmazonTitanG1Config
+    from .llms.bedrock.embed.amazon_titan_multimodal_transformation import (
+        AmazonTitanMultimodalEmbeddingG1Config,
+    )
+    from .llms.bedrock.embed.amazon_titan_v2_transformation import (
+        AmazonTitanV2Config,
+    )
+    from .llms.cohere.chat.transformation import CohereChatConfig
+    from .llms.cohere.chat.v2_transformation import CohereV2ChatConfig
+    from .llms.bedrock.embed.cohere_transformation import BedrockCohereEmbeddingConfig
+    from .llms.bedrock.embed.twelvelabs_marengo_transformation import TwelveLabsMarengoEmbeddingConfig
+    from .llms.openai.openai import OpenAIConfig, MistralEmbeddingConfig
+    from .llms.openai.image_variations.transformation import OpenAIImageVariationConfig
+    from .llms.deepinfra.chat.transformation import DeepInfraConfig
+    from .llms.deepgram.audio_transcription.transformation import (
+        DeepgramAudioTranscriptionConfig,
+    )
+    from .llms.topaz.common_utils import TopazModelInfo
+    from .llms.topaz.image_variations.transformation import TopazImageVariationConfig
+    from litellm.llms.openai.completion.transformation import OpenAITextCompletionConfig
+    from .llms.groq.chat.transformation import GroqChatConfig
+    from .llms.voyage.embedding.transformation import VoyageEmbeddingConfig
+    from .llms.voyage.embedding.transformation_contextual import (
+        VoyageContextualEmbeddingConfig,
+    )
+    from .llms.infinity.embedding.transformation import InfinityEmbeddingConfig
+    from .llms.azure_ai.chat.transformation import AzureAIStudioConfig
+    from .llms.mistral.chat.transformation import MistralConfig
+    from .llms.openai.responses.transformation import OpenAIResponsesAPIConfig
+    from .llms.azure.responses.transformation import AzureOpenAIResponsesAPIConfig
+    from .llms.azure.responses.o_series_transformation import (
+        AzureOpenAIOSeriesResponsesAPIConfig,
+    )
+    from .llms.litellm_proxy.responses.transformation import (
+        LiteLLMProxyResponsesAPIConfig,
+    )
+    from .llms.openai.chat.o_series_transformation import (
+        OpenAIOSeriesConfig as OpenAIO1Config,  # maintain backwards compatibility
+        OpenAIOSeriesConfig,
+    )
+
+    from .llms.gradient_ai.chat.transformation import GradientAIConfig
+
+    from .llms.openai.chat.gpt_transformation import (
+        OpenAIGPTConfig,
+    )
+    from .llms.openai.chat.gpt_5_transformation import (
+        OpenAIGPT5Config,
+    )
+    from .llms.openai.transcriptions.whisper_transformation import (
+        OpenAIWhisperAudioTranscriptionConfig,
+    )
+    from .llms.openai.transcriptions.gpt_transformation import (
+        OpenAIGPTAudioTranscriptionConfig,
+    )
+
+    from .llms.openai.chat.gpt_audio_transformation import (
+        OpenAIGPTAudioConfig,
+    )
+
+    from .llms.nvidia_nim.chat.transformation import NvidiaNimConfig
+    from .llms.nvidia_nim.embed import NvidiaNimEmbeddingConfig
+
+    from .llms.featherless_ai.chat.transformation import FeatherlessAIConfig
+    from .llms.cerebras.chat import CerebrasConfig
+    from .llms.baseten.chat import BasetenConfig
+    from .llms.sambanova.chat import SambanovaConfig
+    from .llms.sambanova.embedding.transformation import SambaNovaEmbeddingConfig
+    from .llms.fireworks_ai.chat.transformation import FireworksAIConfig
+    from .llms.fireworks_ai.completion.transformation import FireworksAITextCompletionConfig
+    from .llms.fireworks_ai.audio_transcription.transformation import (
+        FireworksAIAudioTranscriptionConfig,
+    )
+    from .llms.fireworks_ai.embed.fireworks_ai_transformation import (
+        FireworksAIEmbeddingConfig,
+    )
+    from .llms.friendliai.chat.transformation import FriendliaiChatConfig
+    from .llms.jina_ai.embedding.transformation import JinaAIEmbeddingConfig
+    from .llms.xai.chat.transformation import XAIChatConfig
+    from .llms.xai.common_utils import XAIModelInfo
+    from .llms.aiml.chat.transformation import AIMLChatConfig
+    from .llms.volcengine.chat.transformation import (
+        VolcEngineChatConfig as VolcEngineConfig,
+    )
+    from .llms.codestral.completion.transformation import CodestralTextCompletionConfig
+    from .llms.azure.azure import (
+        AzureOpenAIError,
+        AzureOpenAIAssistantsAPIConfig,
+    )
+    from .llms.heroku.chat.transformation import HerokuChatConfig
+    from .llms.cometapi.chat.transformation import CometAPIConfig
+    from .llms.azure.chat.gpt_transformation import AzureOpenAIConfig
+    from .llms.azure.chat.gpt_5_transformation import AzureOpenAIGPT5Config
+    from .llms.azure.completion.transformation import AzureOpenAITextConfig
+    from .llms.hosted_vllm.chat.transformation import HostedVLLMChatConfig
+    from .llms.llamafile.chat.transformation import LlamafileChatConfig
+    from .llms.litellm_proxy.chat.transformation import LiteLLMProxyChatConfig
+    from .llms.vllm.completion.transformation import VLLMConfig
+    from .llms.deepseek.chat.transformation import DeepSeekChatConfig
+    from .llms.lm_studio.chat.transformation import LMStudioChatConfig
+    from .llms.lm_studio.embed.transformation import LmStudioEmbeddingConfig
+    from .llms.nscale.chat.transformation import NscaleConfig
+    from .llms.perplexity.chat.transformation import PerplexityChatConfig
+    from .llms.azure.chat.o_series_transformation import AzureOpenAIO1Config
+    from .llms.watsonx.completion.transformation import IBMWatsonXAIConfig
+    from .llms.watsonx.chat.transformation import IBMWatsonXChatConfig
+    from .llms.watsonx.embed.transformation import IBMWatsonXEmbeddingConfig
+    from .llms.github_copilot.chat.transformation import GithubCopilotConfig
+    from .llms.nebius.chat.transformation import NebiusConfig
+    from .llms.wandb.chat.transformation import WandbConfig
+    from .llms.dashscope.chat.transformation import DashScopeChatConfig
+    from .llms.moonshot.chat.transformation import MoonshotChatConfig
+    from .llms.v0.chat.transformation import V0ChatConfig
+    from .llms.oci.chat.transformation import OCIChatConfig
+    from .llms.morph.chat.transformation import MorphChatConfig
+    from .llms.lambda_ai.chat.transformation import LambdaAIChatConfig
+    from .llms.hyperbolic.chat.transformation import HyperbolicChatConfig
+    from .llms.vercel_ai_gateway.chat.transformation import VercelAIGatewayConfig
+    from .llms.ovhcloud.chat.transformation import OVHCloudChatConfig
+    from .llms.ovhcloud.embedding.transformation import OVHCloudEmbeddingConfig
+    from .llms.cometapi.embed.transformation import CometAPIEmbeddingConfig
+    from .llms.lemonade.chat.transformation import LemonadeChatConfig
+
+    vertexAITextEmbeddingConfig: VertexAITextEmbeddingConfig
+    openaiOSeriesConfig: OpenAIOSeriesConfig
+    openAIGPTConfig: OpenAIGPTConfig
+    openAIGPTAudioConfig: OpenAIGPTAudioConfig
+    openAIGPT5Config: OpenAIGPT5Config
+    nvidiaNimConfig: NvidiaNimConfig
+    nvidiaNimEmbeddingConfig: NvidiaNimEmbeddingConfig
+
+from litellm import _lazy_imports
+
+
+def __getattr__(name: str) -> Any:
+    return _lazy_imports.load_lazy_attribute(sys.modules[__name__], name)
+
+
+def __dir__() -> List[str]:
+    return sorted(
+        set(globals()).union(
+            _lazy_imports.LAZY_PROVIDER_CONFIGS,
+            _lazy_imports.LAZY_PROVIDER_CONFIG_INSTANCES,
+        )
+    )
 
-from .llms.vertex_ai.vertex_ai_partner_models.anthropic.transformation import (
-    VertexAIAnthropicConfig,
-)
-from .llms.vertex_ai.vertex_ai_partner_models.llama3.transformation import (
-    VertexAILlama3Config,
-)
-from .llms.vertex_ai.vertex_ai_partner_models.ai21.transformation import (
-    VertexAIAi21Config,
-)
-from .llms.ollama.chat.transformation import OllamaChatConfig
-from .llms.ollama.completion.transformation import OllamaConfig
-from .llms.sagemaker.completion.transformation import SagemakerConfig
-from .llms.sagemaker.chat.transformation import SagemakerChatConfig
-from .llms.bedrock.chat.invoke_handler import (
-    AmazonCohereChatConfig,
-    bedrock_tool_name_mappings,
-)
 
-from .llms.bedrock.common_utils import (
-    AmazonBedrockGlobalConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_ai21_transformation import (
-    AmazonAI21Config,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_nova_transformation import (
-    AmazonInvokeNovaConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_qwen3_transformation import (
-    AmazonQwen3Config,
-)
-from .llms.bedrock.chat.invoke_transformations.anthropic_claude2_transformation import (
-    AmazonAnthropicConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.anthropic_claude3_transformation import (
-    AmazonAnthropicClaudeConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_cohere_transformation import (
-    AmazonCohereConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_llama_transformation import (
-    AmazonLlamaConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_deepseek_transformation import (
-    AmazonDeepSeekR1Config,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_mistral_transformation import (
-    AmazonMistralConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_titan_transformation import (
-    AmazonTitanConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.base_invoke_transformation import (
-    AmazonInvokeConfig,
-)
-
-from .llms.bedrock.image.amazon_stability1_transformation import AmazonStabilityConfig
-from .llms.bedrock.image.amazon_stability3_transformation import AmazonStability3Config
-from .llms.bedrock.image.amazon_nova_canvas_transformation import AmazonNovaCanvasConfig
-from .llms.bedrock.embed.amazon_titan_g1_transformation import AmazonTitanG1Config
-from .llms.bedrock.embed.amazon_titan_multimodal_transformation import (
-    AmazonTitanMultimodalEmbeddingG1Config,
-)
-from .llms.bedrock.embed.amazon_titan_v2_transformation import (
-    AmazonTitanV2Config,
-)
-from .llms.cohere.chat.transformation import CohereChatConfig
-from .llms.cohere.chat.v2_transformation import CohereV2ChatConfig
-from .llms.bedrock.embed.cohere_transformation import BedrockCohereEmbeddingConfig
-from .llms.bedrock.embed.twelvelabs_marengo_transformation import TwelveLabsMarengoEmbeddingConfig
-from .llms.openai.openai import OpenAIConfig, MistralEmbeddingConfig
-from .llms.openai.image_variations.transformation import OpenAIImageVariationConfig
-from .llms.deepinfra.chat.transformation import DeepInfraConfig
-from .llms.deepgram.audio_transcription.transformation import (
-    DeepgramAudioTranscriptionConfig,
-)
-from .llms.topaz.common_utils import TopazModelInfo
-from .llms.topaz.image_variations.transformation import TopazImageVariationConfig
-from litellm.llms.openai.completion.transformation import OpenAITextCompletionConfig
-from .llms.groq.chat.transformation import GroqChatConfig
-from .llms.voyage.embedding.transformation import VoyageEmbeddingConfig
-from .llms.voyage.embedding.transformation_contextual import (
-    VoyageContextualEmbeddingConfig,
-)
-from .llms.infinity.embedding.transformation import InfinityEmbeddingConfig
-from .llms.azure_ai.chat.transformation import AzureAIStudioConfig
-from .llms.mistral.chat.transformation import MistralConfig
-from .llms.openai.responses.transformation import OpenAIResponsesAPIConfig
-from .llms.azure.responses.transformation import AzureOpenAIResponsesAPIConfig
-from .llms.azure.responses.o_series_transformation import (
-    AzureOpenAIOSeriesResponsesAPIConfig,
-)
-from .llms.litellm_proxy.responses.transformation import (
-    LiteLLMProxyResponsesAPIConfig,
-)
-from .llms.openai.chat.o_series_transformation import (
-    OpenAIOSeriesConfig as OpenAIO1Config,  # maintain backwards compatibility
-    OpenAIOSeriesConfig,
-)
-
-from .llms.gradient_ai.chat.transformation import GradientAIConfig
-
-openaiOSeriesConfig = OpenAIOSeriesConfig()
-from .llms.openai.chat.gpt_transformation import (
-    OpenAIGPTConfig,
-)
-from .llms.openai.chat.gpt_5_transformation import (
-    OpenAIGPT5Config,
-)
-from .llms.openai.transcriptions.whisper_transformation import (
-    OpenAIWhisperAudioTranscriptionConfig,
-)
-from .llms.openai.transcriptions.gpt_transformation import (
-    OpenAIGPTAudioTranscriptionConfig,
-)
-
-openAIGPTConfig = OpenAIGPTConfig()
-from .llms.openai.chat.gpt_audio_transformation import (
-    OpenAIGPTAudioConfig,
-)
-
-openAIGPTAudioConfig = OpenAIGPTAudioConfig()
-openAIGPT5Config = OpenAIGPT5Config()
-
-from .llms.nvidia_nim.chat.transformation import NvidiaNimConfig
-from .llms.nvidia_nim.embed import NvidiaNimEmbeddingConfig
-
-nvidiaNimConfig = NvidiaNimConfig()
-nvidiaNimEmbeddingConfig = NvidiaNimEmbeddingConfig()
-
-from .llms.featherless_ai.chat.transformation import FeatherlessAIConfig
-from .llms.cerebras.chat import CerebrasConfig
-from .llms.baseten.chat import BasetenConfig
-from .llms.sambanova.chat import SambanovaConfig
-from .llms.sambanova.embedding.transformation import SambaNovaEmbeddingConfig
-from .llms.fireworks_ai.chat.transformation import FireworksAIConfig
-from .llms.fireworks_ai.completion.transformation import FireworksAITextCompletionConfig
-from .llms.fireworks_ai.audio_transcription.transformation import (
-    FireworksAIAudioTranscriptionConfig,
-)
-from .llms.fireworks_ai.embed.fireworks_ai_transformation import (
-    FireworksAIEmbeddingConfig,
-)
-from .llms.friendliai.chat.transformation import FriendliaiChatConfig
-from .llms.jina_ai.embedding.transformation import JinaAIEmbeddingConfig
-from .llms.xai.chat.transformation import XAIChatConfig
-from .llms.xai.common_utils import XAIModelInfo
-from .llms.aiml.chat.transformation import AIMLChatConfig
-from .llms.volcengine.chat.transformation import (
-    VolcEngineChatConfig as VolcEngineConfig,
-)
-from .llms.codestral.completion.transformation import CodestralTextCompletionConfig
-from .llms.azure.azure import (
-    AzureOpenAIError,
-    AzureOpenAIAssistantsAPIConfig,
-)
-from .llms.heroku.chat.transformation import HerokuChatConfig
-from .llms.cometapi.chat.transformation import CometAPIConfig
-from .llms.azure.chat.gpt_transformation import AzureOpenAIConfig
-from .llms.azure.chat.gpt_5_transformation import AzureOpenAIGPT5Config
-from .llms.azure.completion.transformation import AzureOpenAITextConfig
-from .llms.hosted_vllm.chat.transformation import HostedVLLMChatConfig
-from .llms.llamafile.chat.transformation import LlamafileChatConfig
-from .llms.litellm_proxy.chat.transformation import LiteLLMProxyChatConfig
-from .llms.vllm.completion.transformation import VLLMConfig
-from .llms.deepseek.chat.transformation import DeepSeekChatConfig
-from .llms.lm_studio.chat.transformation import LMStudioChatConfig
-from .llms.lm_studio.embed.transformation import LmStudioEmbeddingConfig
-from .llms.nscale.chat.transformation import NscaleConfig
-from .llms.perplexity.chat.transformation import PerplexityChatConfig
-from .llms.azure.chat.o_series_transformation import AzureOpenAIO1Config
-from .llms.watsonx.completion.transformation import IBMWatsonXAIConfig
-from .llms.watsonx.chat.transformation import IBMWatsonXChatConfig
-from .llms.watsonx.embed.transformation import IBMWatsonXEmbeddingConfig
-from .llms.github_copilot.chat.transformation import GithubCopilotConfig
-from .llms.nebius.chat.transformation import NebiusConfig
-from .llms.wandb.chat.transformation import WandbConfig
-from .llms.dashscope.chat.transformation import DashScopeChatConfig
-from .llms.moonshot.chat.transformation import MoonshotChatConfig
-from .llms.v0.chat.transformation import V0ChatConfig
-from .llms.oci.chat.transformation import OCIChatConfig
-from .llms.morph.chat.transformation import MorphChatConfig
-from .llms.lambda_ai.chat.transformation import LambdaAIChatConfig
-from .llms.hyperbolic.chat.transformation import HyperbolicChatConfig
-from .llms.vercel_ai_gateway.chat.transformation import VercelAIGatewayConfig
-from .llms.ovhcloud.chat.transformation import OVHCloudChatConfig
-from .llms.ovhcloud.embedding.transformation import OVHCloudEmbeddingConfig
-from .llms.cometapi.embed.transformation import CometAPIEmbeddingConfig
-from .llms.lemonade.chat.transformation import LemonadeChatConfig
 from .main import *  # type: ignore
 from .integrations import *
 from .llms.custom_httpx.async_client_cleanup import close_litellm_async_clients
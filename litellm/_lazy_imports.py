@@ -0,0 +1,590 @@
+"""
+Attributes of the `litellm` module that are imported on first access, instead of in `litellm/__init__.py`
+
+Importing every provider config up front costs each process import time + memory for providers it never calls.
+`litellm.<name>` (used by `ProviderConfigManager`) and `from litellm import <name>` import the config on first use.
+
+New provider configs exposed on `litellm` are added here, and to the `TYPE_CHECKING` block in `litellm/__init__.py`.
+"""
+
+import importlib
+from types import ModuleType
+from typing import Any, Dict, Tuple
+
+LAZY_PROVIDER_CONFIGS: Dict[str, Tuple[str, str]] = {
+    # attribute name: (module, name in module)
+    "BytezChatConfig": ("litellm.llms.bytez.chat.transformation", "BytezChatConfig"),
+    "CustomLLM": ("litellm.llms.custom_llm", "CustomLLM"),
+    "AmazonConverseConfig": (
+        "litellm.llms.bedrock.chat.converse_transformation",
+        "AmazonConverseConfig",
+    ),
+    "OpenAILikeChatConfig": (
+        "litellm.llms.openai_like.chat.handler",
+        "OpenAILikeChatConfig",
+    ),
+    "AiohttpOpenAIChatConfig": (
+        "litellm.llms.aiohttp_openai.chat.transformation",
+        "AiohttpOpenAIChatConfig",
+    ),
+    "GaladrielChatConfig": (
+        "litellm.llms.galadriel.chat.transformation",
+        "GaladrielChatConfig",
+    ),
+    "GithubChatConfig": ("litellm.llms.github.chat.transformation", "GithubChatConfig"),
+    "CompactifAIChatConfig": (
+        "litellm.llms.compactifai.chat.transformation",
+        "CompactifAIChatConfig",
+    ),
+    "EmpowerChatConfig": (
+        "litellm.llms.empower.chat.transformation",
+        "EmpowerChatConfig",
+    ),
+    "HuggingFaceChatConfig": (
+        "litellm.llms.huggingface.chat.transformation",
+        "HuggingFaceChatConfig",
+    ),
+    "HuggingFaceEmbeddingConfig": (
+        "litellm.llms.huggingface.embedding.transformation",
+        "HuggingFaceEmbeddingConfig",
+    ),
+    "OobaboogaConfig": (
+        "litellm.llms.oobabooga.chat.transformation",
+        "OobaboogaConfig",
+    ),
+    "MaritalkConfig": ("litellm.llms.maritalk", "MaritalkConfig"),
+    "OpenrouterConfig": (
+        "litellm.llms.openrouter.chat.transformation",
+        "OpenrouterConfig",
+    ),
+    "DataRobotConfig": (
+        "litellm.llms.datarobot.chat.transformation",
+        "DataRobotConfig",
+    ),
+    "AnthropicConfig": (
+        "litellm.llms.anthropic.chat.transformation",
+        "AnthropicConfig",
+    ),
+    "AnthropicModelInfo": ("litellm.llms.anthropic.common_utils", "AnthropicModelInfo"),
+    "GroqSTTConfig": ("litellm.llms.groq.stt.transformation", "GroqSTTConfig"),
+    "AnthropicTextConfig": (
+        "litellm.llms.anthropic.completion.transformation",
+        "AnthropicTextConfig",
+    ),
+    "TritonConfig": ("litellm.llms.triton.completion.transformation", "TritonConfig"),
+    "TritonGenerateConfig": (
+        "litellm.llms.triton.completion.transformation",
+        "TritonGenerateConfig",
+    ),
+    "TritonInferConfig": (
+        "litellm.llms.triton.completion.transformation",
+        "TritonInferConfig",
+    ),
+    "TritonEmbeddingConfig": (
+        "litellm.llms.triton.embedding.transformation",
+        "TritonEmbeddingConfig",
+    ),
+    "HuggingFaceRerankConfig": (
+        "litellm.llms.huggingface.rerank.transformation",
+        "HuggingFaceRerankConfig",
+    ),
+    "DatabricksConfig": (
+        "litellm.llms.databricks.chat.transformation",
+        "DatabricksConfig",
+    ),
+    "DatabricksEmbeddingConfig": (
+        "litellm.llms.databricks.embed.transformation",
+        "DatabricksEmbeddingConfig",
+    ),
+    "PredibaseConfig": (
+        "litellm.llms.predibase.chat.transformation",
+        "PredibaseConfig",
+    ),
+    "ReplicateConfig": (
+        "litellm.llms.replicate.chat.transformation",
+        "ReplicateConfig",
+    ),
+    "SnowflakeConfig": (
+        "litellm.llms.snowflake.chat.transformation",
+        "SnowflakeConfig",
+    ),
+    "CohereRerankConfig": (
+        "litellm.llms.cohere.rerank.transformation",
+        "CohereRerankConfig",
+    ),
+    "CohereRerankV2Config": (
+        "litellm.llms.cohere.rerank_v2.transformation",
+        "CohereRerankV2Config",
+    ),
+    "AzureAIRerankConfig": (
+        "litellm.llms.azure_ai.rerank.transformation",
+        "AzureAIRerankConfig",
+    ),
+    "InfinityRerankConfig": (
+        "litellm.llms.infinity.rerank.transformation",
+        "InfinityRerankConfig",
+    ),
+    "JinaAIRerankConfig": (
+        "litellm.llms.jina_ai.rerank.transformation",
+        "JinaAIRerankConfig",
+    ),
+    "DeepinfraRerankConfig": (
+        "litellm.llms.deepinfra.rerank.transformation",
+        "DeepinfraRerankConfig",
+    ),
+    "NvidiaNimRerankConfig": (
+        "litellm.llms.nvidia_nim.rerank.transformation",
+        "NvidiaNimRerankConfig",
+    ),
+    "VertexAIRerankConfig": (
+        "litellm.llms.vertex_ai.rerank.transformation",
+        "VertexAIRerankConfig",
+    ),
+    "ClarifaiConfig": ("litellm.llms.clarifai.chat.transformation", "ClarifaiConfig"),
+    "AI21ChatConfig": ("litellm.llms.ai21.chat.transformation", "AI21ChatConfig"),
+    "AI21Config": ("litellm.llms.ai21.chat.transformation", "AI21ChatConfig"),
+    "LlamaAPIConfig": ("litellm.llms.meta_llama.chat.transformation", "LlamaAPIConfig"),
+    "AnthropicMessagesConfig": (
+        "litellm.llms.anthropic.experimental_pass_through.messages.transformation",
+        "AnthropicMessagesConfig",
+    ),
+    "AmazonAnthropicClaudeMessagesConfig": (
+        "litellm.llms.bedrock.messages.invoke_transformations.anthropic_claude3_transformation",
+        "AmazonAnthropicClaudeMessagesConfig",
+    ),
+    "TogetherAIConfig": ("litellm.llms.together_ai.chat", "TogetherAIConfig"),
+    "TogetherAITextCompletionConfig": (
+        "litellm.llms.together_ai.completion.transformation",
+        "TogetherAITextCompletionConfig",
+    ),
+    "CloudflareChatConfig": (
+        "litellm.llms.cloudflare.chat.transformation",
+        "CloudflareChatConfig",
+    ),
+    "NovitaConfig": ("litellm.llms.novita.chat.transformation", "NovitaConfig"),
+    "PalmConfig": ("litellm.llms.deprecated_providers.palm", "PalmConfig"),
+    "NLPCloudConfig": ("litellm.llms.nlp_cloud.chat.handler", "NLPCloudConfig"),
+    "PetalsConfig": ("litellm.llms.petals.completion.transformation", "PetalsConfig"),
+    "AlephAlphaConfig": (
+        "litellm.llms.deprecated_providers.aleph_alpha",
+        "AlephAlphaConfig",
+    ),
+    "VertexGeminiConfig": (
+        "litellm.llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini",
+        "VertexGeminiConfig",
+    ),
+    "VertexAIConfig": (
+        "litellm.llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini",
+        "VertexGeminiConfig",
+    ),
+    "GeminiModelInfo": ("litellm.llms.gemini.common_utils", "GeminiModelInfo"),
+    "GoogleAIStudioGeminiConfig": (
+        "litellm.llms.gemini.chat.transformation",
+        "GoogleAIStudioGeminiConfig",
+    ),
+    "GeminiConfig": (
+        "litellm.llms.gemini.chat.transformation",
+        "GoogleAIStudioGeminiConfig",
+    ),
+    "VertexAITextEmbeddingConfig": (
+        "litellm.llms.vertex_ai.vertex_embeddings.transformation",
+        "VertexAITextEmbeddingConfig",
+    ),
+    "VertexAIAnthropicConfig": (
+        "litellm.llms.vertex_ai.vertex_ai_partner_models.anthropic.transformation",
+        "VertexAIAnthropicConfig",
+    ),
+    "VertexAILlama3Config": (
+        "litellm.llms.vertex_ai.vertex_ai_partner_models.llama3.transformation",
+        "VertexAILlama3Config",
+    ),
+    "VertexAIAi21Config": (
+        "litellm.llms.vertex_ai.vertex_ai_partner_models.ai21.transformation",
+        "VertexAIAi21Config",
+    ),
+    "OllamaChatConfig": ("litellm.llms.ollama.chat.transformation", "OllamaChatConfig"),
+    "OllamaConfig": ("litellm.llms.ollama.completion.transformation", "OllamaConfig"),
+    "SagemakerConfig": (
+        "litellm.llms.sagemaker.completion.transformation",
+        "SagemakerConfig",
+    ),
+    "SagemakerChatConfig": (
+        "litellm.llms.sagemaker.chat.transformation",
+        "SagemakerChatConfig",
+    ),
+    "AmazonCohereChatConfig": (
+        "litellm.llms.bedrock.chat.invoke_handler",
+        "AmazonCohereChatConfig",
+    ),
+    "bedrock_tool_name_mappings": (
+        "litellm.llms.bedrock.chat.invoke_handler",
+        "bedrock_tool_name_mappings",
+    ),
+    "AmazonBedrockGlobalConfig": (
+        "litellm.llms.bedrock.common_utils",
+        "AmazonBedrockGlobalConfig",
+    ),
+    "AmazonAI21Config": (
+        "litellm.llms.bedrock.chat.invoke_transformations.amazon_ai21_transformation",
+        "AmazonAI21Config",
+    ),
+    "AmazonInvokeNovaConfig": (
+        "litellm.llms.bedrock.chat.invoke_transformations.amazon_nova_transformation",
+        "AmazonInvokeNovaConfig",
+    ),
+    "AmazonQwen3Config": (
+        "litellm.llms.bedrock.chat.invoke_transformations.amazon_qwen3_transformation",
+        "AmazonQwen3Config",
+    ),
+    "AmazonAnthropicConfig": (
+        "litellm.llms.bedrock.chat.invoke_transformations.anthropic_claude2_transformation",
+        "AmazonAnthropicConfig",
+    ),
+    "AmazonAnthropicClaudeConfig": (
+        "litellm.llms.bedrock.chat.invoke_transformations.anthropic_claude3_transformation",
+        "AmazonAnthropicClaudeConfig",
+    ),
+    "AmazonCohereConfig": (
+        "litellm.llms.bedrock.chat.invoke_transformations.amazon_cohere_transformation",
+        "AmazonCohereConfig",
+    ),
+    "AmazonLlamaConfig": (
+        "litellm.llms.bedrock.chat.invoke_transformations.amazon_llama_transformation",
+        "AmazonLlamaConfig",
+    ),
+    "AmazonDeepSeekR1Config": (
+        "litellm.llms.bedrock.chat.invoke_transformations.amazon_deepseek_transformation",
+        "AmazonDeepSeekR1Config",
+    ),
+    "AmazonMistralConfig": (
+        "litellm.llms.bedrock.chat.invoke_transformations.amazon_mistral_transformation",
+        "AmazonMistralConfig",
+    ),
+    "AmazonTitanConfig": (
+        "litellm.llms.bedrock.chat.invoke_transformations.amazon_titan_transformation",
+        "AmazonTitanConfig",
+    ),
+    "AmazonInvokeConfig": (
+        "litellm.llms.bedrock.chat.invoke_transformations.base_invoke_transformation",
+        "AmazonInvokeConfig",
+    ),
+    "AmazonStabilityConfig": (
+        "litellm.llms.bedrock.image.amazon_stability1_transformation",
+        "AmazonStabilityConfig",
+    ),
+    "AmazonStability3Config": (
+        "litellm.llms.bedrock.image.amazon_stability3_transformation",
+        "AmazonStability3Config",
+    ),
+    "AmazonNovaCanvasConfig": (
+        "litellm.llms.bedrock.image.amazon_nova_canvas_transformation",
+        "AmazonNovaCanvasConfig",
+    ),
+    "AmazonTitanG1Config": (
+        "litellm.llms.bedrock.embed.amazon_titan_g1_transformation",
+        "AmazonTitanG1Config",
+    ),
+    "AmazonTitanMultimodalEmbeddingG1Config": (
+        "litellm.llms.bedrock.embed.amazon_titan_multimodal_transformation",
+        "AmazonTitanMultimodalEmbeddingG1Config",
+    ),
+    "AmazonTitanV2Config": (
+        "litellm.llms.bedrock.embed.amazon_titan_v2_transformation",
+        "AmazonTitanV2Config",
+    ),
+    "CohereChatConfig": ("litellm.llms.cohere.chat.transformation", "CohereChatConfig"),
+    "CohereV2ChatConfig": (
+        "litellm.llms.cohere.chat.v2_transformation",
+        "CohereV2ChatConfig",
+    ),
+    "BedrockCohereEmbeddingConfig": (
+        "litellm.llms.bedrock.embed.cohere_transformation",
+        "BedrockCohereEmbeddingConfig",
+    ),
+    "TwelveLabsMarengoEmbeddingConfig": (
+        "litellm.llms.bedrock.embed.twelvelabs_marengo_transformation",
+        "TwelveLabsMarengoEmbeddingConfig",
+    ),
+    "OpenAIConfig": ("litellm.llms.openai.openai", "OpenAIConfig"),
+    "MistralEmbeddingConfig": ("litellm.llms.openai.openai", "MistralEmbeddingConfig"),
+    "OpenAIImageVariationConfig": (
+        "litellm.llms.openai.image_variations.transformation",
+        "OpenAIImageVariationConfig",
+    ),
+    "DeepInfraConfig": (
+        "litellm.llms.deepinfra.chat.transformation",
+        "DeepInfraConfig",
+    ),
+    "DeepgramAudioTranscriptionConfig": (
+        "litellm.llms.deepgram.audio_transcription.transformation",
+        "DeepgramAudioTranscriptionConfig",
+    ),
+    "TopazModelInfo": ("litellm.llms.topaz.common_utils", "TopazModelInfo"),
+    "TopazImageVariationConfig": (
+        "litellm.llms.topaz.image_variations.transformation",
+        "TopazImageVariationConfig",
+    ),
+    "OpenAITextCompletionConfig": (
+        "litellm.llms.openai.completion.transformation",
+        "OpenAITextCompletionConfig",
+    ),
+    "GroqChatConfig": ("litellm.llms.groq.chat.transformation", "GroqChatConfig"),
+    "VoyageEmbeddingConfig": (
+        "litellm.llms.voyage.embedding.transformation",
+        "VoyageEmbeddingConfig",
+    ),
+    "VoyageContextualEmbeddingConfig": (
+        "litellm.llms.voyage.embedding.transformation_contextual",
+        "VoyageContextualEmbeddingConfig",
+    ),
+    "InfinityEmbeddingConfig": (
+        "litellm.llms.infinity.embedding.transformation",
+        "InfinityEmbeddingConfig",
+    ),
+    "AzureAIStudioConfig": (
+        "litellm.llms.azure_ai.chat.transformation",
+        "AzureAIStudioConfig",
+    ),
+    "MistralConfig": ("litellm.llms.mistral.chat.transformation", "MistralConfig"),
+    "OpenAIResponsesAPIConfig": (
+        "litellm.llms.openai.responses.transformation",
+        "OpenAIResponsesAPIConfig",
+    ),
+    "AzureOpenAIResponsesAPIConfig": (
+        "litellm.llms.azure.responses.transformation",
+        "AzureOpenAIResponsesAPIConfig",
+    ),
+    "AzureOpenAIOSeriesResponsesAPIConfig": (
+        "litellm.llms.azure.responses.o_series_transformation",
+        "AzureOpenAIOSeriesResponsesAPIConfig",
+    ),
+    "LiteLLMProxyResponsesAPIConfig": (
+        "litellm.llms.litellm_proxy.responses.transformation",
+        "LiteLLMProxyResponsesAPIConfig",
+    ),
+    "OpenAIO1Config": (
+        "litellm.llms.openai.chat.o_series_transformation",
+        "OpenAIOSeriesConfig",
+    ),
+    "OpenAIOSeriesConfig": (
+        "litellm.llms.openai.chat.o_series_transformation",
+        "OpenAIOSeriesConfig",
+    ),
+    "GradientAIConfig": (
+        "litellm.llms.gradient_ai.chat.transformation",
+        "GradientAIConfig",
+    ),
+    "OpenAIGPTConfig": (
+        "litellm.llms.openai.chat.gpt_transformation",
+        "OpenAIGPTConfig",
+    ),
+    "OpenAIGPT5Config": (
+        "litellm.llms.openai.chat.gpt_5_transformation",
+        "OpenAIGPT5Config",
+    ),
+    "OpenAIWhisperAudioTranscriptionConfig": (
+        "litellm.llms.openai.transcriptions.whisper_transformation",
+        "OpenAIWhisperAudioTranscriptionConfig",
+    ),
+    "OpenAIGPTAudioTranscriptionConfig": (
+        "litellm.llms.openai.transcriptions.gpt_transformation",
+        "OpenAIGPTAudioTranscriptionConfig",
+    ),
+    "OpenAIGPTAudioConfig": (
+        "litellm.llms.openai.chat.gpt_audio_transformation",
+        "OpenAIGPTAudioConfig",
+    ),
+    "NvidiaNimConfig": (
+        "litellm.llms.nvidia_nim.chat.transformation",
+        "NvidiaNimConfig",
+    ),
+    "NvidiaNimEmbeddingConfig": (
+        "litellm.llms.nvidia_nim.embed",
+        "NvidiaNimEmbeddingConfig",
+    ),
+    "FeatherlessAIConfig": (
+        "litellm.llms.featherless_ai.chat.transformation",
+        "FeatherlessAIConfig",
+    ),
+    "CerebrasConfig": ("litellm.llms.cerebras.chat", "CerebrasConfig"),
+    "BasetenConfig": ("litellm.llms.baseten.chat", "BasetenConfig"),
+    "SambanovaConfig": ("litellm.llms.sambanova.chat", "SambanovaConfig"),
+    "SambaNovaEmbeddingConfig": (
+        "litellm.llms.sambanova.embedding.transformation",
+        "SambaNovaEmbeddingConfig",
+    ),
+    "FireworksAIConfig": (
+        "litellm.llms.fireworks_ai.chat.transformation",
+        "FireworksAIConfig",
+    ),
+    "FireworksAITextCompletionConfig": (
+        "litellm.llms.fireworks_ai.completion.transformation",
+        "FireworksAITextCompletionConfig",
+    ),
+    "FireworksAIAudioTranscriptionConfig": (
+        "litellm.llms.fireworks_ai.audio_transcription.transformation",
+        "FireworksAIAudioTranscriptionConfig",
+    ),
+    "FireworksAIEmbeddingConfig": (
+        "litellm.llms.fireworks_ai.embed.fireworks_ai_transformation",
+        "FireworksAIEmbeddingConfig",
+    ),
+    "FriendliaiChatConfig": (
+        "litellm.llms.friendliai.chat.transformation",
+        "FriendliaiChatConfig",
+    ),
+    "JinaAIEmbeddingConfig": (
+        "litellm.llms.jina_ai.embedding.transformation",
+        "JinaAIEmbeddingConfig",
+    ),
+    "XAIChatConfig": ("litellm.llms.xai.chat.transformation", "XAIChatConfig"),
+    "XAIModelInfo": ("litellm.llms.xai.common_utils", "XAIModelInfo"),
+    "AIMLChatConfig": ("litellm.llms.aiml.chat.transformation", "AIMLChatConfig"),
+    "VolcEngineConfig": (
+        "litellm.llms.volcengine.chat.transformation",
+        "VolcEngineChatConfig",
+    ),
+    "CodestralTextCompletionConfig": (
+        "litellm.llms.codestral.completion.transformation",
+        "CodestralTextCompletionConfig",
+    ),
+    "AzureOpenAIError": ("litellm.llms.azure.azure", "AzureOpenAIError"),
+    "AzureOpenAIAssistantsAPIConfig": (
+        "litellm.llms.azure.azure",
+        "AzureOpenAIAssistantsAPIConfig",
+    ),
+    "HerokuChatConfig": ("litellm.llms.heroku.chat.transformation", "HerokuChatConfig"),
+    "CometAPIConfig": ("litellm.llms.cometapi.chat.transformation", "CometAPIConfig"),
+    "AzureOpenAIConfig": (
+        "litellm.llms.azure.chat.gpt_transformation",
+        "AzureOpenAIConfig",
+    ),
+    "AzureOpenAIGPT5Config": (
+        "litellm.llms.azure.chat.gpt_5_transformation",
+        "AzureOpenAIGPT5Config",
+    ),
+    "AzureOpenAITextConfig": (
+        "litellm.llms.azure.completion.transformation",
+        "AzureOpenAITextConfig",
+    ),
+    "HostedVLLMChatConfig": (
+        "litellm.llms.hosted_vllm.chat.transformation",
+        "HostedVLLMChatConfig",
+    ),
+    "LlamafileChatConfig": (
+        "litellm.llms.llamafile.chat.transformation",
+        "LlamafileChatConfig",
+    ),
+    "LiteLLMProxyChatConfig": (
+        "litellm.llms.litellm_proxy.chat.transformation",
+        "LiteLLMProxyChatConfig",
+    ),
+    "VLLMConfig": ("litellm.llms.vllm.completion.transformation", "VLLMConfig"),
+    "DeepSeekChatConfig": (
+        "litellm.llms.deepseek.chat.transformation",
+        "DeepSeekChatConfig",
+    ),
+    "LMStudioChatConfig": (
+        "litellm.llms.lm_studio.chat.transformation",
+        "LMStudioChatConfig",
+    ),
+    "LmStudioEmbeddingConfig": (
+        "litellm.llms.lm_studio.embed.transformation",
+        "LmStudioEmbeddingConfig",
+    ),
+    "NscaleConfig": ("litellm.llms.nscale.chat.transformation", "NscaleConfig"),
+    "PerplexityChatConfig": (
+        "litellm.llms.perplexity.chat.transformation",
+        "PerplexityChatConfig",
+    ),
+    "AzureOpenAIO1Config": (
+        "litellm.llms.azure.chat.o_series_transformation",
+        "AzureOpenAIO1Config",
+    ),
+    "IBMWatsonXAIConfig": (
+        "litellm.llms.watsonx.completion.transformation",
+        "IBMWatsonXAIConfig",
+    ),
+    "IBMWatsonXChatConfig": (
+        "litellm.llms.watsonx.chat.transformation",
+        "IBMWatsonXChatConfig",
+    ),
+    "IBMWatsonXEmbeddingConfig": (
+        "litellm.llms.watsonx.embed.transformation",
+        "IBMWatsonXEmbeddingConfig",
+    ),
+    "GithubCopilotConfig": (
+        "litellm.llms.github_copilot.chat.transformation",
+        "GithubCopilotConfig",
+    ),
+    "NebiusConfig": ("litellm.llms.nebius.chat.transformation", "NebiusConfig"),
+    "WandbConfig": ("litellm.llms.wandb.chat.transformation", "WandbConfig"),
+    "DashScopeChatConfig": (
+        "litellm.llms.dashscope.chat.transformation",
+        "DashScopeChatConfig",
+    ),
+    "MoonshotChatConfig": (
+        "litellm.llms.moonshot.chat.transformation",
+        "MoonshotChatConfig",
+    ),
+    "V0ChatConfig": ("litellm.llms.v0.chat.transformation", "V0ChatConfig"),
+    "OCIChatConfig": ("litellm.llms.oci.chat.transformation", "OCIChatConfig"),
+    "MorphChatConfig": ("litellm.llms.morph.chat.transformation", "MorphChatConfig"),
+    "LambdaAIChatConfig": (
+        "litellm.llms.lambda_ai.chat.transformation",
+        "LambdaAIChatConfig",
+    ),
+    "HyperbolicChatConfig": (
+        "litellm.llms.hyperbolic.chat.transformation",
+        "HyperbolicChatConfig",
+    ),
+    "VercelAIGatewayConfig": (
+        "litellm.llms.vercel_ai_gateway.chat.transformation",
+        "VercelAIGatewayConfig",
+    ),
+    "OVHCloudChatConfig": (
+        "litellm.llms.ovhcloud.chat.transformation",
+        "OVHCloudChatConfig",
+    ),
+    "OVHCloudEmbeddingConfig": (
+        "litellm.llms.ovhcloud.embedding.transformation",
+        "OVHCloudEmbeddingConfig",
+    ),
+    "CometAPIEmbeddingConfig": (
+        "litellm.llms.cometapi.embed.transformation",
+        "CometAPIEmbeddingConfig",
+    ),
+    "LemonadeChatConfig": (
+        "litellm.llms.lemonade.chat.transformation",
+        "LemonadeChatConfig",
+    ),
+}
+
+LAZY_PROVIDER_CONFIG_INSTANCES: Dict[str, str] = {
+    # attribute name: provider config in `LAZY_PROVIDER_CONFIGS`, instantiated on first access
+    "vertexAITextEmbeddingConfig": "VertexAITextEmbeddingConfig",
+    "openaiOSeriesConfig": "OpenAIOSeriesConfig",
+    "openAIGPTConfig": "OpenAIGPTConfig",
+    "openAIGPTAudioConfig": "OpenAIGPTAudioConfig",
+    "openAIGPT5Config": "OpenAIGPT5Config",
+    "nvidiaNimConfig": "NvidiaNimConfig",
+    "nvidiaNimEmbeddingConfig": "NvidiaNimEmbeddingConfig",
+}
+
+
+def load_lazy_attribute(module: ModuleType, name: str) -> Any:
+    """
+    Import `name` into `module` - called by the module's `__getattr__`, so only for attributes not set yet.
+
+    Raises:
+        AttributeError: `name` is not a lazily imported attribute
+    """
+    if name in LAZY_PROVIDER_CONFIGS:
+        module_path, attribute_name = LAZY_PROVIDER_CONFIGS[name]
+        value = getattr(importlib.import_module(module_path), attribute_name)
+    elif name in LAZY_PROVIDER_CONFIG_INSTANCES:
+        value = getattr(module, LAZY_PROVIDER_CONFIG_INSTANCES[name])()
+    else:
+        raise AttributeError(f"module {module.__name__!r} has no attribute {name!r}")
+    # another thread may have loaded it first - keep 1 instance
+    return module.__dict__.setdefault(name, value)
@@ -1,8 +1,11 @@
+import asyncio
 from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import litellm
 from litellm._logging import print_verbose
+from litellm.constants import DEFAULT_BATCH_COMPLETION_MAX_CONCURRENCY
+from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
 from litellm.utils import get_optional_params
 
 from ..llms.vllm.completion import handler as vllm_handler
@@ -251,3 +254,194 @@ def batch_completion_models_all_responses(*args, **kwargs):
                 responses.append(future.result())
 
     return responses
+
+
+def _get_batch_request_provider(request: dict) -> str:
+    try:
+        return get_llm_provider(
+            model=request["model"],
+            custom_llm_provider=request.get("custom_llm_provider"),
+        )[1]
+    except Exception:
+        return ""
+
+
+async def _abatch_completion_requests(
+    requests: List[dict],
+    max_concurrency: int = DEFAULT_BATCH_COMPLETION_MAX_CONCURRENCY,
+    max_concurrency_per_provider: Optional[Dict[str, int]] = None,
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Run `litellm.acompletion(**request)` for each request, yielding `(index, response or exception)` in completion order.
+
+    - at most `max_concurrency` requests are in flight
+    - at most `max_concurrency_per_provider[provider]` requests per provider (e.g. {"openai": 50, "anthropic": 10})
+    - all requests run on the current event loop, so they share litellm's cached async clients (one connection pool
+      per provider) instead of one client per thread
+    - if the consumer stops iterating, the remaining requests are cancelled
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    provider_semaphores: Dict[str, asyncio.Semaphore] = {
+        provider: asyncio.Semaphore(max(1, limit))
+        for provider, limit in (max_concurrency_per_provider or {}).items()
+    }
+
+    async def _acompletion(request: dict):
+        async with semaphore:
+            return await litellm.acompletion(**request)
+
+    async def _acompletion_with_provider_limit(request: dict):
+        provider_semaphore = provider_semaphores.get(
+            _get_batch_request_provider(request)
+        )
+        if provider_semaphore is None:
+            return await _acompletion(request)
+        # acquire the provider slot first, so requests waiting on a busy provider don't hold a global slot
+        async with provider_semaphore:
+            return await _acompletion(request)
+
+    tasks: Dict["asyncio.Task", int] = {
+        asyncio.ensure_future(
+            _acompletion_with_provider_limit(request)
+            if provider_semaphores
+            else _acompletion(request)
+        ): index
+        for index, request in enumerate(requests)
+    }
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.cancelled():
+                    yield tasks[task], asyncio.CancelledError()
+                else:
+                    yield tasks[task], task.exception() or task.result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def abatch_completion_iter(
+    model: str,
+    messages: List[List],
+    max_concurrency: int = DEFAULT_BATCH_COMPLETION_MAX_CONCURRENCY,
+    max_concurrency_per_provider: Optional[Dict[str, int]] = None,
+    **kwargs,
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Async batch litellm.acompletion for a given model, yielding results as they complete.
+
+    Args:
+        model (str): The model to use for generating completions.
+        messages (List[List]): List of message lists, one request per message list.
+        max_concurrency (int, optional): Maximum number of requests in flight. Defaults to 100.
+        max_concurrency_per_provider (Dict[str, int], optional): Maximum number of requests in flight per provider.
+        **kwargs: Other params passed to litellm.acompletion.
+
+    Yields:
+        Tuple[int, Union[ModelResponse, Exception]]: (index in `messages`, response or exception), in completion order.
+    """
+    requests = [
+        {**kwargs, "model": model, "messages": message_list}
+        for message_list in messages
+    ]
+    iterator = _abatch_completion_requests(
+        requests=requests,
+        max_concurrency=max_concurrency,
+        max_concurrency_per_provider=max_concurrency_per_provider,
+    )
+    try:
+        async for index, result in iterator:
+            yield index, result
+    finally:
+        # close the inner generator now (not on garbage collection), so the remaining requests are cancelled
+        await iterator.aclose()  # type: ignore
+
+
+async def abatch_completion(
+    model: str,
+    messages: List[List],
+    max_concurrency: int = DEFAULT_BATCH_COMPLETION_MAX_CONCURRENCY,
+    max_concurrency_per_provider: Optional[Dict[str, int]] = None,
+    **kwargs,
+) -> List[Any]:
+    """
+    Async batch litellm.acompletion for a given model - asyncio version of `batch_completion`.
+
+    Args:
+        model (str): The model to use for generating completions.
+        messages (List[List]): List of message lists, one request per message list.
+        max_concurrency (int, optional): Maximum number of requests in flight. Defaults to 100.
+        max_concurrency_per_provider (Dict[str, int], optional): Maximum number of requests in flight per provider.
+        **kwargs: Other params passed to litellm.acompletion.
+
+    Returns:
+        list: Responses (or exceptions) in the same order as `messages`.
+    """
+    results: List[Any] = [None] * len(messages)
+    async for index, result in abatch_completion_iter(
+        model=model,
+        messages=messages,
+        max_concurrency=max_concurrency,
+        max_concurrency_per_provider=max_concurrency_per_provider,
+        **kwargs,
+    ):
+        results[index] = result
+    return results
+
+
+async def abatch_completion_models(
+    models: List[str],
+    max_concurrency_per_provider: Optional[Dict[str, int]] = None,
+    **kwargs,
+):
+    """
+    Async version of `batch_completion_models` - send a request to multiple models concurrently and return the first
+    successful response. The remaining requests are cancelled.
+
+    Returns:
+        The first successful response, or None if every model failed.
+    """
+    kwargs.pop("model", None)
+    requests = [{**kwargs, "model": model} for model in models]
+    iterator = _abatch_completion_requests(
+        requests=requests,
+        max_concurrency=len(requests),
+        max_concurrency_per_provider=max_concurrency_per_provider,
+    )
+    try:
+        async for _, result in iterator:
+            if not isinstance(result, BaseException) and result is not None:
+                return result
+    finally:
+        await iterator.aclose()  # type: ignore
+    return None
+
+
+async def abatch_completion_models_all_responses(
+    models: List[str],
+    max_concurrency_per_provider: Optional[Dict[str, int]] = None,
+    **kwargs,
+) -> List[Any]:
+    """
+    Async version of `batch_completion_models_all_responses` - send a request to multiple models concurrently and return
+    the responses from all models that respond, in the order of `models`.
+    """
+    kwargs.pop("model", None)
+    requests = [{**kwargs, "model": model} for model in models]
+    results: List[Any] = [None] * len(requests)
+    async for index, result in _abatch_completion_requests(
+        requests=requests,
+        max_concurrency=len(requests),
+        max_concurrency_per_provider=max_concurrency_per_provider,
+    ):
+        results[index] = result
+    return [
+        result
+        for result in results
+        if result is not None and not isinstance(result, BaseException)
+    ]
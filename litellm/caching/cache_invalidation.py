@@ -0,0 +1,108 @@
+"""
+Push invalidation for in-memory caches shared across instances (pods / workers)
+
+An in-memory cache entry lives until its TTL runs out, even if the object changed on another instance. A
+`CacheInvalidator` publishes the keys it invalidates on a pub/sub channel (`litellm.caching.pubsub`) - every other
+instance subscribed to the same channel evicts them from its in-memory cache as soon as the message arrives.
+
+Messages are versioned (`version`) and numbered per publisher (`seq`). Pub/sub delivery is at-most-once - if a message
+can't be applied (unknown version, gap in `seq`, re-subscribe after a disconnect) the whole in-memory cache is flushed.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, Any, List
+
+from litellm._logging import verbose_logger
+from litellm._uuid import uuid
+
+from .dual_cache import LimitedSizeOrderedDict
+from .pubsub import PubSubChannel
+
+if TYPE_CHECKING:
+    from .dual_cache import DualCache
+
+CACHE_INVALIDATION_MESSAGE_VERSION = 1
+CACHE_INVALIDATION_MAX_TRACKED_PUBLISHERS = 1000
+
+
+class CacheInvalidator:
+    """
+    Evicts keys from the in-memory cache of `cache`, on this instance and on every instance subscribed to `channel`.
+    """
+
+    def __init__(self, cache: "DualCache", channel: PubSubChannel):
+        self.cache = cache
+        self.channel = channel
+        self.instance_id = uuid.uuid4().hex
+        self._seq = 0
+        # messages are published 1 at a time - so subscribers receive them in `seq` order, without gaps
+        self._publish_lock = asyncio.Lock()
+        self._last_seq_by_publisher: LimitedSizeOrderedDict = LimitedSizeOrderedDict(
+            max_size=CACHE_INVALIDATION_MAX_TRACKED_PUBLISHERS
+        )
+
+    async def start(self) -> None:
+        await self.channel.subscribe(
+            on_message=self._handle_message, on_reset=self._flush_in_memory_cache
+        )
+
+    async def stop(self) -> None:
+        await self.channel.close()
+
+    async def invalidate(self, keys: List[str], skip_local: bool = False) -> None:
+        """
+        Evict `keys` from every subscribed in-memory cache. `skip_local=True` keeps this instance's entries - e.g. if it
+        just cached the updated objects.
+        """
+        if not keys:
+            return
+        if not skip_local:
+            for key in keys:
+                self.cache.in_memory_cache.delete_cache(key)
+        async with self._publish_lock:
+            seq = self._seq + 1
+            try:
+                await self.channel.publish(
+                    {
+                        "version": CACHE_INVALIDATION_MESSAGE_VERSION,
+                        "publisher": self.instance_id,
+                        "seq": seq,
+                        "keys": keys,
+                    }
+                )
+            except Exception as e:
+                verbose_logger.warning(
+                    "Unable to publish cache invalidation for %s keys. Error - %s",
+                    len(keys),
+                    str(e),
+                )
+                return
+            # only count published messages - a failed publish isn't a gap subscribers flush on
+            self._seq = seq
+
+    def _handle_message(self, message: Any) -> None:
+        if (
+            not isinstance(message, dict)
+            or message.get("version") != CACHE_INVALIDATION_MESSAGE_VERSION
+        ):
+            # can't tell which keys changed
+            self._flush_in_memory_cache()
+            return
+        publisher = message.get("publisher")
+        if publisher == self.instance_id:
+            return
+
+        seq = message.get("seq")
+        last_seq = self._last_seq_by_publisher.get(publisher)
+        self._last_seq_by_publisher[publisher] = seq
+        if last_seq is not None and seq != last_seq + 1:
+            # missed a message from this publisher
+            self._flush_in_memory_cache()
+            return
+
+        for key in message.get("keys") or []:
+            self.cache.in_memory_cache.delete_cache(key)
+
+    def _flush_in_memory_cache(self) -> None:
+        verbose_logger.debug("Cache invalidation - flushing the in-memory cache")
+        self.cache.in_memory_cache.flush_cache()
@@ -0,0 +1,215 @@
+"""
+Incremental SHA-256 hashing for `Cache.get_cache_key`
+
+Hashes each `f"{param}: {param_value}"` as it's serialized, instead of concatenating them into 1 string first.
+The digest is identical to hashing the concatenated string - existing cache keys stay valid.
+
+For multi-turn conversations, the hash state after the last message is cached, so the next turn only hashes the new
+messages.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+MessageSnapshot = Tuple[Tuple[Any, type, Any], ...]
+
+from litellm.constants import CACHE_KEY_MESSAGE_PREFIX_CACHE_SIZE
+
+CACHE_KEY_MESSAGE_PREFIX_MIN_LENGTH = 32768  # ~8k tokens
+_IMMUTABLE_MESSAGE_VALUE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+class _MessagePrefixNode:
+    __slots__ = ("messages", "message_snapshots", "hash_object", "serialized_length")
+
+    def __init__(
+        self,
+        messages: Tuple[dict, ...],
+        message_snapshots: Tuple[MessageSnapshot, ...],
+        hash_object: "hashlib._Hash",
+        serialized_length: int,
+    ):
+        self.messages = messages
+        self.message_snapshots = message_snapshots
+        self.hash_object = hash_object
+        self.serialized_length = serialized_length
+
+    def matches(self, messages: list) -> bool:
+        """
+        `messages` starts with the same message objects as the cached prefix, and they were not mutated since.
+
+        Message values are compared against the snapshots by type and value - `1 == True == 1.0`, but they serialize
+        differently. Unchanged strings are the same objects, so this doesn't re-scan their content.
+        """
+        if len(messages) < len(self.messages):
+            return False
+        try:
+            for message, cached_message, message_snapshot in zip(
+                messages, self.messages, self.message_snapshots
+            ):
+                if message is not cached_message or len(message) != len(
+                    message_snapshot
+                ):
+                    return False
+                # compare items in order - key order changes the serialized message
+                for (key, value), (snapshot_key, value_type, snapshot_value) in zip(
+                    message.items(), message_snapshot
+                ):
+                    if key != snapshot_key or type(value) is not value_type:
+                        return False
+                    if value_type in _IMMUTABLE_MESSAGE_VALUE_TYPES:
+                        if value is not snapshot_value and value != snapshot_value:
+                            return False
+                    elif repr(value) != snapshot_value:
+                        return False
+        except Exception:
+            return False
+        return True
+
+
+class MessagePrefixHashCache:
+    """
+    Bounded LRU cache of the sha256 state after the last message of a hashed `messages` list
+
+    Key = (digest of the params hashed before `messages`, id(last message of the prefix))
+
+    Nodes keep a reference to their messages, so `id(message)` can't be reused while it's cached.
+    """
+
+    def __init__(self, max_size: int = CACHE_KEY_MESSAGE_PREFIX_CACHE_SIZE):
+        self.max_size = max_size
+        self._nodes: "OrderedDict[Tuple[bytes, int], _MessagePrefixNode]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def update(self, hash_object: "hashlib._Hash", messages: list) -> "hashlib._Hash":
+        """
+        Feed the items of `messages`, as `str(messages)` would serialize them (without the brackets), to `hash_object`.
+
+        Returns the hash object to keep feeding - this is a copy of a cached state, if a prefix of `messages` was hashed before.
+        """
+        root_key = hash_object.digest()
+        prefix_node = self._get_longest_prefix_node(root_key, messages)
+        num_hashed_messages = 0
+        serialized_length = 0
+        if prefix_node is not None:
+            hash_object = prefix_node.hash_object.copy()
+            num_hashed_messages = len(prefix_node.messages)
+            serialized_length = prefix_node.serialized_length
+            if num_hashed_messages == len(messages):
+                return hash_object
+
+        if num_hashed_messages > 0:
+            hash_object.update(b", ")
+        serialized_messages = ", ".join(map(repr, messages[num_hashed_messages:]))
+        hash_object.update(serialized_messages.encode())
+        serialized_length += len(serialized_messages)
+
+        # re-hashing short conversations is cheaper than snapshotting them
+        if serialized_length >= CACHE_KEY_MESSAGE_PREFIX_MIN_LENGTH:
+            self._add_node(
+                root_key=root_key,
+                messages=messages,
+                prefix_node=prefix_node,
+                hash_object=hash_object,
+                serialized_length=serialized_length,
+            )
+        return hash_object
+
+    def _get_longest_prefix_node(
+        self, root_key: bytes, messages: list
+    ) -> Optional[_MessagePrefixNode]:
+        if len(self._nodes) == 0:
+            return None
+        for idx in range(len(messages) - 1, -1, -1):
+            key = (root_key, id(messages[idx]))
+            node = self._nodes.get(key)
+            if node is not None and len(node.messages) == idx + 1:
+                if node.matches(messages):
+                    try:
+                        self._nodes.move_to_end(key)
+                    except KeyError:  # evicted by another thread
+                        pass
+                    return node
+        return None
+
+    def _add_node(
+        self,
+        root_key: bytes,
+        messages: list,
+        prefix_node: Optional[_MessagePrefixNode],
+        hash_object: "hashlib._Hash",
+        serialized_length: int,
+    ) -> None:
+        message_snapshots = prefix_node.message_snapshots if prefix_node else ()
+        new_message_snapshots = []
+        for message in messages[len(message_snapshots) :]:
+            message_snapshot = self._get_message_snapshot(message)
+            if message_snapshot is None:
+                return
+            new_message_snapshots.append(message_snapshot)
+
+        node = _MessagePrefixNode(
+            messages=tuple(messages),
+            message_snapshots=message_snapshots + tuple(new_message_snapshots),
+            hash_object=hash_object.copy(),
+            serialized_length=serialized_length,
+        )
+        with self._lock:
+            self._nodes[(root_key, id(messages[-1]))] = node
+            while len(self._nodes) > self.max_size:
+                self._nodes.popitem(last=False)
+
+    @staticmethod
+    def _get_message_snapshot(message: Any) -> Optional[MessageSnapshot]:
+        """
+        (key, type, value) of each message item, used to detect in-place mutations. Only dict messages are cached.
+
+        String values are shared with the message, not copied. Nested values (e.g. content lists) are stored serialized.
+        """
+        if type(message) is not dict:
+            return None
+        try:
+            return tuple(
+                (
+                    key,
+                    type(value),
+                    (
+                        value
+                        if type(value) in _IMMUTABLE_MESSAGE_VALUE_TYPES
+                        else repr(value)
+                    ),
+                )
+                for key, value in message.items()
+            )
+        except Exception:
+            return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._nodes.clear()
+
+
+message_prefix_hash_cache = MessagePrefixHashCache()
+
+
+def update_cache_key_hash(
+    hash_object: "hashlib._Hash", param: str, param_value: Any
+) -> "hashlib._Hash":
+    """
+    Feed `f"{param}: {str(param_value)}"` to `hash_object`
+
+    Returns the hash object to keep feeding.
+    """
+    if param == "messages" and type(param_value) is list and len(param_value) > 0:
+        hash_object.update(f"{param}: [".encode())
+        hash_object = message_prefix_hash_cache.update(
+            hash_object=hash_object, messages=param_value
+        )
+        hash_object.update(b"]")
+        return hash_object
+    hash_object.update(f"{param}: {str(param_value)}".encode())
+    return hash_object
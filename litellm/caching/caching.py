@@ -26,6 +26,7 @@ from litellm.types.utils import EmbeddingResponse, all_litellm_params
 
 from .azure_blob_cache import AzureBlobCache
 from .base_cache import BaseCache
+from .cache_key_hasher import update_cache_key_hash
 from .disk_cache import DiskCache
 from .dual_cache import DualCache  # noqa
 from .gcs_cache import GCSCache
@@ -46,6 +47,9 @@ def print_verbose(print_statement):
         pass
 
 
+_all_litellm_params_set = frozenset(all_litellm_params)
+
+
 class CacheMode(str, Enum):
     default_on = "default_on"
     default_off = "default_off"
@@ -271,21 +275,22 @@ class Cache:
         Returns:
             str: The cache key generated from the arguments, or None if no cache key could be generated.
         """
-        cache_key = ""
-        # verbose_logger.debug("\nGetting Cache key. Kwargs: %s", kwargs)
-
         preset_cache_key = self._get_preset_cache_key_from_kwargs(**kwargs)
         if preset_cache_key is not None:
             verbose_logger.debug("\nReturning preset cache key: %s", preset_cache_key)
             return preset_cache_key
 
         combined_kwargs = ModelParamHelper._get_all_llm_api_params()
-        litellm_param_kwargs = all_litellm_params
+        litellm_param_kwargs = _all_litellm_params_set
+        # hash each param as it's serialized, instead of building the full `"{param}: {value}"` string
+        hash_object = hashlib.sha256()
         for param in kwargs:
             if param in combined_kwargs:
                 param_value: Optional[str] = self._get_param_value(param, kwargs)
                 if param_value is not None:
-                    cache_key += f"{str(param)}: {str(param_value)}"
+                    hash_object = update_cache_key_hash(
+                        hash_object=hash_object, param=param, param_value=param_value
+                    )
             elif (
                 param not in litellm_param_kwargs
             ):  # check if user passed in optional param - e.g. top_k
@@ -294,11 +299,12 @@ class Cache:
                 ):  # feature flagged for now
                     if kwargs[param] is None:
                         continue  # ignore None params
-                    param_value = kwargs[param]
-                    cache_key += f"{str(param)}: {str(param_value)}"
+                    hash_object = update_cache_key_hash(
+                        hash_object=hash_object, param=param, param_value=kwargs[param]
+                    )
 
-        verbose_logger.debug("\nCreated cache key: %s", cache_key)
-        hashed_cache_key = Cache._get_hashed_cache_key(cache_key)
+        hashed_cache_key = hash_object.hexdigest()
+        verbose_logger.debug("Hashed cache key (SHA-256): %s", hashed_cache_key)
         hashed_cache_key = self._add_namespace_to_cache_key(hashed_cache_key, **kwargs)
         self._set_preset_cache_key_in_kwargs(
             preset_cache_key=hashed_cache_key, **kwargs
@@ -391,7 +397,7 @@ class Cache:
         """
         Get the hashed cache key for the given cache key.
 
-        Use hashlib to create a sha256 hash of the cache key
+        Same sha256 digest `get_cache_key` builds incrementally, for a cache key that's already a string
 
         Args:
             cache_key (str): The cache key to hash.
@@ -399,8 +405,8 @@ class Cache:
         Returns:
             str: The hashed cache key.
         """
-        hash_object = hashlib.sha256(cache_key.encode())
-        # Hexadecimal representation of the hash
+        hash_object = hashlib.sha256()
+        hash_object.update(cache_key.encode())
         hash_hex = hash_object.hexdigest()
         verbose_logger.debug("Hashed cache key (SHA-256): %s", hash_hex)
         return hash_hex
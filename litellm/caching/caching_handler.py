@@ -554,7 +554,8 @@ class LLMCachingHandler:
         GLOBAL_LOGGING_WORKER.ensure_initialized_and_enqueue(
             async_coroutine=logging_obj.async_success_handler(
                 result=cached_result, start_time=start_time, end_time=end_time, cache_hit=cache_hit
-            )
+            ),
+            ordering_key=logging_obj.litellm_call_id,
         )
 
         logging_obj.handle_sync_success_callbacks_for_async_calls(
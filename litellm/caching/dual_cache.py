@@ -11,15 +11,21 @@ Has 4 primary methods:
 import asyncio
 import time
 import traceback
+import weakref
 from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 if TYPE_CHECKING:
     from litellm.types.caching import RedisPipelineIncrementOperation
 
+    from .cache_invalidation import CacheInvalidator
+
 import litellm
 from litellm._logging import print_verbose, verbose_logger
-from litellm.constants import DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE
+from litellm.constants import (
+    DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE,
+    DEFAULT_REDIS_BATCH_GET_WINDOW,
+)
 
 from .base_cache import BaseCache
 from .in_memory_cache import InMemoryCache
@@ -42,11 +48,86 @@ class LimitedSizeOrderedDict(OrderedDict):
 
     def __setitem__(self, key, value):
         # If inserting a new key exceeds max size, remove the oldest item
-        if len(self) >= self.max_size:
+        if key not in self and len(self) >= self.max_size:
             self.popitem(last=False)
         super().__setitem__(key, value)
 
 
+class RedisBatchGetCoalescer:
+    """
+    Coalesces the concurrent Redis batch gets of 1 event loop.
+
+    - single-flight: concurrent callers missing the same key share 1 lookup
+    - micro-batching: keys requested within `batch_window` seconds are read with 1 MGET
+    """
+
+    def __init__(self, redis_cache: RedisCache, batch_window: float):
+        self.redis_cache = redis_cache
+        self.batch_window = batch_window
+        self.pending_keys: Dict[str, None] = {}  # keys of the next MGET, in order
+        self.in_flight: Dict[str, asyncio.Future] = {}  # key -> result of its MGET
+        self.flush_task: Optional[asyncio.Task] = None
+
+    async def async_batch_get(
+        self, keys: List[str], parent_otel_span: Optional[Span] = None
+    ) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        futures: Dict[str, asyncio.Future] = {}
+        for key in keys:
+            future = self.in_flight.get(key)
+            if future is None:
+                future = self.in_flight[key] = loop.create_future()
+                self.pending_keys[key] = None
+            futures[key] = future
+
+        if len(self.pending_keys) > 0 and self.flush_task is None:
+            self.flush_task = asyncio.create_task(
+                self._flush(parent_otel_span=parent_otel_span)
+            )
+
+        # asyncio.wait doesn't cancel the shared futures, if this caller is cancelled
+        await asyncio.wait(futures.values())
+        return {key: future.result() for key, future in futures.items()}
+
+    def _pop_pending_keys(self) -> List[str]:
+        keys = list(self.pending_keys)
+        self.pending_keys.clear()
+        self.flush_task = None
+        return keys
+
+    async def _flush(self, parent_otel_span: Optional[Span]) -> None:
+        keys: Optional[List[str]] = None
+        try:
+            # yield to the event loop at least once, so concurrent callers can join the batch
+            await asyncio.sleep(self.batch_window)
+            keys = self._pop_pending_keys()
+            redis_result = (
+                await self.redis_cache.async_batch_get_cache(
+                    keys, parent_otel_span=parent_otel_span
+                )
+                or {}
+            )
+        except BaseException as e:
+            if keys is None:
+                keys = self._pop_pending_keys()
+            for key in keys:
+                future = self.in_flight.pop(key)
+                if future.done():
+                    continue
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                else:
+                    future.cancel()
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for key in keys:
+            future = self.in_flight.pop(key)
+            if not future.done():
+                future.set_result(redis_result.get(key))
+
+
 class DualCache(BaseCache):
     """
     DualCache is a cache implementation that updates both Redis and an in-memory cache simultaneously.
@@ -62,15 +143,19 @@ class DualCache(BaseCache):
         default_redis_ttl: Optional[float] = None,
         default_redis_batch_cache_expiry: Optional[float] = None,
         default_max_redis_batch_cache_size: int = DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE,
+        redis_batch_get_window: float = DEFAULT_REDIS_BATCH_GET_WINDOW,
     ) -> None:
         super().__init__()
         # If in_memory_cache is not provided, use the default InMemoryCache
         self.in_memory_cache = in_memory_cache or InMemoryCache()
         # If redis_cache is not provided, use the default RedisCache
         self.redis_cache = redis_cache
+        # negative cache - when each key was last missing from redis
         self.last_redis_batch_access_time = LimitedSizeOrderedDict(
             max_size=default_max_redis_batch_cache_size
         )
+        self.redis_batch_get_window = redis_batch_get_window
+        self._redis_batch_get_coalescers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, RedisBatchGetCoalescer]" = weakref.WeakKeyDictionary()
         self.redis_batch_cache_expiry = (
             default_redis_batch_cache_expiry
             or litellm.default_redis_batch_cache_expiry
@@ -80,6 +165,8 @@ class DualCache(BaseCache):
             default_in_memory_ttl or litellm.default_in_memory_ttl
         )
         self.default_redis_ttl = default_redis_ttl or litellm.default_redis_ttl
+        # pushes in-memory evictions to other instances, see `async_invalidate_cache`
+        self.cache_invalidator: Optional["CacheInvalidator"] = None
 
     def update_cache_ttl(
         self, default_in_memory_ttl: Optional[float], default_redis_ttl: Optional[float]
@@ -155,7 +242,7 @@ class DualCache(BaseCache):
 
                 result = redis_result
 
-            print_verbose(f"get cache: cache result: {result}")
+            verbose_logger.debug("get cache: cache result: %s", result)
             return result
         except Exception:
             verbose_logger.error(traceback.format_exc())
@@ -213,7 +300,7 @@ class DualCache(BaseCache):
                     key, **kwargs
                 )
 
-                print_verbose(f"in_memory_result: {in_memory_result}")
+                verbose_logger.debug("in_memory_result: %s", in_memory_result)
                 if in_memory_result is not None:
                     result = in_memory_result
 
@@ -231,11 +318,26 @@ class DualCache(BaseCache):
 
                 result = redis_result
 
-            print_verbose(f"get cache: cache result: {result}")
+            verbose_logger.debug("get cache: cache result: %s", result)
             return result
         except Exception:
             verbose_logger.error(traceback.format_exc())
 
+    def _get_redis_batch_get_coalescer(self) -> RedisBatchGetCoalescer:
+        """
+        Concurrent batch gets are coalesced per event loop - asyncio futures can't be shared across event loops
+        """
+        loop = asyncio.get_running_loop()
+        coalescer = self._redis_batch_get_coalescers.get(loop)
+        if coalescer is None or coalescer.redis_cache is not self.redis_cache:
+            coalescer = self._redis_batch_get_coalescers[loop] = (
+                RedisBatchGetCoalescer(
+                    redis_cache=self.redis_cache,  # type: ignore
+                    batch_window=self.redis_batch_get_window,
+                )
+            )
+        return coalescer
+
     def get_redis_batch_keys(
         self,
         current_time: float,
@@ -278,34 +380,29 @@ class DualCache(BaseCache):
                 current_time = time.time()
                 sublist_keys = self.get_redis_batch_keys(current_time, keys, result)
 
-                # Only hit Redis if the last access time was more than 5 seconds ago
+                # Only hit Redis if the key wasn't missing from Redis within the last `redis_batch_cache_expiry` seconds
                 if len(sublist_keys) > 0:
                     # If not found in in-memory cache, try fetching from Redis
-                    redis_result = await self.redis_cache.async_batch_get_cache(
+                    # concurrent callers share 1 MGET
+                    coalescer = self._get_redis_batch_get_coalescer()
+                    redis_result = await coalescer.async_batch_get(
                         sublist_keys, parent_otel_span=parent_otel_span
                     )
-                    
-                    # Update the last access time for ALL queried keys
-                    # This includes keys with None values to throttle repeated Redis queries
-                    for key in sublist_keys:
-                        self.last_redis_batch_access_time[key] = current_time
-                    
-                    # Short-circuit if redis_result is None or contains only None values
-                    if redis_result is None or all(v is None for v in redis_result.values()):
-                        return result
-
-                    # Pre-compute key-to-index mapping for O(1) lookup
-                    key_to_index = {key: i for i, key in enumerate(keys)}
-                    
-                    # Update both result and in-memory cache in a single loop
+
                     for key, value in redis_result.items():
-                        result[key_to_index[key]] = value
-                        
-                        if value is not None and self.in_memory_cache is not None:
+                        if value is None:
+                            # negative cache - throttle repeated Redis queries for missing keys
+                            self.last_redis_batch_access_time[key] = current_time
+                        elif self.in_memory_cache is not None:
                             await self.in_memory_cache.async_set_cache(
                                 key, value, **kwargs
                             )
 
+                    # Update the result in a single pass - keys can be repeated
+                    for i, key in enumerate(keys):
+                        if result[i] is None:
+                            result[i] = redis_result.get(key)
+
             return result
         except Exception:
             verbose_logger.error(traceback.format_exc())
@@ -460,6 +557,19 @@ class DualCache(BaseCache):
         if self.redis_cache is not None:
             await self.redis_cache.async_delete_cache(key)
 
+    async def async_invalidate_cache(
+        self, keys: List[str], skip_local: bool = False
+    ) -> None:
+        """
+        Evict keys from the in-memory cache - of this instance (unless `skip_local`), and of every instance subscribed
+        to the same channel, if a `cache_invalidator` is set
+        """
+        if self.cache_invalidator is not None:
+            await self.cache_invalidator.invalidate(keys=keys, skip_local=skip_local)
+        elif not skip_local:
+            for key in keys:
+                self.in_memory_cache.delete_cache(key)
+
     async def async_get_ttl(self, key: str) -> Optional[int]:
         """
         Get the remaining TTL of a key in in-memory cache or redis
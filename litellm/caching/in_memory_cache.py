@@ -6,23 +6,73 @@ Has 4 methods:
     - get_cache
     - async_set_cache
     - async_get_cache
+
+Storage engine:
+    - `cache_dict` is an OrderedDict kept in LRU order (get / set are O(1))
+    - expiry is lazy: keys are checked on read, and a hashed timing wheel (1 slot per second)
+      is swept at most once per second to drop expired keys without scanning the whole cache
+    - capacity is bounded by number of items and, optionally, by (approximate) total size in bytes
 """
 
 import json
 import sys
 import time
-import heapq
-from typing import TYPE_CHECKING, Any, List, Optional
+from collections import OrderedDict
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+from pydantic import BaseModel
 
 if TYPE_CHECKING:
     from litellm.types.caching import RedisPipelineIncrementOperation
 
-from pydantic import BaseModel
-
-from litellm.constants import MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB
+from litellm.constants import (
+    IN_MEMORY_CACHE_SIZE_MAX_DEPTH,
+    IN_MEMORY_CACHE_SIZE_SAMPLE_ITEMS,
+    IN_MEMORY_CACHE_TIMING_WHEEL_SLOTS,
+    MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB,
+)
+from litellm.types.caching import InMemoryCacheStats
 
 from .base_cache import BaseCache
 
+_SCALAR_TYPES = (str, bytes, bytearray, int, float, bool, type(None))
+
+
+def _estimate_size_in_bytes(value: Any, depth: int) -> int:
+    """
+    `sys.getsizeof` of `value` + its items / pydantic fields, `depth` levels down.
+
+    At most `IN_MEMORY_CACHE_SIZE_SAMPLE_ITEMS` items of a container are sized - the rest are assumed to be the same size
+    on average, so this is bounded for any value.
+    """
+    size = sys.getsizeof(value)
+    if depth <= 0 or isinstance(value, _SCALAR_TYPES):
+        return size
+    if isinstance(value, BaseModel):
+        value = value.__dict__
+    if isinstance(value, dict):
+        num_items = len(value)
+        sampled_items_size = sum(
+            _estimate_size_in_bytes(item_key, depth - 1)
+            + _estimate_size_in_bytes(item_value, depth - 1)
+            for item_key, item_value in islice(
+                value.items(), IN_MEMORY_CACHE_SIZE_SAMPLE_ITEMS
+            )
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        num_items = len(value)
+        sampled_items_size = sum(
+            _estimate_size_in_bytes(item, depth - 1)
+            for item in islice(value, IN_MEMORY_CACHE_SIZE_SAMPLE_ITEMS)
+        )
+    else:
+        return size
+    num_sampled_items = min(num_items, IN_MEMORY_CACHE_SIZE_SAMPLE_ITEMS)
+    if num_sampled_items == 0:
+        return size
+    return size + sampled_items_size * num_items // num_sampled_items
+
 
 class InMemoryCache(BaseCache):
     def __init__(
@@ -32,9 +82,12 @@ class InMemoryCache(BaseCache):
             int
         ] = 600,  # default ttl is 10 minutes. At maximum litellm rate limiting logic requires objects to be in memory for 1 minute
         max_size_per_item: Optional[int] = 1024,  # 1MB = 1024KB
+        max_size_in_bytes: Optional[int] = None,
     ):
         """
         max_size_in_memory [int]: Maximum number of items in cache. done to prevent memory leaks. Use 200 items as a default
+        max_size_per_item [Optional[int]]: Maximum size of 1 value in KB - the shallow `sys.getsizeof` of the value
+        max_size_in_bytes [Optional[int]]: Maximum total size of cached values in bytes (approximate, see `_get_value_size_in_bytes`). Not bounded by default.
         """
         self.max_size_in_memory = (
             max_size_in_memory if max_size_in_memory is not None else 200
@@ -43,49 +96,46 @@ class InMemoryCache(BaseCache):
         self.max_size_per_item = (
             max_size_per_item or MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB
         )  # 1MB = 1024KB
+        self.max_size_in_bytes = max_size_in_bytes
 
-        # in-memory cache
-        self.cache_dict: dict = {}
+        # in-memory cache, ordered from least to most recently used
+        self.cache_dict: "OrderedDict[str, Any]" = OrderedDict()
         self.ttl_dict: dict = {}
-        self.expiration_heap: list[tuple[float, str]] = []
+
+        # size accounting
+        self._size_dict: Dict[str, int] = {}
+        self._current_size_in_bytes: int = 0
+
+        # hashed timing wheel - slot index -> keys expiring in that second
+        self._timing_wheel: Dict[int, Set[str]] = {}
+        self._timing_wheel_slots = max(IN_MEMORY_CACHE_TIMING_WHEEL_SLOTS, 1)
+        self._last_swept_tick: int = int(time.time())
+
+        # stats
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def _get_value_size_in_bytes(self, value: Any) -> int:
+        """
+        Approximate deep size of a value, counted against max_size_in_bytes. Computed once per set, only when
+        max_size_in_bytes is set.
+
+        Containers / pydantic models are walked `IN_MEMORY_CACHE_SIZE_MAX_DEPTH` levels down, sampling at most
+        `IN_MEMORY_CACHE_SIZE_SAMPLE_ITEMS` items per container. Never serializes the value.
+        """
+        return _estimate_size_in_bytes(value, depth=IN_MEMORY_CACHE_SIZE_MAX_DEPTH)
 
     def check_value_size(self, value: Any):
         """
         Check if value size exceeds max_size_per_item (1MB)
         Returns True if value size is acceptable, False otherwise
+
+        The shallow size is checked, so large router / auth objects (e.g. a map of deployments) are still cached.
         """
         try:
-            # Fast path for common primitive types that are typically small
-            if (
-                isinstance(value, (bool, int, float, str))
-                and len(str(value))
-                < self.max_size_per_item * MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB
-            ):  # Conservative estimate
-                return True
-
-            # Direct size check for bytes objects
-            if isinstance(value, bytes):
-                return sys.getsizeof(value) / 1024 <= self.max_size_per_item
-
-            # Handle special types without full conversion when possible
-            if hasattr(value, "__sizeof__"):  # Use __sizeof__ if available
-                size = value.__sizeof__() / 1024
-                return size <= self.max_size_per_item
-
-            # Fallback for complex types
-            if isinstance(value, BaseModel) and hasattr(
-                value, "model_dump"
-            ):  # Pydantic v2
-                value = value.model_dump()
-            elif hasattr(value, "isoformat"):  # datetime objects
-                return True  # datetime strings are always small
-
-            # Only convert to JSON if absolutely necessary
-            if not isinstance(value, (str, bytes)):
-                value = json.dumps(value, default=str)
-
-            return sys.getsizeof(value) / 1024 <= self.max_size_per_item
-
+            return sys.getsizeof(value) <= self.max_size_per_item * 1024
         except Exception:
             return False
 
@@ -95,49 +145,104 @@ class InMemoryCache(BaseCache):
         """
         return key in self.ttl_dict and time.time() > self.ttl_dict[key]
 
+    def _add_key_to_timing_wheel(self, key: str, expiration_time: float) -> None:
+        slot = int(expiration_time) % self._timing_wheel_slots
+        bucket = self._timing_wheel.get(slot)
+        if bucket is None:
+            bucket = self._timing_wheel[slot] = set()
+        bucket.add(key)
+
+    def _remove_key_from_timing_wheel(self, key: str, expiration_time: float) -> None:
+        slot = int(expiration_time) % self._timing_wheel_slots
+        bucket = self._timing_wheel.get(slot)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._timing_wheel[slot]
+
     def _remove_key(self, key: str) -> None:
         """
         Remove a key from both cache_dict and ttl_dict
         """
         self.cache_dict.pop(key, None)
-        self.ttl_dict.pop(key, None)
+        expiration_time = self.ttl_dict.pop(key, None)
+        if expiration_time is not None:
+            self._remove_key_from_timing_wheel(key, expiration_time)
+        self._current_size_in_bytes -= self._size_dict.pop(key, 0)
+
+    def _expire_keys(self, current_time: float) -> None:
+        """
+        Advance the timing wheel to `current_time`, removing expired keys.
+
+        Only slots for fully elapsed seconds are swept, so this does work at most once per second.
+        Keys that expire within the current second are caught lazily on read.
+        """
+        current_tick = int(current_time)
+        if current_tick - 1 <= self._last_swept_tick:
+            return
+        if current_tick - 1 - self._last_swept_tick >= self._timing_wheel_slots:
+            slots_to_sweep = list(self._timing_wheel.keys())
+        else:
+            slots_to_sweep = [
+                tick % self._timing_wheel_slots
+                for tick in range(self._last_swept_tick + 1, current_tick)
+            ]
+        self._last_swept_tick = current_tick - 1
+
+        for slot in slots_to_sweep:
+            bucket = self._timing_wheel.get(slot)
+            if not bucket:
+                continue
+            for key in list(bucket):
+                expiration_time = self.ttl_dict.get(key)
+                if expiration_time is None:
+                    bucket.discard(key)
+                elif expiration_time <= current_time:
+                    self._remove_key(key)
+                    self.expirations += 1
+                # else: key belongs to a later rotation of the wheel, leave it
+            if not bucket:
+                self._timing_wheel.pop(slot, None)
+
+    def _is_over_capacity(
+        self, incoming_size_in_bytes: int = 0, is_new_key: bool = True
+    ) -> bool:
+        max_items = self.max_size_in_memory if is_new_key else self.max_size_in_memory + 1
+        if len(self.cache_dict) >= max_items:
+            return True
+        if (
+            self.max_size_in_bytes is not None
+            and self._current_size_in_bytes + incoming_size_in_bytes
+            > self.max_size_in_bytes
+        ):
+            return True
+        return False
 
-    def evict_cache(self):
+    def evict_cache(self, incoming_size_in_bytes: int = 0, is_new_key: bool = True):
         """
         Eviction policy:
-        1. First, remove expired items from ttl_dict and cache_dict
-        2. If cache is still at or above max_size_in_memory, evict items with earliest expiration times
+        1. First, remove expired items by sweeping the timing wheel
+        2. If cache is still at or above max_size_in_memory / max_size_in_bytes, evict least recently used items
 
 
         This guarantees the following:
-        - 1. When item ttl not set: At minimum each item will remain in memory for the default ttl
+        - 1. When item ttl not set: the item remains in memory for the default ttl, unless cache size requires eviction
         - 2. When ttl is set: the item will remain in memory for at least that amount of time, unless cache size requires eviction
         - 3. the size of in-memory cache is bounded
 
         """
+        # Step 1: Remove expired items
         current_time = time.time()
+        if int(current_time) - 1 > self._last_swept_tick:
+            self._expire_keys(current_time)
 
-        # Step 1: Remove expired or outdated items
-        while self.expiration_heap:
-            expiration_time, key = self.expiration_heap[0]
-
-            # Case 1: Heap entry is outdated
-            if expiration_time != self.ttl_dict.get(key):
-                heapq.heappop(self.expiration_heap)
-            # Case 2: Entry is valid but expired
-            elif expiration_time <= current_time:
-                heapq.heappop(self.expiration_heap)
-                self._remove_key(key)
-            else:
-                # Case 3: Entry is valid and not expired
-                break
-
-        # Step 2: Evict if cache is still full
-        while len(self.cache_dict) >= self.max_size_in_memory:
-            expiration_time, key = heapq.heappop(self.expiration_heap)
-            # Skip if key was removed or updated
-            if self.ttl_dict.get(key) == expiration_time:
-                self._remove_key(key)
+        # Step 2: Evict least recently used items if cache is still full
+        cache_dict = self.cache_dict
+        while cache_dict and self._is_over_capacity(
+            incoming_size_in_bytes=incoming_size_in_bytes, is_new_key=is_new_key
+        ):
+            self._remove_key(next(iter(cache_dict)))
+            self.evictions += 1
 
         # de-reference the removed item
         # https://www.geeksforgeeks.org/diagnosing-and-fixing-memory-leaks-in-python/
@@ -161,20 +266,74 @@ class InMemoryCache(BaseCache):
         if self.max_size_in_memory == 0:
             return  # Don't cache anything if max size is 0
 
-        if len(self.cache_dict) >= self.max_size_in_memory:
-            # only evict when cache is full
-            self.evict_cache()
-        if not self.check_value_size(value):
+        # inlined `check_value_size`, set_cache is on the hot path
+        try:
+            value_size = sys.getsizeof(value)
+            if value_size > self.max_size_per_item * 1024:
+                return
+            if self.max_size_in_bytes is not None:
+                value_size = self._get_value_size_in_bytes(value)
+        except Exception:
             return
 
-        self.cache_dict[key] = value
-        if self.allow_ttl_override(key):  # if ttl is not set, set it to default ttl
-            if "ttl" in kwargs and kwargs["ttl"] is not None:
-                self.ttl_dict[key] = time.time() + float(kwargs["ttl"])
-                heapq.heappush(self.expiration_heap, (self.ttl_dict[key], key))
+        current_time = time.time()
+        if int(current_time) - 1 > self._last_swept_tick:
+            self._expire_keys(current_time)
+
+        cache_dict = self.cache_dict
+        size_dict = self._size_dict
+        # `_size_dict` and `ttl_dict` hold exactly the keys of `cache_dict`
+        previous_size = size_dict.get(key)
+        if previous_size is None:
+            previous_expiration_time = None
+            if self.max_size_in_bytes is not None:
+                if (
+                    len(cache_dict) >= self.max_size_in_memory
+                    or self._current_size_in_bytes + value_size
+                    > self.max_size_in_bytes
+                ):
+                    # only evict when cache is full
+                    self.evict_cache(
+                        incoming_size_in_bytes=value_size, is_new_key=True
+                    )
+            else:
+                # expired keys were swept above - evict least recently used keys while the cache is full
+                while len(cache_dict) >= self.max_size_in_memory:
+                    self._remove_key(next(iter(cache_dict)))
+                    self.evictions += 1
+        else:
+            cache_dict.move_to_end(key)
+            if (
+                self.max_size_in_bytes is not None
+                and self._current_size_in_bytes - previous_size + value_size
+                > self.max_size_in_bytes
+            ):
+                # drop the previous size of this key before evicting, it's replaced below
+                self._current_size_in_bytes -= size_dict.pop(key)
+                self.evict_cache(incoming_size_in_bytes=value_size, is_new_key=False)
             else:
-                self.ttl_dict[key] = time.time() + self.default_ttl
-                heapq.heappush(self.expiration_heap, (self.ttl_dict[key], key))
+                self._current_size_in_bytes -= previous_size
+            previous_expiration_time = self.ttl_dict.get(key)
+
+        cache_dict[key] = value
+        size_dict[key] = value_size
+        self._current_size_in_bytes += value_size
+
+        # if ttl is not set, or is expired, allow override
+        if previous_expiration_time is None or previous_expiration_time < current_time:
+            if previous_expiration_time is not None:
+                self._remove_key_from_timing_wheel(key, previous_expiration_time)
+            ttl = kwargs.get("ttl")
+            expiration_time = current_time + (
+                float(ttl) if ttl is not None else self.default_ttl
+            )
+            self.ttl_dict[key] = expiration_time
+            # inlined `_add_key_to_timing_wheel`
+            slot = int(expiration_time) % self._timing_wheel_slots
+            bucket = self._timing_wheel.get(slot)
+            if bucket is None:
+                bucket = self._timing_wheel[slot] = set()
+            bucket.add(key)
 
     async def async_set_cache(self, key, value, **kwargs):
         self.set_cache(key=key, value=value, **kwargs)
@@ -205,19 +364,31 @@ class InMemoryCache(BaseCache):
         """
         if self._is_key_expired(key):
             self._remove_key(key)
+            self.expirations += 1
             return True
         return False
 
     def get_cache(self, key, **kwargs):
-        if key in self.cache_dict:
-            if self.evict_element_if_expired(key):
+        cache_dict = self.cache_dict
+        if key in cache_dict:
+            # inlined `evict_element_if_expired`
+            expiration_time = self.ttl_dict.get(key)
+            if expiration_time is not None and time.time() > expiration_time:
+                self._remove_key(key)
+                self.expirations += 1
+                self.misses += 1
                 return None
-            original_cached_response = self.cache_dict[key]
+            cache_dict.move_to_end(key)
+            self.hits += 1
+            original_cached_response = cache_dict[key]
+            if not isinstance(original_cached_response, (str, bytes, bytearray)):
+                return original_cached_response
             try:
                 cached_response = json.loads(original_cached_response)
             except Exception:
                 cached_response = original_cached_response
             return cached_response
+        self.misses += 1
         return None
 
     def batch_get_cache(self, keys: list, **kwargs):
@@ -265,7 +436,9 @@ class InMemoryCache(BaseCache):
     def flush_cache(self):
         self.cache_dict.clear()
         self.ttl_dict.clear()
-        self.expiration_heap.clear()
+        self._size_dict.clear()
+        self._current_size_in_bytes = 0
+        self._timing_wheel.clear()
 
     async def disconnect(self):
         pass
@@ -273,6 +446,19 @@ class InMemoryCache(BaseCache):
     def delete_cache(self, key):
         self._remove_key(key)
 
+    def get_cache_stats(self) -> InMemoryCacheStats:
+        """
+        Get hit / miss / eviction counters and the current size of the cache
+        """
+        return InMemoryCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+            num_items=len(self.cache_dict),
+            size_in_bytes=self._current_size_in_bytes,
+        )
+
     async def async_get_ttl(self, key: str) -> Optional[int]:
         """
         Get the remaining TTL of a key in in-memory cache
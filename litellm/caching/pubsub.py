@@ -0,0 +1,169 @@
+"""
+Pub/sub channels, to push messages between instances (pods / workers)
+
+Channels:
+- `RedisPubSubChannel` - redis pub/sub
+- `InMemoryPubSubChannel` - process-local stand-in (e.g. for tests)
+
+Messages are json-serializable dicts. Delivery is at-most-once - subscribers get `on_reset` called when messages may
+have been missed (e.g. after a reconnect), and are expected to resync their state then.
+"""
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+from litellm._logging import verbose_logger
+
+from .redis_cache import RedisCache
+
+REDIS_PUBSUB_POLL_TIMEOUT_SECONDS = 1.0
+REDIS_PUBSUB_MIN_RECONNECT_BACKOFF_SECONDS = 1.0
+REDIS_PUBSUB_MAX_RECONNECT_BACKOFF_SECONDS = 30.0
+
+OnMessage = Callable[[Any], None]
+OnReset = Callable[[], None]
+
+
+class PubSubChannel(ABC):
+    is_subscribed: bool = False
+    """True while messages are being delivered to the subscriber"""
+
+    @abstractmethod
+    async def publish(self, message: dict) -> None:
+        pass
+
+    @abstractmethod
+    async def subscribe(self, on_message: OnMessage, on_reset: OnReset) -> None:
+        """
+        Start delivering messages to `on_message`. `on_reset` is called when messages may have been missed.
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryPubSubChannel(PubSubChannel):
+    """
+    Process-local channel. Instances with the same `channel` name receive each other's messages.
+    """
+
+    _subscribers: Dict[str, List["InMemoryPubSubChannel"]] = defaultdict(list)
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self.on_message: Optional[OnMessage] = None
+
+    async def publish(self, message: dict) -> None:
+        payload = json.dumps(message)  # same serialization as redis
+        for subscriber in list(self._subscribers[self.channel]):
+            if subscriber.on_message is not None:
+                subscriber.on_message(json.loads(payload))
+
+    async def subscribe(self, on_message: OnMessage, on_reset: OnReset) -> None:
+        self.on_message = on_message
+        if self not in self._subscribers[self.channel]:
+            self._subscribers[self.channel].append(self)
+        self.is_subscribed = True
+
+    async def close(self) -> None:
+        if self in self._subscribers[self.channel]:
+            self._subscribers[self.channel].remove(self)
+        self.is_subscribed = False
+        self.on_message = None
+
+
+class RedisPubSubChannel(PubSubChannel):
+    def __init__(self, redis_cache: RedisCache, channel: str):
+        self.redis_cache = redis_cache
+        self.channel = channel
+        self._listen_task: Optional[asyncio.Task] = None
+        self._subscribed_before = False
+
+    async def publish(self, message: dict) -> None:
+        client = self.redis_cache.init_async_client()
+        await client.publish(self.channel, json.dumps(message))  # type: ignore
+
+    async def subscribe(self, on_message: OnMessage, on_reset: OnReset) -> None:
+        """
+        Starts the listener, if it isn't running - e.g. a listener that was cancelled is restarted, and calls `on_reset`
+        once subscribed again.
+        """
+        if self._listen_task is None or self._listen_task.done():
+            self._listen_task = asyncio.create_task(
+                self._listen(on_message=on_message, on_reset=on_reset)
+            )
+
+    async def close(self) -> None:
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except asyncio.CancelledError:
+                pass
+            self._listen_task = None
+        self.is_subscribed = False
+
+    async def _listen(self, on_message: OnMessage, on_reset: OnReset) -> None:
+        try:
+            await self._listen_until_cancelled(
+                on_message=on_message, on_reset=on_reset
+            )
+        finally:
+            # the listener stopped (cancelled, or its event loop closed) - no more messages are delivered
+            self.is_subscribed = False
+
+    async def _listen_until_cancelled(
+        self, on_message: OnMessage, on_reset: OnReset
+    ) -> None:
+        backoff = REDIS_PUBSUB_MIN_RECONNECT_BACKOFF_SECONDS
+        while True:
+            pubsub = None
+            try:
+                client = self.redis_cache.init_async_client()
+                pubsub = client.pubsub()  # type: ignore
+                await pubsub.subscribe(self.channel)
+                self.is_subscribed = True
+                if self._subscribed_before:
+                    # messages published while disconnected are lost
+                    on_reset()
+                self._subscribed_before = True
+                backoff = REDIS_PUBSUB_MIN_RECONNECT_BACKOFF_SECONDS
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=REDIS_PUBSUB_POLL_TIMEOUT_SECONDS,
+                    )
+                    if message is None or message.get("type") != "message":
+                        continue
+                    try:
+                        on_message(json.loads(message["data"]))
+                    except Exception as e:
+                        verbose_logger.debug(
+                            "Unable to handle message on pub/sub channel %s. Error - %s",
+                            self.channel,
+                            str(e),
+                        )
+                        on_reset()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.is_subscribed = False
+                verbose_logger.warning(
+                    "Pub/sub channel %s disconnected, reconnecting in %ss. Error - %s",
+                    self.channel,
+                    backoff,
+                    str(e),
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, REDIS_PUBSUB_MAX_RECONNECT_BACKOFF_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.reset()
+                    except Exception:
+                        pass
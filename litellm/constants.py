@@ -18,10 +18,16 @@ DEFAULT_NUM_WORKERS_LITELLM_PROXY = int(
     os.getenv("DEFAULT_NUM_WORKERS_LITELLM_PROXY", 1)
 )
 DYNAMIC_RATE_LIMIT_ERROR_THRESHOLD_PER_MINUTE = int(os.getenv("DYNAMIC_RATE_LIMIT_ERROR_THRESHOLD_PER_MINUTE", 1))
+RATE_LIMIT_SLIDING_WINDOW_BUCKETS = int(
+    os.getenv("RATE_LIMIT_SLIDING_WINDOW_BUCKETS", 10)
+)
 DEFAULT_SQS_BATCH_SIZE = int(os.getenv("DEFAULT_SQS_BATCH_SIZE", 512))
 SQS_SEND_MESSAGE_ACTION = "SendMessage"
 SQS_API_VERSION = "2012-11-05"
 DEFAULT_MAX_RETRIES = int(os.getenv("DEFAULT_MAX_RETRIES", 2))
+DEFAULT_BATCH_COMPLETION_MAX_CONCURRENCY = int(
+    os.getenv("DEFAULT_BATCH_COMPLETION_MAX_CONCURRENCY", 100)
+)
 DEFAULT_MAX_RECURSE_DEPTH = int(os.getenv("DEFAULT_MAX_RECURSE_DEPTH", 100))
 DEFAULT_MAX_RECURSE_DEPTH_SENSITIVE_DATA_MASKER = int(
     os.getenv("DEFAULT_MAX_RECURSE_DEPTH_SENSITIVE_DATA_MASKER", 10)
@@ -42,9 +48,37 @@ DEFAULT_REPLICATE_POLLING_DELAY_SECONDS = int(
 DEFAULT_IMAGE_TOKEN_COUNT = int(os.getenv("DEFAULT_IMAGE_TOKEN_COUNT", 250))
 DEFAULT_IMAGE_WIDTH = int(os.getenv("DEFAULT_IMAGE_WIDTH", 300))
 DEFAULT_IMAGE_HEIGHT = int(os.getenv("DEFAULT_IMAGE_HEIGHT", 300))
+IMAGE_DIMENSION_PROBE_BYTES = int(
+    os.getenv("IMAGE_DIMENSION_PROBE_BYTES", 8192)
+)  # bytes fetched (Range request) to read an image's dimensions from its header
+IMAGE_DIMENSION_CACHE_TTL_SECONDS = int(
+    os.getenv("IMAGE_DIMENSION_CACHE_TTL_SECONDS", 3600)
+)
+IMAGE_DIMENSION_CACHE_MAX_SIZE = int(os.getenv("IMAGE_DIMENSION_CACHE_MAX_SIZE", 1000))
+TOKEN_COUNTER_MESSAGE_CACHE_SIZE = int(
+    os.getenv("TOKEN_COUNTER_MESSAGE_CACHE_SIZE", 4096)
+)
+DEFAULT_TOKEN_ESTIMATOR_BYTES_PER_TOKEN = float(
+    os.getenv("DEFAULT_TOKEN_ESTIMATOR_BYTES_PER_TOKEN", 4.0)
+)  # starting point for `estimate_token_count`, before it's calibrated against exact counts
+TOKEN_ESTIMATOR_MAX_TOKENIZERS = int(
+    os.getenv("TOKEN_ESTIMATOR_MAX_TOKENIZERS", 256)
+)  # tokenizers `estimate_token_count` keeps a calibrated bytes / token ratio for
+REQUEST_TOKEN_COUNT_MEMO_SIZE = int(
+    os.getenv("REQUEST_TOKEN_COUNT_MEMO_SIZE", 1024)
+)  # recent requests `get_request_token_count` remembers the input token count of
 MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB = int(
     os.getenv("MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB", 1024)
 )  # 1MB = 1024KB
+IN_MEMORY_CACHE_TIMING_WHEEL_SLOTS = int(
+    os.getenv("IN_MEMORY_CACHE_TIMING_WHEEL_SLOTS", 600)
+)  # 1 slot per second, the wheel covers a 10 minute window before wrapping
+IN_MEMORY_CACHE_SIZE_MAX_DEPTH = int(
+    os.getenv("IN_MEMORY_CACHE_SIZE_MAX_DEPTH", 3)
+)  # levels of nested containers / pydantic fields counted in the size of a value, for max_size_in_bytes
+IN_MEMORY_CACHE_SIZE_SAMPLE_ITEMS = int(
+    os.getenv("IN_MEMORY_CACHE_SIZE_SAMPLE_ITEMS", 32)
+)  # items sized per container, the rest are extrapolated
 SINGLE_DEPLOYMENT_TRAFFIC_FAILURE_THRESHOLD = int(
     os.getenv("SINGLE_DEPLOYMENT_TRAFFIC_FAILURE_THRESHOLD", 1000)
 )  # Minimum number of requests to consider "reasonable traffic". Used for single-deployment cooldown logic.
@@ -135,6 +169,17 @@ MAX_SIZE_IN_MEMORY_QUEUE = int(os.getenv("MAX_SIZE_IN_MEMORY_QUEUE", 10000))
 MAX_IN_MEMORY_QUEUE_FLUSH_COUNT = int(
     os.getenv("MAX_IN_MEMORY_QUEUE_FLUSH_COUNT", 1000)
 )
+SPEND_LOG_QUEUE_MAX_SIZE = int(os.getenv("SPEND_LOG_QUEUE_MAX_SIZE", 100000))
+SPEND_LOG_QUEUE_SPILL_DIR = os.getenv("SPEND_LOG_QUEUE_SPILL_DIR", None)
+SPEND_LOG_QUEUE_SPILL_SEGMENT_SIZE = int(
+    os.getenv("SPEND_LOG_QUEUE_SPILL_SEGMENT_SIZE", 1000)
+)
+SPEND_LOG_MIN_BATCH_SIZE = int(os.getenv("SPEND_LOG_MIN_BATCH_SIZE", 100))
+SPEND_LOG_MAX_BATCH_SIZE = int(os.getenv("SPEND_LOG_MAX_BATCH_SIZE", 1000))
+SPEND_LOG_BATCH_TARGET_LATENCY_SECONDS = float(
+    os.getenv("SPEND_LOG_BATCH_TARGET_LATENCY_SECONDS", 1.0)
+)
+SPEND_LOG_MAX_PARALLEL_WRITES = int(os.getenv("SPEND_LOG_MAX_PARALLEL_WRITES", 4))
 ###############################################################################################
 MINIMUM_PROMPT_CACHE_TOKEN_COUNT = int(
     os.getenv("MINIMUM_PROMPT_CACHE_TOKEN_COUNT", 1024)
@@ -201,6 +246,10 @@ REPEATED_STREAMING_CHUNK_LIMIT = int(
     os.getenv("REPEATED_STREAMING_CHUNK_LIMIT", 100)
 )  # catch if model starts looping the same chunk while streaming. Uses high default to prevent false positives.
 DEFAULT_MAX_LRU_CACHE_SIZE = int(os.getenv("DEFAULT_MAX_LRU_CACHE_SIZE", 16))
+MODEL_INFO_INDEX_MAX_SIZE = int(os.getenv("MODEL_INFO_INDEX_MAX_SIZE", 4096))
+LLM_PROVIDER_RESOLVER_CACHE_SIZE = int(
+    os.getenv("LLM_PROVIDER_RESOLVER_CACHE_SIZE", 4096)
+)
 INITIAL_RETRY_DELAY = float(os.getenv("INITIAL_RETRY_DELAY", 0.5))
 MAX_RETRY_DELAY = float(os.getenv("MAX_RETRY_DELAY", 8.0))
 JITTER = float(os.getenv("JITTER", 0.75))
@@ -210,9 +259,30 @@ DEFAULT_IN_MEMORY_TTL = int(
 DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE = int(
     os.getenv("DEFAULT_MAX_REDIS_BATCH_CACHE_SIZE", 1000)
 )  # default max size for redis batch cache
+DEFAULT_REDIS_BATCH_GET_WINDOW = float(
+    os.getenv("DEFAULT_REDIS_BATCH_GET_WINDOW", 0.0)
+)  # seconds to wait, to merge concurrent redis batch gets into 1 MGET. 0 = merge gets of the same event loop iteration
 DEFAULT_POLLING_INTERVAL = float(
     os.getenv("DEFAULT_POLLING_INTERVAL", 0.03)
 )  # default polling interval for the scheduler
+SCHEDULER_PRIORITY_AGING_SECONDS = float(
+    os.getenv("SCHEDULER_PRIORITY_AGING_SECONDS", 0)
+)  # a queued request gains 1 priority level per this many seconds waited. 0 = strict priority (aging off)
+SCHEDULER_REDIS_QUEUE_TTL_SECONDS = int(
+    os.getenv("SCHEDULER_REDIS_QUEUE_TTL_SECONDS", 3600)
+)  # ttl of a model group's redis queue, refreshed on every queued request
+LOGGING_WORKER_MAX_QUEUE_SIZE = int(
+    os.getenv("LOGGING_WORKER_MAX_QUEUE_SIZE", 50_000)
+)  # max queued logging coroutines, per logging worker queue
+LOGGING_WORKER_MAX_TIME_PER_COROUTINE = float(
+    os.getenv("LOGGING_WORKER_MAX_TIME_PER_COROUTINE", 20.0)
+)
+LOGGING_WORKER_CONCURRENCY = int(
+    os.getenv("LOGGING_WORKER_CONCURRENCY", 1)
+)  # number of worker tasks, per logging worker queue
+LOGGING_WORKER_DROP_POLICY = os.getenv(
+    "LOGGING_WORKER_DROP_POLICY", "drop_newest"
+)  # "drop_newest" or "drop_oldest" - which logs to drop when a logging worker queue is full
 AZURE_OPERATION_POLLING_TIMEOUT = int(os.getenv("AZURE_OPERATION_POLLING_TIMEOUT", 120))
 REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 0.1))
 REDIS_CONNECTION_POOL_TIMEOUT = int(os.getenv("REDIS_CONNECTION_POOL_TIMEOUT", 5))
@@ -239,6 +309,16 @@ TOGETHER_AI_EMBEDDING_350_M = int(os.getenv("TOGETHER_AI_EMBEDDING_350_M", 350))
 QDRANT_SCALAR_QUANTILE = float(os.getenv("QDRANT_SCALAR_QUANTILE", 0.99))
 QDRANT_VECTOR_SIZE = int(os.getenv("QDRANT_VECTOR_SIZE", 1536))
 CACHED_STREAMING_CHUNK_DELAY = float(os.getenv("CACHED_STREAMING_CHUNK_DELAY", 0.02))
+CACHE_KEY_MESSAGE_PREFIX_CACHE_SIZE = int(
+    os.getenv("CACHE_KEY_MESSAGE_PREFIX_CACHE_SIZE", 128)
+)
+MODEL_COST_MAP_CACHE_DIR = os.getenv(
+    "LITELLM_MODEL_COST_MAP_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "litellm"),
+)
+MODEL_COST_MAP_REFRESH_TIMEOUT = float(
+    os.getenv("LITELLM_MODEL_COST_MAP_REFRESH_TIMEOUT", 5)
+)
 MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB = int(
     os.getenv("MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB", 512)
 )
@@ -1016,6 +1096,16 @@ BATCH_STATUS_POLL_MAX_ATTEMPTS = int(
 HEALTH_CHECK_TIMEOUT_SECONDS = int(
     os.getenv("HEALTH_CHECK_TIMEOUT_SECONDS", 60)
 )  # 60 seconds
+HEALTH_CHECK_MAX_CONCURRENCY = int(os.getenv("HEALTH_CHECK_MAX_CONCURRENCY", 50))
+BACKGROUND_HEALTH_CHECK_STAGGER_RATIO = float(
+    os.getenv("BACKGROUND_HEALTH_CHECK_STAGGER_RATIO", 0.1)
+)  # spread background health checks over 10% of the health check interval
+LATENCY_PROFILER_EVENT_LOOP_LAG_INTERVAL_SECONDS = float(
+    os.getenv("LATENCY_PROFILER_EVENT_LOOP_LAG_INTERVAL_SECONDS", 0.1)
+)
+LATENCY_PROFILER_MAX_CPU_PROFILE_SECONDS = int(
+    os.getenv("LATENCY_PROFILER_MAX_CPU_PROFILE_SECONDS", 60)
+)
 LITTELM_INTERNAL_HEALTH_SERVICE_ACCOUNT_NAME = "litellm-internal-health-check"
 LITTELM_CLI_SERVICE_ACCOUNT_NAME = "litellm-cli"
 LITELLM_INTERNAL_JOBS_SERVICE_ACCOUNT_NAME = "litellm_internal_jobs"
@@ -1025,6 +1115,9 @@ LITELLM_KEY_ROTATION_ENABLED = os.getenv("LITELLM_KEY_ROTATION_ENABLED", "false"
 LITELLM_KEY_ROTATION_CHECK_INTERVAL_SECONDS = int(os.getenv("LITELLM_KEY_ROTATION_CHECK_INTERVAL_SECONDS", 86400))  # 24 hours default
 UI_SESSION_TOKEN_TEAM_ID = "litellm-dashboard"
 LITELLM_PROXY_ADMIN_NAME = "default_user_id"
+USER_API_KEY_CACHE_INVALIDATION_CHANNEL = "litellm:user_api_key_cache:invalidation"
+ROUTER_COOLDOWN_UPDATES_CHANNEL = "litellm:router:cooldown_updates"
+SCHEDULER_RELEASE_CHANNEL = "litellm:scheduler:released"
 
 ########################### CLI SSO AUTHENTICATION CONSTANTS ###########################
 LITELLM_CLI_SOURCE_IDENTIFIER = "litellm-cli"
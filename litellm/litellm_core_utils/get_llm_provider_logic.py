@@ -1,9 +1,16 @@
-from typing import Optional, Tuple
+import operator
+import threading
+from collections import OrderedDict
+from enum import Enum
+from typing import Dict, FrozenSet, Literal, Optional, Tuple
 
 import httpx
 
 import litellm
-from litellm.constants import REPLICATE_MODEL_NAME_WITH_ID_LENGTH
+from litellm.constants import (
+    LLM_PROVIDER_RESOLVER_CACHE_SIZE,
+    REPLICATE_MODEL_NAME_WITH_ID_LENGTH,
+)
 from litellm.secret_managers.main import get_secret, get_secret_str
 
 from ..types.router import LiteLLM_Params
@@ -85,6 +92,262 @@ def handle_anthropic_text_model_custom_llm_provider(
     return model, custom_llm_provider
 
 
+# (provider, model lists) checked for un-prefixed model names, in order - the first match wins
+_MODEL_LIST_PROVIDERS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (
+        "openai",
+        (
+            "open_ai_chat_completion_models",
+            "openai_image_generation_models",
+            "openai_video_generation_models",
+        ),
+    ),
+    ("text-completion-openai", ("open_ai_text_completion_models",)),
+    ("anthropic", ("anthropic_models",)),
+    ("cohere", ("cohere_models", "cohere_embedding_models")),
+    ("cohere_chat", ("cohere_chat_models",)),
+    ("replicate", ("replicate_models",)),
+    ("openrouter", ("openrouter_models",)),
+    ("maritalk", ("maritalk_models",)),
+    (
+        "vertex_ai",
+        (
+            "vertex_chat_models",
+            "vertex_code_chat_models",
+            "vertex_text_models",
+            "vertex_code_text_models",
+            "vertex_language_models",
+            "vertex_embedding_models",
+            "vertex_vision_models",
+            "vertex_ai_image_models",
+            "vertex_ai_video_models",
+        ),
+    ),
+    ("ai21_chat", ("ai21_chat_models", "ai21_models")),
+    ("aleph_alpha", ("aleph_alpha_models",)),
+    ("baseten", ("baseten_models",)),
+    ("nlp_cloud", ("nlp_cloud_models",)),
+    ("petals", ("petals_models",)),
+    (
+        "bedrock",
+        ("bedrock_models", "bedrock_embedding_models", "bedrock_converse_models"),
+    ),
+    ("watsonx", ("watsonx_models",)),
+    ("openai", ("open_ai_embedding_models",)),
+    ("empower", ("empower_models",)),
+    ("gradient_ai", ("gradient_ai_models",)),
+)
+_REPLICATE_MODEL_LIST_RANK = 5
+
+# checked for un-prefixed model names that aren't in any model list
+_MODEL_PREFIX_PROVIDERS: Tuple[Tuple[str, str], ...] = (
+    ("bytez/", "bytez"),
+    ("lemonade/", "lemonade"),
+    ("heroku/", "heroku"),
+    ("cometapi/", "cometapi"),
+    ("oci/", "oci"),
+    ("compactifai/", "compactifai"),
+    ("ovhcloud/", "ovhcloud"),
+    ("clarifai/", "clarifai"),
+)
+
+# any change to these `litellm` attributes rebuilds the resolver
+_LLM_PROVIDER_RESOLVER_DEPENDENCIES: Tuple[str, ...] = tuple(
+    dict.fromkeys(
+        (
+            "provider_list",
+            "model_list_set",
+            "mistral_chat_models",
+            *(
+                model_list
+                for _, model_lists in _MODEL_LIST_PROVIDERS
+                for model_list in model_lists
+            ),
+        )
+    )
+)
+
+
+_get_llm_provider_resolver_dependencies = operator.itemgetter(
+    *_LLM_PROVIDER_RESOLVER_DEPENDENCIES
+)
+
+
+class LLMProviderResolution:
+    """
+    Part of `get_llm_provider` that only depends on (model, custom_llm_provider) + the `litellm` model lists.
+
+    route:
+    - "azure_non_openai": model="azure/<cohere or mistral model>" -> sent to the openai route
+    - "openai_compatible": model="<provider>/<model>" for an openai-compatible provider -> api base / key are read per call
+    - "provider_prefix": model="<provider>/<model>"
+    - "model_name": provider inferred from the model name, None if it's unknown
+    """
+
+    __slots__ = ("route", "model", "custom_llm_provider")
+
+    def __init__(
+        self,
+        route: Literal[
+            "azure_non_openai", "openai_compatible", "provider_prefix", "model_name"
+        ],
+        model: str,
+        custom_llm_provider: Optional[str],
+    ):
+        self.route = route
+        self.model = model
+        self.custom_llm_provider = custom_llm_provider
+
+
+class LLMProviderResolver:
+    """
+    Memoized (model, custom_llm_provider) -> `LLMProviderResolution`
+
+    Provider prefixes + model names are looked up in tables built from `litellm.provider_list` and the model lists.
+    Resolutions are bounded to `max_size` (oldest dropped first). Both are rebuilt when one of the model lists is
+    reassigned or changes size.
+    """
+
+    def __init__(self, max_size: int = LLM_PROVIDER_RESOLVER_CACHE_SIZE):
+        self.max_size = max_size
+        self._dependencies: Optional[tuple] = None
+        self._dependencies_size = 0
+        self._provider_names: FrozenSet[str] = frozenset()
+        self._model_providers: Dict[str, Tuple[int, str]] = {}
+        self._resolutions: "OrderedDict[Tuple[str, Optional[str]], LLMProviderResolution]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def resolve(
+        self, model: str, custom_llm_provider: Optional[str]
+    ) -> LLMProviderResolution:
+        dependencies = _get_llm_provider_resolver_dependencies(litellm.__dict__)
+        if dependencies != self._dependencies or self._dependencies_size != sum(
+            map(len, dependencies)
+        ):
+            self._build(dependencies)
+
+        resolution_key = (model, custom_llm_provider)
+        resolution = self._resolutions.get(resolution_key)
+        if resolution is None:
+            resolution = self._resolve(model, custom_llm_provider)
+            with self._lock:
+                self._resolutions[resolution_key] = resolution
+                while len(self._resolutions) > self.max_size:
+                    self._resolutions.popitem(last=False)
+        return resolution
+
+    def _build(self, dependencies: tuple) -> None:
+        model_providers: Dict[str, Tuple[int, str]] = {}
+        for rank, (provider, model_lists) in enumerate(_MODEL_LIST_PROVIDERS):
+            for model_list in model_lists:
+                for model_name in getattr(litellm, model_list):
+                    if model_name in model_providers:
+                        continue
+                    if (
+                        provider == "anthropic"
+                        and litellm.AnthropicTextConfig._is_anthropic_text_model(
+                            model_name
+                        )
+                    ):
+                        model_providers[model_name] = (rank, "anthropic_text")
+                    else:
+                        model_providers[model_name] = (rank, provider)
+        model_providers.setdefault("*", (len(_MODEL_LIST_PROVIDERS), "openai"))
+
+        with self._lock:
+            self._provider_names = frozenset(
+                provider.value if isinstance(provider, Enum) else provider
+                for provider in litellm.provider_list
+            )
+            self._model_providers = model_providers
+            self._resolutions.clear()
+            self._dependencies = dependencies
+            self._dependencies_size = sum(map(len, dependencies))
+
+    def _resolve(
+        self, model: str, custom_llm_provider: Optional[str]
+    ) -> LLMProviderResolution:
+        # AZURE AI-Studio Logic - Azure AI Studio supports AZURE/Cohere
+        # If User passes azure/command-r-plus -> we should send it to cohere_chat/command-r-plus
+        if model.split("/", 1)[0] == "azure" and _is_non_openai_azure_model(model):
+            return LLMProviderResolution(
+                route="azure_non_openai", model=model, custom_llm_provider="openai"
+            )
+
+        ### Handle cases when custom_llm_provider is set to cohere/command-r-plus but it should use cohere_chat route
+        model, custom_llm_provider = handle_cohere_chat_model_custom_llm_provider(
+            model, custom_llm_provider
+        )
+
+        model, custom_llm_provider = handle_anthropic_text_model_custom_llm_provider(
+            model, custom_llm_provider
+        )
+
+        if custom_llm_provider and (
+            model.split("/")[0] != custom_llm_provider
+        ):  # handle scenario where model="azure/*" and custom_llm_provider="azure"
+            model = custom_llm_provider + "/" + model
+
+        # check if llm provider part of model name
+        model_prefix = model.split("/", 1)[0]
+        if model_prefix in self._provider_names:
+            if (
+                model_prefix not in litellm.model_list_set
+                and "/" in model  # handle edge case where user passes in `litellm --model mistral` https://github.com/BerriAI/litellm/issues/1351
+            ):
+                return LLMProviderResolution(
+                    route="openai_compatible", model=model, custom_llm_provider=None
+                )
+            return LLMProviderResolution(
+                route="provider_prefix",
+                model=model.split("/", 1)[1],
+                custom_llm_provider=model_prefix,
+            )
+
+        return LLMProviderResolution(
+            route="model_name",
+            model=model,
+            custom_llm_provider=self._get_model_name_provider(model)
+            or custom_llm_provider,
+        )
+
+    def _get_model_name_provider(self, model: str) -> Optional[str]:
+        """
+        Provider for a model name without a provider prefix, None if it's unknown
+
+        for huggingface models, this is None - they don't have a fixed provider (can be togetherai, anyscale, baseten, runpod, et.)
+        """
+        if "ft:gpt-3.5-turbo" in model or "ft:gpt-4" in model:
+            return "openai"
+        rank, provider = self._model_providers.get(model, (None, None))
+        if rank is not None and rank < _REPLICATE_MODEL_LIST_RANK:
+            return provider
+        ## replicate
+        if rank == _REPLICATE_MODEL_LIST_RANK or (
+            ":" in model and len(model) > REPLICATE_MODEL_NAME_WITH_ID_LENGTH
+        ):
+            model_parts = model.split(":")
+            if (
+                len(model_parts) > 1
+                and len(model_parts[1]) == REPLICATE_MODEL_NAME_WITH_ID_LENGTH
+            ):  ## checks if model name has a 64 digit code - e.g. "meta/llama-2-70b-chat:02e509c789964a7ea8736978a43525956ef40397be9033abf9fd2badfe68c9e3"
+                return "replicate"
+            elif rank == _REPLICATE_MODEL_LIST_RANK:
+                return "replicate"
+            return None
+        if provider is not None:
+            return provider
+        for prefix, prefix_provider in _MODEL_PREFIX_PROVIDERS:
+            if model.startswith(prefix):
+                return prefix_provider
+        return None
+
+
+llm_provider_resolver = LLMProviderResolver()
+
+
 def get_llm_provider(  # noqa: PLR0915
     model: str,
     custom_llm_provider: Optional[str] = None,
@@ -119,47 +382,25 @@ def get_llm_provider(  # noqa: PLR0915
             api_key = litellm_params.api_key
 
         dynamic_api_key = None
-        # check if llm provider provided
-        # AZURE AI-Studio Logic - Azure AI Studio supports AZURE/Cohere
-        # If User passes azure/command-r-plus -> we should send it to cohere_chat/command-r-plus
-        if model.split("/", 1)[0] == "azure":
-            if _is_non_openai_azure_model(model):
-                custom_llm_provider = "openai"
-                return model, custom_llm_provider, dynamic_api_key, api_base
-
-        ### Handle cases when custom_llm_provider is set to cohere/command-r-plus but it should use cohere_chat route
-        model, custom_llm_provider = handle_cohere_chat_model_custom_llm_provider(
-            model, custom_llm_provider
-        )
-
-        model, custom_llm_provider = handle_anthropic_text_model_custom_llm_provider(
-            model, custom_llm_provider
+        resolution = llm_provider_resolver.resolve(
+            model=model, custom_llm_provider=custom_llm_provider
         )
-
-        if custom_llm_provider and (
-            model.split("/")[0] != custom_llm_provider
-        ):  # handle scenario where model="azure/*" and custom_llm_provider="azure"
-            model = custom_llm_provider + "/" + model
+        if resolution.route == "azure_non_openai":
+            return resolution.model, "openai", dynamic_api_key, api_base
+        model = resolution.model
 
         if api_key and api_key.startswith("os.environ/"):
             dynamic_api_key = get_secret_str(api_key)
-        # check if llm provider part of model name
 
-        if (
-            model.split("/", 1)[0] in litellm.provider_list
-            and model.split("/", 1)[0] not in litellm.model_list_set
-            and len(model.split("/"))
-            > 1  # handle edge case where user passes in `litellm --model mistral` https://github.com/BerriAI/litellm/issues/1351
-        ):
+        if resolution.route == "openai_compatible":
             return _get_openai_compatible_provider_info(
                 model=model,
                 api_base=api_base,
                 api_key=api_key,
                 dynamic_api_key=dynamic_api_key,
             )
-        elif model.split("/", 1)[0] in litellm.provider_list:
-            custom_llm_provider = model.split("/", 1)[0]
-            model = model.split("/", 1)[1]
+        elif resolution.route == "provider_prefix":
+            custom_llm_provider = resolution.custom_llm_provider
             if api_base is not None and not isinstance(api_base, str):
                 raise Exception(
                     "api base needs to be a string. api_base={}".format(api_base)
@@ -170,7 +411,7 @@ def get_llm_provider(  # noqa: PLR0915
                         dynamic_api_key
                     )
                 )
-            return model, custom_llm_provider, dynamic_api_key, api_base
+            return model, custom_llm_provider, dynamic_api_key, api_base  # type: ignore
         # check if api base is a known openai compatible endpoint
         if api_base:
             for endpoint in litellm.openai_compatible_endpoints:
@@ -272,120 +513,15 @@ def get_llm_provider(  # noqa: PLR0915
                         )
                     return model, custom_llm_provider, dynamic_api_key, api_base  # type: ignore
 
-        # check if model in known model provider list  -> for huggingface models, raise exception as they don't have a fixed provider (can be togetherai, anyscale, baseten, runpod, et.)
-        ## openai - chatcompletion + text completion
-        if (
-            model in litellm.open_ai_chat_completion_models
-            or "ft:gpt-3.5-turbo" in model
-            or "ft:gpt-4" in model  # catches ft:gpt-4-0613, ft:gpt-4o
-            or model in litellm.openai_image_generation_models
-            or model in litellm.openai_video_generation_models
-        ):
-            custom_llm_provider = "openai"
-        elif model in litellm.open_ai_text_completion_models:
-            custom_llm_provider = "text-completion-openai"
-        ## anthropic
-        elif model in litellm.anthropic_models:
-            if litellm.AnthropicTextConfig._is_anthropic_text_model(model):
-                custom_llm_provider = "anthropic_text"
-            else:
-                custom_llm_provider = "anthropic"
-        ## cohere
-        elif model in litellm.cohere_models or model in litellm.cohere_embedding_models:
-            custom_llm_provider = "cohere"
-        ## cohere chat models
-        elif model in litellm.cohere_chat_models:
-            custom_llm_provider = "cohere_chat"
-        ## replicate
-        elif model in litellm.replicate_models or (
-            ":" in model and len(model) > REPLICATE_MODEL_NAME_WITH_ID_LENGTH
-        ):
-            model_parts = model.split(":")
-            if (
-                len(model_parts) > 1
-                and len(model_parts[1]) == REPLICATE_MODEL_NAME_WITH_ID_LENGTH
-            ):  ## checks if model name has a 64 digit code - e.g. "meta/llama-2-70b-chat:02e509c789964a7ea8736978a43525956ef40397be9033abf9fd2badfe68c9e3"
-                custom_llm_provider = "replicate"
-            elif model in litellm.replicate_models:
-                custom_llm_provider = "replicate"
-        ## openrouter
-        elif model in litellm.openrouter_models:
-            custom_llm_provider = "openrouter"
-        ## maritalk
-        elif model in litellm.maritalk_models:
-            custom_llm_provider = "maritalk"
-        ## vertex - text + chat + language (gemini) models
-        elif (
-            model in litellm.vertex_chat_models
-            or model in litellm.vertex_code_chat_models
-            or model in litellm.vertex_text_models
-            or model in litellm.vertex_code_text_models
-            or model in litellm.vertex_language_models
-            or model in litellm.vertex_embedding_models
-            or model in litellm.vertex_vision_models
-            or model in litellm.vertex_ai_image_models
-            or model in litellm.vertex_ai_video_models
-        ):
-            custom_llm_provider = "vertex_ai"
-        ## ai21
-        elif model in litellm.ai21_chat_models or model in litellm.ai21_models:
-            custom_llm_provider = "ai21_chat"
+        # check if model in known model provider list
+        custom_llm_provider = resolution.custom_llm_provider
+        if custom_llm_provider == "ai21_chat":
             api_base = (
                 api_base
                 or get_secret("AI21_API_BASE")
                 or "https://api.ai21.com/studio/v1"
             )  # type: ignore
             dynamic_api_key = api_key or get_secret("AI21_API_KEY")
-        ## aleph_alpha
-        elif model in litellm.aleph_alpha_models:
-            custom_llm_provider = "aleph_alpha"
-        ## baseten
-        elif model in litellm.baseten_models:
-            custom_llm_provider = "baseten"
-        ## nlp_cloud
-        elif model in litellm.nlp_cloud_models:
-            custom_llm_provider = "nlp_cloud"
-        ## petals
-        elif model in litellm.petals_models:
-            custom_llm_provider = "petals"
-        ## bedrock
-        elif (
-            model in litellm.bedrock_models
-            or model in litellm.bedrock_embedding_models
-            or model in litellm.bedrock_converse_models
-        ):
-            custom_llm_provider = "bedrock"
-        elif model in litellm.watsonx_models:
-            custom_llm_provider = "watsonx"
-        # openai embeddings
-        elif model in litellm.open_ai_embedding_models:
-            custom_llm_provider = "openai"
-        elif model in litellm.empower_models:
-            custom_llm_provider = "empower"
-        elif model in litellm.gradient_ai_models:
-            custom_llm_provider = "gradient_ai"
-        elif model == "*":
-            custom_llm_provider = "openai"
-        # bytez models
-        elif model.startswith("bytez/"):
-            custom_llm_provider = "bytez"
-        elif model.startswith("lemonade/"):
-            custom_llm_provider = "lemonade"
-        elif model.startswith("heroku/"):
-            custom_llm_provider = "heroku"
-        # cometapi models
-        elif model.startswith("cometapi/"):
-            custom_llm_provider = "cometapi"
-        elif model.startswith("oci/"):
-            custom_llm_provider = "oci"
-        elif model.startswith("compactifai/"):
-            custom_llm_provider = "compactifai"
-        elif model.startswith("ovhcloud/"):
-            custom_llm_provider = "ovhcloud"
-        elif model.startswith("lemonade/"):
-            custom_llm_provider = "lemonade"
-        elif model.startswith("clarifai/"):
-            custom_llm_provider = "clarifai"
         if not custom_llm_provider:
             if litellm.suppress_debug_info is False:
                 print()  # noqa
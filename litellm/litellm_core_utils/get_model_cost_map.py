@@ -6,26 +6,47 @@ This can be disabled by setting the LITELLM_LOCAL_MODEL_COST_MAP environment var
 ```
 export LITELLM_LOCAL_MODEL_COST_MAP=True
 ```
+
+At import, `litellm.model_cost` is loaded from the last fetched map in `LITELLM_MODEL_COST_MAP_CACHE_DIR` (or the
+bundled backup), and the remote map is refreshed in a background thread - startup doesn't wait on the network.
 """
 
+import hashlib
+import json
 import os
+import tempfile
+import threading
+from typing import Optional, Set, Tuple
 
 import httpx
 
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    MODEL_COST_MAP_CACHE_DIR,
+    MODEL_COST_MAP_REFRESH_TIMEOUT,
+)
 
-def get_model_cost_map(url: str) -> dict:
-    if (
+
+def _use_local_model_cost_map() -> bool:
+    return bool(
         os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False)
         or os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False) == "True"
-    ):
-        import importlib.resources
-        import json
+    )
+
+
+def get_bundled_model_cost_map() -> dict:
+    import importlib.resources
+
+    with importlib.resources.open_text(
+        "litellm", "model_prices_and_context_window_backup.json"
+    ) as f:
+        content = json.load(f)
+        return content
+
 
-        with importlib.resources.open_text(
-            "litellm", "model_prices_and_context_window_backup.json"
-        ) as f:
-            content = json.load(f)
-            return content
+def get_model_cost_map(url: str) -> dict:
+    if _use_local_model_cost_map():
+        return get_bundled_model_cost_map()
 
     try:
         response = httpx.get(
@@ -35,11 +56,161 @@ def get_model_cost_map(url: str) -> dict:
         content = response.json()
         return content
     except Exception:
-        import importlib.resources
-        import json
-
-        with importlib.resources.open_text(
-            "litellm", "model_prices_and_context_window_backup.json"
-        ) as f:
-            content = json.load(f)
-            return content
+        return get_bundled_model_cost_map()
+
+
+class ModelCostMapDiskCache:
+    """
+    Last fetched model cost map for a url + its ETag, in 1 json file.
+
+    Writes go to a temp file first, then `os.replace` - readers never see a partial file.
+    """
+
+    def __init__(self, url: str, cache_dir: Optional[str] = MODEL_COST_MAP_CACHE_DIR):
+        self.cache_file: Optional[str] = None
+        if cache_dir:
+            url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
+            self.cache_file = os.path.join(
+                cache_dir, f"model_cost_map_{url_hash}.json"
+            )
+
+    def load(self) -> Optional[Tuple[Optional[str], dict]]:
+        """Returns (etag, model_cost), None if there's no valid cached map"""
+        if self.cache_file is None:
+            return None
+        try:
+            with open(self.cache_file, "r") as f:
+                cached_data = json.load(f)
+            model_cost = cached_data["model_cost"]
+            if not isinstance(model_cost, dict) or len(model_cost) == 0:
+                return None
+            return cached_data.get("etag"), model_cost
+        except Exception:
+            return None
+
+    def save(self, etag: Optional[str], model_cost: dict) -> None:
+        if self.cache_file is None:
+            return
+        try:
+            cache_dir = os.path.dirname(self.cache_file)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"etag": etag, "model_cost": model_cost}, f)
+                os.replace(tmp_file, self.cache_file)
+            except Exception:
+                os.unlink(tmp_file)
+                raise
+        except Exception as e:
+            verbose_logger.debug(
+                f"Unable to write model cost map cache to {self.cache_file}: {str(e)}"
+            )
+
+
+class ModelCostMapRefresher:
+    """
+    Loads `litellm.model_cost` without blocking on the network, then refreshes it from the remote url in a daemon thread.
+
+    The refreshed map replaces `litellm.model_cost` in 1 assignment, the model lists derived from it are replaced by
+    updated copies - see `_swap`. Models added via `litellm.register_model` are carried over. If `litellm.model_cost`
+    was reassigned since it was loaded (e.g. a proxy config reload), the refreshed map is dropped.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = MODEL_COST_MAP_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.disk_cache: Optional[ModelCostMapDiskCache] = None
+        self.refresh_thread: Optional[threading.Thread] = None
+        self._etag: Optional[str] = None
+        self._loaded_model_cost: Optional[dict] = None
+        self._registered_model_cost_keys: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def load(self, url: str) -> dict:
+        """Returns the model cost map to use at startup, and starts refreshing it in the background"""
+        if _use_local_model_cost_map():
+            return get_bundled_model_cost_map()
+
+        self.disk_cache = ModelCostMapDiskCache(url=url, cache_dir=self.cache_dir)
+        cached_model_cost_map = self.disk_cache.load()
+        if cached_model_cost_map is not None:
+            self._etag, model_cost = cached_model_cost_map
+        else:
+            self._etag, model_cost = None, get_bundled_model_cost_map()
+        self._loaded_model_cost = model_cost
+
+        self.refresh_thread = threading.Thread(
+            target=self._refresh,
+            args=(url,),
+            name="litellm-model-cost-map-refresh",
+            daemon=True,
+        )
+        self.refresh_thread.start()
+        return model_cost
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the background refresh. Returns False if it's still running after `timeout` seconds."""
+        if self.refresh_thread is None:
+            return True
+        self.refresh_thread.join(timeout=timeout)
+        return not self.refresh_thread.is_alive()
+
+    def _refresh(self, url: str) -> None:
+        try:
+            model_cost = self._fetch(url)
+            if model_cost is not None:
+                self._swap(model_cost)
+        except Exception as e:
+            verbose_logger.debug(
+                f"Unable to refresh model cost map from {url}: {str(e)}"
+            )
+
+    def _fetch(self, url: str) -> Optional[dict]:
+        """Returns the remote map, None if it didn't change since it was cached"""
+        headers = {}
+        if self._etag is not None:
+            headers["If-None-Match"] = self._etag
+        response = httpx.get(
+            url, headers=headers, timeout=MODEL_COST_MAP_REFRESH_TIMEOUT
+        )
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        model_cost = response.json()
+        if not isinstance(model_cost, dict) or len(model_cost) == 0:
+            raise ValueError("remote model cost map is empty or not a json object")
+        if self.disk_cache is not None:
+            self.disk_cache.save(
+                etag=response.headers.get("etag"), model_cost=model_cost
+            )
+        return model_cost
+
+    def _swap(self, model_cost: dict) -> bool:
+        """
+        Runs on the refresh thread - nothing other threads may be iterating is mutated. The provider model sets,
+        `model_list`, `model_list_set` and `models_by_provider` are rebuilt as copies, then each is swapped in
+        with 1 assignment.
+        """
+        import litellm
+
+        with self._lock:
+            if litellm.model_cost is not self._loaded_model_cost:
+                return False
+            for model_cost_key in self._registered_model_cost_keys:
+                if model_cost_key in litellm.model_cost:
+                    model_cost[model_cost_key] = litellm.model_cost[model_cost_key]
+            litellm._replace_known_models(model_cost)
+            litellm.model_cost = model_cost
+            self._loaded_model_cost = model_cost
+        return True
+
+    def register_model_cost(self, model_cost_key: str, model_info: dict) -> None:
+        """Add / override a model in `litellm.model_cost`, and keep it across background refreshes"""
+        import litellm
+
+        with self._lock:
+            litellm.model_cost.setdefault(model_cost_key, {}).update(model_info)
+            self._registered_model_cost_keys.add(model_cost_key)
+
+
+model_cost_map_refresher = ModelCostMapRefresher()
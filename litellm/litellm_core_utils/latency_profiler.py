@@ -0,0 +1,196 @@
+"""
+Opt-in latency profiling for the request hot path
+
+- per-stage timing histograms (auth, pre-call hooks, routing, provider call, logging), collected with `perf_counter_ns`
+- event loop lag monitor - a background task that measures how late `asyncio.sleep` wakes up
+- `profile_cpu` - run cProfile on the event loop thread for N seconds, returns the pstats report
+
+Disabled by default. While disabled, an instrumented stage costs one attribute check.
+Used by the proxy's `/debug/profiling/*` endpoints (`general_settings::enable_latency_profiling`).
+"""
+
+import asyncio
+import cProfile
+import functools
+import io
+import pstats
+from bisect import bisect_left
+from time import perf_counter_ns
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar, cast
+
+from litellm._logging import verbose_logger
+from litellm.constants import LATENCY_PROFILER_EVENT_LOOP_LAG_INTERVAL_SECONDS
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+T = TypeVar("T")
+
+EVENT_LOOP_LAG_STAGE = "event_loop_lag"
+
+# bucket upper bounds: 1us, 2us, 4us ... ~137s
+_BUCKET_BOUNDS_NS: List[int] = [1000 * 2**i for i in range(28)]
+
+
+class LatencyHistogram:
+    """
+    Log2-bucketed histogram of durations in nanoseconds. Percentiles are estimated from the bucket upper bounds.
+    """
+
+    __slots__ = ("buckets", "count", "total_ns", "max_ns")
+
+    def __init__(self):
+        self.buckets: List[int] = [0] * (len(_BUCKET_BOUNDS_NS) + 1)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, duration_ns: int) -> None:
+        self.buckets[bisect_left(_BUCKET_BOUNDS_NS, duration_ns)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    def percentile_ns(self, percentile: float) -> int:
+        if self.count == 0:
+            return 0
+        rank = percentile / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank and bucket_count > 0:
+                if index >= len(_BUCKET_BOUNDS_NS):
+                    return self.max_ns
+                return min(_BUCKET_BOUNDS_NS[index], self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ns / self.count / 1e6, 3) if self.count else 0,
+            "p50_ms": round(self.percentile_ns(50) / 1e6, 3),
+            "p90_ms": round(self.percentile_ns(90) / 1e6, 3),
+            "p99_ms": round(self.percentile_ns(99) / 1e6, 3),
+            "max_ms": round(self.max_ns / 1e6, 3),
+        }
+
+
+class LatencyProfiler:
+    def __init__(
+        self,
+        event_loop_lag_interval: float = LATENCY_PROFILER_EVENT_LOOP_LAG_INTERVAL_SECONDS,
+    ):
+        self.enabled = False
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.event_loop_lag_interval = event_loop_lag_interval
+        self._event_loop_lag_task: Optional[asyncio.Task] = None
+        self._cpu_profiler: Optional[cProfile.Profile] = None
+
+    def enable(self) -> None:
+        """
+        Start collecting stage timings. If called from a running event loop, also starts the event loop lag monitor.
+        """
+        self.enabled = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._event_loop_lag_task is None or self._event_loop_lag_task.done():
+            self._event_loop_lag_task = loop.create_task(self._monitor_event_loop_lag())
+
+    def disable(self) -> None:
+        self.enabled = False
+        if self._event_loop_lag_task is not None:
+            self._event_loop_lag_task.cancel()
+            self._event_loop_lag_task = None
+
+    def reset(self) -> None:
+        self.histograms = {}
+
+    def record(self, stage: str, duration_ns: int) -> None:
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms.setdefault(stage, LatencyHistogram())
+        histogram.record(duration_ns)
+
+    def profile_stage(self, stage: str) -> Callable[[F], F]:
+        """
+        Decorator for async functions - records the duration of each call under `stage`.
+        """
+
+        def decorator(func: F) -> F:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return await func(*args, **kwargs)
+                start_ns = perf_counter_ns()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self.record(stage, perf_counter_ns() - start_ns)
+
+            return cast(F, wrapper)
+
+        return decorator
+
+    def time_awaitable(self, stage: str, awaitable: Awaitable[T]) -> Awaitable[T]:
+        """
+        Record how long `awaitable` takes to complete under `stage`. Returns `awaitable` unchanged when disabled.
+        """
+        if not self.enabled:
+            return awaitable
+        return self._time_awaitable(stage, awaitable)
+
+    async def _time_awaitable(self, stage: str, awaitable: Awaitable[T]) -> T:
+        start_ns = perf_counter_ns()
+        try:
+            return await awaitable
+        finally:
+            self.record(stage, perf_counter_ns() - start_ns)
+
+    def get_stage_summaries(self) -> Dict[str, Dict[str, float]]:
+        return {
+            stage: histogram.summary()
+            for stage, histogram in sorted(self.histograms.items())
+        }
+
+    async def _monitor_event_loop_lag(self) -> None:
+        interval_ns = int(self.event_loop_lag_interval * 1e9)
+        while self.enabled:
+            start_ns = perf_counter_ns()
+            await asyncio.sleep(self.event_loop_lag_interval)
+            self.record(
+                EVENT_LOOP_LAG_STAGE, max(0, perf_counter_ns() - start_ns - interval_ns)
+            )
+
+    async def profile_cpu(
+        self, seconds: float, sort_by: str = "cumulative", top_n: int = 50
+    ) -> str:
+        """
+        Profile everything running on the event loop thread for `seconds`, return the top `top_n` functions.
+
+        Raises a `ValueError` if a CPU profile is already running.
+        """
+        if self._cpu_profiler is not None:
+            raise ValueError("A CPU profile is already running")
+        profiler = cProfile.Profile()
+        self._cpu_profiler = profiler
+        try:
+            profiler.enable()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                profiler.disable()
+        finally:
+            self._cpu_profiler = None
+
+        output = io.StringIO()
+        try:
+            stats = pstats.Stats(profiler, stream=output)
+        except TypeError:  # nothing was recorded
+            return ""
+        stats.sort_stats(sort_by).print_stats(top_n)
+        verbose_logger.debug("CPU profile completed after %ss", seconds)
+        return output.getvalue()
+
+
+latency_profiler = LatencyProfiler()
@@ -63,6 +63,11 @@ from litellm.litellm_core_utils.get_litellm_params import get_litellm_params
 from litellm.litellm_core_utils.llm_cost_calc.tool_call_cost_tracking import (
     StandardBuiltInToolCostTracking,
 )
+from litellm.litellm_core_utils.latency_profiler import latency_profiler
+from litellm.litellm_core_utils.logging_worker import (
+    GLOBAL_LOGGING_WORKER,
+    LoggingWorker,
+)
 from litellm.litellm_core_utils.model_param_helper import ModelParamHelper
 from litellm.litellm_core_utils.redact_messages import (
     redact_message_input_output_from_custom_logger,
@@ -2166,6 +2171,7 @@ class Logging(LiteLLMLoggingBaseClass):
                 ),
             )
 
+    @latency_profiler.profile_stage("logging")
     async def async_success_handler(  # noqa: PLR0915
         self, result=None, start_time=None, end_time=None, cache_hit=None, **kwargs
     ):
@@ -2337,134 +2343,160 @@ class Logging(LiteLLMLoggingBaseClass):
             )
             if not should_run:
                 continue
-            try:
-                if callback == "openmeter" and openMeterLogger is not None:
-                    if self.stream is True:
-                        if (
-                            "async_complete_streaming_response"
-                            in self.model_call_details
-                        ):
-                            await openMeterLogger.async_log_success_event(
-                                kwargs=self.model_call_details,
-                                response_obj=self.model_call_details[
-                                    "async_complete_streaming_response"
-                                ],
-                                start_time=start_time,
-                                end_time=end_time,
-                            )
-                        else:
-                            await openMeterLogger.async_log_stream_event(  # [TODO]: move this to being an async log stream event function
-                                kwargs=self.model_call_details,
-                                response_obj=result,
-                                start_time=start_time,
-                                end_time=end_time,
-                            )
-                    else:
+            if LoggingWorker.is_running_in_logging_worker():
+                # 1 queue per callback - a slow callback can't stall the others
+                GLOBAL_LOGGING_WORKER.enqueue(
+                    self._async_success_callback(
+                        callback=callback,
+                        result=result,
+                        start_time=start_time,
+                        end_time=end_time,
+                    ),
+                    queue_name=LoggingWorker.get_callback_queue_name(callback),
+                    ordering_key=self.litellm_call_id,
+                )
+            else:
+                await self._async_success_callback(
+                    callback=callback,
+                    result=result,
+                    start_time=start_time,
+                    end_time=end_time,
+                )
+
+    async def _async_success_callback(
+        self, callback: Any, result: Any, start_time, end_time
+    ) -> None:
+        """
+        Run the async success logging of 1 callback
+        """
+        try:
+            if callback == "openmeter" and openMeterLogger is not None:
+                if self.stream is True:
+                    if (
+                        "async_complete_streaming_response"
+                        in self.model_call_details
+                    ):
                         await openMeterLogger.async_log_success_event(
+                            kwargs=self.model_call_details,
+                            response_obj=self.model_call_details[
+                                "async_complete_streaming_response"
+                            ],
+                            start_time=start_time,
+                            end_time=end_time,
+                        )
+                    else:
+                        await openMeterLogger.async_log_stream_event(  # [TODO]: move this to being an async log stream event function
                             kwargs=self.model_call_details,
                             response_obj=result,
                             start_time=start_time,
                             end_time=end_time,
                         )
-
-                if isinstance(callback, CustomLogger):  # custom logger class
-                    model_call_details: Dict = self.model_call_details
-                    ##################################
-                    # call redaction hook for custom logger
-                    model_call_details = callback.redact_standard_logging_payload_from_model_call_details(
-                        model_call_details=model_call_details
+                else:
+                    await openMeterLogger.async_log_success_event(
+                        kwargs=self.model_call_details,
+                        response_obj=result,
+                        start_time=start_time,
+                        end_time=end_time,
                     )
-                    ##################################
-                    if self.stream is True:
-                        if "async_complete_streaming_response" in model_call_details:
-                            await callback.async_log_success_event(
-                                kwargs=model_call_details,
-                                response_obj=model_call_details[
-                                    "async_complete_streaming_response"
-                                ],
-                                start_time=start_time,
-                                end_time=end_time,
-                            )
-                        else:
-                            await callback.async_log_stream_event(  # [TODO]: move this to being an async log stream event function
-                                kwargs=model_call_details,
-                                response_obj=result,
-                                start_time=start_time,
-                                end_time=end_time,
-                            )
-                    else:
+
+            if isinstance(callback, CustomLogger):  # custom logger class
+                model_call_details: Dict = self.model_call_details
+                ##################################
+                # call redaction hook for custom logger
+                model_call_details = callback.redact_standard_logging_payload_from_model_call_details(
+                    model_call_details=model_call_details
+                )
+                ##################################
+                if self.stream is True:
+                    if "async_complete_streaming_response" in model_call_details:
                         await callback.async_log_success_event(
                             kwargs=model_call_details,
-                            response_obj=result,
+                            response_obj=model_call_details[
+                                "async_complete_streaming_response"
+                            ],
                             start_time=start_time,
                             end_time=end_time,
                         )
-                if callable(callback):  # custom logger functions
-                    global customLogger
-                    if customLogger is None:
-                        customLogger = CustomLogger()
-                    if self.stream:
-                        if (
-                            "async_complete_streaming_response"
-                            in self.model_call_details
-                        ):
-                            await customLogger.async_log_event(
-                                kwargs=self.model_call_details,
-                                response_obj=self.model_call_details[
-                                    "async_complete_streaming_response"
-                                ],
-                                start_time=start_time,
-                                end_time=end_time,
-                                print_verbose=print_verbose,
-                                callback_func=callback,
-                            )
                     else:
+                        await callback.async_log_stream_event(  # [TODO]: move this to being an async log stream event function
+                            kwargs=model_call_details,
+                            response_obj=result,
+                            start_time=start_time,
+                            end_time=end_time,
+                        )
+                else:
+                    await callback.async_log_success_event(
+                        kwargs=model_call_details,
+                        response_obj=result,
+                        start_time=start_time,
+                        end_time=end_time,
+                    )
+            if callable(callback):  # custom logger functions
+                global customLogger
+                if customLogger is None:
+                    customLogger = CustomLogger()
+                if self.stream:
+                    if (
+                        "async_complete_streaming_response"
+                        in self.model_call_details
+                    ):
                         await customLogger.async_log_event(
                             kwargs=self.model_call_details,
-                            response_obj=result,
+                            response_obj=self.model_call_details[
+                                "async_complete_streaming_response"
+                            ],
                             start_time=start_time,
                             end_time=end_time,
                             print_verbose=print_verbose,
                             callback_func=callback,
                         )
-                if callback == "dynamodb":
-                    global dynamoLogger
-                    if dynamoLogger is None:
-                        dynamoLogger = DyanmoDBLogger()
-                    if self.stream:
-                        if (
-                            "async_complete_streaming_response"
-                            in self.model_call_details
-                        ):
-                            print_verbose(
-                                "DynamoDB Logger: Got Stream Event - Completed Stream Response"
-                            )
-                            await dynamoLogger._async_log_event(
-                                kwargs=self.model_call_details,
-                                response_obj=self.model_call_details[
-                                    "async_complete_streaming_response"
-                                ],
-                                start_time=start_time,
-                                end_time=end_time,
-                                print_verbose=print_verbose,
-                            )
-                        else:
-                            print_verbose(
-                                "DynamoDB Logger: Got Stream Event - No complete stream response as yet"
-                            )
-                    else:
+                else:
+                    await customLogger.async_log_event(
+                        kwargs=self.model_call_details,
+                        response_obj=result,
+                        start_time=start_time,
+                        end_time=end_time,
+                        print_verbose=print_verbose,
+                        callback_func=callback,
+                    )
+            if callback == "dynamodb":
+                global dynamoLogger
+                if dynamoLogger is None:
+                    dynamoLogger = DyanmoDBLogger()
+                if self.stream:
+                    if (
+                        "async_complete_streaming_response"
+                        in self.model_call_details
+                    ):
+                        print_verbose(
+                            "DynamoDB Logger: Got Stream Event - Completed Stream Response"
+                        )
                         await dynamoLogger._async_log_event(
                             kwargs=self.model_call_details,
-                            response_obj=result,
+                            response_obj=self.model_call_details[
+                                "async_complete_streaming_response"
+                            ],
                             start_time=start_time,
                             end_time=end_time,
                             print_verbose=print_verbose,
                         )
-            except Exception:
-                verbose_logger.error(
-                    f"LiteLLM.LoggingError: [Non-Blocking] Exception occurred while success logging {traceback.format_exc()}"
-                )
-                pass
+                    else:
+                        print_verbose(
+                            "DynamoDB Logger: Got Stream Event - No complete stream response as yet"
+                        )
+                else:
+                    await dynamoLogger._async_log_event(
+                        kwargs=self.model_call_details,
+                        response_obj=result,
+                        start_time=start_time,
+                        end_time=end_time,
+                        print_verbose=print_verbose,
+                    )
+        except Exception:
+            verbose_logger.error(
+                f"LiteLLM.LoggingError: [Non-Blocking] Exception occurred while success logging {traceback.format_exc()}"
+            )
+            pass
 
     def _failure_handler_helper_fn(
         self, exception, traceback_exception, start_time=None, end_time=None
@@ -2767,41 +2799,67 @@ class Logging(LiteLLMLoggingBaseClass):
 
         self.has_run_logging(event_type="async_failure")
         for callback in callbacks:
-            try:
-                litellm_params = self.model_call_details.get("litellm_params", {})
-                should_run = self.should_run_callback(
-                    callback=callback,
-                    litellm_params=litellm_params,
-                    event_hook="async_failure_handler",
-                )
-                if not should_run:
-                    continue
-                if isinstance(callback, CustomLogger):  # custom logger class
-                    await callback.async_log_failure_event(
-                        kwargs=self.model_call_details,
-                        response_obj=result,
-                        start_time=start_time,
-                        end_time=end_time,
-                    )  # type: ignore
-                if (
-                    callable(callback) and customLogger is not None
-                ):  # custom logger functions
-                    await customLogger.async_log_event(
-                        kwargs=self.model_call_details,
-                        response_obj=result,
+            litellm_params = self.model_call_details.get("litellm_params", {})
+            should_run = self.should_run_callback(
+                callback=callback,
+                litellm_params=litellm_params,
+                event_hook="async_failure_handler",
+            )
+            if not should_run:
+                continue
+            if LoggingWorker.is_running_in_logging_worker():
+                # 1 queue per callback - a slow callback can't stall the others, same as the success callbacks
+                GLOBAL_LOGGING_WORKER.enqueue(
+                    self._async_failure_callback(
+                        callback=callback,
+                        result=result,
                         start_time=start_time,
                         end_time=end_time,
-                        print_verbose=print_verbose,
-                        callback_func=callback,
-                    )
-            except Exception as e:
-                verbose_logger.exception(
-                    "LiteLLM.LoggingError: [Non-Blocking] Exception occurred while failure \
-                        logging {}\nCallback={}".format(
-                        str(e), callback
-                    )
+                    ),
+                    queue_name=LoggingWorker.get_callback_queue_name(callback),
+                    ordering_key=self.litellm_call_id,
+                )
+            else:
+                await self._async_failure_callback(
+                    callback=callback,
+                    result=result,
+                    start_time=start_time,
+                    end_time=end_time,
                 )
 
+    async def _async_failure_callback(
+        self, callback: Any, result: Any, start_time, end_time
+    ) -> None:
+        """
+        Run the async failure logging of 1 callback
+        """
+        try:
+            if isinstance(callback, CustomLogger):  # custom logger class
+                await callback.async_log_failure_event(
+                    kwargs=self.model_call_details,
+                    response_obj=result,
+                    start_time=start_time,
+                    end_time=end_time,
+                )  # type: ignore
+            if (
+                callable(callback) and customLogger is not None
+            ):  # custom logger functions
+                await customLogger.async_log_event(
+                    kwargs=self.model_call_details,
+                    response_obj=result,
+                    start_time=start_time,
+                    end_time=end_time,
+                    print_verbose=print_verbose,
+                    callback_func=callback,
+                )
+        except Exception as e:
+            verbose_logger.exception(
+                "LiteLLM.LoggingError: [Non-Blocking] Exception occurred while failure \
+                    logging {}\nCallback={}".format(
+                    str(e), callback
+                )
+            )
+
     def _get_trace_id(self, service_name: Literal["langfuse"]) -> Optional[str]:
         """
         For the given service (e.g. langfuse), return the trace_id actually logged.
@@ -1,11 +1,27 @@
 import asyncio
 import contextlib
 import contextvars
-from typing import Coroutine, Optional
+import time
+from typing import Any, Coroutine, Dict, List, Literal, Optional, Tuple
 
 from typing_extensions import TypedDict
 
 from litellm._logging import verbose_logger
+from litellm.constants import (
+    LOGGING_WORKER_CONCURRENCY,
+    LOGGING_WORKER_DROP_POLICY,
+    LOGGING_WORKER_MAX_QUEUE_SIZE,
+    LOGGING_WORKER_MAX_TIME_PER_COROUTINE,
+)
+
+LoggingQueueDropPolicy = Literal["drop_newest", "drop_oldest"]
+
+DEFAULT_LOGGING_QUEUE_NAME = "default"
+
+# True while a coroutine runs on the logging worker
+_running_in_logging_worker: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "running_in_logging_worker", default=False
+)
 
 
 class LoggingTask(TypedDict):
@@ -16,6 +32,126 @@ class LoggingTask(TypedDict):
 
     coroutine: Coroutine
     context: contextvars.Context
+    enqueued_at: float
+    ordering_key: Optional[str]  # e.g. the litellm_call_id - tasks with the same key run in enqueue order
+
+
+class LoggingQueueSettings(TypedDict, total=False):
+    max_queue_size: int
+    concurrency: int
+    drop_policy: LoggingQueueDropPolicy
+
+
+class LoggingQueueMetrics(TypedDict):
+    """
+    Counters of 1 logging worker queue
+    """
+
+    queue_depth: int
+    max_queue_size: int
+    concurrency: int
+    drop_policy: LoggingQueueDropPolicy
+    in_flight: int
+    enqueued: int
+    processed: int
+    dropped: int
+    timed_out: int
+    errors: int
+    avg_latency_ms: float  # enqueue -> done
+    max_latency_ms: float
+
+
+class LoggingQueue:
+    """
+    1 bounded queue of the logging worker, with its own worker tasks, drop policy and counters.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_queue_size: int,
+        concurrency: int,
+        drop_policy: LoggingQueueDropPolicy,
+    ):
+        self.name = name
+        self.max_queue_size = max_queue_size
+        self.concurrency = max(1, concurrency)
+        self.drop_policy = drop_policy
+        self.queue: asyncio.Queue[LoggingTask] = asyncio.Queue(maxsize=max_queue_size)
+        self.worker_task: Optional[asyncio.Task] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        # ordering key -> completion of the last dequeued task with that key
+        self.ordering_tails: Dict[str, asyncio.Future] = {}
+
+        self.in_flight = 0
+        self.enqueued = 0
+        self.processed = 0
+        self.dropped = 0
+        self.timed_out = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def put(self, task: LoggingTask) -> None:
+        """
+        Add a task without blocking. When the queue is full, the oldest or the new task is dropped - based on the drop policy.
+
+        `enqueued` only counts tasks that are kept - so `enqueued == processed + in_flight + queue_depth`, and dropped tasks are only counted in `dropped`.
+        """
+        try:
+            self.queue.put_nowait(task)
+        except asyncio.QueueFull as e:
+            verbose_logger.exception(
+                f"LoggingWorker queue is full: queue={self.name}, drop_policy={self.drop_policy} {e}"
+            )
+            self.dropped += 1
+            if self.drop_policy == "drop_oldest":
+                dropped_task = self.queue.get_nowait()
+                self.queue.task_done()
+                self.enqueued -= 1  # the oldest task was counted when it was enqueued
+                self.queue.put_nowait(task)
+                self.enqueued += 1
+            else:
+                dropped_task = task
+            dropped_task["coroutine"].close()  # prevent "never awaited" warnings
+            return
+        self.enqueued += 1
+
+    def rebind(self) -> None:
+        """
+        asyncio queues are bound to the event loop that first waits on them - move queued tasks to a new queue, when the worker restarts on a new event loop.
+        """
+        queue: asyncio.Queue[LoggingTask] = asyncio.Queue(maxsize=self.max_queue_size)
+        while not self.queue.empty():
+            queue.put_nowait(self.queue.get_nowait())
+        self.queue = queue
+        self.in_flight = 0
+        self.ordering_tails = {}
+
+    def record_done(self, task: LoggingTask) -> None:
+        latency = time.perf_counter() - task["enqueued_at"]
+        self.processed += 1
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+
+    def get_metrics(self) -> LoggingQueueMetrics:
+        return LoggingQueueMetrics(
+            queue_depth=self.queue.qsize(),
+            max_queue_size=self.max_queue_size,
+            concurrency=self.concurrency,
+            drop_policy=self.drop_policy,
+            in_flight=self.in_flight,
+            enqueued=self.enqueued,
+            processed=self.processed,
+            dropped=self.dropped,
+            timed_out=self.timed_out,
+            errors=self.errors,
+            avg_latency_ms=(
+                self.total_latency / self.processed * 1000 if self.processed else 0.0
+            ),
+            max_latency_ms=self.max_latency * 1000,
+        )
 
 
 class LoggingWorker:
@@ -25,10 +161,17 @@ class LoggingWorker:
 
     This leads to a +200 RPS performance improvement when using LiteLLM Python SDK or Proxy Server.
     - Use this to queue coroutine tasks that are not critical to the main flow of the application. e.g Success/Error callbacks, logging, etc.
+
+    Coroutines can be queued on named queues - e.g. 1 queue per callback class, so 1 slow callback can't stall the others.
+    Each queue has its own worker tasks (concurrency limit), size limit, drop policy and counters - see `get_queue_metrics`.
+
+    Ordering: coroutines queued with the same `ordering_key` (the litellm_call_id of the request) on 1 queue run one
+    at a time, in enqueue order - also with concurrency > 1. So a callback sees the events of a request in order.
+    Queues are independent - 2 callbacks can process the same request at different times.
     """
 
-    LOGGING_WORKER_MAX_QUEUE_SIZE = 50_000
-    LOGGING_WORKER_MAX_TIME_PER_COROUTINE = 20.0
+    LOGGING_WORKER_MAX_QUEUE_SIZE = LOGGING_WORKER_MAX_QUEUE_SIZE
+    LOGGING_WORKER_MAX_TIME_PER_COROUTINE = LOGGING_WORKER_MAX_TIME_PER_COROUTINE
 
     MAX_ITERATIONS_TO_CLEAR_QUEUE = 200
     MAX_TIME_TO_CLEAR_QUEUE = 5.0
@@ -37,122 +180,295 @@ class LoggingWorker:
         self,
         timeout: float = LOGGING_WORKER_MAX_TIME_PER_COROUTINE,
         max_queue_size: int = LOGGING_WORKER_MAX_QUEUE_SIZE,
+        concurrency: int = LOGGING_WORKER_CONCURRENCY,
+        drop_policy: LoggingQueueDropPolicy = LOGGING_WORKER_DROP_POLICY,  # type: ignore
     ):
         self.timeout = timeout
         self.max_queue_size = max_queue_size
-        self._queue: Optional[asyncio.Queue[LoggingTask]] = None
-        self._worker_task: Optional[asyncio.Task] = None
+        self.concurrency = concurrency
+        self.drop_policy: LoggingQueueDropPolicy = drop_policy
+        self._logging_queues: Dict[str, LoggingQueue] = {}
+        self._logging_queue_settings: Dict[str, LoggingQueueSettings] = {}
+
+    @property
+    def _queue(self) -> Optional[asyncio.Queue]:
+        """The default queue"""
+        logging_queue = self._logging_queues.get(DEFAULT_LOGGING_QUEUE_NAME)
+        return logging_queue.queue if logging_queue is not None else None
+
+    @property
+    def _worker_task(self) -> Optional[asyncio.Task]:
+        """The worker loop of the default queue"""
+        logging_queue = self._logging_queues.get(DEFAULT_LOGGING_QUEUE_NAME)
+        return logging_queue.worker_task if logging_queue is not None else None
+
+    @staticmethod
+    def is_running_in_logging_worker() -> bool:
+        """True if the current coroutine was queued on a logging worker"""
+        return _running_in_logging_worker.get()
+
+    @staticmethod
+    def get_callback_queue_name(callback: Any) -> str:
+        """Callbacks of the same class share a queue"""
+        if isinstance(callback, str):
+            return callback
+        return type(callback).__name__
+
+    def configure_queue(
+        self,
+        queue_name: str,
+        max_queue_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        drop_policy: Optional[LoggingQueueDropPolicy] = None,
+    ) -> None:
+        """
+        Override the size limit, concurrency limit or drop policy of a queue. Call this at startup - before the queue is first used.
+        """
+        settings = self._logging_queue_settings.setdefault(
+            queue_name, LoggingQueueSettings()
+        )
+        if max_queue_size is not None:
+            settings["max_queue_size"] = max_queue_size
+        if concurrency is not None:
+            settings["concurrency"] = concurrency
+        if drop_policy is not None:
+            settings["drop_policy"] = drop_policy
+            if queue_name in self._logging_queues:
+                self._logging_queues[queue_name].drop_policy = drop_policy
+
+    def _get_logging_queue(self, queue_name: str) -> LoggingQueue:
+        logging_queue = self._logging_queues.get(queue_name)
+        if logging_queue is None:
+            settings = self._logging_queue_settings.get(queue_name, {})
+            logging_queue = self._logging_queues[queue_name] = LoggingQueue(
+                name=queue_name,
+                max_queue_size=settings.get("max_queue_size", self.max_queue_size),
+                concurrency=settings.get("concurrency", self.concurrency),
+                drop_policy=settings.get("drop_policy", self.drop_policy),
+            )
+        return logging_queue
 
     def _ensure_queue(self) -> None:
-        """Initialize the queue if it doesn't exist."""
-        if self._queue is None:
-            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
-
-    def start(self) -> None:
-        """Start the logging worker. Idempotent - safe to call multiple times."""
-        self._ensure_queue()
-        if self._worker_task is None or self._worker_task.done():
-            self._worker_task = asyncio.create_task(self._worker_loop())
-
-    async def _worker_loop(self) -> None:
-        """Main worker loop that processes log coroutines sequentially."""
-        try:
-            if self._queue is None:
-                return
+        """Initialize the default queue if it doesn't exist."""
+        self._get_logging_queue(DEFAULT_LOGGING_QUEUE_NAME)
 
-            while True:
-                # Process one coroutine at a time to keep event loop load predictable
-                task = await self._queue.get()
-                try:
-                    # Run the coroutine in its original context
-                    await asyncio.wait_for(
-                        task["context"].run(asyncio.create_task, task["coroutine"]),
-                        timeout=self.timeout,
-                    )
-                except Exception as e:
-                    verbose_logger.exception(f"LoggingWorker error: {e}")
-                    pass
-                finally:
-                    self._queue.task_done()
+    def start(self, queue_name: str = DEFAULT_LOGGING_QUEUE_NAME) -> None:
+        """Start the worker tasks of a queue. Idempotent - safe to call multiple times."""
+        logging_queue = self._get_logging_queue(queue_name)
+        if logging_queue.worker_task is None or logging_queue.worker_task.done():
+            loop = asyncio.get_running_loop()
+            if logging_queue.loop is not None and logging_queue.loop is not loop:
+                logging_queue.rebind()
+            logging_queue.loop = loop
+            logging_queue.worker_task = asyncio.create_task(
+                self._worker_loop(logging_queue)
+            )
 
+    async def _worker_loop(self, logging_queue: Optional[LoggingQueue] = None) -> None:
+        """Main worker loop - runs `concurrency` worker tasks on the queue."""
+        if logging_queue is None:
+            logging_queue = self._get_logging_queue(DEFAULT_LOGGING_QUEUE_NAME)
+        try:
+            await asyncio.gather(
+                *(
+                    self._process_queue(logging_queue)
+                    for _ in range(logging_queue.concurrency)
+                )
+            )
         except asyncio.CancelledError:
             verbose_logger.debug("LoggingWorker cancelled during shutdown")
             # Attempt to clear remaining items to prevent "never awaited" warnings
-            await self.clear_queue()
+            await self.clear_queue(queue_name=logging_queue.name)
 
-    def enqueue(self, coroutine: Coroutine) -> None:
+    async def _process_queue(self, logging_queue: LoggingQueue) -> None:
+        """Process 1 coroutine at a time - a queue runs `concurrency` of these, to keep event loop load predictable"""
+        while True:
+            task = await logging_queue.queue.get()
+            logging_queue.in_flight += 1
+            # registered right after the dequeue (no await in between) - tasks with the same key are chained in queue order
+            previous_task_done, task_done = self._chain_task(logging_queue, task)
+            try:
+                if previous_task_done is not None:
+                    await asyncio.shield(previous_task_done)
+                await self._run_task(task, timeout=self.timeout)
+            except asyncio.TimeoutError as e:
+                logging_queue.timed_out += 1
+                verbose_logger.exception(
+                    f"LoggingWorker error: queue={logging_queue.name} timed out after {self.timeout}s {e}"
+                )
+            except Exception as e:
+                logging_queue.errors += 1
+                verbose_logger.exception(f"LoggingWorker error: {e}")
+            finally:
+                self._unchain_task(logging_queue, task, task_done)
+                logging_queue.in_flight -= 1
+                logging_queue.record_done(task)
+                logging_queue.queue.task_done()
+
+    @staticmethod
+    def _chain_task(
+        logging_queue: LoggingQueue, task: LoggingTask
+    ) -> Tuple[Optional[asyncio.Future], Optional[asyncio.Future]]:
         """
-        Add a coroutine to the logging queue.
-        Hot path: never blocks, drops logs if queue is full.
+        Returns (completion of the previous task with the same ordering key - to wait for, completion of this task)
         """
-        if self._queue is None:
+        ordering_key = task.get("ordering_key")
+        if ordering_key is None:
+            return None, None
+        previous_task_done = logging_queue.ordering_tails.get(ordering_key)
+        task_done = asyncio.get_running_loop().create_future()
+        logging_queue.ordering_tails[ordering_key] = task_done
+        return previous_task_done, task_done
+
+    @staticmethod
+    def _unchain_task(
+        logging_queue: LoggingQueue,
+        task: LoggingTask,
+        task_done: Optional[asyncio.Future],
+    ) -> None:
+        if task_done is None:
             return
+        task_done.set_result(None)
+        ordering_key = task.get("ordering_key")
+        if (
+            ordering_key is not None
+            and logging_queue.ordering_tails.get(ordering_key) is task_done
+        ):
+            del logging_queue.ordering_tails[ordering_key]
 
-        try:
-            # Capture the current context when enqueueing
-            task = LoggingTask(coroutine=coroutine, context=contextvars.copy_context())
-            self._queue.put_nowait(task)
-        except asyncio.QueueFull as e:
-            verbose_logger.exception(f"LoggingWorker queue is full: {e}")
-            # Drop logs on overload to protect request throughput
-            pass
+    @staticmethod
+    async def _run_task(task: LoggingTask, timeout: float) -> None:
+        """
+        Run the coroutine in its original context.
+
+        Uses asyncio.wait instead of asyncio.wait_for - wait_for can swallow the cancellation of the worker, if the coroutine finishes at the same time.
+        """
+        logging_task = task["context"].run(
+            _create_logging_worker_task, task["coroutine"]
+        )
+        done, _ = await asyncio.wait({logging_task}, timeout=timeout)
+        if not done:
+            logging_task.cancel()
+            raise asyncio.TimeoutError()
+        logging_task.result()
 
-    def ensure_initialized_and_enqueue(self, async_coroutine: Coroutine):
+    def enqueue(
+        self,
+        coroutine: Coroutine,
+        queue_name: str = DEFAULT_LOGGING_QUEUE_NAME,
+        ordering_key: Optional[str] = None,
+    ) -> None:
+        """
+        Add a coroutine to a logging queue.
+        Hot path: never blocks, drops logs if queue is full.
+
+        The default queue must be started first, other queues are started on first use.
+
+        ordering_key: coroutines with the same key (e.g. the litellm_call_id) on this queue run in enqueue order
+        """
+        if queue_name == DEFAULT_LOGGING_QUEUE_NAME:
+            if self._queue is None:
+                return
+            logging_queue = self._get_logging_queue(queue_name)
+        else:
+            logging_queue = self._get_logging_queue(queue_name)
+            with contextlib.suppress(RuntimeError):  # no running event loop
+                self.start(queue_name=queue_name)
+
+        # Capture the current context when enqueueing
+        logging_queue.put(
+            LoggingTask(
+                coroutine=coroutine,
+                context=contextvars.copy_context(),
+                enqueued_at=time.perf_counter(),
+                ordering_key=ordering_key,
+            )
+        )
+
+    def ensure_initialized_and_enqueue(
+        self, async_coroutine: Coroutine, ordering_key: Optional[str] = None
+    ):
         """
         Ensure the logging worker is initialized and enqueue the coroutine.
         """
         self.start()
-        self.enqueue(async_coroutine)
+        self.enqueue(async_coroutine, ordering_key=ordering_key)
+
+    def get_queue_metrics(self) -> Dict[str, LoggingQueueMetrics]:
+        """Queue depth, latency and drop counters of each queue"""
+        return {
+            queue_name: logging_queue.get_metrics()
+            for queue_name, logging_queue in self._logging_queues.items()
+        }
 
     async def stop(self) -> None:
         """Stop the logging worker and clean up resources."""
-        if self._worker_task:
-            self._worker_task.cancel()
-            with contextlib.suppress(Exception):
-                await self._worker_task
-            self._worker_task = None
+        for logging_queue in list(self._logging_queues.values()):
+            if logging_queue.worker_task:
+                logging_queue.worker_task.cancel()
+                with contextlib.suppress(Exception):
+                    await logging_queue.worker_task
+                logging_queue.worker_task = None
 
     async def flush(self) -> None:
-        """Flush the logging queue."""
-        if self._queue is None:
-            return
-        while not self._queue.empty():
-            await self._queue.join()
+        """Flush the logging queues - including the callback queues filled while flushing."""
+        while True:
+            logging_queues: List[LoggingQueue] = [
+                logging_queue
+                for logging_queue in self._logging_queues.values()
+                if not logging_queue.queue.empty() or logging_queue.in_flight > 0
+            ]
+            if len(logging_queues) == 0:
+                return
+            for logging_queue in logging_queues:
+                await logging_queue.queue.join()
 
-    async def clear_queue(self):
+    async def clear_queue(self, queue_name: Optional[str] = None):
         """
         Clear the queue with a maximum time limit.
+
+        queue_name: the queue to clear - clears all queues if not set
         """
-        if self._queue is None:
+        if queue_name is not None:
+            logging_queues = [self._logging_queues[queue_name]]
+        else:
+            logging_queues = list(self._logging_queues.values())
+        if len(logging_queues) == 0:
             return
 
         start_time = asyncio.get_event_loop().time()
 
-        for _ in range(self.MAX_ITERATIONS_TO_CLEAR_QUEUE):
-            # Check if we've exceeded the maximum time
-            if (
-                asyncio.get_event_loop().time() - start_time
-                >= self.MAX_TIME_TO_CLEAR_QUEUE
-            ):
-                verbose_logger.warning(
-                    f"clear_queue exceeded max_time of {self.MAX_TIME_TO_CLEAR_QUEUE}s, stopping early"
+        for logging_queue in logging_queues:
+            for _ in range(self.MAX_ITERATIONS_TO_CLEAR_QUEUE):
+                # Check if we've exceeded the maximum time
+                remaining_time = self.MAX_TIME_TO_CLEAR_QUEUE - (
+                    asyncio.get_event_loop().time() - start_time
                 )
-                break
+                if remaining_time <= 0:
+                    verbose_logger.warning(
+                        f"clear_queue exceeded max_time of {self.MAX_TIME_TO_CLEAR_QUEUE}s, stopping early"
+                    )
+                    return
 
-            try:
-                task = self._queue.get_nowait()
-                # Await the coroutine to properly execute and avoid "never awaited" warnings
                 try:
-                    await asyncio.wait_for(
-                        task["context"].run(asyncio.create_task, task["coroutine"]),
-                        timeout=self.timeout,
-                    )
-                except Exception:
-                    # Suppress errors during cleanup
-                    pass
-                self._queue.task_done()  # If you're using join() elsewhere
-            except asyncio.QueueEmpty:
-                break
+                    task = logging_queue.queue.get_nowait()
+                    # Await the coroutine to properly execute and avoid "never awaited" warnings
+                    try:
+                        await self._run_task(
+                            task, timeout=min(self.timeout, remaining_time)
+                        )
+                    except Exception:
+                        # Suppress errors during cleanup
+                        pass
+                    logging_queue.record_done(task)
+                    logging_queue.queue.task_done()  # If you're using join() elsewhere
+                except asyncio.QueueEmpty:
+                    break
+
+
+def _create_logging_worker_task(coroutine: Coroutine) -> asyncio.Task:
+    _running_in_logging_worker.set(True)
+    return asyncio.create_task(coroutine)
 
 
 # Global instance for backward compatibility
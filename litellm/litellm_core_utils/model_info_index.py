@@ -0,0 +1,152 @@
+"""
+Index over `litellm.model_cost` for `_get_model_info_helper`
+
+- lookups: (model, custom_llm_provider) -> the `litellm.model_cost` key it resolved to (or None, if it isn't mapped)
+- entries: `litellm.model_cost` key -> its `ModelInfoBase`, built once
+
+Entries are checked against the raw `litellm.model_cost` value before they're returned, so in-place edits of
+`litellm.model_cost` are picked up. `register_model` invalidates the updated key + the lookups that probed it.
+Reassigning `litellm.model_cost`, or adding / removing keys, resets the index.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from litellm.constants import MODEL_INFO_INDEX_MAX_SIZE
+from litellm.types.utils import ModelInfoBase
+
+_LookupKey = Tuple[str, Optional[str]]
+
+
+class ModelInfoLookup:
+    __slots__ = ("key", "custom_llm_provider", "potential_model_names")
+
+    def __init__(
+        self,
+        key: Optional[str],
+        custom_llm_provider: Optional[str],
+        potential_model_names: Tuple[str, ...],
+    ):
+        self.key = key
+        self.custom_llm_provider = custom_llm_provider
+        self.potential_model_names = potential_model_names
+
+
+class _ModelInfoEntry:
+    __slots__ = ("raw_model_info", "raw_model_info_snapshot", "model_info")
+
+    def __init__(self, raw_model_info: dict, model_info: ModelInfoBase):
+        self.raw_model_info = raw_model_info
+        self.raw_model_info_snapshot = dict(raw_model_info)
+        self.model_info = model_info
+
+
+class ModelInfoIndex:
+    """
+    Lookups are bounded to `max_size` (oldest dropped first) - model names come from requests.
+    Entries are bounded by the size of `litellm.model_cost`.
+    """
+
+    def __init__(self, max_size: int = MODEL_INFO_INDEX_MAX_SIZE):
+        self.max_size = max_size
+        self._model_cost: Optional[dict] = None
+        self._model_cost_size = 0
+        self._lookups: "OrderedDict[_LookupKey, ModelInfoLookup]" = OrderedDict()
+        self._lookup_keys_by_model_name: Dict[str, Set[_LookupKey]] = {}
+        self._entries: Dict[str, _ModelInfoEntry] = {}
+        self._lock = threading.Lock()
+
+    def _is_valid_for(self, model_cost: dict) -> bool:
+        return (
+            model_cost is self._model_cost
+            and len(model_cost) == self._model_cost_size
+        )
+
+    def _reset(self, model_cost: dict) -> None:
+        with self._lock:
+            self._lookups.clear()
+            self._lookup_keys_by_model_name.clear()
+            self._entries.clear()
+            self._model_cost = model_cost
+            self._model_cost_size = len(model_cost)
+
+    def get_lookup(
+        self, model_cost: dict, model: str, custom_llm_provider: Optional[str]
+    ) -> Optional[ModelInfoLookup]:
+        if not self._is_valid_for(model_cost):
+            self._reset(model_cost)
+            return None
+        return self._lookups.get((model, custom_llm_provider))
+
+    def add_lookup(
+        self,
+        model_cost: dict,
+        model: str,
+        custom_llm_provider: Optional[str],
+        lookup: ModelInfoLookup,
+    ) -> None:
+        if not self._is_valid_for(model_cost):
+            return
+        lookup_key = (model, custom_llm_provider)
+        with self._lock:
+            self._remove_lookup(lookup_key)
+            self._lookups[lookup_key] = lookup
+            for model_name in lookup.potential_model_names:
+                self._lookup_keys_by_model_name.setdefault(model_name, set()).add(
+                    lookup_key
+                )
+            while len(self._lookups) > self.max_size:
+                self._remove_lookup(next(iter(self._lookups)))
+
+    def _remove_lookup(self, lookup_key: _LookupKey) -> None:
+        lookup = self._lookups.pop(lookup_key, None)
+        if lookup is None:
+            return
+        for model_name in lookup.potential_model_names:
+            lookup_keys = self._lookup_keys_by_model_name.get(model_name)
+            if lookup_keys is not None:
+                lookup_keys.discard(lookup_key)
+                if len(lookup_keys) == 0:
+                    del self._lookup_keys_by_model_name[model_name]
+
+    def get_model_info(self, model_cost: dict, key: str) -> Optional[ModelInfoBase]:
+        """Returns a copy of the `ModelInfoBase` for `key`, None if it's not indexed or `model_cost[key]` changed"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        raw_model_info = model_cost.get(key)
+        if (
+            raw_model_info is not entry.raw_model_info
+            or raw_model_info != entry.raw_model_info_snapshot
+        ):
+            return None
+        return ModelInfoBase(**entry.model_info)  # type: ignore
+
+    def add_model_info(
+        self, model_cost: dict, key: str, model_info: ModelInfoBase
+    ) -> None:
+        if not self._is_valid_for(model_cost) or key not in model_cost:
+            return
+        with self._lock:
+            self._entries[key] = _ModelInfoEntry(
+                raw_model_info=model_cost[key],
+                model_info=ModelInfoBase(**model_info),  # type: ignore
+            )
+
+    def invalidate(self, model_cost_keys: Iterable[str]) -> None:
+        """
+        Drop the entries for `model_cost_keys`, and the lookups that probed them.
+
+        New keys change the size of `litellm.model_cost` - that resets the whole index on the next lookup.
+        """
+        with self._lock:
+            for model_cost_key in model_cost_keys:
+                self._entries.pop(model_cost_key, None)
+                for lookup_key in list(
+                    self._lookup_keys_by_model_name.get(model_cost_key, ())
+                ):
+                    self._remove_lookup(lookup_key)
+
+
+model_info_index = ModelInfoIndex()
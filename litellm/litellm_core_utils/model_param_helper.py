@@ -1,4 +1,5 @@
-from typing import Set
+from functools import lru_cache
+from typing import FrozenSet, Set
 
 from openai.types.chat.completion_create_params import (
     CompletionCreateParamsNonStreaming,
@@ -46,12 +47,15 @@ class ModelParamHelper:
         combined_kwargs = all_openai_llm_api_params.difference(
             set(ModelParamHelper.get_exclude_params_for_model_parameters())
         )
-        return combined_kwargs
+        return set(combined_kwargs)
 
     @staticmethod
-    def _get_all_llm_api_params() -> Set[str]:
+    @lru_cache(maxsize=1)
+    def _get_all_llm_api_params() -> FrozenSet[str]:
         """
         Gets the supported kwargs for each call type and combines them
+
+        Computed once - called for every cache key
         """
         chat_completion_kwargs = (
             ModelParamHelper._get_litellm_supported_chat_completion_kwargs()
@@ -73,7 +77,7 @@ class ModelParamHelper:
             rerank_kwargs,
         )
         combined_kwargs = combined_kwargs.difference(exclude_kwargs)
-        return combined_kwargs
+        return frozenset(combined_kwargs)
 
     @staticmethod
     def get_litellm_provider_specific_params_for_chat_params() -> Set[str]:
@@ -2,10 +2,6 @@ import base64
 import time
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, cast
 
-from litellm.types.llms.openai import (
-    ChatCompletionAssistantContentValue,
-    ChatCompletionAudioDelta,
-)
 from litellm.types.utils import (
     ChatCompletionAudioResponse,
     ChatCompletionMessageToolCall,
@@ -46,279 +42,8 @@ class ChunkProcessor:
             )
         return chunks
 
-    def update_model_response_with_hidden_params(
-        self, model_response: ModelResponse, chunk: Optional[Dict[str, Any]] = None
-    ) -> ModelResponse:
-        if chunk is None:
-            return model_response
-        # set hidden params from chunk to model_response
-        if model_response is not None and hasattr(model_response, "_hidden_params"):
-            model_response._hidden_params = chunk.get("_hidden_params", {})
-        return model_response
-
     @staticmethod
-    def _get_chunk_id(chunks: List[Dict[str, Any]]) -> str:
-        """
-        Chunks:
-        [{"id": ""}, {"id": "1"}, {"id": "1"}]
-        """
-        for chunk in chunks:
-            if chunk.get("id"):
-                return chunk["id"]
-        return ""
-
-    def build_base_response(self, chunks: List[Dict[str, Any]]) -> ModelResponse:
-        chunk = self.first_chunk
-        id = ChunkProcessor._get_chunk_id(chunks)
-        object = chunk["object"]
-        created = chunk["created"]
-        model = chunk["model"]
-        system_fingerprint = chunk.get("system_fingerprint", None)
-
-        role = chunk["choices"][0]["delta"]["role"]
-        finish_reason = "stop"
-        for chunk in chunks:
-            if "choices" in chunk and len(chunk["choices"]) > 0:
-                if hasattr(chunk["choices"][0], "finish_reason"):
-                    finish_reason = chunk["choices"][0].finish_reason
-                elif "finish_reason" in chunk["choices"][0]:
-                    finish_reason = chunk["choices"][0]["finish_reason"]
-
-        # Initialize the response dictionary
-        response = ModelResponse(
-            **{
-                "id": id,
-                "object": object,
-                "created": created,
-                "model": model,
-                "system_fingerprint": system_fingerprint,
-                "choices": [
-                    {
-                        "index": 0,
-                        "message": {"role": role, "content": ""},
-                        "finish_reason": finish_reason,
-                    }
-                ],
-                "usage": {
-                    "prompt_tokens": 0,  # Modify as needed
-                    "completion_tokens": 0,  # Modify as needed
-                    "total_tokens": 0,  # Modify as needed
-                },
-            }
-        )
-
-        response = self.update_model_response_with_hidden_params(
-            model_response=response, chunk=chunk
-        )
-        return response
-
-    def get_combined_tool_content(
-        self, tool_call_chunks: List[Dict[str, Any]]
-    ) -> List[ChatCompletionMessageToolCall]:
-        tool_calls_list: List[ChatCompletionMessageToolCall] = []
-        tool_call_map: Dict[int, Dict[str, Any]] = (
-            {}
-        )  # Map to store tool calls by index
-
-        for chunk in tool_call_chunks:
-            choices = chunk["choices"]
-            for choice in choices:
-                delta = choice.get("delta", {})
-                tool_calls = delta.get("tool_calls", [])
-
-                for tool_call in tool_calls:
-                    if not tool_call or not hasattr(tool_call, "function"):
-                        continue
-
-                    index = getattr(tool_call, "index", 0)
-                    if index not in tool_call_map:
-                        tool_call_map[index] = {
-                            "id": None,
-                            "name": None,
-                            "type": None,
-                            "arguments": [],
-                        }
-
-                    if hasattr(tool_call, "id") and tool_call.id:
-                        tool_call_map[index]["id"] = tool_call.id
-                    if hasattr(tool_call, "type") and tool_call.type:
-                        tool_call_map[index]["type"] = tool_call.type
-                    if hasattr(tool_call, "function"):
-                        if (
-                            hasattr(tool_call.function, "name")
-                            and tool_call.function.name
-                        ):
-                            tool_call_map[index]["name"] = tool_call.function.name
-                        if (
-                            hasattr(tool_call.function, "arguments")
-                            and tool_call.function.arguments
-                        ):
-                            tool_call_map[index]["arguments"].append(
-                                tool_call.function.arguments
-                            )
-
-        # Convert the map to a list of tool calls
-        for index in sorted(tool_call_map.keys()):
-            tool_call_data = tool_call_map[index]
-            if tool_call_data["id"] and tool_call_data["name"]:
-                combined_arguments = "".join(tool_call_data["arguments"]) or "{}"
-                tool_calls_list.append(
-                    ChatCompletionMessageToolCall(
-                        id=tool_call_data["id"],
-                        function=Function(
-                            arguments=combined_arguments,
-                            name=tool_call_data["name"],
-                        ),
-                        type=tool_call_data["type"] or "function",
-                    )
-                )
-
-        return tool_calls_list
-
-    def get_combined_function_call_content(
-        self, function_call_chunks: List[Dict[str, Any]]
-    ) -> FunctionCall:
-        argument_list = []
-        delta = function_call_chunks[0]["choices"][0]["delta"]
-        function_call = delta.get("function_call", "")
-        function_call_name = function_call.name
-
-        for chunk in function_call_chunks:
-            choices = chunk["choices"]
-            for choice in choices:
-                delta = choice.get("delta", {})
-                function_call = delta.get("function_call", "")
-
-                # Check if a function call is present
-                if function_call:
-                    # Now, function_call is expected to be a dictionary
-                    arguments = function_call.arguments
-                    argument_list.append(arguments)
-
-        combined_arguments = "".join(argument_list)
-
-        return FunctionCall(
-            name=function_call_name,
-            arguments=combined_arguments,
-        )
-
-    def get_combined_content(
-        self, chunks: List[Dict[str, Any]], delta_key: str = "content"
-    ) -> ChatCompletionAssistantContentValue:
-        content_list: List[str] = []
-        for chunk in chunks:
-            choices = chunk["choices"]
-            for choice in choices:
-                delta = choice.get("delta", {})
-                content = delta.get(delta_key, "")
-                if content is None:
-                    continue  # openai v1.0.0 sets content = None for chunks
-                content_list.append(content)
-
-        # Combine the "content" strings into a single string || combine the 'function' strings into a single string
-        combined_content = "".join(content_list)
-
-        # Update the "content" field within the response dictionary
-        return combined_content
-
-    def get_combined_thinking_content(
-        self, chunks: List[Dict[str, Any]]
-    ) -> Optional[
-        List[
-            Union["ChatCompletionThinkingBlock", "ChatCompletionRedactedThinkingBlock"]
-        ]
-    ]:
-        from litellm.types.llms.openai import (
-            ChatCompletionRedactedThinkingBlock,
-            ChatCompletionThinkingBlock,
-        )
-
-        thinking_blocks: List[
-            Union["ChatCompletionThinkingBlock", "ChatCompletionRedactedThinkingBlock"]
-        ] = []
-        combined_thinking_text: Optional[str] = None
-        data: Optional[str] = None
-        signature: Optional[str] = None
-        type: Literal["thinking", "redacted_thinking"] = "thinking"
-        for chunk in chunks:
-            choices = chunk["choices"]
-            for choice in choices:
-                delta = choice.get("delta", {})
-                thinking = delta.get("thinking_blocks", None)
-                if thinking and isinstance(thinking, list):
-                    for thinking_block in thinking:
-                        thinking_type = thinking_block.get("type", None)
-                        if thinking_type and thinking_type == "redacted_thinking":
-                            type = "redacted_thinking"
-                            data = thinking_block.get("data", None)
-                        else:
-                            type = "thinking"
-                            thinking_text = thinking_block.get("thinking", None)
-                            if thinking_text:
-                                if combined_thinking_text is None:
-                                    combined_thinking_text = ""
-
-                                combined_thinking_text += thinking_text
-                            signature = thinking_block.get("signature", None)
-
-        if combined_thinking_text and type == "thinking" and signature:
-            thinking_blocks.append(
-                ChatCompletionThinkingBlock(
-                    type=type,
-                    thinking=combined_thinking_text,
-                    signature=signature,
-                )
-            )
-        elif data and type == "redacted_thinking":
-            thinking_blocks.append(
-                ChatCompletionRedactedThinkingBlock(
-                    type=type,
-                    data=data,
-                )
-            )
-
-        if len(thinking_blocks) > 0:
-            return thinking_blocks
-        return None
-
-    def get_combined_reasoning_content(
-        self, chunks: List[Dict[str, Any]]
-    ) -> ChatCompletionAssistantContentValue:
-        return self.get_combined_content(chunks, delta_key="reasoning_content")
-
-    def get_combined_audio_content(
-        self, chunks: List[Dict[str, Any]]
-    ) -> ChatCompletionAudioResponse:
-        base64_data_list: List[str] = []
-        transcript_list: List[str] = []
-        expires_at: Optional[int] = None
-        id: Optional[str] = None
-
-        for chunk in chunks:
-            choices = chunk["choices"]
-            for choice in choices:
-                delta = choice.get("delta") or {}
-                audio: Optional[ChatCompletionAudioDelta] = delta.get("audio")
-                if audio is not None:
-                    for k, v in audio.items():
-                        if k == "data" and v is not None and isinstance(v, str):
-                            base64_data_list.append(v)
-                        elif k == "transcript" and v is not None and isinstance(v, str):
-                            transcript_list.append(v)
-                        elif k == "expires_at" and v is not None and isinstance(v, int):
-                            expires_at = v
-                        elif k == "id" and v is not None and isinstance(v, str):
-                            id = v
-
-        concatenated_audio = concatenate_base64_list(base64_data_list)
-        return ChatCompletionAudioResponse(
-            data=concatenated_audio,
-            expires_at=expires_at or int(time.time() + 3600),
-            transcript="".join(transcript_list),
-            id=id,
-        )
-
-    def _usage_chunk_calculation_helper(self, usage_chunk: Usage) -> dict:
+    def _usage_chunk_calculation_helper(usage_chunk: Usage) -> dict:
         prompt_tokens = 0
         completion_tokens = 0
         ## anthropic prompt caching information ##
@@ -363,7 +88,8 @@ class ChunkProcessor:
             "prompt_tokens_details": prompt_tokens_details,
         }
 
-    def count_reasoning_tokens(self, response: ModelResponse) -> int:
+    @staticmethod
+    def count_reasoning_tokens(response: ModelResponse) -> int:
         reasoning_tokens = 0
         for choice in response.choices:
             if (
@@ -377,89 +103,105 @@ class ChunkProcessor:
 
         return reasoning_tokens
 
-    def _calculate_usage_per_chunk(
-        self,
-        chunks: List[Union[Dict[str, Any], ModelResponse]],
-    ) -> "UsagePerChunk":
+    @staticmethod
+    def _get_usage_from_chunk(
+        chunk: Union[Dict[str, Any], ModelResponse, ModelResponseStream],
+    ) -> Optional[Usage]:
+        if "usage" in chunk:
+            return chunk["usage"]
+        elif (
+            isinstance(chunk, ModelResponse) or isinstance(chunk, ModelResponseStream)
+        ) and hasattr(chunk, "_hidden_params"):
+            return chunk._hidden_params.get("usage", None)
+        return None
+
+    @staticmethod
+    def _get_empty_usage_per_chunk() -> "UsagePerChunk":
         from litellm.types.litellm_core_utils.streaming_chunk_builder_utils import (
             UsagePerChunk,
         )
 
-        # # Update usage information if needed
-        prompt_tokens = 0
-        completion_tokens = 0
-        ## anthropic prompt caching information ##
-        cache_creation_input_tokens: Optional[int] = None
-        cache_read_input_tokens: Optional[int] = None
-
-        web_search_requests: Optional[int] = None
-        completion_tokens_details: Optional[CompletionTokensDetails] = None
-        prompt_tokens_details: Optional[PromptTokensDetailsWrapper] = None
-        for chunk in chunks:
-            usage_chunk: Optional[Usage] = None
-            if "usage" in chunk:
-                usage_chunk = chunk["usage"]
-            elif (
-                isinstance(chunk, ModelResponse)
-                or isinstance(chunk, ModelResponseStream)
-            ) and hasattr(chunk, "_hidden_params"):
-                usage_chunk = chunk._hidden_params.get("usage", None)
+        return UsagePerChunk(
+            prompt_tokens=0,
+            completion_tokens=0,
+            cache_creation_input_tokens=None,
+            cache_read_input_tokens=None,
+            web_search_requests=None,
+            completion_tokens_details=None,
+            prompt_tokens_details=None,
+        )
 
-            if usage_chunk is not None:
-                usage_chunk_dict = self._usage_chunk_calculation_helper(usage_chunk)
-                if (
-                    usage_chunk_dict["prompt_tokens"] is not None
-                    and usage_chunk_dict["prompt_tokens"] > 0
-                ):
-                    prompt_tokens = usage_chunk_dict["prompt_tokens"]
-                if (
-                    usage_chunk_dict["completion_tokens"] is not None
-                    and usage_chunk_dict["completion_tokens"] > 0
-                ):
-                    completion_tokens = usage_chunk_dict["completion_tokens"]
-                if usage_chunk_dict["cache_creation_input_tokens"] is not None and (
-                    usage_chunk_dict["cache_creation_input_tokens"] > 0
-                    or cache_creation_input_tokens is None
-                ):
-                    cache_creation_input_tokens = usage_chunk_dict[
-                        "cache_creation_input_tokens"
-                    ]
-                if usage_chunk_dict["cache_read_input_tokens"] is not None and (
-                    usage_chunk_dict["cache_read_input_tokens"] > 0
-                    or cache_read_input_tokens is None
-                ):
-                    cache_read_input_tokens = usage_chunk_dict[
-                        "cache_read_input_tokens"
-                    ]
-                if usage_chunk_dict["completion_tokens_details"] is not None:
-                    completion_tokens_details = usage_chunk_dict[
-                        "completion_tokens_details"
-                    ]
-                if (
-                    usage_chunk_dict["prompt_tokens_details"] is not None
-                    and getattr(
-                        usage_chunk_dict["prompt_tokens_details"],
-                        "web_search_requests",
-                        None,
-                    )
-                    is not None
-                ):
-                    web_search_requests = getattr(
-                        usage_chunk_dict["prompt_tokens_details"],
-                        "web_search_requests",
-                    )
+    @staticmethod
+    def _add_usage_chunk(
+        calculated_usage_per_chunk: "UsagePerChunk", usage_chunk: Usage
+    ) -> None:
+        """
+        Fold the usage of 1 chunk into the usage calculated so far - the most recent non-zero values win.
+        """
+        usage_chunk_dict = ChunkProcessor._usage_chunk_calculation_helper(usage_chunk)
+        if (
+            usage_chunk_dict["prompt_tokens"] is not None
+            and usage_chunk_dict["prompt_tokens"] > 0
+        ):
+            calculated_usage_per_chunk["prompt_tokens"] = usage_chunk_dict[
+                "prompt_tokens"
+            ]
+        if (
+            usage_chunk_dict["completion_tokens"] is not None
+            and usage_chunk_dict["completion_tokens"] > 0
+        ):
+            calculated_usage_per_chunk["completion_tokens"] = usage_chunk_dict[
+                "completion_tokens"
+            ]
+        if usage_chunk_dict["cache_creation_input_tokens"] is not None and (
+            usage_chunk_dict["cache_creation_input_tokens"] > 0
+            or calculated_usage_per_chunk["cache_creation_input_tokens"] is None
+        ):
+            calculated_usage_per_chunk["cache_creation_input_tokens"] = (
+                usage_chunk_dict["cache_creation_input_tokens"]
+            )
+        if usage_chunk_dict["cache_read_input_tokens"] is not None and (
+            usage_chunk_dict["cache_read_input_tokens"] > 0
+            or calculated_usage_per_chunk["cache_read_input_tokens"] is None
+        ):
+            calculated_usage_per_chunk["cache_read_input_tokens"] = usage_chunk_dict[
+                "cache_read_input_tokens"
+            ]
+        if usage_chunk_dict["completion_tokens_details"] is not None:
+            calculated_usage_per_chunk["completion_tokens_details"] = (
+                usage_chunk_dict["completion_tokens_details"]
+            )
+        if (
+            usage_chunk_dict["prompt_tokens_details"] is not None
+            and getattr(
+                usage_chunk_dict["prompt_tokens_details"],
+                "web_search_requests",
+                None,
+            )
+            is not None
+        ):
+            calculated_usage_per_chunk["web_search_requests"] = getattr(
+                usage_chunk_dict["prompt_tokens_details"],
+                "web_search_requests",
+            )
 
-                prompt_tokens_details = usage_chunk_dict["prompt_tokens_details"]
+        calculated_usage_per_chunk["prompt_tokens_details"] = usage_chunk_dict[
+            "prompt_tokens_details"
+        ]
 
-        return UsagePerChunk(
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            cache_creation_input_tokens=cache_creation_input_tokens,
-            cache_read_input_tokens=cache_read_input_tokens,
-            web_search_requests=web_search_requests,
-            completion_tokens_details=completion_tokens_details,
-            prompt_tokens_details=prompt_tokens_details,
-        )
+    def _calculate_usage_per_chunk(
+        self,
+        chunks: List[Union[Dict[str, Any], ModelResponse]],
+    ) -> "UsagePerChunk":
+        calculated_usage_per_chunk = self._get_empty_usage_per_chunk()
+        for chunk in chunks:
+            usage_chunk = self._get_usage_from_chunk(chunk)
+            if usage_chunk is not None:
+                self._add_usage_chunk(
+                    calculated_usage_per_chunk=calculated_usage_per_chunk,
+                    usage_chunk=usage_chunk,
+                )
+        return calculated_usage_per_chunk
 
     def calculate_usage(
         self,
@@ -472,10 +214,26 @@ class ChunkProcessor:
         """
         Calculate usage for the given chunks.
         """
-        returned_usage = Usage()
-        # # Update usage information if needed
+        return self._build_usage(
+            calculated_usage_per_chunk=self._calculate_usage_per_chunk(chunks=chunks),
+            model=model,
+            completion_output=completion_output,
+            messages=messages,
+            reasoning_tokens=reasoning_tokens,
+        )
 
-        calculated_usage_per_chunk = self._calculate_usage_per_chunk(chunks=chunks)
+    @staticmethod
+    def _build_usage(
+        calculated_usage_per_chunk: "UsagePerChunk",
+        model: str,
+        completion_output: str,
+        messages: Optional[List] = None,
+        reasoning_tokens: Optional[int] = None,
+    ) -> Usage:
+        """
+        Build the usage object from the usage calculated over the chunks - missing token counts are counted with `token_counter`.
+        """
+        returned_usage = Usage()
         prompt_tokens = calculated_usage_per_chunk["prompt_tokens"]
         completion_tokens = calculated_usage_per_chunk["completion_tokens"]
         ## anthropic prompt caching information ##
@@ -566,18 +324,342 @@ class ChunkProcessor:
         return returned_usage
 
 
-def concatenate_base64_list(base64_strings: List[str]) -> str:
+class StreamingResponseAccumulator:
     """
-    Concatenates a list of base64-encoded strings.
+    Folds chat completion chunks into running buffers as they arrive, so the complete response is built without
+    keeping the chunks alive. Memory grows with the generated text, not with the number of chunks.
 
-    Args:
-        base64_strings (List[str]): A list of base64 strings to concatenate.
+    Works on attribute access, so it accepts both `ModelResponseStream` and `openai.types.chat.ChatCompletionChunk`
+    objects without converting them. Only the first choice is assembled - same as `stream_chunk_builder`.
 
-    Returns:
-        str: The concatenated result as a base64-encoded string.
+    Used by `CustomStreamWrapper` and `stream_chunk_builder`.
     """
-    # Decode each base64 string and collect the resulting bytes
-    combined_bytes = b"".join(base64.b64decode(b64_str) for b64_str in base64_strings)
 
-    # Encode the concatenated bytes back to base64
-    return base64.b64encode(combined_bytes).decode("utf-8")
+    def __init__(self):
+        self.id: Optional[str] = None
+        self.object: Optional[str] = None
+        self.created: Optional[int] = None
+        self.model: Optional[str] = None
+        self.system_fingerprint: Optional[str] = None
+        self.role: Optional[str] = None
+        self.finish_reason: Optional[str] = None
+        self.hidden_params: Optional[dict] = None
+        self.usage_per_chunk: Optional["UsagePerChunk"] = None
+        self.has_content: bool = False
+        self.content_parts: List[str] = []
+        self.has_reasoning_content: bool = False
+        self.reasoning_content_parts: List[str] = []
+        self.tool_calls: Dict[int, Dict[str, Any]] = {}  # index -> tool call
+        self.has_function_call: bool = False
+        self.function_call_name: Optional[str] = None
+        self.function_call_arguments_parts: List[str] = []
+        ## thinking blocks - combined into 1 block
+        self.thinking_parts: List[str] = []
+        self.thinking_signature: Optional[str] = None
+        self.thinking_type: Literal["thinking", "redacted_thinking"] = "thinking"
+        self.redacted_thinking_data: Optional[str] = None
+        self.annotations: Optional[List] = None
+        ## audio
+        self.has_audio: bool = False
+        self.audio_data: bytearray = bytearray()
+        self.audio_transcript_parts: List[str] = []
+        self.audio_expires_at: Optional[int] = None
+        self.audio_id: Optional[str] = None
+        ## used by `CustomStreamWrapper.safety_checker` - number of consecutive chunks with the same content
+        self.repeated_content: Optional[str] = None
+        self.repeated_content_count: int = 0
+        self.num_chunks: int = 0
+
+    @property
+    def content(self) -> str:
+        return "".join(self.content_parts)
+
+    def add_chunk(self, chunk: Any) -> None:
+        if self.num_chunks == 0:
+            self.object = getattr(chunk, "object", None)
+            self.created = getattr(chunk, "created", None)
+            self.model = getattr(chunk, "model", None)
+            self.system_fingerprint = getattr(chunk, "system_fingerprint", None)
+        self.num_chunks += 1
+        if self.id is None:
+            self.id = getattr(chunk, "id", None) or None
+        self.hidden_params = getattr(chunk, "_hidden_params", self.hidden_params)
+
+        self._add_usage(chunk)
+
+        choices = getattr(chunk, "choices", None)
+        if not choices:
+            self._update_repeated_content(content=None)
+            return
+        choice = choices[0]
+        finish_reason = getattr(choice, "finish_reason", None)
+        if finish_reason:
+            self.finish_reason = finish_reason
+
+        delta = getattr(choice, "delta", None)
+        if delta is None:
+            self._update_repeated_content(content=None)
+            return
+        if self.num_chunks == 1:
+            self.role = getattr(delta, "role", None)
+
+        content = getattr(delta, "content", None)
+        self._update_repeated_content(content=content)
+        if content is not None:
+            self.has_content = True
+            self.content_parts.append(content)
+
+        reasoning_content = getattr(delta, "reasoning_content", None)
+        if reasoning_content is not None:
+            self.has_reasoning_content = True
+            self.reasoning_content_parts.append(reasoning_content)
+
+        tool_calls = getattr(delta, "tool_calls", None)
+        if tool_calls:
+            self._add_tool_calls(tool_calls)
+
+        function_call = getattr(delta, "function_call", None)
+        if function_call:
+            self._add_function_call(function_call)
+
+        thinking_blocks = getattr(delta, "thinking_blocks", None)
+        if thinking_blocks and isinstance(thinking_blocks, list):
+            self._add_thinking_blocks(thinking_blocks)
+
+        annotations = getattr(delta, "annotations", None)
+        if annotations is not None and self.annotations is None:
+            self.annotations = annotations
+
+        audio = getattr(delta, "audio", None)
+        if audio is not None:
+            self._add_audio(audio)
+
+    def _update_repeated_content(self, content: Optional[str]) -> None:
+        if self.repeated_content_count > 0 and content == self.repeated_content:
+            self.repeated_content_count += 1
+        else:
+            self.repeated_content = content
+            self.repeated_content_count = 1
+
+    def _add_usage(self, chunk: Any) -> None:
+        if isinstance(chunk, (ModelResponse, ModelResponseStream)):
+            usage = ChunkProcessor._get_usage_from_chunk(chunk)
+        else:
+            usage = getattr(chunk, "usage", None)
+        if usage is None:
+            return
+        if not isinstance(usage, (Usage, dict)):
+            usage = Usage(**usage.model_dump())
+        if self.usage_per_chunk is None:
+            self.usage_per_chunk = ChunkProcessor._get_empty_usage_per_chunk()
+        ChunkProcessor._add_usage_chunk(
+            calculated_usage_per_chunk=self.usage_per_chunk, usage_chunk=usage
+        )
+
+    def _add_tool_calls(self, tool_calls: list) -> None:
+        for tool_call in tool_calls:
+            if not tool_call:
+                continue
+            function = getattr(tool_call, "function", None)
+            if function is None:
+                continue
+            index = getattr(tool_call, "index", 0) or 0
+            tool_call_data = self.tool_calls.get(index)
+            if tool_call_data is None:
+                tool_call_data = self.tool_calls[index] = {
+                    "id": None,
+                    "name": None,
+                    "type": None,
+                    "arguments": [],
+                }
+            if getattr(tool_call, "id", None):
+                tool_call_data["id"] = tool_call.id
+            if getattr(tool_call, "type", None):
+                tool_call_data["type"] = tool_call.type
+            if getattr(function, "name", None):
+                tool_call_data["name"] = function.name
+            if getattr(function, "arguments", None):
+                tool_call_data["arguments"].append(function.arguments)
+
+    def _add_function_call(self, function_call: Any) -> None:
+        if not self.has_function_call:
+            self.has_function_call = True
+            self.function_call_name = getattr(function_call, "name", None)
+        arguments = getattr(function_call, "arguments", None)
+        if arguments:
+            self.function_call_arguments_parts.append(arguments)
+
+    def _add_thinking_blocks(self, thinking_blocks: list) -> None:
+        for thinking_block in thinking_blocks:
+            thinking_type = thinking_block.get("type", None)
+            if thinking_type and thinking_type == "redacted_thinking":
+                self.thinking_type = "redacted_thinking"
+                self.redacted_thinking_data = thinking_block.get("data", None)
+            else:
+                self.thinking_type = "thinking"
+                thinking_text = thinking_block.get("thinking", None)
+                if thinking_text:
+                    self.thinking_parts.append(thinking_text)
+                self.thinking_signature = thinking_block.get("signature", None)
+
+    def _add_audio(self, audio: Any) -> None:
+        self.has_audio = True
+        audio_delta: dict = audio if isinstance(audio, dict) else vars(audio)
+        data = audio_delta.get("data")
+        if data is not None and isinstance(data, str):
+            self.audio_data += base64.b64decode(data)
+        transcript = audio_delta.get("transcript")
+        if transcript is not None and isinstance(transcript, str):
+            self.audio_transcript_parts.append(transcript)
+        expires_at = audio_delta.get("expires_at")
+        if expires_at is not None and isinstance(expires_at, int):
+            self.audio_expires_at = expires_at
+        audio_id = audio_delta.get("id")
+        if audio_id is not None and isinstance(audio_id, str):
+            self.audio_id = audio_id
+
+    def _get_tool_calls(self) -> List[ChatCompletionMessageToolCall]:
+        tool_calls_list: List[ChatCompletionMessageToolCall] = []
+        for index in sorted(self.tool_calls.keys()):
+            tool_call_data = self.tool_calls[index]
+            if tool_call_data["id"] and tool_call_data["name"]:
+                tool_calls_list.append(
+                    ChatCompletionMessageToolCall(
+                        id=tool_call_data["id"],
+                        function=Function(
+                            arguments="".join(tool_call_data["arguments"]) or "{}",
+                            name=tool_call_data["name"],
+                        ),
+                        type=tool_call_data["type"] or "function",
+                    )
+                )
+        return tool_calls_list
+
+    def _get_thinking_blocks(
+        self,
+    ) -> Optional[
+        List[
+            Union["ChatCompletionThinkingBlock", "ChatCompletionRedactedThinkingBlock"]
+        ]
+    ]:
+        from litellm.types.llms.openai import (
+            ChatCompletionRedactedThinkingBlock,
+            ChatCompletionThinkingBlock,
+        )
+
+        if (
+            self.thinking_parts
+            and self.thinking_type == "thinking"
+            and self.thinking_signature
+        ):
+            return [
+                ChatCompletionThinkingBlock(
+                    type="thinking",
+                    thinking="".join(self.thinking_parts),
+                    signature=self.thinking_signature,
+                )
+            ]
+        elif self.redacted_thinking_data and self.thinking_type == "redacted_thinking":
+            return [
+                ChatCompletionRedactedThinkingBlock(
+                    type="redacted_thinking",
+                    data=self.redacted_thinking_data,
+                )
+            ]
+        return None
+
+    def get_total_usage(self) -> Usage:
+        """
+        Prompt + completion tokens reported by the provider so far - no token counting.
+        """
+        prompt_tokens = 0
+        completion_tokens = 0
+        if self.usage_per_chunk is not None:
+            prompt_tokens = self.usage_per_chunk["prompt_tokens"]
+            completion_tokens = self.usage_per_chunk["completion_tokens"]
+        return Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+
+    def build_model_response(
+        self,
+        model: Optional[str] = None,
+        messages: Optional[List] = None,
+        logging_obj: Optional[Any] = None,
+    ) -> ModelResponse:
+        """
+        Build the complete response from the running buffers.
+
+        model: the model name to return - defaults to the model of the first chunk
+        logging_obj: used to add the response cost to the usage, if `litellm.include_cost_in_streaming_usage` is set
+        """
+        import litellm
+        from litellm.litellm_core_utils.prompt_templates.common_utils import (
+            get_content_from_model_response,
+        )
+
+        model = model or self.model or ""
+        message: Dict[str, Any] = {"role": self.role, "content": ""}
+        tool_calls = self._get_tool_calls()
+        if self.tool_calls:
+            message["content"] = None
+            message["tool_calls"] = tool_calls
+        if self.has_function_call:
+            message["content"] = None
+            message["function_call"] = FunctionCall(
+                name=self.function_call_name,
+                arguments="".join(self.function_call_arguments_parts),
+            )
+        if self.has_content:
+            message["content"] = self.content
+        if self.thinking_parts or self.redacted_thinking_data:
+            message["thinking_blocks"] = self._get_thinking_blocks()
+        if self.has_reasoning_content:
+            message["reasoning_content"] = "".join(self.reasoning_content_parts)
+        if self.annotations is not None:
+            message["annotations"] = self.annotations
+
+        response = ModelResponse(
+            id=self.id or "",
+            object=self.object,
+            created=self.created,
+            model=model,
+            system_fingerprint=self.system_fingerprint,
+            choices=[
+                Choices(
+                    index=0,
+                    message=message,
+                    finish_reason=self.finish_reason or "stop",
+                )
+            ],
+        )
+        if self.has_audio:
+            cast(Choices, response.choices[0]).message.audio = (
+                ChatCompletionAudioResponse(
+                    data=base64.b64encode(self.audio_data).decode("utf-8"),
+                    expires_at=self.audio_expires_at or int(time.time() + 3600),
+                    transcript="".join(self.audio_transcript_parts),
+                    id=self.audio_id,
+                )
+            )
+        if self.hidden_params is not None:
+            response._hidden_params = self.hidden_params
+
+        usage = ChunkProcessor._build_usage(
+            calculated_usage_per_chunk=self.usage_per_chunk
+            or ChunkProcessor._get_empty_usage_per_chunk(),
+            model=model,
+            completion_output=get_content_from_model_response(response),
+            messages=messages,
+            reasoning_tokens=ChunkProcessor.count_reasoning_tokens(response),
+        )
+        setattr(response, "usage", usage)
+
+        # Add cost to usage object if include_cost_in_streaming_usage is True
+        if litellm.include_cost_in_streaming_usage and logging_obj is not None:
+            setattr(
+                usage, "cost", logging_obj._response_cost_calculator(result=response)
+            )
+        return response
@@ -5,7 +5,7 @@ import json
 import threading
 import time
 import traceback
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Dict, Optional, Union, cast
 
 import httpx
 from pydantic import BaseModel
@@ -25,6 +25,9 @@ from litellm.types.utils import (
 )
 from litellm.types.utils import GenericStreamingChunk as GChunk
 from litellm.types.utils import (
+    ChatCompletionDeltaToolCall,
+    Function,
+    FunctionCall,
     ModelResponse,
     ModelResponseStream,
     StreamingChoices,
@@ -142,11 +145,16 @@ class CustomStreamWrapper:
             True if self.check_send_stream_usage(self.stream_options) else False
         )
         self.tool_call = False
-        self.chunks: List = (
-            []
-        )  # keep track of the returned chunks - used for calculating the input/output tokens for stream options
+        from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+            StreamingResponseAccumulator,
+        )
+
+        self.response_accumulator = (
+            StreamingResponseAccumulator()
+        )  # folds the returned chunks into the complete response - used for logging + calculating the input/output tokens for stream options
         self.is_function_call = self.check_is_function_call(logging_obj=logging_obj)
         self.created: Optional[int] = None
+        self.lean_streaming: bool = self._is_lean_streaming_enabled()
 
     def __iter__(self):
         return self
@@ -198,28 +206,25 @@ class CustomStreamWrapper:
 
         Raises - InternalServerError, if LLM enters infinite loop while streaming
         """
-        if len(self.chunks) >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
-            # Get the last n chunks
-            last_chunks = self.chunks[-litellm.REPEATED_STREAMING_CHUNK_LIMIT :]
-
-            # Extract the relevant content from the chunks
-            last_contents = [chunk.choices[0].delta.content for chunk in last_chunks]
-
-            # Check if all extracted contents are identical
-            if all(content == last_contents[0] for content in last_contents):
-                if (
-                    last_contents[0] is not None
-                    and isinstance(last_contents[0], str)
-                    and len(last_contents[0]) > 2
-                ):  # ignore empty content - https://github.com/BerriAI/litellm/issues/5158#issuecomment-2287156946
-                    # All last n chunks are identical
-                    raise litellm.InternalServerError(
-                        message="The model is repeating the same chunk = {}.".format(
-                            last_contents[0]
-                        ),
-                        model="",
-                        llm_provider="",
-                    )
+        # the accumulator counts how many of the last chunks have identical content
+        if (
+            self.response_accumulator.repeated_content_count
+            >= litellm.REPEATED_STREAMING_CHUNK_LIMIT
+        ):
+            last_content = self.response_accumulator.repeated_content
+            if (
+                last_content is not None
+                and isinstance(last_content, str)
+                and len(last_content) > 2
+            ):  # ignore empty content - https://github.com/BerriAI/litellm/issues/5158#issuecomment-2287156946
+                # All last n chunks are identical
+                raise litellm.InternalServerError(
+                    message="The model is repeating the same chunk = {}.".format(
+                        last_content
+                    ),
+                    model="",
+                    llm_provider="",
+                )
 
     def check_special_tokens(self, chunk: str, finish_reason: Optional[str]):
         """
@@ -607,9 +612,10 @@ class CustomStreamWrapper:
         except Exception as e:
             raise e
 
-    def model_response_creator(
-        self, chunk: Optional[dict] = None, hidden_params: Optional[dict] = None
-    ):
+    def _get_response_model(self) -> str:
+        """
+        Model name returned on chunks - prefixed with the provider for openai-compatible providers
+        """
         _model = self.model
         _received_llm_provider = self.custom_llm_provider
         _logging_obj_llm_provider = self.logging_obj.model_call_details.get("custom_llm_provider", None)  # type: ignore
@@ -618,6 +624,13 @@ class CustomStreamWrapper:
             and _received_llm_provider != _logging_obj_llm_provider
         ):
             _model = "{}/{}".format(_logging_obj_llm_provider, _model)
+        return _model
+
+    def model_response_creator(
+        self, chunk: Optional[dict] = None, hidden_params: Optional[dict] = None
+    ):
+        _model = self._get_response_model()
+        _logging_obj_llm_provider = self.logging_obj.model_call_details.get("custom_llm_provider", None)  # type: ignore
         if chunk is None:
             chunk = {}
         else:
@@ -947,7 +960,7 @@ class CustomStreamWrapper:
 
                 # Default - return StopIteration
                 if hasattr(model_response, "usage"):
-                    self.chunks.append(model_response)
+                    self.response_accumulator.add_chunk(model_response)
                 raise StopIteration
             # flush any remaining holding chunk
             if len(self.holding_chunk) > 0:
@@ -977,7 +990,7 @@ class CustomStreamWrapper:
             return self._handle_special_delta_content(model_response)
         else:
             if hasattr(model_response, "usage"):
-                self.chunks.append(model_response)
+                self.response_accumulator.add_chunk(model_response)
             return
 
     def _optional_combine_thinking_block_in_choices(
@@ -1507,6 +1520,248 @@ class CustomStreamWrapper:
                 original_exception=e,
             )
 
+    def _is_lean_streaming_enabled(self) -> bool:
+        """
+        Lean streaming - `litellm.lean_streaming = True`.
+
+        Chunks from providers that already emit OpenAI-shaped chunks are forwarded as-is, instead of being rebuilt
+        by `chunk_creator`. The complete response for logging is assembled incrementally.
+
+        Disabled when a feature needs the per-chunk processing of `chunk_creator`.
+        """
+        if litellm.lean_streaming is not True:
+            return False
+        if (
+            self.custom_llm_provider == "cached_response"
+            or self.custom_llm_provider in litellm._custom_providers
+            or self.merge_reasoning_content_in_choices is True
+            or self.is_function_call is True
+            or len(litellm.post_call_rules) > 0
+        ):
+            return False
+
+        from litellm.integrations.custom_logger import CustomLogger
+
+        for callback in litellm.callbacks:
+            if (
+                isinstance(callback, CustomLogger)
+                and type(callback).async_post_call_streaming_deployment_hook
+                is not CustomLogger.async_post_call_streaming_deployment_hook
+            ):  # the hook modifies the final chunk
+                return False
+        return True
+
+    @staticmethod
+    def _is_openai_shaped_chunk(chunk: Any) -> bool:
+        return isinstance(chunk, (ModelResponseStream, ChatCompletionChunk))
+
+    def _process_lean_streaming_chunk(
+        self, chunk: Any
+    ) -> Optional[ModelResponseStream]:
+        """
+        Fold the chunk into the accumulator and return it as a `ModelResponseStream`, with light patches - the
+        per-chunk processing of `chunk_creator` is skipped.
+
+        Returns None if the chunk should not be sent to the client.
+        """
+        self.response_accumulator.add_chunk(chunk)
+
+        if self.logging_obj.completion_start_time is None:
+            self.logging_obj._update_completion_start_time(
+                completion_start_time=datetime.datetime.now()
+            )
+
+        send_usage = True
+        if getattr(chunk, "usage", None) is not None and not self.send_stream_usage:
+            # usage is only sent to the client if requested - it's kept in the accumulator for logging
+            if not chunk.choices:
+                return None
+            send_usage = False
+        elif not chunk.choices and getattr(chunk, "usage", None) is None:
+            return None
+
+        if isinstance(chunk, ModelResponseStream):
+            if not send_usage:
+                delattr(chunk, "usage")
+            chunk.model = self._get_response_model()
+            chunk._hidden_params = {
+                **chunk._hidden_params,
+                "custom_llm_provider": self.logging_obj.model_call_details.get(
+                    "custom_llm_provider", None
+                ),
+                **self._hidden_params,
+                "response_cost": None,
+            }
+            model_response: ModelResponseStream = chunk
+        else:  # openai sdk `ChatCompletionChunk`
+            model_response = self._build_lean_chunk_from_openai_chunk(
+                chunk=chunk, send_usage=send_usage
+            )
+
+        self.sent_first_chunk = True
+        return model_response
+
+    def _build_lean_chunk_from_openai_chunk(
+        self, chunk: ChatCompletionChunk, send_usage: bool
+    ) -> ModelResponseStream:
+        """
+        Build a `ModelResponseStream` from the attributes of an openai sdk chunk - same result as
+        `model_response_creator(chunk=chunk.model_dump(exclude_none=True))`, without dumping the chunk to a dict
+        and validating it again.
+        """
+        choices = []
+        for choice in chunk.choices:
+            delta = choice.delta
+            delta_params: Dict[str, Any] = dict(delta.model_extra or {})
+            if delta.refusal is not None:
+                delta_params["refusal"] = delta.refusal
+            tool_calls = None
+            if delta.tool_calls is not None:
+                tool_calls = [
+                    ChatCompletionDeltaToolCall(
+                        id=tool_call.id,
+                        type=tool_call.type,
+                        index=tool_call.index,
+                        function=Function(
+                            arguments=tool_call.function.arguments,
+                            name=tool_call.function.name,
+                        )
+                        if tool_call.function is not None
+                        else Function(),
+                    )
+                    for tool_call in delta.tool_calls
+                ]
+            function_call = None
+            if delta.function_call is not None:
+                function_call = FunctionCall(
+                    arguments=delta.function_call.arguments or "",
+                    name=delta.function_call.name,
+                )
+            choice_params: Dict[str, Any] = dict(choice.model_extra or {})
+            choices.append(
+                StreamingChoices(
+                    finish_reason=choice.finish_reason,
+                    index=choice.index,
+                    delta=Delta(
+                        content=delta.content,
+                        role=delta.role,
+                        function_call=function_call,
+                        tool_calls=tool_calls,
+                        **delta_params,
+                    ),
+                    logprobs=choice.logprobs.model_dump()
+                    if choice.logprobs is not None
+                    else None,
+                    **choice_params,
+                )
+            )
+
+        response_params: Dict[str, Any] = dict(chunk.model_extra or {})
+        response_params.pop("stream", None)
+        if chunk.service_tier is not None:
+            response_params["service_tier"] = chunk.service_tier
+        if send_usage and chunk.usage is not None:
+            response_params["usage"] = chunk.usage.model_dump(exclude_none=True)
+
+        model_response = ModelResponseStream(
+            id=self.response_id or chunk.id,
+            created=self.created or chunk.created,
+            model=self._get_response_model(),
+            system_fingerprint=self.system_fingerprint or chunk.system_fingerprint,
+            choices=choices,
+            **response_params,
+        )
+        if self.created is None:  # maintain same 'created' across all chunks
+            self.created = model_response.created
+        model_response._hidden_params = {
+            **model_response._hidden_params,
+            "custom_llm_provider": self.logging_obj.model_call_details.get(
+                "custom_llm_provider", None
+            ),
+            "created_at": time.time(),
+            **self._hidden_params,
+            "response_cost": None,
+        }
+        return model_response
+
+    def _finish_lean_streaming(
+        self, cache_hit: bool, is_async: bool = True
+    ) -> Optional[ModelResponseStream]:
+        """
+        Run success logging + caching on the incrementally assembled response.
+
+        `is_async` - called from `__anext__`. The sync iterator only runs the sync success handler and cache.
+
+        Returns a final usage chunk, if usage was requested but not sent by the provider.
+        """
+        if self.sent_last_chunk is True or self.response_accumulator.num_chunks == 0:
+            return None
+        self.sent_last_chunk = True
+
+        complete_streaming_response = self.response_accumulator.build_model_response(
+            model=self._get_response_model(), messages=self.messages
+        )
+        complete_streaming_response._hidden_params = {
+            "custom_llm_provider": self.logging_obj.model_call_details.get(
+                "custom_llm_provider", None
+            ),
+            **self._hidden_params,
+            "response_cost": None,
+        }
+
+        if not is_async:
+            self.cache_streaming_response(
+                processed_chunk=complete_streaming_response.model_copy(deep=True),
+                cache_hit=cache_hit,
+            )
+        else:
+            if self.logging_obj._llm_caching_handler is not None:
+                asyncio.create_task(
+                    self.async_cache_streaming_response(
+                        processed_chunk=complete_streaming_response.model_copy(
+                            deep=True
+                        ),
+                        cache_hit=cache_hit,
+                    )
+                )
+            asyncio.create_task(
+                self.logging_obj.async_success_handler(
+                    complete_streaming_response,
+                    cache_hit=cache_hit,
+                    start_time=None,
+                    end_time=None,
+                )
+            )
+        executor.submit(
+            self.logging_obj.success_handler,
+            complete_streaming_response,
+            cache_hit=cache_hit,
+            start_time=None,
+            end_time=None,
+        )
+
+        if (
+            self.send_stream_usage is True
+            and self.response_accumulator.usage_per_chunk is None
+        ):
+            self.sent_stream_usage = True
+            response = self.model_response_creator()
+            setattr(response, "usage", getattr(complete_streaming_response, "usage"))
+            return response
+        return None
+
+    def build_complete_streaming_response(self) -> Optional[ModelResponse]:
+        """
+        Build the complete response from the chunks returned so far.
+
+        Returns None if no chunks were returned.
+        """
+        if self.response_accumulator.num_chunks == 0:
+            return None
+        return self.response_accumulator.build_model_response(
+            messages=self.messages, logging_obj=self.logging_obj
+        )
+
     def set_logging_event_loop(self, loop):
         """
         import litellm, asyncio
@@ -1644,6 +1899,19 @@ class CustomStreamWrapper:
                 else:
                     chunk = next(self.completion_stream)
                 if chunk is not None and chunk != b"":
+                    if self.lean_streaming is True:
+                        if (
+                            self.response_accumulator.num_chunks == 0
+                            and not self._is_openai_shaped_chunk(chunk)
+                        ):
+                            # provider chunks need the full chunk_creator processing
+                            self.lean_streaming = False
+                        else:
+                            lean_chunk = self._process_lean_streaming_chunk(chunk)
+                            if lean_chunk is None:
+                                continue
+                            return lean_chunk
+
                     print_verbose(
                         f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}; custom_llm_provider: {self.custom_llm_provider}"
                     )
@@ -1674,7 +1942,7 @@ class CustomStreamWrapper:
                         input=self.response_uptil_now, model=self.model
                     )
                     # HANDLE STREAM OPTIONS
-                    self.chunks.append(response)
+                    self.response_accumulator.add_chunk(response)
                     if hasattr(
                         response, "usage"
                     ):  # remove usage from chunk, only send on final chunk
@@ -1698,18 +1966,21 @@ class CustomStreamWrapper:
                             continue
                     # add usage as hidden param
                     if self.sent_last_chunk is True and self.stream_options is None:
-                        usage = calculate_total_usage(chunks=self.chunks)
+                        usage = self.response_accumulator.get_total_usage()
                         response._hidden_params["usage"] = usage
                     # RETURN RESULT
                     return response
 
         except StopIteration:
-            if self.sent_last_chunk is True:
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks,
-                    messages=self.messages,
-                    logging_obj=self.logging_obj,
+            if self.lean_streaming is True and self.response_accumulator.num_chunks > 0:
+                usage_chunk = self._finish_lean_streaming(
+                    cache_hit=cache_hit, is_async=False
                 )
+                if usage_chunk is not None:
+                    return usage_chunk
+                raise
+            if self.sent_last_chunk is True:
+                complete_streaming_response = self.build_complete_streaming_response()
 
                 response = self.model_response_creator()
                 if complete_streaming_response is not None:
@@ -1747,7 +2018,7 @@ class CustomStreamWrapper:
                 self.sent_last_chunk = True
                 processed_chunk = self.finish_reason_handler()
                 if self.stream_options is None:  # add usage as hidden param
-                    usage = calculate_total_usage(chunks=self.chunks)
+                    usage = self.response_accumulator.get_total_usage()
                     processed_chunk._hidden_params["usage"] = usage
                 ## LOGGING
                 executor.submit(
@@ -1811,6 +2082,20 @@ class CustomStreamWrapper:
                         and len(chunk.parts) == 0
                     ):
                         continue
+
+                    if self.lean_streaming is True:
+                        if (
+                            self.response_accumulator.num_chunks == 0
+                            and not self._is_openai_shaped_chunk(chunk)
+                        ):
+                            # provider chunks need the full chunk_creator processing
+                            self.lean_streaming = False
+                        else:
+                            lean_chunk = self._process_lean_streaming_chunk(chunk)
+                            if lean_chunk is None:
+                                continue
+                            return lean_chunk
+
                     # chunk_creator() does logging/stream chunk building. We need to let it know its being called in_async_func, so we don't double add chunks.
                     # __anext__ also calls async_success_handler, which does logging
                     verbose_logger.debug(
@@ -1839,7 +2124,7 @@ class CustomStreamWrapper:
                     self.rules.post_call_rules(
                         input=self.response_uptil_now, model=self.model
                     )
-                    self.chunks.append(processed_chunk)
+                    self.response_accumulator.add_chunk(processed_chunk)
                     if hasattr(
                         processed_chunk, "usage"
                     ):  # remove usage from chunk, only send on final chunk
@@ -1862,7 +2147,7 @@ class CustomStreamWrapper:
 
                     # add usage as hidden param
                     if self.sent_last_chunk is True and self.stream_options is None:
-                        usage = calculate_total_usage(chunks=self.chunks)
+                        usage = self.response_accumulator.get_total_usage()
                         processed_chunk._hidden_params["usage"] = usage
                     
                     # Call post-call streaming deployment hook for final chunk
@@ -1873,6 +2158,7 @@ class CustomStreamWrapper:
                 raise StopAsyncIteration
             else:  # temporary patch for non-aiohttp async calls
                 # example - boto3 bedrock llms
+                self.lean_streaming = False
                 while True:
                     if isinstance(self.completion_stream, str) or isinstance(
                         self.completion_stream, bytes
@@ -1902,16 +2188,17 @@ class CustomStreamWrapper:
                             input=self.response_uptil_now, model=self.model
                         )
                         # RETURN RESULT
-                        self.chunks.append(processed_chunk)
+                        self.response_accumulator.add_chunk(processed_chunk)
                         return processed_chunk
         except (StopAsyncIteration, StopIteration):
+            if self.lean_streaming is True and self.response_accumulator.num_chunks > 0:
+                usage_chunk = self._finish_lean_streaming(cache_hit=cache_hit)
+                if usage_chunk is not None:
+                    return usage_chunk
+                raise StopAsyncIteration
             if self.sent_last_chunk is True:
                 # log the final chunk with accurate streaming values
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks,
-                    messages=self.messages,
-                    logging_obj=self.logging_obj,
-                )
+                complete_streaming_response = self.build_complete_streaming_response()
 
                 response = self.model_response_creator()
                 if complete_streaming_response is not None:
@@ -2000,7 +2287,11 @@ class CustomStreamWrapper:
                     model=self.model,
                     llm_provider=self.custom_llm_provider or "anthropic",
                     original_exception=e,
-                    generated_content=self.response_uptil_now,
+                    generated_content=(
+                        self.response_accumulator.content
+                        if self.lean_streaming is True
+                        else self.response_uptil_now
+                    ),
                     is_pre_first_chunk=not self.sent_first_chunk,
                 )
 
@@ -2041,26 +2332,6 @@ class CustomStreamWrapper:
         return chunk
 
 
-def calculate_total_usage(chunks: List[ModelResponse]) -> Usage:
-    """Assume most recent usage chunk has total usage uptil then."""
-    prompt_tokens: int = 0
-    completion_tokens: int = 0
-    for chunk in chunks:
-        if "usage" in chunk:
-            if "prompt_tokens" in chunk["usage"]:
-                prompt_tokens = chunk["usage"].get("prompt_tokens", 0) or 0
-            if "completion_tokens" in chunk["usage"]:
-                completion_tokens = chunk["usage"].get("completion_tokens", 0) or 0
-
-    returned_usage_chunk = Usage(
-        prompt_tokens=prompt_tokens,
-        completion_tokens=completion_tokens,
-        total_tokens=prompt_tokens + completion_tokens,
-    )
-
-    return returned_usage_chunk
-
-
 def generic_chunk_has_all_required_fields(chunk: dict) -> bool:
     """
     Checks if the provided chunk dictionary contains all required fields for GenericStreamingChunk.
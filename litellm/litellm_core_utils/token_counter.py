@@ -1,9 +1,27 @@
 # What is this?
 ## Helper utilities for token counting
+import asyncio
 import base64
+import binascii
+import hashlib
 import io
+import json
 import struct
-from typing import Callable, List, Literal, Optional, Tuple, Union, cast
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import tiktoken
 
@@ -13,13 +31,25 @@ from litellm.constants import (
     DEFAULT_IMAGE_HEIGHT,
     DEFAULT_IMAGE_TOKEN_COUNT,
     DEFAULT_IMAGE_WIDTH,
+    DEFAULT_TOKEN_ESTIMATOR_BYTES_PER_TOKEN,
+    IMAGE_DIMENSION_CACHE_MAX_SIZE,
+    IMAGE_DIMENSION_CACHE_TTL_SECONDS,
+    IMAGE_DIMENSION_PROBE_BYTES,
     MAX_LONG_SIDE_FOR_IMAGE_HIGH_RES,
     MAX_SHORT_SIDE_FOR_IMAGE_HIGH_RES,
     MAX_TILE_HEIGHT,
     MAX_TILE_WIDTH,
+    REQUEST_TOKEN_COUNT_MEMO_SIZE,
+    TOKEN_COUNTER_MESSAGE_CACHE_SIZE,
+    TOKEN_ESTIMATOR_MAX_TOKENIZERS,
 )
+from litellm.caching.in_memory_cache import InMemoryCache
 from litellm.litellm_core_utils.default_encoding import encoding as default_encoding
-from litellm.llms.custom_httpx.http_handler import _get_httpx_client
+from litellm.llms.custom_httpx.http_handler import (
+    _get_httpx_client,
+    get_async_httpx_client,
+)
+from litellm.types.llms.custom_http import httpxSpecialProvider
 from litellm.types.llms.openai import (
     AllMessageValues,
     ChatCompletionNamedToolChoiceParam,
@@ -183,11 +213,202 @@ def get_image_type(image_data: bytes) -> Union[str, None]:
     return None
 
 
+def _get_image_dimensions_from_bytes(img_data: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Read the width and height from an image's header.
+
+    Returns the default dimensions if the image type isn't recognized, None if `img_data` is cut off before
+    the dimensions (e.g. only the start of the image was fetched).
+    """
+    img_type = get_image_type(img_data)
+
+    try:
+        if img_type == "png":
+            w, h = struct.unpack(">LL", img_data[16:24])
+            return w, h
+        elif img_type == "gif":
+            w, h = struct.unpack("<HH", img_data[6:10])
+            return w, h
+        elif img_type == "jpeg":
+            with io.BytesIO(img_data) as fhandle:
+                fhandle.seek(0)
+                size = 2
+                ftype = 0
+                while not 0xC0 <= ftype <= 0xCF or ftype in (0xC4, 0xC8, 0xCC):
+                    fhandle.seek(size, 1)
+                    byte = fhandle.read(1)
+                    while ord(byte) == 0xFF:
+                        byte = fhandle.read(1)
+                    ftype = ord(byte)
+                    size = struct.unpack(">H", fhandle.read(2))[0] - 2
+                fhandle.seek(1, 1)
+                h, w = struct.unpack(">HH", fhandle.read(4))
+            return w, h
+        elif img_type == "webp":
+            # For WebP, the dimensions are stored at different offsets depending on the format
+            # Check for VP8X (extended format)
+            if img_data[12:16] == b"VP8X":
+                w = struct.unpack("<I", img_data[24:27] + b"\x00")[0] + 1
+                h = struct.unpack("<I", img_data[27:30] + b"\x00")[0] + 1
+                return w, h
+            # Check for VP8 (lossy format)
+            elif img_data[12:16] == b"VP8 ":
+                w = struct.unpack("<H", img_data[26:28])[0] & 0x3FFF
+                h = struct.unpack("<H", img_data[28:30])[0] & 0x3FFF
+                return w, h
+            # Check for VP8L (lossless format)
+            elif img_data[12:16] == b"VP8L":
+                bits = struct.unpack("<I", img_data[21:25])[0]
+                w = (bits & 0x3FFF) + 1
+                h = ((bits >> 14) & 0x3FFF) + 1
+                return w, h
+    except (struct.error, TypeError):
+        # header is cut off - e.g. `ord(b"")` at the end of a truncated jpeg
+        return None
+
+    # return sensible default image dimensions if unable to get dimensions
+    return DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT
+
+
+def _is_image_url(data: str) -> bool:
+    return data.startswith(("http://", "https://"))
+
+
+def _get_base64_image_dimensions(data: str) -> Tuple[int, int]:
+    """
+    Only the start of the image is decoded - the dimensions are in the header.
+    """
+    _header, encoded = data.split(",", 1)
+    probe_length = (IMAGE_DIMENSION_PROBE_BYTES // 3) * 4
+    dimensions: Optional[Tuple[int, int]] = None
+    if len(encoded) > probe_length:
+        try:
+            dimensions = _get_image_dimensions_from_bytes(
+                base64.b64decode(encoded[:probe_length])
+            )
+        except binascii.Error:
+            dimensions = None
+    if dimensions is None:
+        dimensions = _get_image_dimensions_from_bytes(base64.b64decode(encoded))
+    return dimensions or (DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT)
+
+
+def _fetch_image_dimensions(url: str) -> Tuple[int, int]:
+    """
+    Fetch the first `IMAGE_DIMENSION_PROBE_BYTES` of the image (Range request), and read its dimensions.
+
+    Falls back to fetching the whole image, if the dimensions aren't in the first bytes.
+    """
+    client = _get_httpx_client()
+    img_data = b""
+    with client.client.stream(
+        "GET", url, headers={"Range": f"bytes=0-{IMAGE_DIMENSION_PROBE_BYTES - 1}"}
+    ) as response:
+        for chunk in response.iter_bytes():
+            img_data += chunk
+            if len(img_data) >= IMAGE_DIMENSION_PROBE_BYTES:
+                break
+    dimensions = _get_image_dimensions_from_bytes(img_data)
+    if dimensions is None:
+        dimensions = _get_image_dimensions_from_bytes(client.get(url).read())
+    return dimensions or (DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT)
+
+
+async def _async_fetch_image_dimensions(url: str) -> Tuple[int, int]:
+    """
+    Async version of `_fetch_image_dimensions`
+    """
+    client = get_async_httpx_client(llm_provider=httpxSpecialProvider.TokenCounter)
+    img_data = b""
+    async with client.client.stream(
+        "GET", url, headers={"Range": f"bytes=0-{IMAGE_DIMENSION_PROBE_BYTES - 1}"}
+    ) as response:
+        async for chunk in response.aiter_bytes():
+            img_data += chunk
+            if len(img_data) >= IMAGE_DIMENSION_PROBE_BYTES:
+                break
+    dimensions = _get_image_dimensions_from_bytes(img_data)
+    if dimensions is None:
+        response = await client.get(url)
+        dimensions = _get_image_dimensions_from_bytes(response.content)
+    return dimensions or (DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT)
+
+
+class ImageDimensionCache:
+    """
+    Image URL -> (width, height), bounded by `IMAGE_DIMENSION_CACHE_MAX_SIZE` + `IMAGE_DIMENSION_CACHE_TTL_SECONDS`.
+
+    Also tracks in-flight async probes, so an image referenced by several messages / requests is fetched once.
+    """
+
+    def __init__(
+        self,
+        max_size: int = IMAGE_DIMENSION_CACHE_MAX_SIZE,
+        ttl: int = IMAGE_DIMENSION_CACHE_TTL_SECONDS,
+    ):
+        self.cache = InMemoryCache(max_size_in_memory=max_size, default_ttl=ttl)
+        self._probes: Dict[str, "asyncio.Task[Tuple[int, int]]"] = {}
+
+    def get(self, url: str) -> Optional[Tuple[int, int]]:
+        dimensions = self.cache.get_cache(key=url)
+        if dimensions is None:
+            return None
+        return dimensions[0], dimensions[1]
+
+    def set(self, url: str, dimensions: Tuple[int, int]) -> None:
+        self.cache.set_cache(key=url, value=dimensions)
+
+    async def async_probe(self, url: str) -> Tuple[int, int]:
+        dimensions = self.get(url)
+        if dimensions is not None:
+            return dimensions
+        probe = self._get_or_create_probe(asyncio.get_running_loop(), url)
+        return await asyncio.shield(probe)
+
+    def schedule_probe(self, loop: asyncio.AbstractEventLoop, url: str) -> None:
+        """Probe `url` in the background on `loop` - so the next count for it is exact"""
+        self._get_or_create_probe(loop, url)
+
+    def _get_or_create_probe(
+        self, loop: asyncio.AbstractEventLoop, url: str
+    ) -> "asyncio.Task[Tuple[int, int]]":
+        probe = self._probes.get(url)
+        if probe is None or probe.get_loop() is not loop:
+            probe = loop.create_task(_async_fetch_image_dimensions(url))
+            self._probes[url] = probe
+            probe.add_done_callback(lambda _probe: self._on_probe_done(url, _probe))
+        return probe
+
+    def _on_probe_done(self, url: str, probe: "asyncio.Task[Tuple[int, int]]") -> None:
+        if self._probes.get(url) is probe:
+            del self._probes[url]
+        if probe.cancelled():
+            return
+        if probe.exception() is not None:
+            verbose_logger.debug(
+                "Error getting image dimensions for %s: %s", url, probe.exception()
+            )
+            return
+        self.set(url, probe.result())
+
+
+image_dimension_cache = ImageDimensionCache()
+# set when `get_image_dimensions` returned the default dimensions for an image URL that's still being probed
+_used_default_image_dimensions: ContextVar[bool] = ContextVar(
+    "_used_default_image_dimensions", default=False
+)
+
+
 def get_image_dimensions(
     data: str,
 ) -> Tuple[int, int]:
     """
-    Async Function to get the dimensions of an image from a URL or base64 encoded string.
+    Function to get the dimensions of an image from a URL or base64 encoded string.
+
+    URL dimensions are cached. Only the start of the image is fetched (Range request).
+    On a running event loop, uncached URLs aren't fetched - the default dimensions are returned and the URL is probed
+    in the background, so the event loop is never blocked. Async callers that need exact counts prefetch the
+    dimensions first - see `async_prefetch_image_dimensions`.
 
     Args:
         data (str): The URL or base64 encoded string of the image.
@@ -195,61 +416,78 @@ def get_image_dimensions(
     Returns:
         Tuple[int, int]: The width and height of the image.
     """
-    img_data = None
+    if not _is_image_url(data):
+        return _get_base64_image_dimensions(data)
+
+    dimensions = image_dimension_cache.get(data)
+    if dimensions is not None:
+        return dimensions
+
     try:
-        # Try to open as URL
-        client = _get_httpx_client()
-        response = client.get(data)
-        img_data = response.read()
-    except Exception:
-        # If not URL, assume it's base64
-        _header, encoded = data.split(",", 1)
-        img_data = base64.b64decode(encoded)
+        loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if loop is not None:
+        verbose_logger.debug(
+            "get_image_dimensions: %s is not cached, counting it as %sx%s while it's probed in the background",
+            data,
+            DEFAULT_IMAGE_WIDTH,
+            DEFAULT_IMAGE_HEIGHT,
+        )
+        image_dimension_cache.schedule_probe(loop, data)
+        _used_default_image_dimensions.set(True)
+        return DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT
 
-    img_type = get_image_type(img_data)
+    dimensions = _fetch_image_dimensions(data)
+    image_dimension_cache.set(data, dimensions)
+    return dimensions
 
-    if img_type == "png":
-        w, h = struct.unpack(">LL", img_data[16:24])
-        return w, h
-    elif img_type == "gif":
-        w, h = struct.unpack("<HH", img_data[6:10])
-        return w, h
-    elif img_type == "jpeg":
-        with io.BytesIO(img_data) as fhandle:
-            fhandle.seek(0)
-            size = 2
-            ftype = 0
-            while not 0xC0 <= ftype <= 0xCF or ftype in (0xC4, 0xC8, 0xCC):
-                fhandle.seek(size, 1)
-                byte = fhandle.read(1)
-                while ord(byte) == 0xFF:
-                    byte = fhandle.read(1)
-                ftype = ord(byte)
-                size = struct.unpack(">H", fhandle.read(2))[0] - 2
-            fhandle.seek(1, 1)
-            h, w = struct.unpack(">HH", fhandle.read(4))
-        return w, h
-    elif img_type == "webp":
-        # For WebP, the dimensions are stored at different offsets depending on the format
-        # Check for VP8X (extended format)
-        if img_data[12:16] == b"VP8X":
-            w = struct.unpack("<I", img_data[24:27] + b"\x00")[0] + 1
-            h = struct.unpack("<I", img_data[27:30] + b"\x00")[0] + 1
-            return w, h
-        # Check for VP8 (lossy format)
-        elif img_data[12:16] == b"VP8 ":
-            w = struct.unpack("<H", img_data[26:28])[0] & 0x3FFF
-            h = struct.unpack("<H", img_data[28:30])[0] & 0x3FFF
-            return w, h
-        # Check for VP8L (lossless format)
-        elif img_data[12:16] == b"VP8L":
-            bits = struct.unpack("<I", img_data[21:25])[0]
-            w = (bits & 0x3FFF) + 1
-            h = ((bits >> 14) & 0x3FFF) + 1
-            return w, h
 
-    # return sensible default image dimensions if unable to get dimensions
-    return DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT
+async def async_get_image_dimensions(
+    data: str,
+) -> Tuple[int, int]:
+    """
+    Async version of `get_image_dimensions` - fetches uncached URLs without blocking the event loop.
+    """
+    if not _is_image_url(data):
+        return _get_base64_image_dimensions(data)
+    return await image_dimension_cache.async_probe(data)
+
+
+async def async_prefetch_image_dimensions(
+    messages: Optional[Sequence[Union[AllMessageValues, Message, dict]]],
+) -> None:
+    """
+    Probe the dimensions of every high detail image URL in `messages` in parallel, so `token_counter` reads them
+    from the cache instead of returning the default dimensions.
+
+    Errors are ignored - `token_counter` handles the image as it would without the prefetch.
+    """
+    if not messages:
+        return
+    urls = set()
+    for message in messages:
+        content = (
+            message.get("content")
+            if isinstance(message, dict)
+            else getattr(message, "content", None)
+        )
+        if not isinstance(content, list):
+            continue
+        for content_part in content:
+            if not isinstance(content_part, dict) or content_part.get("type") != "image_url":
+                continue
+            image_url = content_part.get("image_url")
+            if isinstance(image_url, dict) and image_url.get("detail") == "high":
+                url = image_url.get("url")
+                if isinstance(url, str) and _is_image_url(url):
+                    urls.add(url)
+    if len(urls) == 0:
+        return
+    await asyncio.gather(
+        *(image_dimension_cache.async_probe(url) for url in urls),
+        return_exceptions=True,
+    )
 
 
 def calculate_img_tokens(
@@ -299,6 +537,166 @@ Type for a function that counts tokens in a string.
 """
 
 
+class MessageTokenCountCache:
+    """
+    LRU of per-message token counts, keyed by the tokenizer, the message count params and a hash of the message.
+
+    Multi-turn conversations resend every previous message - only the new ones get tokenized.
+    """
+
+    def __init__(self, max_size: int = TOKEN_COUNTER_MESSAGE_CACHE_SIZE):
+        self.max_size = max_size
+        self._cache: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_message_hash(message: AllMessageValues) -> Optional[bytes]:
+        try:
+            message_str = json.dumps(message, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(message_str.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: Hashable) -> Optional[int]:
+        with self._lock:
+            num_tokens = self._cache.get(key)
+            if num_tokens is not None:
+                self._cache.move_to_end(key)
+            return num_tokens
+
+    def set(self, key: Hashable, num_tokens: int) -> None:
+        with self._lock:
+            self._cache[key] = num_tokens
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+class TokenCountEstimator:
+    """
+    Approximates token counts from the UTF-8 byte length of the text.
+
+    The bytes / token ratio is calibrated per tokenizer, from the exact counts `token_counter` computes - only while
+    `litellm.use_token_count_estimator_for_routing` is True, so exact counts don't pay for it otherwise.
+    Until then, `default_bytes_per_token` is used. At most `max_tokenizers` ratios are kept - the oldest is dropped first.
+    """
+
+    # weight of the default ratio - so the first few (short) strings counted don't skew the estimate
+    PRIOR_NUM_TOKENS = 1000
+
+    def __init__(
+        self,
+        default_bytes_per_token: float = DEFAULT_TOKEN_ESTIMATOR_BYTES_PER_TOKEN,
+        max_tokenizers: int = TOKEN_ESTIMATOR_MAX_TOKENIZERS,
+    ):
+        self.default_bytes_per_token = default_bytes_per_token
+        self.max_tokenizers = max_tokenizers
+        # tokenizer key -> [num bytes, num tokens]
+        self._samples: "OrderedDict[Hashable, List[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def calibrate(
+        self, tokenizer_key: Optional[Hashable], text: str, num_tokens: int
+    ) -> None:
+        if tokenizer_key is None:
+            return
+        samples = self._samples.get(tokenizer_key)
+        if samples is None:
+            with self._lock:
+                samples = self._samples.setdefault(
+                    tokenizer_key,
+                    [
+                        int(self.default_bytes_per_token * self.PRIOR_NUM_TOKENS),
+                        self.PRIOR_NUM_TOKENS,
+                    ],
+                )
+                while len(self._samples) > self.max_tokenizers:
+                    self._samples.popitem(last=False)
+        # not locked - a lost sample under contention doesn't matter for an estimate
+        samples[0] += len(text.encode("utf-8", errors="ignore"))
+        samples[1] += num_tokens
+
+    def get_bytes_per_token(self, tokenizer_key: Optional[Hashable]) -> float:
+        samples = self._samples.get(tokenizer_key) if tokenizer_key is not None else None
+        if samples is None or samples[1] == 0:
+            return self.default_bytes_per_token
+        return samples[0] / samples[1]
+
+    def estimate(self, tokenizer_key: Optional[Hashable], text: str) -> int:
+        if not text:
+            return 0
+        num_bytes = len(text.encode("utf-8", errors="ignore"))
+        return max(1, round(num_bytes / self.get_bytes_per_token(tokenizer_key)))
+
+
+class RequestTokenCountMemo:
+    """
+    Input token counts of recent requests, keyed by (`litellm_trace_id`, model, approximate) - for `get_request_token_count`.
+
+    Kept out of the request metadata, which is logged. An entry only holds the count and the `id()` + length of the
+    counted input - not the input itself, so a finished request's messages aren't kept alive by the memo. lists and
+    strings can't be weakly referenced; a stale match needs the same trace id, with its input replaced by a new one
+    of the same length at the same address.
+    """
+
+    def __init__(self, max_size: int = REQUEST_TOKEN_COUNT_MEMO_SIZE):
+        self.max_size = max_size
+        # (trace id, model, approximate) -> ((id + length of messages, id of text), token count)
+        self._cache: "OrderedDict[Tuple[str, str, bool], Tuple[Tuple[int, int, int], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_input_fingerprint(
+        messages: Optional[List], text: Optional[Union[str, List[str]]]
+    ) -> Tuple[int, int, int]:
+        return (
+            id(messages),
+            len(messages) if messages is not None else 0,
+            id(text),
+        )
+
+    def get(
+        self,
+        key: Tuple[str, str, bool],
+        messages: Optional[List],
+        text: Optional[Union[str, List[str]]],
+    ) -> Optional[int]:
+        with self._lock:
+            entry = self._cache.get(key)
+        if entry is None:
+            return None
+        input_fingerprint, num_tokens = entry
+        if input_fingerprint != self._get_input_fingerprint(messages, text):
+            return None
+        return num_tokens
+
+    def set(
+        self,
+        key: Tuple[str, str, bool],
+        messages: Optional[List],
+        text: Optional[Union[str, List[str]]],
+        num_tokens: int,
+    ) -> None:
+        with self._lock:
+            self._cache[key] = (self._get_input_fingerprint(messages, text), num_tokens)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+message_token_count_cache = MessageTokenCountCache()
+token_count_estimator = TokenCountEstimator()
+request_token_count_memo = RequestTokenCountMemo()
+
+
 class _MessageCountParams:
     """
     A class to hold the parameters for counting tokens in messages.
@@ -308,6 +706,7 @@ class _MessageCountParams:
         self,
         model: str,
         custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]],
+        approximate: bool = False,
     ):
         from litellm.utils import print_verbose
 
@@ -329,7 +728,17 @@ class _MessageCountParams:
             )
             self.tokens_per_message = 3
             self.tokens_per_name = 1
-        self.count_function = _get_count_function(model, custom_tokenizer)
+        self.count_function, tokenizer_key = _get_count_function_and_tokenizer_key(
+            model, custom_tokenizer, approximate
+        )
+        # estimates are cheaper than hashing the message - only exact counts are cached
+        self.message_cache_key: Optional[tuple] = None
+        if tokenizer_key is not None and approximate is False:
+            self.message_cache_key = (
+                tokenizer_key,
+                self.tokens_per_message,
+                self.tokens_per_name,
+            )
 
 
 def token_counter(
@@ -360,6 +769,99 @@ def token_counter(
     Returns:
     int: The number of tokens in the text.
     """
+    return _token_counter(
+        model=model,
+        custom_tokenizer=custom_tokenizer,
+        text=text,
+        messages=messages,
+        count_response_tokens=count_response_tokens,
+        tools=tools,
+        tool_choice=tool_choice,
+        use_default_image_token_count=use_default_image_token_count,
+        default_token_count=default_token_count,
+        approximate=False,
+    )
+
+
+def estimate_token_count(
+    model="",
+    custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
+    text: Optional[Union[str, List[str]]] = None,
+    messages: Optional[List[Union[AllMessageValues, Message]]] = None,
+    tools: Optional[List[ChatCompletionToolParam]] = None,
+    tool_choice: Optional[ChatCompletionNamedToolChoiceParam] = None,
+) -> int:
+    """
+    Fast approximation of `token_counter` - for routing decisions, where an exact count isn't needed.
+
+    Text is counted from its UTF-8 byte length, using the bytes / token ratio `token_counter` has observed
+    for the model's tokenizer. Images use the default image token count - no GET request is made.
+    """
+    return _token_counter(
+        model=model,
+        custom_tokenizer=custom_tokenizer,
+        text=text,
+        messages=messages,
+        count_response_tokens=False,
+        tools=tools,
+        tool_choice=tool_choice,
+        use_default_image_token_count=True,
+        default_token_count=None,
+        approximate=True,
+    )
+
+
+def get_request_token_count(
+    request_kwargs: Optional[dict],
+    model: str = "",
+    messages: Optional[List] = None,
+    text: Optional[Union[str, List[str]]] = None,
+) -> int:
+    """
+    Input token count for a request - memoized in `request_token_count_memo`, so pre-call checks + routing strategies
+    only count a request once.
+
+    The memo is keyed on the request's `litellm_trace_id` and the model, and only matches the same input objects (by
+    `id()`).
+    Uses `estimate_token_count` if `litellm.use_token_count_estimator_for_routing` is True.
+    """
+    approximate = litellm.use_token_count_estimator_for_routing is True
+    trace_id = (
+        request_kwargs.get("litellm_trace_id") if request_kwargs is not None else None
+    )
+    memo_key: Optional[Tuple[str, str, bool]] = None
+    if isinstance(trace_id, str):
+        memo_key = (trace_id, model, approximate)
+        num_tokens = request_token_count_memo.get(
+            memo_key, messages=messages, text=text
+        )
+        if num_tokens is not None:
+            return num_tokens
+
+    if approximate:
+        num_tokens = estimate_token_count(model=model, messages=messages, text=text)
+    else:
+        num_tokens = token_counter(model=model, messages=messages, text=text)
+
+    if memo_key is not None:
+        request_token_count_memo.set(
+            memo_key, messages=messages, text=text, num_tokens=num_tokens
+        )
+    return num_tokens
+
+
+def _token_counter(
+    model: str,
+    custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]],
+    text: Optional[Union[str, List[str]]],
+    messages: Optional[List[Union[AllMessageValues, Message]]],
+    count_response_tokens: Optional[bool],
+    tools: Optional[List[ChatCompletionToolParam]],
+    tool_choice: Optional[ChatCompletionNamedToolChoiceParam],
+    use_default_image_token_count: Optional[bool],
+    default_token_count: Optional[int],
+    approximate: bool,
+) -> int:
     from litellm.utils import convert_list_message_to_dict
 
     #########################################################
@@ -386,14 +888,16 @@ def token_counter(
             text_to_count = "".join(t for t in text if isinstance(t, str))
         elif isinstance(text, str):
             text_to_count = text
-        count_function = _get_count_function(model, custom_tokenizer)
+        count_function, _ = _get_count_function_and_tokenizer_key(
+            model, custom_tokenizer, approximate
+        )
         num_tokens = count_function(text_to_count)
 
     elif messages is not None:
         new_messages = cast(
             List[AllMessageValues], convert_list_message_to_dict(messages)
         )
-        params = _MessageCountParams(model, custom_tokenizer)
+        params = _MessageCountParams(model, custom_tokenizer, approximate)
         num_tokens = _count_messages(
             params, new_messages, use_default_image_token_count, default_token_count
         )
@@ -420,6 +924,9 @@ def _count_messages(
     """
     Count the number of tokens in a list of messages.
 
+    Messages already counted with the same tokenizer + params are read from `message_token_count_cache`. Counts that
+    used the default dimensions for an image that's still being probed aren't cached - the next count is exact.
+
     Args:
         params (_MessageCountParams): The parameters for counting tokens.
         messages (List[AllMessageValues]): The list of messages to count tokens in.
@@ -430,40 +937,85 @@ def _count_messages(
     if len(messages) == 0:
         return num_tokens
     for message in messages:
-        num_tokens += params.tokens_per_message
-        for key, value in message.items():
-            if value is None:
-                pass
-            elif key == "tool_calls":
-                if isinstance(value, List):
-                    for tool_call in value:
-                        if "function" in tool_call:
-                            function_arguments = tool_call["function"].get(
-                                "arguments", []
-                            )
-                            num_tokens += params.count_function(str(function_arguments))
-                        else:
-                            raise ValueError(
-                                f"Unsupported tool call {tool_call} must contain a function key"
-                            )
-                else:
-                    raise ValueError(
-                        f"Unsupported type {type(value)} for key tool_calls in message {message}"
-                    )
-            elif isinstance(value, str):
-                num_tokens += params.count_function(value)
-                if key == "name":
-                    num_tokens += params.tokens_per_name
-            elif key == "content" and isinstance(value, List):
-                num_tokens += _count_content_list(
-                    params.count_function,
-                    value,
+        message_cache_key: Optional[tuple] = None
+        if params.message_cache_key is not None:
+            message_hash = MessageTokenCountCache.get_message_hash(message)
+            if message_hash is not None:
+                message_cache_key = (
+                    *params.message_cache_key,
                     use_default_image_token_count,
                     default_token_count,
+                    message_hash,
                 )
+                cached_num_tokens = message_token_count_cache.get(message_cache_key)
+                if cached_num_tokens is not None:
+                    num_tokens += cached_num_tokens
+                    continue
+
+        if message_cache_key is None:
+            num_tokens += _count_message(
+                params, message, use_default_image_token_count, default_token_count
+            )
+            continue
+        used_default_image_dimensions_token = _used_default_image_dimensions.set(False)
+        try:
+            message_num_tokens = _count_message(
+                params, message, use_default_image_token_count, default_token_count
+            )
+            used_default_image_dimensions = _used_default_image_dimensions.get()
+        finally:
+            _used_default_image_dimensions.reset(used_default_image_dimensions_token)
+        if used_default_image_dimensions:
+            _used_default_image_dimensions.set(True)
+        else:
+            message_token_count_cache.set(message_cache_key, message_num_tokens)
+        num_tokens += message_num_tokens
+    return num_tokens
+
+
+def _count_message(
+    params: _MessageCountParams,
+    message: AllMessageValues,
+    use_default_image_token_count: bool,
+    default_token_count: Optional[int],
+) -> int:
+    """
+    Count the number of tokens in a single message.
+    """
+    num_tokens = params.tokens_per_message
+    for key, value in message.items():
+        if value is None:
+            pass
+        elif key == "tool_calls":
+            if isinstance(value, List):
+                for tool_call in value:
+                    if "function" in tool_call:
+                        function_arguments = tool_call["function"].get(
+                            "arguments", []
+                        )
+                        num_tokens += params.count_function(str(function_arguments))
+                    else:
+                        raise ValueError(
+                            f"Unsupported tool call {tool_call} must contain a function key"
+                        )
             else:
-                # Skip unsupported keys instead of raising an error
-                continue
+                raise ValueError(
+                    f"Unsupported type {type(value)} for key tool_calls in message {message}"
+                )
+        elif isinstance(value, str):
+            num_tokens += params.count_function(value)
+            if key == "name":
+                num_tokens += params.tokens_per_name
+        elif key == "content" and isinstance(value, List):
+            num_tokens += _count_content_list(
+                params.count_function,
+                value,
+                use_default_image_token_count,
+                default_token_count,
+            )
+        else:
+            # Skip unsupported keys instead of raising an error
+            continue
     return num_tokens
 
 
@@ -507,15 +1059,37 @@ def _get_count_function(
 ) -> TokenCounterFunction:
     """
     Get the function to count tokens based on the model and custom tokenizer."""
+    count_function, _ = _get_count_function_and_tokenizer_key(model, custom_tokenizer)
+    return count_function
+
+
+def _get_count_function_and_tokenizer_key(
+    model: Optional[str],
+    custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
+    approximate: bool = False,
+) -> Tuple[TokenCounterFunction, Optional[Hashable]]:
+    """
+    Get the function to count tokens, and a key identifying its tokenizer across calls.
+
+    The key is None for custom huggingface tokenizers - those are only identified by the (caller-owned) object.
+    Exact counts calibrate `token_count_estimator`, if `litellm.use_token_count_estimator_for_routing` is True.
+    If `approximate` is True, the returned function estimates instead.
+    """
     from litellm.utils import _select_tokenizer, print_verbose
 
     if model is not None or custom_tokenizer is not None:
         tokenizer_json = custom_tokenizer or _select_tokenizer(model)  # type: ignore
         if tokenizer_json["type"] == "huggingface_tokenizer":
+            tokenizer_key: Optional[Hashable] = (
+                ("huggingface_tokenizer", model) if custom_tokenizer is None else None
+            )
 
             def count_tokens(text: str) -> int:
                 enc = tokenizer_json["tokenizer"].encode(text)
-                return len(enc.ids)
+                num_tokens = len(enc.ids)
+                if litellm.use_token_count_estimator_for_routing is True:
+                    token_count_estimator.calibrate(tokenizer_key, text, num_tokens)
+                return num_tokens
 
         elif tokenizer_json["type"] == "openai_tokenizer":
             model_to_use = _fix_model_name(model)  # type: ignore
@@ -527,18 +1101,33 @@ def _get_count_function(
             except KeyError:
                 print_verbose("Warning: model not found. Using cl100k_base encoding.")
                 encoding = tiktoken.get_encoding("cl100k_base")
+            tokenizer_key = ("openai_tokenizer", encoding.name)
 
             def count_tokens(text: str) -> int:
-                return len(encoding.encode(text, disallowed_special=()))
+                num_tokens = len(encoding.encode(text, disallowed_special=()))
+                if litellm.use_token_count_estimator_for_routing is True:
+                    token_count_estimator.calibrate(tokenizer_key, text, num_tokens)
+                return num_tokens
 
         else:
             raise ValueError("Unsupported tokenizer type")
     else:
+        tokenizer_key = ("openai_tokenizer", default_encoding.name)
 
         def count_tokens(text: str) -> int:
-            return len(default_encoding.encode(text, disallowed_special=()))
+            num_tokens = len(default_encoding.encode(text, disallowed_special=()))
+            if litellm.use_token_count_estimator_for_routing is True:
+                token_count_estimator.calibrate(tokenizer_key, text, num_tokens)
+            return num_tokens
+
+    if approximate is True:
+
+        def estimate_tokens(text: str) -> int:
+            return token_count_estimator.estimate(tokenizer_key, text)
+
+        return estimate_tokens, tokenizer_key
 
-    return count_tokens
+    return count_tokens, tokenizer_key
 
 
 def _fix_model_name(model: str) -> str:
@@ -79,9 +79,6 @@ from litellm.litellm_core_utils.mock_functions import (
     mock_embedding,
     mock_image_generation,
 )
-from litellm.litellm_core_utils.prompt_templates.common_utils import (
-    get_content_from_model_response,
-)
 from litellm.llms.base_llm import BaseConfig, BaseImageGenerationConfig
 from litellm.llms.base_llm.base_model_iterator import (
     convert_model_response_to_streaming,
@@ -147,7 +144,10 @@ from .litellm_core_utils.prompt_templates.factory import (
     prompt_factory,
     stringify_json_tool_call_content,
 )
-from .litellm_core_utils.streaming_chunk_builder_utils import ChunkProcessor
+from .litellm_core_utils.streaming_chunk_builder_utils import (
+    ChunkProcessor,
+    StreamingResponseAccumulator,
+)
 from .llms.anthropic.chat import AnthropicChatCompletion
 from .llms.azure.audio_transcriptions import AzureAudioTranscription
 from .llms.azure.azure import AzureChatCompletion, _check_dynamic_azure_params
@@ -6205,7 +6205,7 @@ def stream_chunk_builder_text_completion(
     return TextCompletionResponse(**response)
 
 
-def stream_chunk_builder(  # noqa: PLR0915
+def stream_chunk_builder(
     chunks: list,
     messages: Optional[list] = None,
     start_time=None,
@@ -6237,122 +6237,13 @@ def stream_chunk_builder(  # noqa: PLR0915
                 chunks=chunks, messages=messages
             )
 
-        model = chunks[0]["model"]
-        # Initialize the response dictionary
-        response = processor.build_base_response(chunks)
-
-        tool_call_chunks = [
-            chunk
-            for chunk in chunks
-            if len(chunk["choices"]) > 0
-            and "tool_calls" in chunk["choices"][0]["delta"]
-            and chunk["choices"][0]["delta"]["tool_calls"] is not None
-        ]
-
-        if len(tool_call_chunks) > 0:
-            tool_calls_list = processor.get_combined_tool_content(tool_call_chunks)
-            _choice = cast(Choices, response.choices[0])
-            _choice.message.content = None
-            _choice.message.tool_calls = tool_calls_list
-
-        function_call_chunks = [
-            chunk
-            for chunk in chunks
-            if len(chunk["choices"]) > 0
-            and "function_call" in chunk["choices"][0]["delta"]
-            and chunk["choices"][0]["delta"]["function_call"] is not None
-        ]
-
-        if len(function_call_chunks) > 0:
-            _choice = cast(Choices, response.choices[0])
-            _choice.message.content = None
-            _choice.message.function_call = (
-                processor.get_combined_function_call_content(function_call_chunks)
-            )
-
-        content_chunks = [
-            chunk
-            for chunk in chunks
-            if len(chunk["choices"]) > 0
-            and "content" in chunk["choices"][0]["delta"]
-            and chunk["choices"][0]["delta"]["content"] is not None
-        ]
-
-        if len(content_chunks) > 0:
-            response["choices"][0]["message"]["content"] = (
-                processor.get_combined_content(content_chunks)
-            )
-
-        thinking_blocks = [
-            chunk
-            for chunk in chunks
-            if len(chunk["choices"]) > 0
-            and "thinking_blocks" in chunk["choices"][0]["delta"]
-            and chunk["choices"][0]["delta"]["thinking_blocks"] is not None
-        ]
-
-        if len(thinking_blocks) > 0:
-            response["choices"][0]["message"]["thinking_blocks"] = (
-                processor.get_combined_thinking_content(thinking_blocks)
-            )
-
-        reasoning_chunks = [
-            chunk
-            for chunk in chunks
-            if len(chunk["choices"]) > 0
-            and "reasoning_content" in chunk["choices"][0]["delta"]
-            and chunk["choices"][0]["delta"]["reasoning_content"] is not None
-        ]
-
-        if len(reasoning_chunks) > 0:
-            response["choices"][0]["message"]["reasoning_content"] = (
-                processor.get_combined_reasoning_content(reasoning_chunks)
-            )
-
-        annotation_chunks = [
-            chunk
-            for chunk in chunks
-            if len(chunk["choices"]) > 0
-            and "annotations" in chunk["choices"][0]["delta"]
-            and chunk["choices"][0]["delta"]["annotations"] is not None
-        ]
-
-        if len(annotation_chunks) > 0:
-            annotations = annotation_chunks[0]["choices"][0]["delta"]["annotations"]
-            response["choices"][0]["message"]["annotations"] = annotations
-
-        audio_chunks = [
-            chunk
-            for chunk in chunks
-            if len(chunk["choices"]) > 0
-            and "audio" in chunk["choices"][0]["delta"]
-            and chunk["choices"][0]["delta"]["audio"] is not None
-        ]
-
-        if len(audio_chunks) > 0:
-            _choice = cast(Choices, response.choices[0])
-            _choice.message.audio = processor.get_combined_audio_content(audio_chunks)
-
-        completion_output = get_content_from_model_response(response)
-
-        reasoning_tokens = processor.count_reasoning_tokens(response)
-
-        usage = processor.calculate_usage(
-            chunks=chunks,
-            model=model,
-            completion_output=completion_output,
-            messages=messages,
-            reasoning_tokens=reasoning_tokens,
+        accumulator = StreamingResponseAccumulator()
+        for chunk in chunks:
+            accumulator.add_chunk(chunk)
+        response = accumulator.build_model_response(
+            model=chunks[0]["model"], messages=messages, logging_obj=logging_obj
         )
 
-        setattr(response, "usage", usage)
-
-        # Add cost to usage object if include_cost_in_streaming_usage is True
-        if litellm.include_cost_in_streaming_usage and logging_obj is not None:
-            setattr(
-                usage, "cost", logging_obj._response_cost_calculator(result=response)
-            )
-
         return response
     except Exception as e:
         verbose_logger.exception(
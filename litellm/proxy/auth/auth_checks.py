@@ -484,7 +484,13 @@ async def get_end_user_object(
         check_in_budget(end_user_obj=return_obj)
         return return_obj
 
-    # else, check db
+    # else, check db - unless the end user wasn't in the db on a recent lookup
+    if not _should_check_db(
+        key=_key,
+        last_db_access_time=last_db_access_time,
+        db_cache_expiry=db_cache_expiry,
+    ):
+        return None
     try:
         response = await prisma_client.db.litellm_endusertable.find_unique(
             where={"user_id": end_user_id},
@@ -492,6 +498,9 @@ async def get_end_user_object(
         )
 
         if response is None:
+            _update_last_db_access_time(
+                key=_key, value=None, last_db_access_time=last_db_access_time
+            )
             raise Exception
 
         # save the end-user object to cache (always store as dict for consistency)
@@ -716,7 +725,7 @@ def _should_check_db(
     ):  # check db for non-null values (for refresh operations)
         return True
     elif last_db_access_time[key][0] is None:
-        if current_time - last_db_access_time[key] >= db_cache_expiry:
+        if current_time - last_db_access_time[key][1] >= db_cache_expiry:
             return True
     return False
 
@@ -889,6 +898,12 @@ async def get_user_object(
                     include={"organization_memberships": True},
                 )
             else:
+                if should_check_db:
+                    _update_last_db_access_time(
+                        key=db_access_time_key,
+                        value=None,
+                        last_db_access_time=last_db_access_time,
+                    )
                 raise Exception
 
         if (
@@ -932,7 +947,11 @@ async def _cache_management_object(
     value: BaseModel,
     user_api_key_cache: DualCache,
     proxy_logging_obj: Optional[ProxyLogging],
+    invalidate_other_instances: bool = False,
 ):
+    """
+    Set `invalidate_other_instances=True` if the object was updated - other instances evict their cached copy.
+    """
 
     await user_api_key_cache.async_set_cache(
         key=key,
@@ -940,12 +959,16 @@ async def _cache_management_object(
         ttl=DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL,
     )
 
+    if invalidate_other_instances:
+        await user_api_key_cache.async_invalidate_cache(keys=[key], skip_local=True)
+
 
 async def _cache_team_object(
     team_id: str,
     team_table: LiteLLM_TeamTableCachedObj,
     user_api_key_cache: DualCache,
     proxy_logging_obj: Optional[ProxyLogging],
+    invalidate_other_instances: bool = False,
 ):
     key = "team_id:{}".format(team_id)
 
@@ -957,6 +980,7 @@ async def _cache_team_object(
         value=team_table,
         user_api_key_cache=user_api_key_cache,
         proxy_logging_obj=proxy_logging_obj,
+        invalidate_other_instances=invalidate_other_instances,
     )
 
 
@@ -965,6 +989,7 @@ async def _cache_key_object(
     user_api_key_obj: UserAPIKeyAuth,
     user_api_key_cache: DualCache,
     proxy_logging_obj: Optional[ProxyLogging],
+    invalidate_other_instances: bool = False,
 ):
     key = hashed_token
 
@@ -976,6 +1001,7 @@ async def _cache_key_object(
         value=user_api_key_obj,
         user_api_key_cache=user_api_key_cache,
         proxy_logging_obj=proxy_logging_obj,
+        invalidate_other_instances=invalidate_other_instances,
     )
 
 
@@ -987,6 +1013,7 @@ async def _delete_cache_key_object(
     key = hashed_token
 
     user_api_key_cache.delete_cache(key=key)
+    await user_api_key_cache.async_invalidate_cache(keys=[key], skip_local=True)
 
     ## UPDATE REDIS CACHE ##
     if proxy_logging_obj is not None:
@@ -1220,6 +1247,17 @@ class ExperimentalUIJWTToken:
             )
 
 
+def _get_key_not_found_in_db_error(hashed_token: str) -> ProxyException:
+    return ProxyException(
+        message="Authentication Error, Invalid proxy server token passed. key={}, not found in db. Create key via `/key/generate` call.".format(
+            hashed_token
+        ),
+        type=ProxyErrorTypes.token_not_found_in_db,
+        param="key",
+        code=status.HTTP_401_UNAUTHORIZED,
+    )
+
+
 @log_db_metrics
 async def get_key_object(
     hashed_token: str,
@@ -1266,14 +1304,7 @@ async def get_key_object(
     )
 
     if _valid_token is None:
-        raise ProxyException(
-            message="Authentication Error, Invalid proxy server token passed. key={}, not found in db. Create key via `/key/generate` call.".format(
-                hashed_token
-            ),
-            type=ProxyErrorTypes.token_not_found_in_db,
-            param="key",
-            code=status.HTTP_401_UNAUTHORIZED,
-        )
+        raise _get_key_not_found_in_db_error(hashed_token=hashed_token)
 
     _response = UserAPIKeyAuth(**_valid_token.model_dump(exclude_none=True))
 
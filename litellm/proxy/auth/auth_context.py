@@ -0,0 +1,480 @@
+"""
+Auth context loader for `user_api_key_auth`
+
+Virtual key auth reads a key, its user, team and team membership, and the request's end user. Looked up one at a time,
+a cold cache costs one DB query each. `get_auth_context` loads all of them in one round trip:
+
+- warm: one `user_api_key_cache` batch get (in-memory, then one Redis MGET for the misses). The entity cache keys are
+  known up front, because the user / team ids of a key are cached in its auth context entry (`auth_context:{hashed_token}`).
+- cold: one joined SQL query - the combined key view + user, team, team membership and end user rows. The rows are
+  written back to the entity cache entries in one pipeline. Users / end users that aren't in the db are remembered in
+  `last_db_access_time` (like `get_user_object` does), so they're not queried again on every request.
+
+The entity cache entries (`{hashed_token}`, `{user_id}`, `team_id:{team_id}`, `end_user_id:{end_user_id}`) stay the source
+of truth - spend tracking updates them in place - so the loaded objects are picked up by the existing `get_*_object`
+helpers from the in-memory cache. The auth context entry itself only stores the ids + a version. It's rebuilt when the
+version doesn't match, or the key's user / team changed.
+"""
+
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from litellm._logging import verbose_proxy_logger
+from litellm.caching.dual_cache import DualCache
+from litellm.constants import DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL
+from litellm.proxy._types import (
+    LiteLLM_BudgetTable,
+    LiteLLM_EndUserTable,
+    LiteLLM_TeamMembership,
+    LiteLLM_TeamTableCachedObj,
+    LiteLLM_UserTable,
+    UserAPIKeyAuth,
+)
+from litellm.proxy.auth.auth_checks import (
+    _cache_key_object,
+    _should_check_db,
+    _update_last_db_access_time,
+    db_cache_expiry,
+    last_db_access_time,
+)
+from litellm.proxy.utils import (
+    COMBINED_VIEW_COLUMNS,
+    COMBINED_VIEW_JOINS,
+    PrismaClient,
+    combined_view_row_to_token_view,
+)
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Span as _Span
+
+    Span = _Span
+else:
+    Span = Any
+
+# bump when the auth context entry changes shape - older entries are ignored
+AUTH_CONTEXT_VERSION = 1
+TEAM_MEMBERSHIP_CACHE_TTL = 5  # same as the team member budget check in `user_api_key_auth`
+
+AUTH_CONTEXT_QUERY = f"""
+    SELECT {COMBINED_VIEW_COLUMNS.rstrip()},
+        to_jsonb(u.*) AS auth_context_user,
+        (
+            SELECT jsonb_agg(to_jsonb(om.*))
+            FROM "LiteLLM_OrganizationMembership" AS om
+            WHERE om.user_id = v.user_id
+        ) AS auth_context_user_organization_memberships,
+        to_jsonb(t.*) AS auth_context_team,
+        to_jsonb(tm.*) AS auth_context_team_membership,
+        to_jsonb(tmb.*) AS auth_context_team_membership_budget,
+        to_jsonb(e.*) AS auth_context_end_user,
+        to_jsonb(eb.*) AS auth_context_end_user_budget
+    {COMBINED_VIEW_JOINS}
+    LEFT JOIN "LiteLLM_UserTable" AS u ON v.user_id = u.user_id
+    LEFT JOIN "LiteLLM_BudgetTable" AS tmb ON tm.budget_id = tmb.budget_id
+    LEFT JOIN "LiteLLM_EndUserTable" AS e ON e.user_id = $2
+    LEFT JOIN "LiteLLM_BudgetTable" AS eb ON e.budget_id = eb.budget_id
+    WHERE v.token = $1
+"""
+
+
+class LiteLLM_AuthContext:
+    __slots__ = ("key", "user", "team", "team_membership", "end_user", "loaded_from_db")
+
+    def __init__(
+        self,
+        key: Optional[UserAPIKeyAuth] = None,
+        user: Optional[LiteLLM_UserTable] = None,
+        team: Optional[LiteLLM_TeamTableCachedObj] = None,
+        team_membership: Optional[LiteLLM_TeamMembership] = None,
+        end_user: Optional[LiteLLM_EndUserTable] = None,
+        loaded_from_db: bool = False,
+    ):
+        self.key = key
+        self.user = user
+        self.team = team
+        self.team_membership = team_membership
+        self.end_user = end_user
+        self.loaded_from_db = loaded_from_db  # if True and `key` is None, the key isn't in the db
+
+
+def get_auth_context_cache_key(hashed_token: str) -> str:
+    return "auth_context:{}".format(hashed_token)
+
+
+def _get_end_user_cache_key(end_user_id: str) -> str:
+    return "end_user_id:{}".format(end_user_id)
+
+
+def _get_user_db_access_time_key(user_id: str) -> str:
+    return "user_id:{}".format(user_id)  # same key as `get_user_object`
+
+
+def _is_missing_from_db(db_access_time_key: str) -> bool:
+    """
+    True if the object wasn't in the db on a recent lookup - `get_user_object` / `get_end_user_object` skip the db then
+    too
+    """
+    return not _should_check_db(
+        key=db_access_time_key,
+        last_db_access_time=last_db_access_time,
+        db_cache_expiry=db_cache_expiry,
+    )
+
+
+def _record_missing_from_db(
+    user_id: Optional[str],
+    end_user_id: Optional[str],
+    db_auth_context: LiteLLM_AuthContext,
+) -> None:
+    """
+    Remember a key's user / the end user not being in the db, so the next requests don't query for them again
+    """
+    if db_auth_context.key is None:  # the query only returns rows for existing keys
+        return
+    if user_id is not None and db_auth_context.user is None:
+        _update_last_db_access_time(
+            key=_get_user_db_access_time_key(user_id),
+            value=None,
+            last_db_access_time=last_db_access_time,
+        )
+    if end_user_id is not None and db_auth_context.end_user is None:
+        _update_last_db_access_time(
+            key=_get_end_user_cache_key(end_user_id),
+            value=None,
+            last_db_access_time=last_db_access_time,
+        )
+
+
+def _get_entity_cache_keys(
+    user_id: Optional[str], team_id: Optional[str]
+) -> Dict[str, str]:
+    """
+    Cache keys used by `get_user_object`, `get_team_object` and the team member budget check
+    """
+    cache_keys: Dict[str, str] = {}
+    if user_id is not None:
+        cache_keys["user"] = user_id
+    if team_id is not None:
+        cache_keys["team"] = "team_id:{}".format(team_id)
+    if user_id is not None and team_id is not None:
+        cache_keys["team_membership"] = "{}_{}".format(team_id, user_id)
+    return cache_keys
+
+
+def _get_auth_context_ids(value: Any) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    if isinstance(value, dict) and value.get("version") == AUTH_CONTEXT_VERSION:
+        return value.get("user_id"), value.get("team_id")
+    return None
+
+
+def _parse_cached_object(value: Any, object_type: Any) -> Any:
+    if value is None or isinstance(value, object_type):
+        return value
+    if isinstance(value, dict):
+        return object_type(**value)
+    return None
+
+
+def _parse_team_membership(value: Any) -> Optional[LiteLLM_TeamMembership]:
+    if value is None or isinstance(value, LiteLLM_TeamMembership):
+        return value
+    if isinstance(value, dict):
+        return LiteLLM_TeamMembership(**value)
+    # prisma model, stored by the team member budget check in `user_api_key_auth`
+    return LiteLLM_TeamMembership(**value.dict())
+
+
+async def _batch_get(
+    user_api_key_cache: DualCache,
+    keys: List[str],
+    parent_otel_span: Optional[Span],
+) -> Dict[str, Any]:
+    if not keys:
+        return {}
+    values = await user_api_key_cache.async_batch_get_cache(
+        keys=keys, parent_otel_span=parent_otel_span
+    )
+    return dict(zip(keys, values or [None] * len(keys)))
+
+
+def _parse_auth_context_row(row: dict) -> LiteLLM_AuthContext:
+    user_row = row.pop("auth_context_user", None)
+    organization_memberships = row.pop(
+        "auth_context_user_organization_memberships", None
+    )
+    team_row = row.pop("auth_context_team", None)
+    team_membership_row = row.pop("auth_context_team_membership", None)
+    team_membership_budget_row = row.pop("auth_context_team_membership_budget", None)
+    end_user_row = row.pop("auth_context_end_user", None)
+    end_user_budget_row = row.pop("auth_context_end_user_budget", None)
+
+    token_view = combined_view_row_to_token_view(row)
+    auth_context = LiteLLM_AuthContext(
+        key=UserAPIKeyAuth(**token_view.model_dump(exclude_none=True)),
+        loaded_from_db=True,
+    )
+    if user_row is not None:
+        auth_context.user = LiteLLM_UserTable(
+            **user_row, organization_memberships=organization_memberships or []
+        )
+    if team_row is not None:
+        auth_context.team = LiteLLM_TeamTableCachedObj(**team_row)
+    if team_membership_row is not None:
+        auth_context.team_membership = LiteLLM_TeamMembership(
+            **team_membership_row,
+            litellm_budget_table=(
+                LiteLLM_BudgetTable(**team_membership_budget_row)
+                if team_membership_budget_row is not None
+                else None
+            ),
+        )
+    if end_user_row is not None:
+        auth_context.end_user = LiteLLM_EndUserTable(
+            **end_user_row,
+            litellm_budget_table=(
+                LiteLLM_BudgetTable(**end_user_budget_row)
+                if end_user_budget_row is not None
+                else None
+            ),
+        )
+    return auth_context
+
+
+async def _cache_auth_context(
+    hashed_token: str,
+    end_user_id: Optional[str],
+    auth_context: LiteLLM_AuthContext,
+    user_api_key_cache: DualCache,
+) -> None:
+    """
+    Write the loaded objects to their entity cache entries + the auth context entry, in one pipeline.
+
+    Only objects set on `auth_context` are written - cached spend can be ahead of the db, so cached objects aren't
+    overwritten with db rows. The key is written as an object (spend tracking updates it in place), like `get_key_object`
+    does, if `auth_context.loaded_from_db`.
+    """
+    if auth_context.key is None:
+        return
+    if auth_context.loaded_from_db:
+        await _cache_key_object(
+            hashed_token=hashed_token,
+            user_api_key_obj=auth_context.key,
+            user_api_key_cache=user_api_key_cache,
+            proxy_logging_obj=None,
+        )
+    user_id = auth_context.key.user_id
+    team_id = auth_context.key.team_id
+    entity_cache_keys = _get_entity_cache_keys(user_id=user_id, team_id=team_id)
+
+    cache_list: List[Tuple[str, Any]] = [
+        (
+            get_auth_context_cache_key(hashed_token),
+            {"version": AUTH_CONTEXT_VERSION, "user_id": user_id, "team_id": team_id},
+        )
+    ]
+    if auth_context.user is not None and "user" in entity_cache_keys:
+        cache_list.append(
+            (entity_cache_keys["user"], auth_context.user.model_dump(mode="json"))
+        )
+    if auth_context.team is not None and "team" in entity_cache_keys:
+        auth_context.team.last_refreshed_at = time.time()
+        cache_list.append(
+            (entity_cache_keys["team"], auth_context.team.model_dump(mode="json"))
+        )
+    if auth_context.end_user is not None and end_user_id is not None:
+        cache_list.append(
+            (
+                _get_end_user_cache_key(end_user_id),
+                auth_context.end_user.model_dump(mode="json"),
+            )
+        )
+    await user_api_key_cache.async_set_cache_pipeline(
+        cache_list=cache_list, ttl=DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL
+    )
+
+    if (
+        auth_context.team_membership is not None
+        and "team_membership" in entity_cache_keys
+    ):
+        # short lived + local, like the team member budget check in `user_api_key_auth`
+        await user_api_key_cache.async_set_cache(
+            key=entity_cache_keys["team_membership"],
+            value=auth_context.team_membership,
+            ttl=TEAM_MEMBERSHIP_CACHE_TTL,
+            local_only=True,
+        )
+
+
+async def _get_auth_context_from_db(
+    hashed_token: str,
+    end_user_id: Optional[str],
+    prisma_client: PrismaClient,
+) -> LiteLLM_AuthContext:
+    row = await prisma_client.db.query_first(
+        AUTH_CONTEXT_QUERY, hashed_token, end_user_id
+    )
+    if row is None:
+        return LiteLLM_AuthContext(loaded_from_db=True)
+    return _parse_auth_context_row(dict(row))
+
+
+async def _get_auth_context(
+    hashed_token: str,
+    end_user_id: Optional[str],
+    prisma_client: PrismaClient,
+    user_api_key_cache: DualCache,
+    parent_otel_span: Optional[Span],
+) -> LiteLLM_AuthContext:
+    auth_context_cache_key = get_auth_context_cache_key(hashed_token)
+    end_user_cache_key = (
+        _get_end_user_cache_key(end_user_id) if end_user_id is not None else None
+    )
+
+    # the ids of a key are read from the local cache, so all entity keys can go in one batch get
+    ids = _get_auth_context_ids(
+        user_api_key_cache.in_memory_cache.get_cache(key=auth_context_cache_key)
+    )
+    keys = [hashed_token]
+    if end_user_cache_key is not None:
+        keys.append(end_user_cache_key)
+    if ids is None:
+        keys.append(auth_context_cache_key)
+    else:
+        keys.extend(_get_entity_cache_keys(user_id=ids[0], team_id=ids[1]).values())
+    cached_values = await _batch_get(
+        user_api_key_cache=user_api_key_cache,
+        keys=keys,
+        parent_otel_span=parent_otel_span,
+    )
+
+    db_auth_context: Optional[LiteLLM_AuthContext] = None
+    key = _parse_cached_object(cached_values.get(hashed_token), UserAPIKeyAuth)
+    if key is None:
+        db_auth_context = await _get_auth_context_from_db(
+            hashed_token=hashed_token,
+            end_user_id=end_user_id,
+            prisma_client=prisma_client,
+        )
+        if db_auth_context.key is None:
+            return db_auth_context
+        key = db_auth_context.key
+        _record_missing_from_db(
+            user_id=key.user_id,
+            end_user_id=end_user_id,
+            db_auth_context=db_auth_context,
+        )
+
+    if ids is None:
+        ids = _get_auth_context_ids(cached_values.get(auth_context_cache_key))
+    entity_cache_keys = _get_entity_cache_keys(user_id=key.user_id, team_id=key.team_id)
+    ids_changed = ids != (key.user_id, key.team_id)
+    if ids_changed:
+        # first request for this key on this instance, or its user / team changed
+        cached_values.update(
+            await _batch_get(
+                user_api_key_cache=user_api_key_cache,
+                keys=[k for k in entity_cache_keys.values() if k not in cached_values],
+                parent_otel_span=parent_otel_span,
+            )
+        )
+
+    auth_context = LiteLLM_AuthContext(
+        key=key,
+        user=_parse_cached_object(
+            cached_values.get(entity_cache_keys.get("user", "")), LiteLLM_UserTable
+        ),
+        team=_parse_cached_object(
+            cached_values.get(entity_cache_keys.get("team", "")),
+            LiteLLM_TeamTableCachedObj,
+        ),
+        team_membership=_parse_team_membership(
+            cached_values.get(entity_cache_keys.get("team_membership", ""))
+        ),
+        end_user=(
+            _parse_cached_object(
+                cached_values.get(end_user_cache_key), LiteLLM_EndUserTable
+            )
+            if end_user_cache_key is not None
+            else None
+        ),
+        loaded_from_db=db_auth_context is not None,
+    )
+
+    if db_auth_context is None and (
+        (
+            key.user_id is not None
+            and auth_context.user is None
+            and not _is_missing_from_db(_get_user_db_access_time_key(key.user_id))
+        )
+        or (
+            end_user_cache_key is not None
+            and auth_context.end_user is None
+            and not _is_missing_from_db(end_user_cache_key)
+        )
+    ):
+        # fill the gaps with 1 query, instead of 1 per missing object. The cached key stays authoritative.
+        db_auth_context = await _get_auth_context_from_db(
+            hashed_token=hashed_token,
+            end_user_id=end_user_id,
+            prisma_client=prisma_client,
+        )
+        _record_missing_from_db(
+            user_id=key.user_id,
+            end_user_id=end_user_id,
+            db_auth_context=db_auth_context,
+        )
+
+    if db_auth_context is None and not ids_changed:
+        return auth_context
+
+    # cached spend can be ahead of the db - only objects missing from the cache are written back
+    missing = LiteLLM_AuthContext(key=key, loaded_from_db=auth_context.loaded_from_db)
+    if db_auth_context is not None:
+        if auth_context.user is None:
+            missing.user = auth_context.user = db_auth_context.user
+        if auth_context.team is None:
+            missing.team = auth_context.team = db_auth_context.team
+        if auth_context.team_membership is None:
+            missing.team_membership = auth_context.team_membership = (
+                db_auth_context.team_membership
+            )
+        if auth_context.end_user is None:
+            missing.end_user = auth_context.end_user = db_auth_context.end_user
+    await _cache_auth_context(
+        hashed_token=hashed_token,
+        end_user_id=end_user_id,
+        auth_context=missing,
+        user_api_key_cache=user_api_key_cache,
+    )
+    return auth_context
+
+
+async def get_auth_context(
+    hashed_token: str,
+    end_user_id: Optional[str],
+    prisma_client: Optional[PrismaClient],
+    user_api_key_cache: DualCache,
+    parent_otel_span: Optional[Span] = None,
+) -> Optional[LiteLLM_AuthContext]:
+    """
+    Load the key, user, team, team membership and end user for a virtual key in one round trip, and make them available
+    to the `get_*_object` helpers through `user_api_key_cache`.
+
+    Returns None if the context couldn't be loaded - auth then falls back to the per-object lookups.
+    """
+    if prisma_client is None:
+        return None
+    try:
+        return await _get_auth_context(
+            hashed_token=hashed_token,
+            end_user_id=end_user_id,
+            prisma_client=prisma_client,
+            user_api_key_cache=user_api_key_cache,
+            parent_otel_span=parent_otel_span,
+        )
+    except Exception as e:
+        verbose_proxy_logger.debug(
+            "Unable to load auth context, falling back to per-object lookups. Error - %s",
+            str(e),
+        )
+        return None
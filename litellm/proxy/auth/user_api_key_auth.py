@@ -21,10 +21,12 @@ from litellm._logging import verbose_logger, verbose_proxy_logger
 from litellm._service_logger import ServiceLogging
 from litellm.caching import DualCache
 from litellm.litellm_core_utils.dd_tracing import tracer
+from litellm.litellm_core_utils.latency_profiler import latency_profiler
 from litellm.proxy._types import *
 from litellm.proxy.auth.auth_checks import (
     ExperimentalUIJWTToken,
     _cache_key_object,
+    _get_key_not_found_in_db_error,
     _get_user_role,
     _is_user_proxy_admin,
     _virtual_key_max_budget_check,
@@ -37,6 +39,7 @@ from litellm.proxy.auth.auth_checks import (
     get_user_object,
     is_valid_fallback_model,
 )
+from litellm.proxy.auth.auth_context import LiteLLM_AuthContext, get_auth_context
 from litellm.proxy.auth.auth_exception_handler import UserAPIKeyAuthExceptionHandler
 from litellm.proxy.auth.auth_utils import (
     abbreviate_api_key,
@@ -348,6 +351,7 @@ async def check_api_key_for_custom_headers_or_pass_through_endpoints(
     return api_key
 
 
+@latency_profiler.profile_stage("auth")
 async def _user_api_key_auth_builder(  # noqa: PLR0915
     request: Request,
     api_key: str,
@@ -625,6 +629,25 @@ async def _user_api_key_auth_builder(  # noqa: PLR0915
         end_user_id = get_end_user_id_from_request_body(
             request_data, _safe_get_request_headers(request)
         )
+
+        ## Load key + user + team + end-user objects in 1 round trip (cache, else db)
+        ## The checks below read them from `user_api_key_cache`
+        auth_context: Optional[LiteLLM_AuthContext] = None
+        if (
+            isinstance(api_key, str)
+            and api_key.startswith("sk-")
+            and prisma_client is not None
+            and isinstance(master_key, str)
+            and not secrets.compare_digest(api_key.encode(), master_key.encode())
+        ):
+            auth_context = await get_auth_context(
+                hashed_token=hash_token(api_key),
+                end_user_id=end_user_id,
+                prisma_client=prisma_client,
+                user_api_key_cache=user_api_key_cache,
+                parent_otel_span=parent_otel_span,
+            )
+
         if end_user_id:
             try:
                 end_user_params["end_user_id"] = end_user_id
@@ -821,13 +844,19 @@ async def _user_api_key_auth_builder(  # noqa: PLR0915
                 api_key = hash_token(token=api_key)
 
             try:
-                valid_token = await get_key_object(
-                    hashed_token=api_key,
-                    prisma_client=prisma_client,
-                    user_api_key_cache=user_api_key_cache,
-                    parent_otel_span=parent_otel_span,
-                    proxy_logging_obj=proxy_logging_obj,
-                )
+                if auth_context is not None and auth_context.loaded_from_db:
+                    # key was already looked up in the db with the auth context
+                    if auth_context.key is None:
+                        raise _get_key_not_found_in_db_error(hashed_token=api_key)
+                    valid_token = auth_context.key
+                else:
+                    valid_token = await get_key_object(
+                        hashed_token=api_key,
+                        prisma_client=prisma_client,
+                        user_api_key_cache=user_api_key_cache,
+                        parent_otel_span=parent_otel_span,
+                        proxy_logging_obj=proxy_logging_obj,
+                    )
             except ProxyException as e:
                 if e.code == 401 or e.code == "401":
                     e.message = "Authentication Error, Invalid proxy server token passed. Received API Key = {}, Key Hash (Token) ={}. Unable to find token in cache or `LiteLLM_VerificationTokenTable`".format(
@@ -3,17 +3,23 @@ import asyncio
 import gc
 import json
 import os
+import pstats
 import sys
 import tracemalloc
 from collections import Counter
 from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 
 from litellm import get_secret_str
 from litellm._logging import verbose_proxy_logger
-from litellm.constants import PYTHON_GC_THRESHOLD
-from litellm.proxy._types import UserAPIKeyAuth
+from litellm.constants import (
+    LATENCY_PROFILER_MAX_CPU_PROFILE_SECONDS,
+    PYTHON_GC_THRESHOLD,
+)
+from litellm.litellm_core_utils.latency_profiler import latency_profiler
+from litellm.proxy._types import LitellmUserRoles, UserAPIKeyAuth
 from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
 
 router = APIRouter()
@@ -78,6 +84,21 @@ async def get_active_tasks_stats():
     }
 
 
+@router.get("/debug/logging-worker", include_in_schema=False)
+async def get_logging_worker_stats(
+    _: UserAPIKeyAuth = Depends(user_api_key_auth),
+):
+    """
+    Returns the queue depth, latency and drop counters of each logging worker queue. Proxy admin only.
+
+    Returns:
+      { queue_name: { queue_depth, in_flight, enqueued, processed, dropped, timed_out, errors, avg_latency_ms, max_latency_ms, ... } }
+    """
+    from litellm.litellm_core_utils.logging_worker import GLOBAL_LOGGING_WORKER
+
+    return GLOBAL_LOGGING_WORKER.get_queue_metrics()
+
+
 if os.environ.get("LITELLM_PROFILE", "false").lower() == "true":
     try:
         import objgraph  # type: ignore
@@ -169,8 +190,8 @@ async def memory_usage_in_mem_cache_items(
     )
 
     if llm_router is None:
-        llm_router_in_memory_cache_dict = {}
-        llm_router_in_memory_ttl_dict = {}
+        llm_router_in_memory_cache_dict: Dict[str, Any] = {}
+        llm_router_in_memory_ttl_dict: Dict[str, Any] = {}
     else:
         llm_router_in_memory_cache_dict = llm_router.cache.in_memory_cache.cache_dict
         llm_router_in_memory_ttl_dict = llm_router.cache.in_memory_cache.ttl_dict
@@ -669,6 +690,94 @@ async def configure_gc_thresholds_endpoint(
     }
 
 
+@router.get("/debug/profiling/stages", include_in_schema=False)
+async def get_latency_profiling_stages(
+    _: UserAPIKeyAuth = Depends(user_api_key_auth),
+) -> Dict[str, Any]:
+    """
+    Per-stage latency histograms for this worker, collected when `general_settings::enable_latency_profiling` is true.
+
+    Stages:
+    - auth: `user_api_key_auth`
+    - pre_call_hooks: proxy pre-call hooks (guardrails, rate limiters, budget checks)
+    - routing: `Router.async_get_available_deployment`
+    - provider_call: `litellm.acompletion` for the picked deployment
+    - logging: `Logging.async_success_handler`
+    - event_loop_lag: how late the event loop wakes up a sleeping task
+
+    Example usage:
+    curl http://localhost:4000/debug/profiling/stages -H "Authorization: Bearer sk-1234"
+    """
+    return {
+        "worker_pid": os.getpid(),
+        "enabled": latency_profiler.enabled,
+        "stages": latency_profiler.get_stage_summaries(),
+    }
+
+
+def _check_can_change_latency_profiling(user_api_key_dict: UserAPIKeyAuth) -> None:
+    """
+    Resetting / running the profiler changes the state of the worker - proxy admins only, not view-only admins
+    """
+    if user_api_key_dict.user_role != LitellmUserRoles.PROXY_ADMIN:
+        raise HTTPException(
+            status_code=401,
+            detail={
+                "error": "Only proxy admins can reset or run the latency profiler. Your role={}".format(
+                    user_api_key_dict.user_role
+                )
+            },
+        )
+
+
+@router.post("/debug/profiling/reset", include_in_schema=False)
+async def reset_latency_profiling_stages(
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+) -> Dict[str, Any]:
+    """
+    Clear the per-stage latency histograms, e.g. before a load test.
+    """
+    _check_can_change_latency_profiling(user_api_key_dict)
+    latency_profiler.reset()
+    return {"message": "Latency profiling histograms reset"}
+
+
+@router.post("/debug/profiling/cpu", include_in_schema=False)
+async def get_cpu_profile(
+    user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+    seconds: float = Query(10, description="How long to profile for", gt=0),
+    sort_by: str = Query(
+        "cumulative", description="pstats sort key, e.g. cumulative, tottime, calls"
+    ),
+    top_n: int = Query(50, description="Number of functions to return", gt=0),
+) -> PlainTextResponse:
+    """
+    Run cProfile on this worker's event loop thread for `seconds` and return the pstats report.
+
+    Works whether or not `enable_latency_profiling` is set. Only one CPU profile can run at a time per worker.
+
+    Example usage:
+    curl -X POST "http://localhost:4000/debug/profiling/cpu?seconds=10&sort_by=tottime" -H "Authorization: Bearer sk-1234"
+    """
+    _check_can_change_latency_profiling(user_api_key_dict)
+    if seconds > LATENCY_PROFILER_MAX_CPU_PROFILE_SECONDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"seconds must be <= {LATENCY_PROFILER_MAX_CPU_PROFILE_SECONDS}",
+        )
+    if sort_by not in pstats.Stats.sort_arg_dict_default:
+        raise HTTPException(status_code=400, detail=f"Invalid sort_by: {sort_by}")
+    try:
+        report = await latency_profiler.profile_cpu(
+            seconds=seconds, sort_by=sort_by, top_n=top_n
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return PlainTextResponse(
+        content=f"worker_pid: {os.getpid()}\n{report}",
+    )
+
+
 @router.get("/otel-spans", include_in_schema=False)
 async def get_otel_spans():
     from litellm.proxy.proxy_server import open_telemetry_logger
@@ -11,8 +11,20 @@ import os
 import time
 import traceback
 import random
+import uuid
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Union, cast, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
 
 import litellm
 from litellm._logging import verbose_proxy_logger
@@ -45,6 +57,13 @@ else:
     PrismaClient = Any
     ProxyLogging = Any
 
+# prisma table accessor -> postgres table name
+DAILY_SPEND_TABLE_NAMES = {
+    "litellm_dailyuserspend": "LiteLLM_DailyUserSpend",
+    "litellm_dailyteamspend": "LiteLLM_DailyTeamSpend",
+    "litellm_dailytagspend": "LiteLLM_DailyTagSpend",
+}
+
 
 class DBSpendUpdateWriter:
     """
@@ -1011,6 +1030,34 @@ class DBSpendUpdateWriter:
                         )
                         break
 
+                    # 1 `INSERT ... ON CONFLICT DO UPDATE` for the batch, instead of 1 upsert per row
+                    bulk_upsert_transactions = {
+                        key: transaction
+                        for key, transaction in transactions_to_process.items()
+                        if DBSpendUpdateWriter._can_bulk_upsert_daily_spend_transaction(
+                            transaction=transaction, entity_id_field=entity_id_field
+                        )
+                    }
+                    if len(bulk_upsert_transactions) > 0:
+                        query, params = DBSpendUpdateWriter._get_daily_spend_bulk_upsert_query(
+                            table_name=DAILY_SPEND_TABLE_NAMES[table_name],
+                            entity_id_field=entity_id_field,
+                            daily_spend_transactions=list(
+                                bulk_upsert_transactions.values()
+                            ),
+                        )
+                        await prisma_client.db.execute_raw(query, *params)
+                        # committed - don't re-apply on retry
+                        for key in bulk_upsert_transactions.keys():
+                            transactions_to_process.pop(key, None)
+                            daily_spend_transactions.pop(key, None)
+
+                    if len(transactions_to_process) == 0:
+                        verbose_proxy_logger.debug(
+                            f"Processed {len(bulk_upsert_transactions)} daily {entity_type} transactions in {time.time() - start_time:.2f}s"
+                        )
+                        break
+
                     async with prisma_client.db.batch_() as batcher:
                         for _, transaction in transactions_to_process.items():
                             entity_id = transaction.get(entity_id_field)
@@ -1146,6 +1193,108 @@ class DBSpendUpdateWriter:
                 e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
             )
 
+    @staticmethod
+    def _can_bulk_upsert_daily_spend_transaction(
+        transaction: BaseDailySpendTransaction, entity_id_field: str
+    ) -> bool:
+        """
+        NULLs are distinct in postgres unique constraints - `ON CONFLICT` never matches a row with a NULL entity id, model or custom_llm_provider.
+
+        These rows are upserted with prisma - so a missing custom_llm_provider is still stored as NULL, and stays in the same bucket as the existing rows.
+        """
+        return (
+            transaction.get(entity_id_field) is not None  # type: ignore
+            and transaction.get("model") is not None
+            and transaction.get("custom_llm_provider") is not None
+        )
+
+    @staticmethod
+    def _get_daily_spend_bulk_upsert_query(
+        table_name: str,
+        entity_id_field: str,
+        daily_spend_transactions: List[BaseDailySpendTransaction],
+    ) -> Tuple[str, List[Any]]:
+        """
+        Build 1 `INSERT ... ON CONFLICT DO UPDATE` statement, that increments the spend + usage of each row.
+
+        Rows are merged by the unique constraint - postgres can't update the same row twice in 1 statement.
+
+        Returns:
+            (query, params) - params are positional ($1, $2, ...)
+        """
+        unique_columns = [
+            entity_id_field,
+            "date",
+            "api_key",
+            "model",
+            "custom_llm_provider",
+            "mcp_namespaced_tool_name",
+        ]
+        text_columns = ["id", *unique_columns, "model_group"]
+        bigint_columns = [
+            "prompt_tokens",
+            "completion_tokens",
+            "cache_read_input_tokens",
+            "cache_creation_input_tokens",
+            "api_requests",
+            "successful_requests",
+            "failed_requests",
+        ]
+        increment_columns = [*bigint_columns, "spend"]
+
+        rows: Dict[tuple, Dict[str, Any]] = {}
+        for transaction in daily_spend_transactions:
+            row: Dict[str, Any] = {
+                entity_id_field: transaction.get(entity_id_field),
+                "date": transaction["date"],
+                "api_key": transaction["api_key"],
+                "model": transaction.get("model"),
+                "custom_llm_provider": transaction.get("custom_llm_provider"),
+                "mcp_namespaced_tool_name": transaction.get("mcp_namespaced_tool_name")
+                or "",
+                "model_group": transaction.get("model_group"),
+                "spend": transaction["spend"],
+            }
+            for column in bigint_columns:
+                row[column] = transaction.get(column, 0) or 0  # type: ignore
+
+            unique_key = tuple(row[column] for column in unique_columns)
+            existing_row = rows.get(unique_key)
+            if existing_row is None:
+                row["id"] = str(uuid.uuid4())
+                rows[unique_key] = row
+            else:
+                for column in increment_columns:
+                    existing_row[column] += row[column]
+
+        column_casts = [
+            *[(column, "text") for column in text_columns],
+            *[(column, "bigint") for column in bigint_columns],
+            ("spend", "float8"),
+        ]
+        params: List[Any] = []
+        values: List[str] = []
+        for row in rows.values():
+            placeholders = []
+            for column, cast_type in column_casts:
+                params.append(row[column])
+                placeholders.append(f"${len(params)}::{cast_type}")
+            values.append(f"({', '.join(placeholders)}, CURRENT_TIMESTAMP)")
+
+        columns = ", ".join(f'"{column}"' for column, _ in column_casts)
+        conflict_columns = ", ".join(f'"{column}"' for column in unique_columns)
+        increments = ", ".join(
+            f'"{column}" = "{table_name}"."{column}" + EXCLUDED."{column}"'
+            for column in increment_columns
+        )
+        query = (
+            f'INSERT INTO "{table_name}" ({columns}, "updated_at") '
+            f"VALUES {', '.join(values)} "
+            f"ON CONFLICT ({conflict_columns}) "
+            f'DO UPDATE SET {increments}, "updated_at" = CURRENT_TIMESTAMP'
+        )
+        return query, params
+
     @staticmethod
     async def update_daily_user_spend(
         n_retry_times: int,
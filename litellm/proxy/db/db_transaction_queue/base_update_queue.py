@@ -38,9 +38,15 @@ class BaseUpdateQueue:
                     "Max in memory queue flush count reached, stopping flush"
                 )
                 break
-            updates.append(await self.update_queue.get())
+            update = await self.update_queue.get()
+            self._remove_pending_update(update)
+            updates.append(update)
         return updates
 
+    def _remove_pending_update(self, update) -> None:
+        """placeholder, called when an update is dequeued - subclasses that aggregate updates in place, at enqueue time, stop aggregating into it"""
+        pass
+
     async def _emit_new_item_added_to_queue_event(
         self,
         queue_size: Optional[int] = None,
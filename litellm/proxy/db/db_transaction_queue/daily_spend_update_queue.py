@@ -49,6 +49,9 @@ class DailySpendUpdateQueue(BaseUpdateQueue):
                 }
             }
         ]
+
+    Updates are aggregated at enqueue time - adding an update for a daily_transaction_key that's already queued
+    adds to the queued transaction, so the queue holds O(distinct daily_transaction_keys), not O(requests).
     """
 
     def __init__(self):
@@ -56,11 +59,40 @@ class DailySpendUpdateQueue(BaseUpdateQueue):
         self.update_queue: asyncio.Queue[Dict[str, BaseDailySpendTransaction]] = (
             asyncio.Queue()
         )
+        self._pending_transactions: Dict[str, BaseDailySpendTransaction] = {}
+        """
+        Queued transactions that new updates for the same daily_transaction_key are added to
+        Key=daily_transaction_key
+        Value=BaseDailySpendTransaction in `update_queue`
+        """
+
+    def _remove_pending_update(
+        self, update: Dict[str, BaseDailySpendTransaction]
+    ) -> None:
+        for _key, payload in update.items():
+            if self._pending_transactions.get(_key) is payload:
+                del self._pending_transactions[_key]
+
+    async def _put_update(self, update: Dict[str, BaseDailySpendTransaction]) -> None:
+        """Add each transaction to the queued transaction with the same key, queue the transactions with new keys"""
+        new_transactions: Dict[str, BaseDailySpendTransaction] = {}
+        for _key, payload in update.items():
+            pending_transaction = self._pending_transactions.get(_key)
+            if pending_transaction is not None:
+                DailySpendUpdateQueue._add_to_daily_spend_transaction(
+                    daily_transaction=pending_transaction, payload=payload
+                )
+            else:
+                new_transactions[_key] = self._pending_transactions[_key] = deepcopy(
+                    payload
+                )
+        if len(new_transactions) > 0:
+            await self.update_queue.put(new_transactions)
 
     async def add_update(self, update: Dict[str, BaseDailySpendTransaction]):
         """Enqueue an update."""
         verbose_proxy_logger.debug("Adding update to queue: %s", update)
-        await self.update_queue.put(update)
+        await self._put_update(update)
         if self.update_queue.qsize() >= self.MAX_SIZE_IN_MEMORY_QUEUE:
             verbose_proxy_logger.warning(
                 "Spend update queue is full. Aggregating all entries in queue to concatenate entries."
@@ -78,7 +110,7 @@ class DailySpendUpdateQueue(BaseUpdateQueue):
         aggregated_updates = self.get_aggregated_daily_spend_update_transactions(
             updates
         )
-        await self.update_queue.put(aggregated_updates)
+        await self._put_update(aggregated_updates)
 
     async def flush_and_get_aggregated_daily_spend_update_transactions(
         self,
@@ -96,6 +128,28 @@ class DailySpendUpdateQueue(BaseUpdateQueue):
         )
         return aggregated_daily_spend_update_transactions
 
+    @staticmethod
+    def _add_to_daily_spend_transaction(
+        daily_transaction: BaseDailySpendTransaction,
+        payload: BaseDailySpendTransaction,
+    ) -> None:
+        """Add the spend + usage of `payload` to `daily_transaction`, in place"""
+        daily_transaction["spend"] += payload["spend"]
+        daily_transaction["prompt_tokens"] += payload["prompt_tokens"]
+        daily_transaction["completion_tokens"] += payload["completion_tokens"]
+        daily_transaction["api_requests"] += payload["api_requests"]
+        daily_transaction["successful_requests"] += payload["successful_requests"]
+        daily_transaction["failed_requests"] += payload["failed_requests"]
+
+        # Add optional metrics cache_read_input_tokens and cache_creation_input_tokens
+        daily_transaction["cache_read_input_tokens"] = (
+            payload.get("cache_read_input_tokens", 0) or 0
+        ) + daily_transaction.get("cache_read_input_tokens", 0)
+
+        daily_transaction["cache_creation_input_tokens"] = (
+            payload.get("cache_creation_input_tokens", 0) or 0
+        ) + daily_transaction.get("cache_creation_input_tokens", 0)
+
     @staticmethod
     def get_aggregated_daily_spend_update_transactions(
         updates: List[Dict[str, BaseDailySpendTransaction]],
@@ -107,27 +161,12 @@ class DailySpendUpdateQueue(BaseUpdateQueue):
         for _update in updates:
             for _key, payload in _update.items():
                 if _key in aggregated_daily_spend_update_transactions:
-                    daily_transaction = aggregated_daily_spend_update_transactions[_key]
-                    daily_transaction["spend"] += payload["spend"]
-                    daily_transaction["prompt_tokens"] += payload["prompt_tokens"]
-                    daily_transaction["completion_tokens"] += payload[
-                        "completion_tokens"
-                    ]
-                    daily_transaction["api_requests"] += payload["api_requests"]
-                    daily_transaction["successful_requests"] += payload[
-                        "successful_requests"
-                    ]
-                    daily_transaction["failed_requests"] += payload["failed_requests"]
-
-                    # Add optional metrics cache_read_input_tokens and cache_creation_input_tokens
-                    daily_transaction["cache_read_input_tokens"] = (
-                        payload.get("cache_read_input_tokens", 0) or 0
-                    ) + daily_transaction.get("cache_read_input_tokens", 0)
-
-                    daily_transaction["cache_creation_input_tokens"] = (
-                        payload.get("cache_creation_input_tokens", 0) or 0
-                    ) + daily_transaction.get("cache_creation_input_tokens", 0)
-
+                    DailySpendUpdateQueue._add_to_daily_spend_transaction(
+                        daily_transaction=aggregated_daily_spend_update_transactions[
+                            _key
+                        ],
+                        payload=payload,
+                    )
                 else:
                     aggregated_daily_spend_update_transactions[_key] = deepcopy(payload)
         return aggregated_daily_spend_update_transactions
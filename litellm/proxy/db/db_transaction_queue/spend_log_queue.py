@@ -0,0 +1,418 @@
+"""
+In memory buffer for spend logs (rows of LiteLLM_SpendLogs) waiting to be written to the database
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+from litellm._logging import verbose_proxy_logger
+from litellm._uuid import uuid
+from litellm.constants import (
+    SPEND_LOG_BATCH_TARGET_LATENCY_SECONDS,
+    SPEND_LOG_MAX_BATCH_SIZE,
+    SPEND_LOG_MAX_PARALLEL_WRITES,
+    SPEND_LOG_MIN_BATCH_SIZE,
+    SPEND_LOG_QUEUE_MAX_SIZE,
+    SPEND_LOG_QUEUE_SPILL_DIR,
+    SPEND_LOG_QUEUE_SPILL_SEGMENT_SIZE,
+)
+from litellm.proxy._types import SpendLogsPayload
+from litellm.proxy.db.db_transaction_queue.base_update_queue import service_logger_obj
+from litellm.types.services import ServiceTypes
+
+
+SPILL_FILE_NAME_PREFIX = "spend_logs_"
+
+
+def _is_process_alive(pid: int) -> bool:
+    if pid == os.getpid():  # the pid of a previous run of this process, e.g. in a restarted container
+        return False
+    if os.name != "posix":
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _get_spill_file_owner_pid(file_name: str) -> Optional[int]:
+    """`spend_logs_{pid}_{uuid}_{n}.jsonl` -> pid. None for files without a pid."""
+    owner = file_name[len(SPILL_FILE_NAME_PREFIX) :].split("_", 1)[0]
+    return int(owner) if owner.isdigit() else None
+
+
+class SpendLogBatch(NamedTuple):
+    logs: List[dict]
+    enqueued_at: float  # when the oldest log in the batch was queued
+
+
+class SpendLogQueue:
+    """
+    Bounded FIFO buffer for spend logs
+
+    - append / dequeue cost O(1) per log - the buffer is never copied to remove flushed logs
+    - holds at most `max_size` logs in memory (+ logs put back after a failed write, or a recovered spill file larger
+      than `max_size`). Once full, new logs are spilled to `spill_dir` (jsonl files of `spill_segment_size` logs) if
+      set, else the oldest queued log is dropped
+    - spilled logs are loaded back as the in-memory buffer drains. Spill files left in `spill_dir` by a process that
+      exited (e.g. a restart) are picked up on init and written before any new logs
+    - inside an event loop, spill files are written and read in the default executor - use `async_pop_batch` there
+    - `batch_size` adapts to the db - it grows while the backlog is larger than the parallel writers take per round,
+      and shrinks on slow or failed writes
+    """
+
+    def __init__(
+        self,
+        logs: Optional[Iterable[dict]] = None,
+        max_size: int = SPEND_LOG_QUEUE_MAX_SIZE,
+        spill_dir: Optional[str] = SPEND_LOG_QUEUE_SPILL_DIR,
+        spill_segment_size: int = SPEND_LOG_QUEUE_SPILL_SEGMENT_SIZE,
+    ):
+        if spill_dir is not None and spill_segment_size > max_size:
+            # a spill file is loaded back at once - it has to fit in the in-memory buffer
+            raise ValueError(
+                f"spill_segment_size={spill_segment_size} must be <= max_size={max_size}. Set "
+                "SPEND_LOG_QUEUE_SPILL_SEGMENT_SIZE <= SPEND_LOG_QUEUE_MAX_SIZE."
+            )
+        self.max_size = max_size
+        self.spill_dir = spill_dir
+        self.spill_segment_size = spill_segment_size
+        self.batch_size = SPEND_LOG_MIN_BATCH_SIZE
+        self.dropped_count = 0
+        self._logs: Deque[Tuple[float, dict]] = deque()
+        self._overflow: List[Tuple[float, dict]] = []
+        """spilled logs not yet written to a segment file"""
+        self._spill_segments: Deque[Tuple[str, int]] = deque()
+        """(path, number of logs) of spill files, oldest first"""
+        self._pending_spill_writes: Dict[
+            str, Tuple["asyncio.Future[bool]", List[Tuple[float, dict]]]
+        ] = {}
+        """path -> (write, logs) of spill files still being written in the executor"""
+        self._load_lock: Optional[asyncio.Lock] = None
+        self._spilled_count = 0
+        self._spill_file_prefix = (
+            f"{SPILL_FILE_NAME_PREFIX}{os.getpid()}_{uuid.uuid4().hex}"
+        )
+        self._spill_file_count = 0
+        self._reported_dropped_count = 0
+        if self.spill_dir is not None:
+            self._recover_spill_segments()
+        for log in logs or []:
+            self.append(log)
+
+    def __len__(self) -> int:
+        return len(self._logs) + self._spilled_count
+
+    def __iter__(self) -> Iterator[dict]:
+        for _, log in self._logs:
+            yield log
+        for path, _ in self._spill_segments:
+            pending_write = self._pending_spill_writes.get(path)
+            items = (
+                pending_write[1]
+                if pending_write is not None
+                else self._read_spill_segment(path)
+            )
+            for _, log in items:
+                yield log
+        for _, log in self._overflow:
+            yield log
+
+    def append(self, log: Union[dict, SpendLogsPayload]) -> None:
+        item = (time.time(), cast(dict, log))
+        if self._spilled_count == 0 and len(self._logs) < self.max_size:
+            self._logs.append(item)
+        elif self.spill_dir is not None:
+            # once anything is spilled, new logs queue behind it - keeps the buffer FIFO
+            self._overflow.append(item)
+            self._spilled_count += 1
+            if len(self._overflow) >= self.spill_segment_size:
+                self._write_spill_segment()
+        else:
+            self._logs.popleft()
+            self._logs.append(item)
+            self.dropped_count += 1
+
+    def pop_batch(self, batch_size: int) -> SpendLogBatch:
+        self._load_spilled_logs()
+        return self._pop_batch(batch_size)
+
+    async def async_pop_batch(self, batch_size: int) -> SpendLogBatch:
+        await self._async_load_spilled_logs()
+        return self._pop_batch(batch_size)
+
+    def _pop_batch(self, batch_size: int) -> SpendLogBatch:
+        enqueued_at = self._logs[0][0] if self._logs else time.time()
+        logs = [
+            self._logs.popleft()[1] for _ in range(min(batch_size, len(self._logs)))
+        ]
+        return SpendLogBatch(logs=logs, enqueued_at=enqueued_at)
+
+    def requeue(self, batches: List[SpendLogBatch]) -> None:
+        """
+        Put batches that couldn't be written back at the front of the queue. `batches` are in the order they were
+        popped - the queue stays FIFO.
+        """
+        for batch in reversed(batches):
+            self._logs.extendleft(
+                (batch.enqueued_at, log) for log in reversed(batch.logs)
+            )
+
+    def oldest_log_age(self) -> float:
+        """Seconds the oldest queued log has been waiting to be written"""
+        if not self._logs:
+            return 0.0
+        return time.time() - self._logs[0][0]
+
+    def record_batch_written(self, latency: float) -> None:
+        if latency > SPEND_LOG_BATCH_TARGET_LATENCY_SECONDS:
+            self._shrink_batch_size()
+        elif len(self) > self.batch_size * SPEND_LOG_MAX_PARALLEL_WRITES:
+            self.batch_size = min(self.batch_size * 2, SPEND_LOG_MAX_BATCH_SIZE)
+
+    def record_batch_failed(self) -> None:
+        self._shrink_batch_size()
+
+    def _shrink_batch_size(self) -> None:
+        self.batch_size = max(self.batch_size // 2, SPEND_LOG_MIN_BATCH_SIZE)
+
+    def _next_spill_segment_to_load(self) -> Optional[Tuple[str, int]]:
+        """
+        The oldest spill file, if it fits in the in-memory buffer. Spilled logs not yet written to a file are moved
+        to the buffer directly.
+        """
+        while self._spilled_count > 0:
+            room = self.max_size - len(self._logs)
+            if self._spill_segments:
+                path, count = self._spill_segments[0]
+                if count > room and len(self._logs) > 0:
+                    # an empty buffer takes any spill file - e.g. one recovered from a run with a larger max_size
+                    return None
+                return path, count
+            if room <= 0:
+                return None
+            self._logs.extend(self._overflow[:room])
+            self._spilled_count -= len(self._overflow[:room])
+            del self._overflow[:room]
+        return None
+
+    def _load_spilled_logs(self) -> None:
+        while True:
+            segment = self._next_spill_segment_to_load()
+            if segment is None or segment[0] in self._pending_spill_writes:
+                return
+            path, count = segment
+            items = self._read_spill_segment_or_drop(path, count)
+            self._add_loaded_spill_segment(count, items)
+            self._remove_spill_file(path)
+
+    async def _async_load_spilled_logs(self) -> None:
+        if self._spilled_count == 0:
+            return
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        # one loader at a time - spill files are loaded in order
+        async with self._load_lock:
+            while True:
+                segment = self._next_spill_segment_to_load()
+                if segment is None:
+                    return
+                path, count = segment
+                pending_write = self._pending_spill_writes.get(path)
+                written = pending_write is None or await pending_write[0]
+                self._pending_spill_writes.pop(path, None)
+                items: List[Tuple[float, dict]] = []
+                if written:
+                    items = await loop.run_in_executor(
+                        None, self._read_spill_segment_or_drop, path, count
+                    )
+                # the segment stays queued until its logs are in the buffer - new logs keep queueing behind it
+                self._add_loaded_spill_segment(count, items)
+                await loop.run_in_executor(None, self._remove_spill_file, path)
+
+    def _add_loaded_spill_segment(
+        self, count: int, items: List[Tuple[float, dict]]
+    ) -> None:
+        self._spill_segments.popleft()
+        self._spilled_count -= count
+        self._logs.extend(items)
+        if not items:  # unreadable, or never written
+            self.dropped_count += count
+
+    @staticmethod
+    def _read_spill_segment_or_drop(path: str, count: int) -> List[Tuple[float, dict]]:
+        try:
+            return SpendLogQueue._read_spill_segment(path)
+        except OSError as e:
+            verbose_proxy_logger.warning(
+                "Unable to read spend log spill file %s, dropping %s spend logs. Error - %s",
+                path,
+                count,
+                str(e),
+            )
+            return []
+
+    @staticmethod
+    def _remove_spill_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:  # never written
+            pass
+        except OSError as e:
+            verbose_proxy_logger.warning(
+                "Unable to remove spend log spill file %s. Error - %s",
+                path,
+                str(e),
+            )
+
+    def _write_spill_segment(self) -> None:
+        assert self.spill_dir is not None
+        self._spill_file_count += 1
+        path = os.path.join(
+            self.spill_dir, f"{self._spill_file_prefix}_{self._spill_file_count}.jsonl"
+        )
+        items, self._overflow = self._overflow, []
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # no event loop - e.g. logs passed on init
+            if self._write_spill_file(self.spill_dir, path, items):
+                self._spill_segments.append((path, len(items)))
+            else:
+                self._spilled_count -= len(items)
+                self.dropped_count += len(items)
+            return
+        # queued right away, so it keeps its place - loading waits for the write
+        self._spill_segments.append((path, len(items)))
+        self._pending_spill_writes[path] = (
+            loop.run_in_executor(
+                None, self._write_spill_file, self.spill_dir, path, items
+            ),
+            items,
+        )
+
+    @staticmethod
+    def _write_spill_file(
+        spill_dir: str, path: str, items: List[Tuple[float, dict]]
+    ) -> bool:
+        try:
+            os.makedirs(spill_dir, exist_ok=True)
+            with open(path, "w") as f:
+                for enqueued_at, log in items:
+                    f.write(
+                        json.dumps({"enqueued_at": enqueued_at, "log": log}, default=str)
+                        + "\n"
+                    )
+            return True
+        except Exception as e:
+            verbose_proxy_logger.warning(
+                "Unable to spill %s spend logs to %s, dropping them. Error - %s",
+                len(items),
+                path,
+                str(e),
+            )
+            return False
+
+    def _recover_spill_segments(self) -> None:
+        """
+        Queue the spill files of processes that exited, oldest first. Each file is claimed by renaming it to this
+        queue's prefix, so it's replayed by one process only - and deleted once loaded, like any spill file.
+        """
+        assert self.spill_dir is not None
+        try:
+            file_names = os.listdir(self.spill_dir)
+        except OSError:  # nothing spilled yet
+            return
+        orphaned_paths: List[str] = []
+        for file_name in file_names:
+            if not (
+                file_name.startswith(SPILL_FILE_NAME_PREFIX)
+                and file_name.endswith(".jsonl")
+            ):
+                continue
+            owner_pid = _get_spill_file_owner_pid(file_name)
+            if owner_pid is not None and _is_process_alive(owner_pid):
+                continue
+            orphaned_paths.append(os.path.join(self.spill_dir, file_name))
+        try:
+            orphaned_paths.sort(key=lambda path: (os.path.getmtime(path), path))
+        except OSError:  # claimed by another process in the meantime
+            orphaned_paths.sort()
+
+        for orphaned_path in orphaned_paths:
+            self._spill_file_count += 1
+            path = os.path.join(
+                self.spill_dir,
+                f"{self._spill_file_prefix}_{self._spill_file_count}.jsonl",
+            )
+            try:
+                os.rename(orphaned_path, path)
+                count = len(self._read_spill_segment(path))
+            except OSError:  # claimed by another process
+                continue
+            self._spill_segments.append((path, count))
+            self._spilled_count += count
+        if self._spilled_count > 0:
+            verbose_proxy_logger.info(
+                "Recovered %s spend logs from %s spill files in %s",
+                self._spilled_count,
+                len(self._spill_segments),
+                self.spill_dir,
+            )
+
+    @staticmethod
+    def _read_spill_segment(path: str) -> List[Tuple[float, dict]]:
+        items: List[Tuple[float, dict]] = []
+        with open(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError:  # partly written line, e.g. the process was killed mid-write
+                    verbose_proxy_logger.warning(
+                        "Skipping unreadable spend log in spill file %s", path
+                    )
+                    continue
+                items.append((item["enqueued_at"], item["log"]))
+        return items
+
+    async def emit_queue_metrics(self) -> None:
+        if self.dropped_count > self._reported_dropped_count:
+            verbose_proxy_logger.warning(
+                "Spend log queue full (max_size=%s) - dropped %s spend logs. Set SPEND_LOG_QUEUE_SPILL_DIR to spill "
+                "them to disk instead.",
+                self.max_size,
+                self.dropped_count - self._reported_dropped_count,
+            )
+            self._reported_dropped_count = self.dropped_count
+        for label, value in (
+            ("queue_size", len(self)),
+            ("spilled_to_disk", self._spilled_count),
+            ("oldest_log_age_seconds", self.oldest_log_age()),
+            ("dropped", self.dropped_count),
+        ):
+            await service_logger_obj.async_service_success_hook(
+                service=ServiceTypes.IN_MEMORY_SPEND_LOG_QUEUE,
+                duration=0,
+                call_type="emit_queue_metrics",
+                event_metadata={"gauge_labels": label, "gauge_value": value},
+            )
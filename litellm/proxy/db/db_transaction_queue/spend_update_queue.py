@@ -1,5 +1,5 @@
 import asyncio
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from litellm._logging import verbose_proxy_logger
 from litellm.proxy._types import (
@@ -17,11 +17,21 @@ from litellm.types.services import ServiceTypes
 class SpendUpdateQueue(BaseUpdateQueue):
     """
     In memory buffer for spend updates that should be committed to the database
+
+    Updates are aggregated at enqueue time - the queue holds 1 item per (entity_type, entity_id), not 1 item per request.
     """
 
     def __init__(self):
         super().__init__()
         self.update_queue: asyncio.Queue[SpendUpdateQueueItem] = asyncio.Queue()
+        self._pending_updates: Dict[
+            Tuple[Optional[Litellm_EntityType], Optional[str]], SpendUpdateQueueItem
+        ] = {}
+        """
+        Queued updates that new updates for the same entity are added to
+        Key=(entity_type, entity_id)
+        Value=SpendUpdateQueueItem in `update_queue`
+        """
 
     async def flush_and_get_aggregated_db_spend_update_transactions(
         self,
@@ -31,10 +41,34 @@ class SpendUpdateQueue(BaseUpdateQueue):
         verbose_proxy_logger.debug("Aggregating updates by entity type: %s", updates)
         return self.get_aggregated_db_spend_update_transactions(updates)
 
+    @staticmethod
+    def _get_pending_update_key(
+        update: SpendUpdateQueueItem,
+    ) -> Tuple[Optional[Litellm_EntityType], Optional[str]]:
+        return (update.get("entity_type"), update.get("entity_id"))
+
+    def _remove_pending_update(self, update: SpendUpdateQueueItem) -> None:
+        key = self._get_pending_update_key(update)
+        if self._pending_updates.get(key) is update:
+            del self._pending_updates[key]
+
+    async def _put_update(self, update: SpendUpdateQueueItem) -> None:
+        """Queue a new item for the entity, or add the spend to the entity's queued item"""
+        key = self._get_pending_update_key(update)
+        pending_update = self._pending_updates.get(key)
+        if pending_update is not None:
+            pending_update["response_cost"] = (
+                pending_update.get("response_cost", 0) or 0
+            ) + (update.get("response_cost", 0) or 0)
+            return
+        pending_update = SpendUpdateQueueItem(**update)  # type: ignore
+        self._pending_updates[key] = pending_update
+        await self.update_queue.put(pending_update)
+
     async def add_update(self, update: SpendUpdateQueueItem):
         """Enqueue an update to the spend update queue"""
         verbose_proxy_logger.debug("Adding update to queue: %s", update)
-        await self.update_queue.put(update)
+        await self._put_update(update)
 
         # if the queue is full, aggregate the updates
         if self.update_queue.qsize() >= self.MAX_SIZE_IN_MEMORY_QUEUE:
@@ -50,7 +84,7 @@ class SpendUpdateQueue(BaseUpdateQueue):
         ] = await self.flush_all_updates_from_in_memory_queue()
         aggregated_updates = self._get_aggregated_spend_update_queue_item(updates)
         for update in aggregated_updates:
-            await self.update_queue.put(update)
+            await self._put_update(update)
         return
 
     def _get_aggregated_spend_update_queue_item(
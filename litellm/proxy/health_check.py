@@ -3,12 +3,12 @@
 import asyncio
 import logging
 import random
-from typing import List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import litellm
 
 logger = logging.getLogger(__name__)
-from litellm.constants import HEALTH_CHECK_TIMEOUT_SECONDS
+from litellm.constants import HEALTH_CHECK_MAX_CONCURRENCY, HEALTH_CHECK_TIMEOUT_SECONDS
 
 ILLEGAL_DISPLAY_PARAMS = [
     "messages",
@@ -64,38 +64,33 @@ def filter_deployments_by_id(
 
 
 async def run_with_timeout(task, timeout):
+    """
+    Await `task`, returning an error dict if it takes longer than `timeout`.
+
+    On timeout only `task` is cancelled - other tasks on the event loop (e.g. in-flight requests) are left alone.
+    """
     try:
         return await asyncio.wait_for(task, timeout)
     except asyncio.TimeoutError:
-        task.cancel()
-        # Only cancel child tasks of the current task
-        current_task = asyncio.current_task()
-        for t in asyncio.all_tasks():
-            if t != current_task:
-                t.cancel()
-        try:
-            await asyncio.wait_for(task, 0.1)  # Give 100ms for cleanup
-        except (asyncio.TimeoutError, asyncio.CancelledError, Exception):
-            pass
         return {"error": "Timeout exceeded"}
 
 
-async def _perform_health_check(model_list: list, details: Optional[bool] = True):
+async def _run_health_check(
+    model: dict, semaphore: asyncio.Semaphore, stagger_seconds: float
+) -> dict:
     """
-    Perform a health check for each model in the list.
+    Health check a single deployment, after a random delay of up to `stagger_seconds`, holding a semaphore slot.
     """
+    if stagger_seconds > 0:
+        await asyncio.sleep(random.uniform(0, stagger_seconds))
 
-    tasks = []
-    for model in model_list:
-        litellm_params = model["litellm_params"]
+    async with semaphore:
         model_info = model.get("model_info", {})
         mode = model_info.get("mode", None)
-        litellm_params = _update_litellm_params_for_health_check(
-            model_info, litellm_params
-        )
+        _update_litellm_params_for_health_check(model_info, model["litellm_params"])
         timeout = model_info.get("health_check_timeout") or HEALTH_CHECK_TIMEOUT_SECONDS
 
-        task = run_with_timeout(
+        return await run_with_timeout(
             litellm.ahealth_check(
                 model["litellm_params"],
                 mode=mode,
@@ -105,30 +100,144 @@ async def _perform_health_check(model_list: list, details: Optional[bool] = True
             timeout,
         )
 
-        tasks.append(task)
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+def _get_endpoint_data(
+    model: dict, result: Any, details: Optional[bool] = True
+) -> Tuple[bool, dict]:
+    """
+    Returns (is_healthy, endpoint data for display) for a health check result.
+    """
+    litellm_params = model["litellm_params"]
+    if isinstance(result, dict) and "error" not in result:
+        return True, _clean_endpoint_data({**litellm_params, **result}, details)
+    elif isinstance(result, dict):
+        return False, _clean_endpoint_data({**litellm_params, **result}, details)
+    return False, _clean_endpoint_data(litellm_params, details)
 
-    healthy_endpoints = []
-    unhealthy_endpoints = []
 
-    for is_healthy, model in zip(results, model_list):
-        litellm_params = model["litellm_params"]
+async def _perform_health_check(
+    model_list: list,
+    details: Optional[bool] = True,
+    max_concurrency: int = HEALTH_CHECK_MAX_CONCURRENCY,
+    stagger_seconds: float = 0,
+    on_result: Optional[Callable[[dict, bool, dict], Awaitable[None]]] = None,
+):
+    """
+    Perform a health check for each model in the list.
 
-        if isinstance(is_healthy, dict) and "error" not in is_healthy:
-            healthy_endpoints.append(
-                _clean_endpoint_data({**litellm_params, **is_healthy}, details)
+    - At most `max_concurrency` checks run at once.
+    - Each check starts after a random delay of up to `stagger_seconds`, to spread load on providers.
+    - `on_result(model, is_healthy, endpoint_data)` is awaited as each check completes.
+    - If this is cancelled, only the health check tasks it started are cancelled.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    tasks: Dict["asyncio.Task", int] = {
+        asyncio.ensure_future(
+            _run_health_check(
+                model=model, semaphore=semaphore, stagger_seconds=stagger_seconds
             )
-        elif isinstance(is_healthy, dict):
-            unhealthy_endpoints.append(
-                _clean_endpoint_data({**litellm_params, **is_healthy}, details)
+        ): index
+        for index, model in enumerate(model_list)
+    }
+    results: List[Any] = [None] * len(model_list)
+
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
             )
+            for task in done:
+                index = tasks[task]
+                if task.cancelled():
+                    result: Any = asyncio.CancelledError()
+                else:
+                    result = task.exception() or task.result()
+                results[index] = result
+                if on_result is not None:
+                    is_healthy, endpoint_data = _get_endpoint_data(
+                        model_list[index], result, details
+                    )
+                    try:
+                        await on_result(model_list[index], is_healthy, endpoint_data)
+                    except Exception as e:
+                        logger.debug(f"Health check on_result callback failed: {e}")
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+    healthy_endpoints = []
+    unhealthy_endpoints = []
+
+    for result, model in zip(results, model_list):
+        is_healthy, endpoint_data = _get_endpoint_data(model, result, details)
+        if is_healthy:
+            healthy_endpoints.append(endpoint_data)
         else:
-            unhealthy_endpoints.append(_clean_endpoint_data(litellm_params, details))
+            unhealthy_endpoints.append(endpoint_data)
 
     return healthy_endpoints, unhealthy_endpoints
 
 
+class BackgroundHealthCheckResults:
+    """
+    Latest background health check result per deployment, updated as each check completes.
+
+    The healthy / unhealthy endpoint lists are kept up to date in O(1) per result - not rebuilt on every result. The
+    order of each list isn't meaningful.
+    """
+
+    def __init__(self):
+        self._endpoints: Dict[bool, List[dict]] = {True: [], False: []}
+        """is_healthy -> endpoint data"""
+        self._model_ids: Dict[bool, List[str]] = {True: [], False: []}
+        """is_healthy -> model id, at the same index as its endpoint data"""
+        self._positions: Dict[str, Tuple[bool, int]] = {}
+        """model id -> (is_healthy, index in the endpoint list)"""
+
+    def update(self, model_id: str, is_healthy: bool, endpoint_data: dict) -> None:
+        position = self._positions.get(model_id)
+        if position is not None and position[0] == is_healthy:
+            self._endpoints[is_healthy][position[1]] = endpoint_data
+            return
+        if position is not None:
+            self._remove(model_id)
+        self._positions[model_id] = (is_healthy, len(self._endpoints[is_healthy]))
+        self._endpoints[is_healthy].append(endpoint_data)
+        self._model_ids[is_healthy].append(model_id)
+
+    def prune(self, model_ids: set) -> None:
+        """
+        Drop results for deployments that are no longer checked.
+        """
+        for model_id in list(self._positions.keys()):
+            if model_id not in model_ids:
+                self._remove(model_id)
+
+    def _remove(self, model_id: str) -> None:
+        """swap with the last endpoint of the list, and pop it"""
+        is_healthy, index = self._positions.pop(model_id)
+        endpoints = self._endpoints[is_healthy]
+        model_ids = self._model_ids[is_healthy]
+        last_endpoint_data, last_model_id = endpoints.pop(), model_ids.pop()
+        if index < len(endpoints):
+            endpoints[index] = last_endpoint_data
+            model_ids[index] = last_model_id
+            self._positions[last_model_id] = (is_healthy, index)
+
+    def get_health_check_results(self) -> dict:
+        """
+        The endpoint lists are returned as-is, not copied - they're updated in place as results come in.
+        """
+        return {
+            "healthy_endpoints": self._endpoints[True],
+            "unhealthy_endpoints": self._endpoints[False],
+            "healthy_count": len(self._endpoints[True]),
+            "unhealthy_count": len(self._endpoints[False]),
+        }
+
+
 def _update_litellm_params_for_health_check(
     model_info: dict, litellm_params: dict
 ) -> dict:
@@ -190,6 +299,9 @@ async def perform_health_check(
     model: Optional[str] = None,
     cli_model: Optional[str] = None,
     details: Optional[bool] = True,
+    max_concurrency: int = HEALTH_CHECK_MAX_CONCURRENCY,
+    stagger_seconds: float = 0,
+    on_result: Optional[Callable[[dict, bool, dict], Awaitable[None]]] = None,
 ):
     """
     Perform a health check on the system.
@@ -217,7 +329,11 @@ async def perform_health_check(
         model_list=model_list
     )  # filter duplicate deployments (e.g. when model alias'es are used)
     healthy_endpoints, unhealthy_endpoints = await _perform_health_check(
-        model_list, details
+        model_list,
+        details,
+        max_concurrency=max_concurrency,
+        stagger_seconds=stagger_seconds,
+        on_result=on_result,
     )
 
     return healthy_endpoints, unhealthy_endpoints
@@ -171,10 +171,8 @@ class _PROXY_DynamicRateLimitHandlerV3(CustomLogger):
                 )
                 
                 # Query cache for current counter value
-                counter_value = await self.internal_usage_cache.async_get_cache(
-                    key=counter_key,
-                    litellm_parent_otel_span=None,
-                    local_only=False,  # Check Redis too
+                counter_value = await self.v3_limiter.async_get_rate_limit_counter(
+                    counter_key=counter_key,
                 )
                 
                 if counter_value is not None:
@@ -195,10 +193,8 @@ class _PROXY_DynamicRateLimitHandlerV3(CustomLogger):
                     rate_limit_type="tokens",
                 )
                 
-                counter_value = await self.internal_usage_cache.async_get_cache(
-                    key=counter_key,
-                    litellm_parent_otel_span=None,
-                    local_only=False,
+                counter_value = await self.v3_limiter.async_get_rate_limit_counter(
+                    counter_key=counter_key,
                 )
                 
                 if counter_value is not None:
@@ -0,0 +1,207 @@
+"""
+In-process counter store for the v3 rate limiter (`parallel_request_limiter_v3.py`), used when Redis is not configured.
+
+Instead of reading/writing window + counter keys through `DualCache` (several awaited calls per descriptor), each
+counter is a slotted object held in a single dict. All descriptors of a request are checked and incremented in one
+synchronous call - there are no awaits in between, so concurrent requests on the event loop can't interleave.
+
+Algorithms:
+- `fixed_window`: same semantics as the Redis Lua script - the window starts at the first request and the counter
+  resets once `window_size` seconds have passed.
+- `sliding_window`: the window is split into `RATE_LIMIT_SLIDING_WINDOW_BUCKETS` sub-window buckets (ring buffer),
+  the counter is the sum of the buckets inside the last `window_size` seconds.
+- `token_bucket`: capacity = limit, refilled continuously at `limit / window_size` per second. The counter is the
+  amount of capacity currently used.
+"""
+
+from typing import Dict, List, Literal, Optional, Tuple, Type, Union
+
+from litellm.constants import RATE_LIMIT_SLIDING_WINDOW_BUCKETS
+
+RateLimitAlgorithm = Literal["fixed_window", "sliding_window", "token_bucket"]
+RATE_LIMIT_ALGORITHMS = ("fixed_window", "sliding_window", "token_bucket")
+
+
+class _FixedWindowCounter:
+    __slots__ = ("window_size", "window_start", "value")
+
+    def __init__(self, window_size: int, now: float):
+        self.window_size = window_size
+        self.window_start = now
+        self.value: float = 0
+
+    def get(self, now: float) -> float:
+        if now - self.window_start >= self.window_size:
+            self.window_start = now
+            self.value = 0
+        return self.value
+
+    def add(self, amount: float, now: float, limit: Optional[int] = None) -> float:
+        self.value = self.get(now) + amount
+        return self.value
+
+    def is_expired(self, now: float) -> bool:
+        return now - self.window_start >= self.window_size
+
+
+class _SlidingWindowCounter:
+    __slots__ = ("bucket_size", "buckets", "head", "total")
+
+    def __init__(self, window_size: int, now: float):
+        self.bucket_size = window_size / RATE_LIMIT_SLIDING_WINDOW_BUCKETS
+        self.buckets: List[float] = [0] * RATE_LIMIT_SLIDING_WINDOW_BUCKETS
+        self.head = int(now // self.bucket_size)
+        self.total: float = 0
+
+    def get(self, now: float) -> float:
+        index = int(now // self.bucket_size)
+        elapsed = index - self.head
+        if elapsed > 0:
+            num_buckets = len(self.buckets)
+            if elapsed >= num_buckets:
+                self.buckets = [0] * num_buckets
+                self.total = 0
+            else:
+                for i in range(self.head + 1, index + 1):
+                    slot = i % num_buckets
+                    self.total -= self.buckets[slot]
+                    self.buckets[slot] = 0
+            self.head = index
+        return self.total
+
+    def add(self, amount: float, now: float, limit: Optional[int] = None) -> float:
+        self.get(now)
+        self.buckets[self.head % len(self.buckets)] += amount
+        self.total += amount
+        return self.total
+
+    def is_expired(self, now: float) -> bool:
+        return int(now // self.bucket_size) - self.head >= len(self.buckets)
+
+
+class _TokenBucketCounter:
+    __slots__ = ("window_size", "refill_rate", "used", "last_refill")
+
+    def __init__(self, window_size: int, now: float):
+        self.window_size = window_size
+        self.refill_rate: Optional[float] = None  # set from the first check with a limit
+        self.used: float = 0
+        self.last_refill = now
+
+    def get(self, now: float) -> float:
+        if self.refill_rate is None:
+            # no limit seen yet (e.g. token usage logged before the first check) - expire like a fixed window
+            if now - self.last_refill >= self.window_size:
+                self.used = 0
+                self.last_refill = now
+            return self.used
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.used = max(0.0, self.used - elapsed * self.refill_rate)
+            self.last_refill = now
+        return self.used
+
+    def add(self, amount: float, now: float, limit: Optional[int] = None) -> float:
+        if limit is not None:
+            self.get(now)
+            self.refill_rate = limit / self.window_size
+        self.used = self.get(now) + amount
+        return self.used
+
+    def is_expired(self, now: float) -> bool:
+        return self.get(now) <= 0 and now - self.last_refill >= self.window_size
+
+
+_Counter = Union[_FixedWindowCounter, _SlidingWindowCounter, _TokenBucketCounter]
+_COUNTER_TYPES: Dict[str, Type[_Counter]] = {
+    "fixed_window": _FixedWindowCounter,
+    "sliding_window": _SlidingWindowCounter,
+    "token_bucket": _TokenBucketCounter,
+}
+
+
+class InMemoryRateLimitStore:
+    """
+    Rate limit counters keyed by the v3 limiter's counter keys (`{key:value}:rate_limit_type`).
+
+    Not thread-safe - it's only used from the proxy's event loop, where each call runs to completion.
+    """
+
+    def __init__(self, sweep_interval: float = 60):
+        self._counters: Dict[str, _Counter] = {}
+        self._sweep_interval = sweep_interval
+        self._last_sweep: Optional[float] = None
+
+    def check_and_increment(
+        self,
+        counters: List[Tuple[str, RateLimitAlgorithm, Optional[int], int]],
+        now: float,
+        increment: int = 1,
+    ) -> List[float]:
+        """
+        Increment every counter by `increment` and return the new values, in order.
+
+        `counters` is a list of (counter_key, algorithm, limit, window_size). With `increment=0` the current values are
+        returned without changing anything.
+        """
+        self._maybe_sweep(now)
+        values: List[float] = []
+        for counter_key, algorithm, limit, window_size in counters:
+            counter = self._get_or_create(counter_key, algorithm, window_size, now)
+            if increment:
+                values.append(counter.add(increment, now, limit))
+            else:
+                values.append(counter.get(now))
+        return values
+
+    def increment(
+        self,
+        counter_key: str,
+        amount: float,
+        algorithm: RateLimitAlgorithm,
+        window_size: int,
+        now: float,
+    ) -> float:
+        """
+        Add `amount` (can be negative) to a counter, e.g. token usage after a call or a finished parallel request.
+        """
+        counter = self._get_or_create(counter_key, algorithm, window_size, now)
+        return counter.add(amount, now)
+
+    def get(self, counter_key: str, now: float) -> Optional[float]:
+        counter = self._counters.get(counter_key)
+        if counter is None:
+            return None
+        return counter.get(now)
+
+    def _get_or_create(
+        self,
+        counter_key: str,
+        algorithm: RateLimitAlgorithm,
+        window_size: int,
+        now: float,
+    ) -> _Counter:
+        existing_counter = self._counters.get(counter_key)
+        if existing_counter is not None:
+            return existing_counter
+        counter = _COUNTER_TYPES[algorithm](window_size, now)
+        self._counters[counter_key] = counter
+        return counter
+
+    def _maybe_sweep(self, now: float) -> None:
+        """
+        Drop counters that have fully expired, so keys that stop sending requests don't accumulate.
+        """
+        if self._last_sweep is None:
+            self._last_sweep = now
+            return
+        if now - self._last_sweep < self._sweep_interval:
+            return
+        self._last_sweep = now
+        expired = [
+            counter_key
+            for counter_key, counter in self._counters.items()
+            if counter.is_expired(now)
+        ]
+        for counter_key in expired:
+            del self._counters[counter_key]
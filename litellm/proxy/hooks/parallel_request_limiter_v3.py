@@ -15,6 +15,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Tuple,
     TypedDict,
     Union,
     cast,
@@ -28,6 +29,11 @@ from litellm.constants import DYNAMIC_RATE_LIMIT_ERROR_THRESHOLD_PER_MINUTE
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.proxy._types import UserAPIKeyAuth
 from litellm.proxy.auth.auth_utils import get_model_rate_limit_from_metadata
+from litellm.proxy.hooks.in_memory_rate_limiter import (
+    RATE_LIMIT_ALGORITHMS,
+    InMemoryRateLimitStore,
+    RateLimitAlgorithm,
+)
 from litellm.types.llms.openai import BaseLiteLLMOpenAIResponseObject
 
 if TYPE_CHECKING:
@@ -160,7 +166,18 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
             self.token_increment_script = None
 
         self.window_size = int(os.getenv("LITELLM_RATE_LIMIT_WINDOW_SIZE", 60))
-        
+
+        # In-process counter store - only without Redis, with Redis the counters are shared across instances
+        self.rate_limit_algorithm = self._get_rate_limit_algorithm()
+        self.in_memory_store: Optional[InMemoryRateLimitStore] = None
+        if (
+            self.rate_limit_algorithm is not None
+            and self.internal_usage_cache.dual_cache.redis_cache is None
+        ):
+            self.in_memory_store = InMemoryRateLimitStore(
+                sweep_interval=self.window_size
+            )
+
         # Batch rate limiter (lazy loaded)
         self._batch_rate_limiter: Optional[Any] = None
 
@@ -182,6 +199,92 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
                 )
         return self._batch_rate_limiter
 
+    def _get_rate_limit_algorithm(self) -> Optional[RateLimitAlgorithm]:
+        rate_limit_algorithm = os.getenv("LITELLM_RATE_LIMIT_ALGORITHM")
+        if rate_limit_algorithm is None:
+            return None
+        if rate_limit_algorithm not in RATE_LIMIT_ALGORITHMS:
+            verbose_proxy_logger.warning(
+                f"Invalid LITELLM_RATE_LIMIT_ALGORITHM={rate_limit_algorithm}, expected one of {RATE_LIMIT_ALGORITHMS}. Using the in-memory cache."
+            )
+            return None
+        return cast(RateLimitAlgorithm, rate_limit_algorithm)
+
+    def _get_counter_algorithm(self, counter_key: str) -> RateLimitAlgorithm:
+        # parallel requests are a gauge (incremented on start, decremented on end), not a rate
+        if counter_key.endswith(":max_parallel_requests"):
+            return "fixed_window"
+        return cast(RateLimitAlgorithm, self.rate_limit_algorithm)
+
+    def _in_memory_store_check_and_increment(
+        self,
+        store: InMemoryRateLimitStore,
+        keys: List[str],
+        key_metadata: Dict[str, Any],
+        now: float,
+        read_only: bool,
+    ) -> List[Any]:
+        """
+        Check + increment all counters in one synchronous call to the in-process store.
+
+        Returns window/counter pairs in the same format as the Redis Lua script.
+        """
+        counters = []
+        for i in range(0, len(keys), 2):
+            metadata = key_metadata[keys[i]]
+            counter_key = keys[i + 1]
+            rate_limit_type = counter_key.rsplit(":", 1)[1]
+            counters.append(
+                (
+                    counter_key,
+                    self._get_counter_algorithm(counter_key),
+                    metadata[f"{rate_limit_type}_limit"],
+                    metadata["window_size"],
+                )
+            )
+        counter_values = store.check_and_increment(
+            counters=counters, now=now, increment=0 if read_only else 1
+        )
+
+        results: List[Any] = []
+        for counter_value in counter_values:
+            results.append(str(int(now)))  # window_start
+            results.append(counter_value)  # counter
+        return results
+
+    def _in_memory_store_increment(
+        self,
+        store: InMemoryRateLimitStore,
+        pipeline_operations: List["RedisPipelineIncrementOperation"],
+    ) -> None:
+        now = self._get_current_time().timestamp()
+        for op in pipeline_operations:
+            store.increment(
+                counter_key=op["key"],
+                amount=op["increment_value"],
+                algorithm=self._get_counter_algorithm(op["key"]),
+                window_size=op["ttl"] or self.window_size,
+                now=now,
+            )
+
+    async def async_get_rate_limit_counter(
+        self,
+        counter_key: str,
+        parent_otel_span: Optional[Span] = None,
+    ) -> Optional[Any]:
+        """
+        Read the current value of a counter, without incrementing it.
+        """
+        if self.in_memory_store is not None:
+            return self.in_memory_store.get(
+                counter_key, now=self._get_current_time().timestamp()
+            )
+        return await self.internal_usage_cache.async_get_cache(
+            key=counter_key,
+            litellm_parent_otel_span=parent_otel_span,
+            local_only=False,  # Check Redis too
+        )
+
     def _get_current_time(self) -> datetime:
         """Return the current time for rate limiting calculations."""
         return self._time_provider()
@@ -438,30 +541,14 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
 
         return all_cache_values
 
-    async def should_rate_limit(
-        self,
-        descriptors: List[RateLimitDescriptor],
-        parent_otel_span: Optional[Span] = None,
-        read_only: bool = False,
-    ) -> RateLimitResponse:
+    def _get_rate_limit_keys(
+        self, descriptors: List[RateLimitDescriptor]
+    ) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
         """
-        Check if any of the rate limit descriptors should be rate limited.
-        Returns a RateLimitResponse with the overall code and status for each descriptor.
-        Uses batch operations for Redis to improve performance.
-
-        Args:
-            descriptors: List of rate limit descriptors to check
-            parent_otel_span: Optional OpenTelemetry span for tracing
-            read_only: If True, only check limits without incrementing counters
+        Returns (the window + counter keys to check for the descriptors, window key -> limits of its descriptor)
         """
-
-        current_time = self._get_current_time()
-        now = current_time.timestamp()
-        now_int = int(now)  # Convert to integer for Redis Lua script
-
-        # Collect all keys and their metadata upfront
         keys_to_fetch: List[str] = []
-        key_metadata = {}  # Store metadata for each key
+        key_metadata: Dict[str, Dict[str, Any]] = {}  # Store metadata for each key
         for descriptor in descriptors:
             descriptor_key = descriptor["key"]
             descriptor_value = descriptor["value"]
@@ -512,6 +599,59 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
                 "descriptor_key": descriptor_key,
             }
 
+        return keys_to_fetch, key_metadata
+
+    def _should_rate_limit_in_memory(
+        self,
+        store: InMemoryRateLimitStore,
+        keys_to_fetch: List[str],
+        key_metadata: Dict[str, Dict[str, Any]],
+        now: float,
+        read_only: bool,
+    ) -> RateLimitResponse:
+        """`should_rate_limit` with the in-process counter store - checks + increments all keys in 1 synchronous call"""
+        cache_values = self._in_memory_store_check_and_increment(
+            store=store,
+            keys=keys_to_fetch,
+            key_metadata=key_metadata,
+            now=now,
+            read_only=read_only,
+        )
+        return self.is_cache_list_over_limit(keys_to_fetch, cache_values, key_metadata)
+
+    async def should_rate_limit(
+        self,
+        descriptors: List[RateLimitDescriptor],
+        parent_otel_span: Optional[Span] = None,
+        read_only: bool = False,
+    ) -> RateLimitResponse:
+        """
+        Check if any of the rate limit descriptors should be rate limited.
+        Returns a RateLimitResponse with the overall code and status for each descriptor.
+        Uses batch operations for Redis to improve performance.
+
+        Args:
+            descriptors: List of rate limit descriptors to check
+            parent_otel_span: Optional OpenTelemetry span for tracing
+            read_only: If True, only check limits without incrementing counters
+        """
+
+        current_time = self._get_current_time()
+        now = current_time.timestamp()
+        now_int = int(now)  # Convert to integer for Redis Lua script
+
+        # Collect all keys and their metadata upfront
+        keys_to_fetch, key_metadata = self._get_rate_limit_keys(descriptors)
+
+        if self.in_memory_store is not None:
+            return self._should_rate_limit_in_memory(
+                store=self.in_memory_store,
+                keys_to_fetch=keys_to_fetch,
+                key_metadata=key_metadata,
+                now=now,
+                read_only=read_only,
+            )
+
         ## CHECK IN-MEMORY CACHE
         cache_values = await self.internal_usage_cache.async_batch_get_cache(
             keys=keys_to_fetch,
@@ -1277,6 +1417,10 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
         if not pipeline_operations:
             return
 
+        if self.in_memory_store is not None:
+            self._in_memory_store_increment(self.in_memory_store, pipeline_operations)
+            return
+
         # Check if script is available
         if self.token_increment_script is None:
             verbose_proxy_logger.debug(
@@ -1523,7 +1667,11 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
                 )
 
             # Execute all increments in a single pipeline
-            if pipeline_operations:
+            if pipeline_operations and self.in_memory_store is not None:
+                self._in_memory_store_increment(
+                    self.in_memory_store, pipeline_operations
+                )
+            elif pipeline_operations:
                 await self.internal_usage_cache.dual_cache.async_increment_cache_pipeline(
                     increment_list=pipeline_operations,
                     litellm_parent_otel_span=litellm_parent_otel_span,
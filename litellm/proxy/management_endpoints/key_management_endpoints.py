@@ -2413,11 +2413,16 @@ async def delete_verification_tokens(
         verbose_proxy_logger.debug(traceback.format_exc())
         raise e
 
+    deleted_cache_keys: List[str] = []
     for key in tokens:
         user_api_key_cache.delete_cache(key)
         # remove hash token from cache
         hashed_token = hash_token(cast(str, key))
         user_api_key_cache.delete_cache(hashed_token)
+        deleted_cache_keys.extend([key, hashed_token])
+    await user_api_key_cache.async_invalidate_cache(
+        keys=deleted_cache_keys, skip_local=True
+    )
 
     return {"deleted_keys": deleted_tokens}, _keys_being_deleted
 
@@ -3370,6 +3375,7 @@ async def block_key(
         user_api_key_obj=key_object,
         user_api_key_cache=user_api_key_cache,
         proxy_logging_obj=proxy_logging_obj,
+        invalidate_other_instances=True,
     )
 
     return record
@@ -3484,6 +3490,7 @@ async def unblock_key(
         user_api_key_obj=key_object,
         user_api_key_cache=user_api_key_cache,
         proxy_logging_obj=proxy_logging_obj,
+        invalidate_other_instances=True,
     )
 
     return record
@@ -1284,6 +1284,7 @@ async def update_team(
         team_table=LiteLLM_TeamTableCachedObj(**team_row.model_dump()),
         user_api_key_cache=user_api_key_cache,
         proxy_logging_obj=proxy_logging_obj,
+        invalidate_other_instances=True,
     )
 
     # Enterprise Feature - Audit Logging. Enable with litellm.store_audit_logs = True
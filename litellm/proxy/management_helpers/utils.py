@@ -2,7 +2,7 @@
 ## Helper utils for the management endpoints (keys/users/teams)
 from datetime import datetime
 from functools import wraps
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from fastapi import HTTPException, Request
 
@@ -242,64 +242,85 @@ async def add_new_member(
     return returned_user, returned_team_membership
 
 
-def _delete_user_id_from_cache(kwargs):
+def _delete_user_id_from_cache(kwargs) -> List[str]:
     from litellm.proxy.proxy_server import user_api_key_cache
 
+    deleted_cache_keys: List[str] = []
     if kwargs.get("data") is not None:
         update_user_request = kwargs.get("data")
         if isinstance(update_user_request, UpdateUserRequest):
-            user_api_key_cache.delete_cache(key=update_user_request.user_id)
+            if update_user_request.user_id is not None:
+                deleted_cache_keys.append(update_user_request.user_id)
 
         # delete user request
         if isinstance(update_user_request, DeleteUserRequest):
-            for user_id in update_user_request.user_ids:
-                user_api_key_cache.delete_cache(key=user_id)
-    pass
+            deleted_cache_keys.extend(update_user_request.user_ids)
 
+    for key in deleted_cache_keys:
+        user_api_key_cache.delete_cache(key=key)
+    return deleted_cache_keys
 
-def _delete_api_key_from_cache(kwargs):
+
+def _delete_api_key_from_cache(kwargs) -> List[str]:
     from litellm.proxy.proxy_server import user_api_key_cache
 
+    deleted_cache_keys: List[str] = []
     if kwargs.get("data") is not None:
         update_request = kwargs.get("data")
         if isinstance(update_request, UpdateKeyRequest):
-            user_api_key_cache.delete_cache(key=update_request.key)
+            deleted_cache_keys.append(update_request.key)
 
         # delete key request
         if isinstance(update_request, KeyRequest) and update_request.keys:
-            for key in update_request.keys:
-                user_api_key_cache.delete_cache(key=key)
-    pass
+            deleted_cache_keys.extend(update_request.keys)
+
+    for key in deleted_cache_keys:
+        user_api_key_cache.delete_cache(key=key)
+    return deleted_cache_keys
 
 
-def _delete_team_id_from_cache(kwargs):
+def _delete_team_id_from_cache(kwargs) -> List[str]:
     from litellm.proxy.proxy_server import user_api_key_cache
 
+    team_ids: List[str] = []
     if kwargs.get("data") is not None:
         update_request = kwargs.get("data")
         if isinstance(update_request, UpdateTeamRequest):
-            user_api_key_cache.delete_cache(key=update_request.team_id)
+            team_ids.append(update_request.team_id)
 
         # delete team request
         if isinstance(update_request, DeleteTeamRequest):
-            for team_id in update_request.team_ids:
-                user_api_key_cache.delete_cache(key=team_id)
-    pass
+            team_ids.extend(update_request.team_ids)
+
+    deleted_cache_keys: List[str] = []
+    for team_id in team_ids:
+        user_api_key_cache.delete_cache(key=team_id)
+        deleted_cache_keys.append(team_id)
+        # team objects are cached as `team_id:{team_id}` - refreshed locally by the team endpoints
+        deleted_cache_keys.append("team_id:{}".format(team_id))
+    return deleted_cache_keys
 
 
-def _delete_customer_id_from_cache(kwargs):
+def _delete_customer_id_from_cache(kwargs) -> List[str]:
     from litellm.proxy.proxy_server import user_api_key_cache
 
+    end_user_ids: List[str] = []
     if kwargs.get("data") is not None:
         update_request = kwargs.get("data")
         if isinstance(update_request, UpdateCustomerRequest):
-            user_api_key_cache.delete_cache(key=update_request.user_id)
+            end_user_ids.append(update_request.user_id)
 
         # delete customer request
         if isinstance(update_request, DeleteCustomerRequest):
-            for user_id in update_request.user_ids:
-                user_api_key_cache.delete_cache(key=user_id)
-    pass
+            end_user_ids.extend(update_request.user_ids)
+
+    deleted_cache_keys: List[str] = []
+    for end_user_id in end_user_ids:
+        # end user objects are cached as `end_user_id:{end_user_id}`
+        for key in (end_user_id, "end_user_id:{}".format(end_user_id)):
+            user_api_key_cache.delete_cache(key=key)
+            deleted_cache_keys.append(key)
+    return deleted_cache_keys
 
 
 async def send_management_endpoint_alert(
@@ -409,10 +430,18 @@ def management_endpoint_wrapper(func):
                             )
 
                 # Delete updated/deleted info from cache
-                _delete_api_key_from_cache(kwargs=kwargs)
-                _delete_user_id_from_cache(kwargs=kwargs)
-                _delete_team_id_from_cache(kwargs=kwargs)
-                _delete_customer_id_from_cache(kwargs=kwargs)
+                deleted_cache_keys = [
+                    *_delete_api_key_from_cache(kwargs=kwargs),
+                    *_delete_user_id_from_cache(kwargs=kwargs),
+                    *_delete_team_id_from_cache(kwargs=kwargs),
+                    *_delete_customer_id_from_cache(kwargs=kwargs),
+                ]
+                # + from the in-memory cache of other instances
+                from litellm.proxy.proxy_server import user_api_key_cache
+
+                await user_api_key_cache.async_invalidate_cache(
+                    keys=deleted_cache_keys, skip_local=True
+                )
             except Exception as e:
                 # Non-Blocking Exception
                 verbose_logger.debug("Error in management endpoint wrapper: %s", str(e))
@@ -31,6 +31,7 @@ from litellm.constants import (
     AIOHTTP_CONNECTOR_LIMIT,
     AIOHTTP_KEEPALIVE_TIMEOUT,
     AIOHTTP_TTL_DNS_CACHE,
+    BACKGROUND_HEALTH_CHECK_STAGGER_RATIO,
     BASE_MCP_ROUTE,
     DEFAULT_MAX_RECURSE_DEPTH,
     DEFAULT_SHARED_HEALTH_CHECK_LOCK_TTL,
@@ -38,6 +39,7 @@ from litellm.constants import (
     DEFAULT_SLACK_ALERTING_THRESHOLD,
     LITELLM_EMBEDDING_PROVIDERS_SUPPORTING_INPUT_ARRAY_OF_TOKENS,
     LITELLM_SETTINGS_SAFE_DB_OVERRIDES,
+    USER_API_KEY_CACHE_INVALIDATION_CHANNEL,
 )
 from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
 from litellm.types.utils import (
@@ -158,6 +160,7 @@ from litellm.litellm_core_utils.core_helpers import (
     get_litellm_metadata_from_kwargs,
 )
 from litellm.litellm_core_utils.credential_accessor import CredentialAccessor
+from litellm.litellm_core_utils.latency_profiler import latency_profiler
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
 from litellm.litellm_core_utils.sensitive_data_masker import SensitiveDataMasker
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
@@ -239,7 +242,10 @@ from litellm.proxy.guardrails.init_guardrails import (
     init_guardrails_v2,
     initialize_guardrails,
 )
-from litellm.proxy.health_check import perform_health_check
+from litellm.proxy.health_check import (
+    BackgroundHealthCheckResults,
+    perform_health_check,
+)
 from litellm.proxy.health_endpoints._health_endpoints import router as health_router
 from litellm.proxy.hooks.model_max_budget_limiter import (
     _PROXY_VirtualKeyModelMaxBudgetLimiter,
@@ -589,6 +595,12 @@ async def proxy_shutdown_event():
             # [DO NOT BLOCK shutdown events for this]
             pass
 
+    latency_profiler.disable()
+
+    if user_api_key_cache.cache_invalidator is not None:
+        await user_api_key_cache.cache_invalidator.stop()
+        user_api_key_cache.cache_invalidator = None
+
     ## RESET CUSTOM VARIABLES ##
     cleanup_router_config_variables()
 
@@ -691,10 +703,12 @@ async def proxy_startup_event(app: FastAPI):
             user_api_key_cache=user_api_key_cache,
         )
 
-    ProxyStartupEvent._initialize_startup_logging(
+    await ProxyStartupEvent._initialize_startup_logging(
         llm_router=llm_router,
         proxy_logging_obj=proxy_logging_obj,
         redis_usage_cache=redis_usage_cache,
+        general_settings=general_settings,
+        user_api_key_cache=user_api_key_cache,
     )
 
     ## JWT AUTH ##
@@ -732,6 +746,9 @@ async def proxy_startup_event(app: FastAPI):
             _run_background_health_check()
         )  # start the background health check coroutine.
 
+    ## [Optional] Start latency profiling (per-stage histograms + event loop lag)
+    ProxyStartupEvent._initialize_latency_profiling(general_settings=general_settings)
+
     ## [Optional] Initialize dd tracer
     ProxyStartupEvent._init_dd_tracer()
 
@@ -1062,7 +1079,9 @@ use_shared_health_check = None
 use_queue = False
 health_check_interval = None
 health_check_details = None
+health_check_cooldown = None
 health_check_results: Dict[str, Union[int, List[Dict[str, Any]]]] = {}
+background_health_check_results = BackgroundHealthCheckResults()
 queue: List = []
 litellm_proxy_budget_name = "litellm-proxy-budget"
 litellm_proxy_admin_name = LITELLM_PROXY_ADMIN_NAME
@@ -1504,6 +1523,38 @@ def run_ollama_serve():
         )
 
 
+async def _on_background_health_check_result(
+    deployment: dict, is_healthy: bool, endpoint_data: dict
+):
+    """
+    Awaited as each background health check completes.
+
+    - updates health_check_results, so /health shows results as they stream in. The results are updated in place -
+      not rebuilt per check
+    - if `health_check_cooldown` is enabled, puts unhealthy deployments in cooldown on the router
+    """
+    model_id = (deployment.get("model_info") or {}).get("id")
+    if model_id is None:
+        return
+
+    background_health_check_results.update(
+        model_id=model_id, is_healthy=is_healthy, endpoint_data=endpoint_data
+    )
+    health_check_results.update(
+        background_health_check_results.get_health_check_results()
+    )
+
+    if not is_healthy and health_check_cooldown is True and llm_router is not None:
+        await llm_router.cooldown_cache.async_add_deployment_to_cooldown(
+            model_id=model_id,
+            original_exception=Exception(
+                endpoint_data.get("error", "Background health check failed")
+            ),
+            exception_status=503,
+            cooldown_time=None,
+        )
+
+
 async def _run_background_health_check():
     """
     Periodically run health checks in the background on the endpoints.
@@ -1569,7 +1620,17 @@ async def _run_background_health_check():
                 )
         else:
             healthy_endpoints, unhealthy_endpoints = await perform_health_check(
-                model_list=_llm_model_list, details=health_check_details
+                model_list=_llm_model_list,
+                details=health_check_details,
+                stagger_seconds=health_check_interval
+                * BACKGROUND_HEALTH_CHECK_STAGGER_RATIO,
+                on_result=_on_background_health_check_result,
+            )
+            background_health_check_results.prune(
+                {
+                    (m.get("model_info") or {}).get("id")
+                    for m in _llm_model_list
+                }
             )
 
         # Update the global variable with the health check results
@@ -1592,6 +1653,14 @@ class ProxyConfig:
 
     def __init__(self) -> None:
         self.config: Dict[str, Any] = {}
+        self._db_model_snapshots: Dict[Optional[str], tuple] = {}
+        """
+        Router model id -> DB row last added to the router. Rows that haven't changed aren't decrypted / upserted again
+        """
+        self._applied_db_config_values: Dict[str, Any] = {}
+        """
+        Callback / router / general settings last applied from the config - unchanged ones aren't re-applied
+        """
 
     def is_yaml(self, config_file_path: str) -> bool:
         if not os.path.isfile(config_file_path):
@@ -2004,7 +2073,7 @@ class ProxyConfig:
         """
         Load config values into proxy global state
         """
-        global master_key, user_config_file_path, otel_logging, user_custom_auth, user_custom_auth_path, user_custom_key_generate, user_custom_sso, user_custom_ui_sso_sign_in_handler, use_background_health_checks, use_shared_health_check, health_check_interval, use_queue, proxy_budget_rescheduler_max_time, proxy_budget_rescheduler_min_time, ui_access_mode, litellm_master_key_hash, proxy_batch_write_at, disable_spend_logs, prompt_injection_detection_obj, redis_usage_cache, store_model_in_db, premium_user, open_telemetry_logger, health_check_details, callback_settings, proxy_batch_polling_interval, config_passthrough_endpoints
+        global master_key, user_config_file_path, otel_logging, user_custom_auth, user_custom_auth_path, user_custom_key_generate, user_custom_sso, user_custom_ui_sso_sign_in_handler, use_background_health_checks, use_shared_health_check, health_check_interval, use_queue, proxy_budget_rescheduler_max_time, proxy_budget_rescheduler_min_time, ui_access_mode, litellm_master_key_hash, proxy_batch_write_at, disable_spend_logs, prompt_injection_detection_obj, redis_usage_cache, store_model_in_db, premium_user, open_telemetry_logger, health_check_details, health_check_cooldown, callback_settings, proxy_batch_polling_interval, config_passthrough_endpoints
 
         config: dict = await self.get_config(config_file_path=config_file_path)
 
@@ -2408,6 +2477,8 @@ class ProxyConfig:
                 "health_check_interval", DEFAULT_HEALTH_CHECK_INTERVAL
             )
             health_check_details = general_settings.get("health_check_details", True)
+            # Put deployments that fail background health checks in cooldown
+            health_check_cooldown = general_settings.get("health_check_cooldown", False)
 
             ### RBAC ###
             rbac_role_permissions = general_settings.get("role_permissions", None)
@@ -2688,7 +2759,18 @@ class ProxyConfig:
             _model_info = RouterModelInfo(id=model.model_id, db_model=db_model)
         return _model_info
 
-    async def _delete_deployment(self, db_models: list) -> int:
+    @staticmethod
+    def _get_db_model_id(model) -> Optional[str]:
+        """
+        Router model id of a DB model - same as `get_model_info_with_id(model).id`, without building the model info
+        """
+        if isinstance(model.model_info, dict) and model.model_info.get("id") is not None:
+            return str(model.model_info["id"])
+        return model.model_id
+
+    async def _delete_deployment(
+        self, db_models: list, config: Optional[dict] = None
+    ) -> int:
         """
         (Helper function of add deployment) -> combined to reduce prisma db calls
 
@@ -2696,11 +2778,14 @@ class ProxyConfig:
         - Compare all up list to router model id's
         - Remove any that are missing
 
+        Args:
+        - config: dict - the proxy config, if already loaded. Read with `get_config` if not given.
+
         Return:
         - int - returns number of deleted deployments
         """
         global user_config_file_path, llm_router
-        combined_id_list = []
+        combined_ids: Set[str] = set()
 
         ## BASE CASES ##
         # if llm_router is None or db_models is empty, return 0
@@ -2709,12 +2794,13 @@ class ProxyConfig:
 
         ## DB MODELS ##
         for m in db_models:
-            model_info = self.get_model_info_with_id(model=m)
-            if model_info.id is not None:
-                combined_id_list.append(model_info.id)
+            model_id = self._get_db_model_id(model=m)
+            if model_id is not None:
+                combined_ids.add(model_id)
 
         ## CONFIG MODELS ##
-        config = await self.get_config(config_file_path=user_config_file_path)
+        if config is None:
+            config = await self.get_config(config_file_path=user_config_file_path)
         model_list = config.get("model_list", None)
         if model_list:
             for model in model_list:
@@ -2733,14 +2819,14 @@ class ProxyConfig:
                     )
                 else:
                     model_id = str(model_id)
-                combined_id_list.append(model_id)  # ADD CONFIG MODEL TO COMBINED LIST
+                combined_ids.add(model_id)  # ADD CONFIG MODEL TO COMBINED LIST
 
         router_model_ids = llm_router.get_model_ids()
-        # Check for model IDs in llm_router not present in combined_id_list and delete them
+        # Check for model IDs in llm_router not present in combined_ids and delete them
 
         deleted_deployments = 0
         for model_id in router_model_ids:
-            if model_id not in combined_id_list:
+            if model_id not in combined_ids:
                 is_deleted = llm_router.delete_deployment(id=model_id)
                 if is_deleted is not None:
                     deleted_deployments += 1
@@ -2833,17 +2919,84 @@ class ProxyConfig:
 
         return _model_list
 
+    @staticmethod
+    def _get_db_model_snapshot(model) -> tuple:
+        litellm_params = model.litellm_params
+        if isinstance(litellm_params, BaseModel):
+            litellm_params = litellm_params.model_dump()
+        elif isinstance(litellm_params, dict):
+            litellm_params = dict(litellm_params)  # decrypted in place when added
+        model_info = model.model_info
+        if isinstance(model_info, dict):
+            model_info = dict(model_info)
+        return (
+            model.model_name,
+            litellm_params,
+            model_info,
+            getattr(model, "updated_at", None),
+        )
+
+    def _get_changed_db_models(
+        self, db_models: list
+    ) -> Tuple[list, Dict[Optional[str], tuple]]:
+        """
+        Returns
+        - DB models that changed since they were last added to the router, or are missing from it
+        - snapshots of all `db_models` - set as `_db_model_snapshots` once the changed models are added
+        """
+        changed_models = []
+        snapshots: Dict[Optional[str], tuple] = {}
+        for m in db_models:
+            model_id = self._get_db_model_id(model=m)
+            snapshot = self._get_db_model_snapshot(model=m)
+            snapshots[model_id] = snapshot
+            if (
+                llm_router is None
+                or model_id is None
+                or self._db_model_snapshots.get(model_id) != snapshot
+                or not llm_router.has_model_id(model_id)
+            ):
+                changed_models.append(m)
+        return changed_models, snapshots
+
+    def _is_db_config_value_applied(
+        self, name: str, value: Any, targets: tuple = ()
+    ) -> bool:
+        """
+        True if `value` was the last value applied for `name`, to the same `targets` objects
+        """
+        applied = self._applied_db_config_values.get(name)
+        return (
+            applied is not None
+            and applied[1] == value
+            and len(applied[0]) == len(targets)
+            and all(a is b for a, b in zip(applied[0], targets))
+        )
+
+    def _set_db_config_value_applied(
+        self, name: str, value: Any, targets: tuple = ()
+    ) -> None:
+        self._applied_db_config_values[name] = (targets, copy.deepcopy(value))
+
     async def _update_llm_router(
         self,
         new_models: list,
         proxy_logging_obj: ProxyLogging,
     ):
+        """
+        Sync the router with the DB models + the callback / router / general settings from the config.
+
+        Runs on every DB poll - only DB models that changed since the last poll are decrypted and upserted, and
+        unchanged settings aren't re-applied.
+        """
         global llm_router, llm_model_list, master_key, general_settings
 
+        config_data: Optional[dict] = None
         try:
             if llm_router is None and master_key is not None:
                 verbose_proxy_logger.debug(f"len new_models: {len(new_models)}")
 
+                _, snapshots = self._get_changed_db_models(db_models=new_models)
                 _model_list: list = self.decrypt_model_list_from_db(
                     new_models=new_models
                 )
@@ -2856,14 +3009,25 @@ class ProxyConfig:
                         ),
                         ignore_invalid_deployments=True,
                     )
+                    self._db_model_snapshots = snapshots
                     verbose_proxy_logger.debug(f"updated llm_router: {llm_router}")
             else:
                 verbose_proxy_logger.debug(f"len new_models: {len(new_models)}")
+                config_data = await self.get_config(
+                    config_file_path=user_config_file_path
+                )
                 ## DELETE MODEL LOGIC
-                await self._delete_deployment(db_models=new_models)
+                await self._delete_deployment(db_models=new_models, config=config_data)
 
                 ## ADD MODEL LOGIC
-                self._add_deployment(db_models=new_models)
+                changed_models, snapshots = self._get_changed_db_models(
+                    db_models=new_models
+                )
+                verbose_proxy_logger.debug(
+                    f"len changed db models: {len(changed_models)}"
+                )
+                self._add_deployment(db_models=changed_models)
+                self._db_model_snapshots = snapshots
 
         except Exception as e:
             verbose_proxy_logger.exception(
@@ -2873,9 +3037,18 @@ class ProxyConfig:
         if llm_router is not None:
             llm_model_list = llm_router.get_model_list()
 
+        if config_data is None:
+            config_data = await self.get_config()
+
         # check if user set any callbacks in Config Table
-        config_data = await proxy_config.get_config()
-        self._add_callbacks_from_db_config(config_data)
+        litellm_settings = config_data.get("litellm_settings")
+        if not self._is_db_config_value_applied(
+            name="litellm_settings", value=litellm_settings
+        ):
+            self._add_callbacks_from_db_config(config_data)
+            self._set_db_config_value_applied(
+                name="litellm_settings", value=litellm_settings
+            )
 
         # router settings
         await self._add_router_settings_from_db_config(
@@ -2883,11 +3056,22 @@ class ProxyConfig:
         )
 
         # general settings
-        self._add_general_settings_from_db_config(
-            config_data=config_data,
-            general_settings=general_settings,
-            proxy_logging_obj=proxy_logging_obj,
-        )
+        _general_settings = config_data.get("general_settings")
+        if not self._is_db_config_value_applied(
+            name="general_settings",
+            value=_general_settings,
+            targets=(general_settings, proxy_logging_obj),
+        ):
+            self._add_general_settings_from_db_config(
+                config_data=config_data,
+                general_settings=general_settings,
+                proxy_logging_obj=proxy_logging_obj,
+            )
+            self._set_db_config_value_applied(
+                name="general_settings",
+                value=_general_settings,
+                targets=(general_settings, proxy_logging_obj),
+            )
 
     def _add_callback_from_db_to_in_memory_litellm_callbacks(
         self,
@@ -3038,8 +3222,17 @@ class ProxyConfig:
             ):
                 combined_router_settings = db_router_settings.param_value
 
-            if combined_router_settings:
+            if combined_router_settings and not self._is_db_config_value_applied(
+                name="router_settings",
+                value=combined_router_settings,
+                targets=(llm_router,),
+            ):
                 llm_router.update_settings(**combined_router_settings)
+                self._set_db_config_value_applied(
+                    name="router_settings",
+                    value=combined_router_settings,
+                    targets=(llm_router,),
+                )
 
     def _add_general_settings_from_db_config(
         self, config_data: dict, general_settings: dict, proxy_logging_obj: ProxyLogging
@@ -4025,13 +4218,15 @@ def giveup(e):
 
 class ProxyStartupEvent:
     @classmethod
-    def _initialize_startup_logging(
+    async def _initialize_startup_logging(
         cls,
         llm_router: Optional[Router],
         proxy_logging_obj: ProxyLogging,
         redis_usage_cache: Optional[RedisCache],
+        general_settings: dict,
+        user_api_key_cache: DualCache,
     ):
-        """Initialize logging and alerting on startup"""
+        """Initialize logging, alerting and the redis-backed cache syncing on startup"""
         ## COST TRACKING ##
         cost_tracking()
 
@@ -4039,6 +4234,13 @@ class ProxyStartupEvent:
             llm_router=llm_router, redis_usage_cache=redis_usage_cache
         )
 
+        ## [Optional] Push user api key cache invalidations to other instances
+        await cls._initialize_user_api_key_cache_invalidation(
+            general_settings=general_settings,
+            redis_usage_cache=redis_usage_cache,
+            user_api_key_cache=user_api_key_cache,
+        )
+
     @classmethod
     def _initialize_jwt_auth(
         cls,
@@ -4060,6 +4262,42 @@ class ProxyStartupEvent:
             litellm_jwtauth=litellm_jwtauth,
         )
 
+    @classmethod
+    async def _initialize_user_api_key_cache_invalidation(
+        cls,
+        general_settings: dict,
+        redis_usage_cache: Optional[RedisCache],
+        user_api_key_cache: DualCache,
+    ):
+        """
+        Evict updated keys / teams / users from the in-memory `user_api_key_cache` of every instance (redis pub/sub).
+        Enable with `general_settings::enable_user_api_key_cache_invalidation`
+        """
+        if general_settings.get("enable_user_api_key_cache_invalidation") is not True:
+            return
+        if redis_usage_cache is None:
+            verbose_proxy_logger.warning(
+                "enable_user_api_key_cache_invalidation requires a redis cache (`litellm_settings::cache_params`). Skipping."
+            )
+            return
+        from litellm.caching.cache_invalidation import CacheInvalidator
+        from litellm.caching.pubsub import RedisPubSubChannel
+
+        user_api_key_cache.cache_invalidator = CacheInvalidator(
+            cache=user_api_key_cache,
+            channel=RedisPubSubChannel(
+                redis_cache=redis_usage_cache,
+                channel=USER_API_KEY_CACHE_INVALIDATION_CHANNEL,
+            ),
+        )
+        await user_api_key_cache.cache_invalidator.start()
+
+    @classmethod
+    def _initialize_latency_profiling(cls, general_settings: dict):
+        """Start latency profiling - if `general_settings::enable_latency_profiling` is set"""
+        if general_settings.get("enable_latency_profiling", False) is True:
+            latency_profiler.enable()
+
     @classmethod
     def _add_proxy_budget_to_db(cls, litellm_proxy_budget_name: str):
         """Adds a global proxy budget to db"""
@@ -6490,6 +6728,9 @@ async def token_counter(request: TokenCountRequest, call_endpoint: bool = False)
         TokenCountResponse
     """
     from litellm import token_counter
+    from litellm.litellm_core_utils.token_counter import (
+        async_prefetch_image_dimensions,
+    )
 
     global llm_router
 
@@ -6575,6 +6816,8 @@ async def token_counter(request: TokenCountRequest, call_endpoint: bool = False)
     )
 
     tokenizer_used = str(_tokenizer_used["type"])
+    # fetch image dimensions off the event loop, token_counter reads them from the cache
+    await async_prefetch_image_dimensions(messages)
     total_tokens = token_counter(
         model=model_to_use,
         text=prompt,
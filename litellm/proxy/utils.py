@@ -17,13 +17,18 @@ from typing import (
     List,
     Literal,
     Optional,
+    Tuple,
     Union,
     cast,
     overload,
 )
 
 from litellm import _custom_logger_compatible_callbacks_literal
-from litellm.constants import DEFAULT_MODEL_CREATED_AT_TIME, MAX_TEAM_LIST_LIMIT
+from litellm.constants import (
+    DEFAULT_MODEL_CREATED_AT_TIME,
+    MAX_TEAM_LIST_LIMIT,
+    SPEND_LOG_MAX_PARALLEL_WRITES,
+)
 from litellm.proxy._types import (
     DB_CONNECTION_ERROR_TYPES,
     CommonProxyErrors,
@@ -62,6 +67,7 @@ from litellm.integrations.custom_guardrail import CustomGuardrail
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.integrations.SlackAlerting.slack_alerting import SlackAlerting
 from litellm.integrations.SlackAlerting.utils import _add_langfuse_trace_id_to_alert
+from litellm.litellm_core_utils.latency_profiler import latency_profiler
 from litellm.litellm_core_utils.litellm_logging import Logging
 from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
 from litellm.litellm_core_utils.safe_json_loads import safe_json_loads
@@ -79,6 +85,10 @@ from litellm.proxy.db.create_views import (
     should_create_missing_views,
 )
 from litellm.proxy.db.db_spend_update_writer import DBSpendUpdateWriter
+from litellm.proxy.db.db_transaction_queue.spend_log_queue import (
+    SpendLogBatch,
+    SpendLogQueue,
+)
 from litellm.proxy.db.log_db_metrics import log_db_metrics
 from litellm.proxy.db.prisma_client import PrismaWrapper
 from litellm.proxy.guardrails.guardrail_hooks.unified_guardrail.unified_guardrail import (
@@ -900,6 +910,7 @@ class ProxyLogging:
     ) -> dict:
         pass
 
+    @latency_profiler.profile_stage("pre_call_hooks")
     async def pre_call_hook(
         self,
         user_api_key_dict: UserAPIKeyAuth,
@@ -1657,15 +1668,96 @@ def jsonify_object(data: dict) -> dict:
     return db_data
 
 
-class PrismaClient:
-    spend_log_transactions: List = []
+COMBINED_VIEW_COLUMNS = """
+    v.*,
+    t.spend AS team_spend,
+    t.max_budget AS team_max_budget,
+    t.tpm_limit AS team_tpm_limit,
+    t.rpm_limit AS team_rpm_limit,
+    t.models AS team_models,
+    t.metadata AS team_metadata,
+    t.blocked AS team_blocked,
+    t.team_alias AS team_alias,
+    t.metadata AS team_metadata,
+    t.members_with_roles AS team_members_with_roles,
+    t.organization_id as org_id,
+    tm.spend AS team_member_spend,
+    m.aliases AS team_model_aliases,
+    -- Added comma to separate b.* columns
+    b.max_budget AS litellm_budget_table_max_budget,
+    b.tpm_limit AS litellm_budget_table_tpm_limit,
+    b.rpm_limit AS litellm_budget_table_rpm_limit,
+    b.model_max_budget as litellm_budget_table_model_max_budget,
+    b.soft_budget as litellm_budget_table_soft_budget,
+    o.metadata as organization_metadata,
+    b2.max_budget as organization_max_budget,
+    b2.tpm_limit as organization_tpm_limit,
+    b2.rpm_limit as organization_rpm_limit
+"""
+COMBINED_VIEW_JOINS = """
+    FROM "LiteLLM_VerificationToken" AS v
+    LEFT JOIN "LiteLLM_TeamTable" AS t ON v.team_id = t.team_id
+    LEFT JOIN "LiteLLM_TeamMembership" AS tm ON v.team_id = tm.team_id AND tm.user_id = v.user_id
+    LEFT JOIN "LiteLLM_ModelTable" m ON t.model_id = m.id
+    LEFT JOIN "LiteLLM_BudgetTable" AS b ON v.budget_id = b.budget_id
+    LEFT JOIN "LiteLLM_OrganizationTable" AS o ON v.organization_id = o.organization_id
+    LEFT JOIN "LiteLLM_BudgetTable" AS b2 ON o.budget_id = b2.budget_id
+"""
+
+
+def combined_view_row_to_token_view(response: dict) -> LiteLLM_VerificationTokenView:
+    """
+    Convert a row selected with `COMBINED_VIEW_COLUMNS` (key + team + team member + budget + org) into a
+    `LiteLLM_VerificationTokenView`
+    """
+    if response["team_models"] is None:
+        response["team_models"] = []
+    if response["team_blocked"] is None:
+        response["team_blocked"] = False
+
+    team_member: Optional[Member] = None
+    if (
+        response["team_members_with_roles"] is not None
+        and response["user_id"] is not None
+    ):
+        ## find the team member corresponding to user id
+        """
+        [
+            {
+                "role": "admin",
+                "user_id": "default_user_id",
+                "user_email": null
+            },
+            {
+                "role": "user",
+                "user_id": null,
+                "user_email": "test@email.com"
+            }
+        ]
+        """
+        for tm in response["team_members_with_roles"]:
+            if tm.get("user_id") is not None and response["user_id"] == tm.get(
+                "user_id"
+            ):
+                team_member = Member(**tm)
+    response["team_member"] = team_member
+    token_view = LiteLLM_VerificationTokenView(
+        **response, last_refreshed_at=time.time()
+    )
+    # for prisma we need to cast the expires time to str
+    if token_view.expires is not None and isinstance(token_view.expires, datetime):
+        token_view.expires = token_view.expires.isoformat()
+    return token_view
+
 
+class PrismaClient:
     def __init__(
         self,
         database_url: str,
         proxy_logging_obj: ProxyLogging,
         http_client: Optional[Any] = None,
     ):
+        self.spend_log_transactions = SpendLogQueue()
         ## init logging object
         self.proxy_logging_obj = proxy_logging_obj
         self.iam_token_db_auth: Optional[bool] = str_to_bool(
@@ -2208,83 +2300,15 @@ class PrismaClient:
                         )
 
                     sql_query = f"""
-                        SELECT 
-                            v.*,
-                            t.spend AS team_spend, 
-                            t.max_budget AS team_max_budget, 
-                            t.tpm_limit AS team_tpm_limit,
-                            t.rpm_limit AS team_rpm_limit,
-                            t.models AS team_models,
-                            t.metadata AS team_metadata,
-                            t.blocked AS team_blocked,
-                            t.team_alias AS team_alias,
-                            t.metadata AS team_metadata,
-                            t.members_with_roles AS team_members_with_roles,
-                            t.organization_id as org_id,
-                            tm.spend AS team_member_spend,
-                            m.aliases AS team_model_aliases,
-                            -- Added comma to separate b.* columns
-                            b.max_budget AS litellm_budget_table_max_budget,
-                            b.tpm_limit AS litellm_budget_table_tpm_limit,
-                            b.rpm_limit AS litellm_budget_table_rpm_limit,
-                            b.model_max_budget as litellm_budget_table_model_max_budget,
-                            b.soft_budget as litellm_budget_table_soft_budget,
-                            o.metadata as organization_metadata,
-                            b2.max_budget as organization_max_budget,
-                            b2.tpm_limit as organization_tpm_limit,
-                            b2.rpm_limit as organization_rpm_limit
-                        FROM "LiteLLM_VerificationToken" AS v
-                        LEFT JOIN "LiteLLM_TeamTable" AS t ON v.team_id = t.team_id
-                        LEFT JOIN "LiteLLM_TeamMembership" AS tm ON v.team_id = tm.team_id AND tm.user_id = v.user_id
-                        LEFT JOIN "LiteLLM_ModelTable" m ON t.model_id = m.id
-                        LEFT JOIN "LiteLLM_BudgetTable" AS b ON v.budget_id = b.budget_id
-                        LEFT JOIN "LiteLLM_OrganizationTable" AS o ON v.organization_id = o.organization_id
-                        LEFT JOIN "LiteLLM_BudgetTable" AS b2 ON o.budget_id = b2.budget_id
+                        SELECT {COMBINED_VIEW_COLUMNS}
+                        {COMBINED_VIEW_JOINS}
                         WHERE v.token = '{token}'
                     """
 
                     response = await self.db.query_first(query=sql_query)
 
                     if response is not None:
-                        if response["team_models"] is None:
-                            response["team_models"] = []
-                        if response["team_blocked"] is None:
-                            response["team_blocked"] = False
-
-                        team_member: Optional[Member] = None
-                        if (
-                            response["team_members_with_roles"] is not None
-                            and response["user_id"] is not None
-                        ):
-                            ## find the team member corresponding to user id
-                            """
-                            [
-                                {
-                                    "role": "admin",
-                                    "user_id": "default_user_id",
-                                    "user_email": null
-                                },
-                                {
-                                    "role": "user",
-                                    "user_id": null,
-                                    "user_email": "test@email.com"
-                                }
-                            ]
-                            """
-                            for tm in response["team_members_with_roles"]:
-                                if tm.get("user_id") is not None and response[
-                                    "user_id"
-                                ] == tm.get("user_id"):
-                                    team_member = Member(**tm)
-                        response["team_member"] = team_member
-                        response = LiteLLM_VerificationTokenView(
-                            **response, last_refreshed_at=time.time()
-                        )
-                        # for prisma we need to cast the expires time to str
-                        if response.expires is not None and isinstance(
-                            response.expires, datetime
-                        ):
-                            response.expires = response.expires.isoformat()
+                        response = combined_view_row_to_token_view(response)
                     return response
         except Exception as e:
             import traceback
@@ -3285,71 +3309,123 @@ class ProxyUpdateSpend:
         db_writer_client: Optional[HTTPHandler],
         proxy_logging_obj: ProxyLogging,
     ):
-        BATCH_SIZE = 100  # Preferred size of each batch to write to the database
-        MAX_LOGS_PER_INTERVAL = (
-            1000  # Maximum number of logs to flush in a single interval
-        )
-        # Get initial logs to process
-        logs_to_process = prisma_client.spend_log_transactions[:MAX_LOGS_PER_INTERVAL]
+        """
+        Write the queued spend logs to the db, in batches of `batch_size` with up to SPEND_LOG_MAX_PARALLEL_WRITES
+        batches in flight.
+
+        Flushes the logs queued when the flush starts - logs added during the flush wait for the next one.
+        - connection errors: the batch is retried `n_retry_times`, then put back in the queue
+        - other errors: the batch is dropped
+
+        Batches that go back in the queue are requeued together once all writers are done, in the order they were
+        popped - so the queue stays FIFO.
+        """
+        spend_log_queue = prisma_client.spend_log_transactions
+        if not isinstance(spend_log_queue, SpendLogQueue):  # e.g. a list
+            spend_log_queue = SpendLogQueue(logs=spend_log_queue)
+            prisma_client.spend_log_transactions = spend_log_queue
+        logs_to_flush = len(spend_log_queue)
         start_time = time.time()
-        try:
-            for i in range(n_retry_times + 1):
+        errors: List[Exception] = []
+        failed_batches: List[Tuple[int, SpendLogBatch]] = []
+        batch_count = 0
+        stop_flush = False
+
+        async def _writer():
+            nonlocal logs_to_flush, stop_flush, batch_count
+            while logs_to_flush > 0 and not stop_flush:
+                batch = await spend_log_queue.async_pop_batch(
+                    min(spend_log_queue.batch_size, logs_to_flush)
+                )
+                if not batch.logs:
+                    return
+                batch_index = batch_count
+                batch_count += 1
+                logs_to_flush -= len(batch.logs)
                 try:
-                    base_url = os.getenv("SPEND_LOGS_URL", None)
-                    if (
-                        len(logs_to_process) > 0
-                        and base_url is not None
-                        and db_writer_client is not None
-                    ):
-                        if not base_url.endswith("/"):
-                            base_url += "/"
-                        verbose_proxy_logger.debug("base_url: {}".format(base_url))
-                        response = await db_writer_client.post(
-                            url=base_url + "spend/update",
-                            data=json.dumps(logs_to_process),
-                            headers={"Content-Type": "application/json"},
-                        )
-                        if response.status_code == 200:
-                            prisma_client.spend_log_transactions = (
-                                prisma_client.spend_log_transactions[
-                                    len(logs_to_process) :
-                                ]
-                            )
-                    else:
-                        for j in range(0, len(logs_to_process), BATCH_SIZE):
-                            batch = logs_to_process[j : j + BATCH_SIZE]
-                            batch_with_dates = [
-                                prisma_client.jsonify_object({**entry})
-                                for entry in batch
-                            ]
-                            await prisma_client.db.litellm_spendlogs.create_many(
-                                data=batch_with_dates, skip_duplicates=True
-                            )
-                            verbose_proxy_logger.debug(
-                                f"Flushed {len(batch)} logs to the DB."
-                            )
-
-                        prisma_client.spend_log_transactions = (
-                            prisma_client.spend_log_transactions[len(logs_to_process) :]
-                        )
-                        verbose_proxy_logger.debug(
-                            f"{len(logs_to_process)} logs processed. Remaining in queue: {len(prisma_client.spend_log_transactions)}"
-                        )
-                    break
-                except DB_CONNECTION_ERROR_TYPES:
-                    if i is None:
-                        i = 0
-                    if i >= n_retry_times:
-                        raise
-                    await asyncio.sleep(2**i)
-        except Exception as e:
-            prisma_client.spend_log_transactions = prisma_client.spend_log_transactions[
-                len(logs_to_process) :
-            ]
+                    written = await ProxyUpdateSpend._write_spend_log_batch(
+                        batch=batch,
+                        n_retry_times=n_retry_times,
+                        spend_log_queue=spend_log_queue,
+                        prisma_client=prisma_client,
+                        db_writer_client=db_writer_client,
+                    )
+                except DB_CONNECTION_ERROR_TYPES as e:
+                    # db unreachable - keep the logs for the next flush
+                    errors.append(e)
+                    written = False
+                except Exception as e:
+                    errors.append(e)
+                    stop_flush = True
+                    return
+                if not written:
+                    failed_batches.append((batch_index, batch))
+                    stop_flush = True
+
+        await asyncio.gather(
+            *(_writer() for _ in range(SPEND_LOG_MAX_PARALLEL_WRITES))
+        )
+        spend_log_queue.requeue(
+            [batch for _, batch in sorted(failed_batches, key=lambda item: item[0])]
+        )
+        verbose_proxy_logger.debug(
+            "Spend logs flushed in %.2fs. Remaining in queue: %s, batch size: %s",
+            time.time() - start_time,
+            len(spend_log_queue),
+            spend_log_queue.batch_size,
+        )
+        await spend_log_queue.emit_queue_metrics()
+        if errors:
             _raise_failed_update_spend_exception(
-                e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
+                e=errors[0], start_time=start_time, proxy_logging_obj=proxy_logging_obj
             )
 
+    @staticmethod
+    async def _write_spend_log_batch(
+        batch: SpendLogBatch,
+        n_retry_times: int,
+        spend_log_queue: SpendLogQueue,
+        prisma_client: PrismaClient,
+        db_writer_client: Optional[HTTPHandler],
+    ) -> bool:
+        """
+        Returns False if the spend logs server didn't accept the batch. Raises if it couldn't be written - the caller
+        puts the batch back in the queue on connection errors.
+        """
+        for i in range(n_retry_times + 1):
+            batch_start_time = time.time()
+            try:
+                base_url = os.getenv("SPEND_LOGS_URL", None)
+                if base_url is not None and db_writer_client is not None:
+                    if not base_url.endswith("/"):
+                        base_url += "/"
+                    verbose_proxy_logger.debug("base_url: {}".format(base_url))
+                    response = await db_writer_client.post(
+                        url=base_url + "spend/update",
+                        data=json.dumps(batch.logs),
+                        headers={"Content-Type": "application/json"},
+                    )
+                    if response.status_code != 200:
+                        return False
+                else:
+                    batch_with_dates = [
+                        prisma_client.jsonify_object({**entry}) for entry in batch.logs
+                    ]
+                    await prisma_client.db.litellm_spendlogs.create_many(
+                        data=batch_with_dates, skip_duplicates=True
+                    )
+                verbose_proxy_logger.debug(f"Flushed {len(batch.logs)} logs to the DB.")
+                spend_log_queue.record_batch_written(
+                    latency=time.time() - batch_start_time
+                )
+                return True
+            except DB_CONNECTION_ERROR_TYPES:
+                spend_log_queue.record_batch_failed()
+                if i >= n_retry_times:
+                    raise
+                await asyncio.sleep(2**i)
+        return False
+
     @staticmethod
     def disable_spend_updates() -> bool:
         """
@@ -61,8 +61,13 @@ from litellm.litellm_core_utils.core_helpers import (
 from litellm.litellm_core_utils.coroutine_checker import coroutine_checker
 from litellm.litellm_core_utils.credential_accessor import CredentialAccessor
 from litellm.litellm_core_utils.dd_tracing import tracer
+from litellm.litellm_core_utils.latency_profiler import latency_profiler
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLogging
 from litellm.litellm_core_utils.sensitive_data_masker import SensitiveDataMasker
+from litellm.litellm_core_utils.token_counter import (
+    async_prefetch_image_dimensions,
+    get_request_token_count,
+)
 from litellm.router_strategy.budget_limiter import RouterBudgetLimiting
 from litellm.router_strategy.least_busy import LeastBusyLoggingHandler
 from litellm.router_strategy.lowest_cost import LowestCostLoggingHandler
@@ -295,7 +300,7 @@ class Router:
             cache_kwargs (dict): Additional kwargs to pass to RedisCache. Defaults to {}.
             caching_groups (Optional[List[tuple]]): List of model groups for caching across model groups. Defaults to None.
             client_ttl (int): Time-to-live for cached clients in seconds. Defaults to 3600.
-            polling_interval: (Optional[float]): frequency of polling queue. Only for '.scheduler_acompletion()'. Default is 3ms.
+            polling_interval: (Optional[float]): with no healthy deployments, '.schedule_acompletion()' releases 1 queued request per interval. Default is 0.03s.
             default_priority: (Optional[int]): the default priority for a request. Only for '.scheduler_acompletion()'. Default is None.
             num_retries (Optional[int]): Number of retries for failed requests. Defaults to 2.
             timeout (Optional[float]): Timeout for requests. Defaults to None.
@@ -453,7 +458,9 @@ class Router:
             self.allowed_fails = litellm.allowed_fails
         self.cooldown_time = cooldown_time or DEFAULT_COOLDOWN_TIME_SECONDS
         self.cooldown_cache = CooldownCache(
-            cache=self.cache, default_cooldown_time=self.cooldown_time
+            cache=self.cache,
+            default_cooldown_time=self.cooldown_time,
+            push_updates=self.router_general_settings.push_cooldown_updates,
         )
         self.disable_cooldowns = disable_cooldowns
         self.failed_calls = (
@@ -1178,10 +1185,10 @@ class Router:
                 async for item in model_response:
                     yield item
             except MidStreamFallbackError as e:
-                from litellm.main import stream_chunk_builder
-
-                complete_response_object = stream_chunk_builder(
-                    chunks=model_response.chunks
+                complete_response_object = (
+                    model_response.build_complete_streaming_response()
+                    if isinstance(model_response, CustomStreamWrapper)
+                    else None
                 )
                 complete_response_object_usage = cast(
                     Optional[Usage],
@@ -1340,7 +1347,9 @@ class Router:
                 **kwargs,
             }
 
-            _response = litellm.acompletion(**input_kwargs)
+            _response = latency_profiler.time_awaitable(
+                "provider_call", litellm.acompletion(**input_kwargs)
+            )
 
             logging_obj: Optional[LiteLLMLogging] = kwargs.get(
                 "litellm_logging_obj", None
@@ -1875,33 +1884,25 @@ class Router:
         item = FlowItem(
             priority=priority,  # 👈 SET PRIORITY FOR REQUEST
             request_id=_request_id,  # 👈 SET REQUEST ID
-            model_name="gpt-3.5-turbo",  # 👈 SAME as 'Router'
+            model_name=model,  # 👈 SAME as 'Router'
         )
         ### [fin] ###
 
         ## ADDS REQUEST TO QUEUE ##
         await self.scheduler.add_request(request=item)
 
-        ## POLL QUEUE
-        end_time = time.monotonic() + self.timeout
-        curr_time = time.monotonic()
-        poll_interval = self.scheduler.polling_interval  # poll every 3ms
-        make_request = False
-
-        while curr_time < end_time:
+        async def _get_healthy_deployments() -> list:
             _healthy_deployments, _ = await self._async_get_healthy_deployments(
                 model=model, parent_otel_span=parent_otel_span
             )
-            make_request = await self.scheduler.poll(  ## POLL QUEUE ## - returns 'True' if there's healthy deployments OR if request is at top of queue
-                id=item.request_id,
-                model_name=item.model_name,
-                health_deployments=_healthy_deployments,
-            )
-            if make_request:  ## IF TRUE -> MAKE REQUEST
-                break
-            else:  ## ELSE -> loop till default_timeout
-                await asyncio.sleep(poll_interval)
-                curr_time = time.monotonic()
+            return _healthy_deployments
+
+        ## WAIT FOR TURN ## - returns 'True' if there's healthy deployments OR once the request is woken up at the top of queue
+        make_request = await self.scheduler.wait_for_turn(
+            request=item,
+            get_healthy_deployments=_get_healthy_deployments,
+            timeout=self.timeout,
+        )
 
         if make_request:
             try:
@@ -1916,9 +1917,13 @@ class Router:
             except Exception as e:
                 setattr(e, "priority", priority)
                 raise e
+            finally:
+                await self.scheduler.release(
+                    request=item, get_healthy_deployments=_get_healthy_deployments
+                )
         else:
             raise litellm.Timeout(
-                message="Request timed out while polling queue",
+                message="Request timed out while waiting in queue",
                 model=model,
                 llm_provider="openai",
             )
@@ -1944,26 +1949,18 @@ class Router:
         ## ADDS REQUEST TO QUEUE ##
         await self.scheduler.add_request(request=item)
 
-        ## POLL QUEUE
-        end_time = time.monotonic() + self.timeout
-        curr_time = time.monotonic()
-        poll_interval = self.scheduler.polling_interval  # poll every 3ms
-        make_request = False
-
-        while curr_time < end_time:
+        async def _get_healthy_deployments() -> list:
             _healthy_deployments, _ = await self._async_get_healthy_deployments(
                 model=model, parent_otel_span=parent_otel_span
             )
-            make_request = await self.scheduler.poll(  ## POLL QUEUE ## - returns 'True' if there's healthy deployments OR if request is at top of queue
-                id=item.request_id,
-                model_name=item.model_name,
-                health_deployments=_healthy_deployments,
-            )
-            if make_request:  ## IF TRUE -> MAKE REQUEST
-                break
-            else:  ## ELSE -> loop till default_timeout
-                await asyncio.sleep(poll_interval)
-                curr_time = time.monotonic()
+            return _healthy_deployments
+
+        ## WAIT FOR TURN ## - returns 'True' if there's healthy deployments OR once the request is woken up at the top of queue
+        make_request = await self.scheduler.wait_for_turn(
+            request=item,
+            get_healthy_deployments=_get_healthy_deployments,
+            timeout=self.timeout,
+        )
 
         if make_request:
             try:
@@ -1977,9 +1974,13 @@ class Router:
             except Exception as e:
                 setattr(e, "priority", priority)
                 raise e
+            finally:
+                await self.scheduler.release(
+                    request=item, get_healthy_deployments=_get_healthy_deployments
+                )
         else:
             raise litellm.Timeout(
-                message="Request timed out while polling queue",
+                message="Request timed out while waiting in queue",
                 model=model,
                 llm_provider="openai",
             )
@@ -6828,7 +6829,9 @@ class Router:
         invalid_model_indices = set()  # Use set for O(1) membership checks
 
         try:
-            input_tokens = litellm.token_counter(messages=messages)
+            input_tokens = get_request_token_count(
+                request_kwargs=request_kwargs, messages=messages
+            )
         except Exception as e:
             verbose_router_logger.error(
                 "litellm.router.py::_pre_call_checks: failed to count tokens. Returning initial list of deployments. Got - {}".format(
@@ -7215,6 +7218,16 @@ class Router:
 
         return healthy_deployments
 
+    def _counts_request_tokens(self) -> bool:
+        """True if routing counts the request's input tokens exactly - pre-call checks, tpm / cost based routing"""
+        if litellm.use_token_count_estimator_for_routing is True:
+            return False
+        return self.enable_pre_call_checks or self.routing_strategy in (
+            "usage-based-routing-v2",
+            "cost-based-routing",
+        )
+
+    @latency_profiler.profile_stage("routing")
     async def async_get_available_deployment(
         self,
         model: str,
@@ -7261,6 +7274,10 @@ class Router:
                 messages = pre_routing_hook_response.messages
             #########################################################
 
+            if messages is not None and self._counts_request_tokens():
+                # fetch image dimensions off the event loop - the token count reads them from the cache
+                await async_prefetch_image_dimensions(messages)  # type: ignore
+
             healthy_deployments = await self.async_get_healthy_deployments(
                 model=model,
                 request_kwargs=request_kwargs,
@@ -7283,6 +7300,7 @@ class Router:
                         healthy_deployments=healthy_deployments,  # type: ignore
                         messages=messages,
                         input=input,
+                        request_kwargs=request_kwargs,
                     )
                 )
             elif (
@@ -7295,6 +7313,7 @@ class Router:
                         healthy_deployments=healthy_deployments,  # type: ignore
                         messages=messages,
                         input=input,
+                        request_kwargs=request_kwargs,
                     )
                 )
             elif (
@@ -7487,6 +7506,7 @@ class Router:
                 healthy_deployments=healthy_deployments,  # type: ignore
                 messages=messages,
                 input=input,
+                request_kwargs=request_kwargs,
             )
         elif (
             self.routing_strategy == "usage-based-routing-v2"
@@ -7497,6 +7517,7 @@ class Router:
                 healthy_deployments=healthy_deployments,  # type: ignore
                 messages=messages,
                 input=input,
+                request_kwargs=request_kwargs,
             )
         else:
             deployment = None
@@ -4,10 +4,11 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Union
 
 import litellm
-from litellm import ModelResponse, token_counter, verbose_logger
+from litellm import ModelResponse, verbose_logger
 from litellm._logging import verbose_router_logger
 from litellm.caching.caching import DualCache
 from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.token_counter import get_request_token_count
 
 
 class LowestCostLoggingHandler(CustomLogger):
@@ -229,7 +230,9 @@ class LowestCostLoggingHandler(CustomLogger):
                 }
 
         try:
-            input_tokens = token_counter(messages=messages, text=input)
+            input_tokens = get_request_token_count(
+                request_kwargs=request_kwargs, messages=messages, text=input
+            )
         except Exception:
             input_tokens = 0
 
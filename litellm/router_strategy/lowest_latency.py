@@ -1,11 +1,12 @@
 #### What this does ####
 #   picks based on response time (for streaming, this is time to first token)
 import random
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import litellm
-from litellm import ModelResponse, token_counter, verbose_logger
+from litellm import ModelResponse, verbose_logger
 from litellm.caching.caching import DualCache
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.core_helpers import safe_divide_seconds
@@ -24,9 +25,30 @@ class RoutingArgs(LiteLLMPydanticObjectBase):
     ttl: float = 1 * 60 * 60  # 1 hour
     lowest_latency_buffer: float = 0
     max_latency_list_size: int = 10
+    latency_ewma_alpha: float = 0.3  # weight of the newest sample in the moving average latency
 
 
 class LowestLatencyLoggingHandler(CustomLogger):
+    """
+    Picks the deployment with the lowest latency (for streaming, time to first token).
+
+    Per-deployment stats are maintained incrementally on each success / failure event, so routing
+    reads precomputed values:
+    {
+        {model_group}_map: {
+            id: {
+                "latency": [..],  # most recent samples, for debugging
+                "time_to_first_token": [..],
+                "avg_latency": 0.2,  # exponentially weighted moving average
+                "avg_time_to_first_token": 0.01,
+                "minute": "2024-01-01-10-30",  # current minute
+                "tpm": 34,
+                "rpm": 3,
+            }
+        }
+    }
+    """
+
     test_flag: bool = False
     logged_success: int = 0
     logged_failure: int = 0
@@ -36,154 +58,170 @@ class LowestLatencyLoggingHandler(CustomLogger):
     ):
         self.router_cache = router_cache
         self.routing_args = RoutingArgs(**routing_args)
+        self._current_epoch_minute: Optional[int] = None
+        self._current_precise_minute: str = ""
 
-    def log_success_event(  # noqa: PLR0915
-        self, kwargs, response_obj, start_time, end_time
-    ):
-        try:
-            """
-            Update latency usage on success
-            """
-            metadata_field = self._select_metadata_field(kwargs)
-            if kwargs["litellm_params"].get(metadata_field) is None:
-                pass
-            else:
-                model_group = kwargs["litellm_params"][metadata_field].get(
-                    "model_group", None
-                )
+    def _get_precise_minute(self) -> str:
+        """
+        Return the current UTC minute as 'YYYY-MM-DD-HH-MM'. Only formatted once per minute.
 
-                id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
-                if model_group is None or id is None:
-                    return
-                elif isinstance(id, int):
-                    id = str(id)
-
-                # ------------
-                # Setup values
-                # ------------
-                """
-                {
-                    {model_group}_map: {
-                        id: {
-                            "latency": [..]
-                            f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
-                        }
-                    }
-                }
-                """
-                latency_key = f"{model_group}_map"
-
-                current_date = datetime.now().strftime("%Y-%m-%d")
-                current_hour = datetime.now().strftime("%H")
-                current_minute = datetime.now().strftime("%M")
-                precise_minute = f"{current_date}-{current_hour}-{current_minute}"
-
-                response_ms = end_time - start_time
-                time_to_first_token_response_time = None
-
-                if kwargs.get("stream", None) is not None and kwargs["stream"] is True:
-                    # only log ttft for streaming request
-                    time_to_first_token_response_time = (
-                        kwargs.get("completion_start_time", end_time) - start_time
-                    )
+        The key is derived from the same epoch minute used to detect the minute change - in UTC, so it doesn't jump on
+        a DST change and matches across instances in different timezones.
+        """
+        epoch_minute = int(time.time() // 60)
+        if epoch_minute != self._current_epoch_minute:
+            self._current_precise_minute = datetime.fromtimestamp(
+                epoch_minute * 60, tz=timezone.utc
+            ).strftime("%Y-%m-%d-%H-%M")
+            self._current_epoch_minute = epoch_minute
+        return self._current_precise_minute
+
+    def _get_deployment_model_group_and_id(
+        self, kwargs: dict
+    ) -> Tuple[Optional[str], Optional[str]]:
+        metadata_field = self._select_metadata_field(kwargs)
+        if kwargs["litellm_params"].get(metadata_field) is None:
+            return None, None
+        model_group = kwargs["litellm_params"][metadata_field].get("model_group", None)
+        id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
+        if isinstance(id, int):
+            id = str(id)
+        return model_group, id
+
+    @staticmethod
+    def _get_seconds(value: Union[float, timedelta]) -> float:
+        if isinstance(value, timedelta):
+            return value.total_seconds()
+        return value
+
+    def _get_latency_values(
+        self, kwargs: dict, response_obj: Any, start_time, end_time
+    ) -> Tuple[float, Optional[float], int]:
+        """
+        Returns (latency, time_to_first_token, total_tokens) of a successful request.
 
-                final_value: Union[float, timedelta] = response_ms
-                time_to_first_token: Optional[float] = None
-                total_tokens = 0
-
-                if isinstance(response_obj, ModelResponse):
-                    _usage = getattr(response_obj, "usage", None)
-                    if _usage is not None:
-                        completion_tokens = _usage.completion_tokens
-                        total_tokens = _usage.total_tokens
-                        
-                        # Handle both timedelta and float response times
-                        if isinstance(response_ms, timedelta):
-                            response_seconds = response_ms.total_seconds()
-                        else:
-                            response_seconds = response_ms
-                            
-                        final_value = safe_divide_seconds(response_seconds, completion_tokens)
-                        if final_value is not None:
-                            final_value = float(final_value)
-                        else:
-                            final_value = response_seconds
-
-                        if time_to_first_token_response_time is not None:
-                            if isinstance(time_to_first_token_response_time, timedelta):
-                                ttft_seconds = time_to_first_token_response_time.total_seconds()
-                            else:
-                                ttft_seconds = time_to_first_token_response_time
-                            time_to_first_token = safe_divide_seconds(
-                                ttft_seconds, completion_tokens
-                            )
-
-                # ------------
-                # Update usage
-                # ------------
-                parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
-                request_count_dict = (
-                    self.router_cache.get_cache(
-                        key=latency_key, parent_otel_span=parent_otel_span
+        latency / time to first token are per completion token, if usage is available.
+        """
+        response_seconds = self._get_seconds(end_time - start_time)
+        time_to_first_token_seconds: Optional[float] = None
+        if kwargs.get("stream", None) is not None and kwargs["stream"] is True:
+            # only log ttft for streaming request
+            time_to_first_token_seconds = self._get_seconds(
+                kwargs.get("completion_start_time", end_time) - start_time
+            )
+
+        final_value: float = response_seconds
+        time_to_first_token: Optional[float] = None
+        total_tokens = 0
+
+        if isinstance(response_obj, ModelResponse):
+            _usage = getattr(response_obj, "usage", None)
+            if _usage is not None:
+                completion_tokens = _usage.completion_tokens
+                total_tokens = _usage.total_tokens
+                final_value = safe_divide_seconds(
+                    response_seconds, completion_tokens, default=response_seconds
+                )  # type: ignore
+                if time_to_first_token_seconds is not None:
+                    time_to_first_token = safe_divide_seconds(
+                        time_to_first_token_seconds, completion_tokens
                     )
-                    or {}
-                )
+        return final_value, time_to_first_token, total_tokens
 
-                if id not in request_count_dict:
-                    request_count_dict[id] = {}
+    def _add_latency_sample(
+        self, deployment_stats: dict, field: str, value: float
+    ) -> None:
+        """
+        Update the recent samples + moving average of a latency field ('latency' / 'time_to_first_token')
+        """
+        samples = deployment_stats.get(field)
+        if samples is None:
+            samples = deployment_stats[field] = []
+        samples.append(value)
+        if len(samples) > self.routing_args.max_latency_list_size:
+            del samples[: len(samples) - self.routing_args.max_latency_list_size]
+
+        avg_field = f"avg_{field}"
+        current_avg = deployment_stats.get(avg_field)
+        if current_avg is None:
+            deployment_stats[avg_field] = value
+        else:
+            alpha = self.routing_args.latency_ewma_alpha
+            deployment_stats[avg_field] = alpha * value + (1 - alpha) * current_avg
+
+    def _update_deployment_stats(
+        self,
+        request_count_dict: dict,
+        id: str,
+        latency: float,
+        time_to_first_token: Optional[float] = None,
+        total_tokens: Optional[int] = None,
+    ) -> None:
+        """
+        Update the stats of 1 deployment in-place.
 
-                ## Latency
-                if (
-                    len(request_count_dict[id].get("latency", []))
-                    < self.routing_args.max_latency_list_size
-                ):
-                    request_count_dict[id].setdefault("latency", []).append(final_value)
-                else:
-                    request_count_dict[id]["latency"] = request_count_dict[id][
-                        "latency"
-                    ][: self.routing_args.max_latency_list_size - 1] + [final_value]
-
-                ## Time to first token
-                if time_to_first_token is not None:
-                    if (
-                        len(request_count_dict[id].get("time_to_first_token", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault(
-                            "time_to_first_token", []
-                        ).append(time_to_first_token)
-                    else:
-                        request_count_dict[id][
-                            "time_to_first_token"
-                        ] = request_count_dict[id]["time_to_first_token"][
-                            : self.routing_args.max_latency_list_size - 1
-                        ] + [
-                            time_to_first_token
-                        ]
-
-                if precise_minute not in request_count_dict[id]:
-                    request_count_dict[id][precise_minute] = {}
-
-                ## TPM
-                request_count_dict[id][precise_minute]["tpm"] = (
-                    request_count_dict[id][precise_minute].get("tpm", 0) + total_tokens
-                )
+        total_tokens: None for failed requests - they don't count towards tpm / rpm.
+        """
+        deployment_stats = request_count_dict.get(id)
+        if deployment_stats is None:
+            deployment_stats = request_count_dict[id] = {}
+
+        self._add_latency_sample(deployment_stats, "latency", latency)
+        if time_to_first_token is not None:
+            self._add_latency_sample(
+                deployment_stats, "time_to_first_token", time_to_first_token
+            )
 
-                ## RPM
-                request_count_dict[id][precise_minute]["rpm"] = (
-                    request_count_dict[id][precise_minute].get("rpm", 0) + 1
-                )
+        if total_tokens is not None:
+            precise_minute = self._get_precise_minute()
+            if deployment_stats.get("minute") != precise_minute:
+                deployment_stats["minute"] = precise_minute
+                deployment_stats["tpm"] = 0
+                deployment_stats["rpm"] = 0
+            deployment_stats["tpm"] += total_tokens
+            deployment_stats["rpm"] += 1
+
+    def log_success_event(self, kwargs, response_obj, start_time, end_time):
+        try:
+            """
+            Update latency usage on success
+            """
+            model_group, id = self._get_deployment_model_group_and_id(kwargs)
+            if model_group is None or id is None:
+                return
+
+            latency_key = f"{model_group}_map"
+            latency, time_to_first_token, total_tokens = self._get_latency_values(
+                kwargs, response_obj, start_time, end_time
+            )
 
-                self.router_cache.set_cache(
-                    key=latency_key, value=request_count_dict, ttl=self.routing_args.ttl
-                )  # reset map within window
+            # ------------
+            # Update usage
+            # ------------
+            parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
+            request_count_dict = (
+                self.router_cache.get_cache(
+                    key=latency_key, parent_otel_span=parent_otel_span
+                )
+                or {}
+            )
+            self._update_deployment_stats(
+                request_count_dict=request_count_dict,
+                id=id,
+                latency=latency,
+                time_to_first_token=time_to_first_token,
+                total_tokens=total_tokens,
+            )
+            self.router_cache.set_cache(
+                key=latency_key, value=request_count_dict, ttl=self.routing_args.ttl
+            )  # reset map within window
 
-                ### TESTING ###
-                if self.test_flag:
-                    self.logged_success += 1
+            ### TESTING ###
+            if self.test_flag:
+                self.logged_success += 1
         except Exception as e:
             verbose_logger.exception(
-                "litellm.proxy.hooks.prompt_injection_detection.py::async_pre_call_hook(): Exception occured - {}".format(
+                "litellm.router_strategy.lowest_latency.py::log_success_event(): Exception occured - {}".format(
                     str(e)
                 )
             )
@@ -194,215 +232,78 @@ class LowestLatencyLoggingHandler(CustomLogger):
         Check if Timeout Error, if timeout set deployment latency -> 100
         """
         try:
-            metadata_field = self._select_metadata_field(kwargs)
             _exception = kwargs.get("exception", None)
-            if isinstance(_exception, litellm.Timeout):
-                if kwargs["litellm_params"].get(metadata_field) is None:
-                    pass
-                else:
-                    model_group = kwargs["litellm_params"][metadata_field].get(
-                        "model_group", None
-                    )
-
-                    id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
-                    if model_group is None or id is None:
-                        return
-                    elif isinstance(id, int):
-                        id = str(id)
-
-                    # ------------
-                    # Setup values
-                    # ------------
-                    """
-                    {
-                        {model_group}_map: {
-                            id: {
-                                "latency": [..]
-                                f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
-                            }
-                        }
-                    }
-                    """
-                    latency_key = f"{model_group}_map"
-                    request_count_dict = (
-                        await self.router_cache.async_get_cache(key=latency_key) or {}
-                    )
-
-                    if id not in request_count_dict:
-                        request_count_dict[id] = {}
-
-                    ## Latency - give 1000s penalty for failing
-                    if (
-                        len(request_count_dict[id].get("latency", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault("latency", []).append(1000.0)
-                    else:
-                        request_count_dict[id]["latency"] = request_count_dict[id][
-                            "latency"
-                        ][: self.routing_args.max_latency_list_size - 1] + [1000.0]
-
-                    await self.router_cache.async_set_cache(
-                        key=latency_key,
-                        value=request_count_dict,
-                        ttl=self.routing_args.ttl,
-                    )  # reset map within window
-            else:
+            if not isinstance(_exception, litellm.Timeout):
                 # do nothing if it's not a timeout error
                 return
+
+            model_group, id = self._get_deployment_model_group_and_id(kwargs)
+            if model_group is None or id is None:
+                return
+
+            latency_key = f"{model_group}_map"
+            request_count_dict = (
+                await self.router_cache.async_get_cache(key=latency_key) or {}
+            )
+
+            ## Latency - give 1000s penalty for failing
+            self._update_deployment_stats(
+                request_count_dict=request_count_dict, id=id, latency=1000.0
+            )
+
+            await self.router_cache.async_set_cache(
+                key=latency_key,
+                value=request_count_dict,
+                ttl=self.routing_args.ttl,
+            )  # reset map within window
         except Exception as e:
             verbose_logger.exception(
-                "litellm.proxy.hooks.prompt_injection_detection.py::async_pre_call_hook(): Exception occured - {}".format(
+                "litellm.router_strategy.lowest_latency.py::async_log_failure_event(): Exception occured - {}".format(
                     str(e)
                 )
             )
             pass
 
-    async def async_log_success_event(  # noqa: PLR0915
-        self, kwargs, response_obj, start_time, end_time
-    ):
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         try:
             """
             Update latency usage on success
             """
-            metadata_field = self._select_metadata_field(kwargs)
-            if kwargs["litellm_params"].get(metadata_field) is None:
-                pass
-            else:
-                model_group = kwargs["litellm_params"][metadata_field].get(
-                    "model_group", None
-                )
-
-                id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
-                if model_group is None or id is None:
-                    return
-                elif isinstance(id, int):
-                    id = str(id)
-
-                # ------------
-                # Setup values
-                # ------------
-                """
-                {
-                    {model_group}_map: {
-                        id: {
-                            "latency": [..]
-                            "time_to_first_token": [..]
-                            f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
-                        }
-                    }
-                }
-                """
-                latency_key = f"{model_group}_map"
-
-                current_date = datetime.now().strftime("%Y-%m-%d")
-                current_hour = datetime.now().strftime("%H")
-                current_minute = datetime.now().strftime("%M")
-                precise_minute = f"{current_date}-{current_hour}-{current_minute}"
-
-                response_ms = end_time - start_time
-                time_to_first_token_response_time = None
-                if kwargs.get("stream", None) is not None and kwargs["stream"] is True:
-                    # only log ttft for streaming request
-                    time_to_first_token_response_time = (
-                        kwargs.get("completion_start_time", end_time) - start_time
-                    )
-
-                final_value: Union[float, timedelta] = response_ms
-                total_tokens = 0
-                time_to_first_token: Optional[float] = None
-
-                if isinstance(response_obj, ModelResponse):
-                    _usage = getattr(response_obj, "usage", None)
-                    if _usage is not None:
-                        completion_tokens = _usage.completion_tokens
-                        total_tokens = _usage.total_tokens
-                        
-                        # Handle both timedelta and float response times
-                        if isinstance(response_ms, timedelta):
-                            response_seconds = response_ms.total_seconds()
-                        else:
-                            response_seconds = response_ms
-                            
-                        final_value = safe_divide_seconds(response_seconds, completion_tokens)
-                        if final_value is not None:
-                            final_value = float(final_value)
-                        else:
-                            final_value = response_ms
-
-                        if time_to_first_token_response_time is not None:
-                            if isinstance(time_to_first_token_response_time, timedelta):
-                                ttft_seconds = time_to_first_token_response_time.total_seconds()
-                            else:
-                                ttft_seconds = time_to_first_token_response_time
-                            time_to_first_token = safe_divide_seconds(
-                                ttft_seconds, completion_tokens
-                            )
-                # ------------
-                # Update usage
-                # ------------
-                parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
-                request_count_dict = (
-                    await self.router_cache.async_get_cache(
-                        key=latency_key,
-                        parent_otel_span=parent_otel_span,
-                        local_only=True,
-                    )
-                    or {}
-                )
-
-                if id not in request_count_dict:
-                    request_count_dict[id] = {}
+            model_group, id = self._get_deployment_model_group_and_id(kwargs)
+            if model_group is None or id is None:
+                return
 
-                ## Latency
-                if (
-                    len(request_count_dict[id].get("latency", []))
-                    < self.routing_args.max_latency_list_size
-                ):
-                    request_count_dict[id].setdefault("latency", []).append(final_value)
-                else:
-                    request_count_dict[id]["latency"] = request_count_dict[id][
-                        "latency"
-                    ][: self.routing_args.max_latency_list_size - 1] + [final_value]
-
-                ## Time to first token
-                if time_to_first_token is not None:
-                    if (
-                        len(request_count_dict[id].get("time_to_first_token", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault(
-                            "time_to_first_token", []
-                        ).append(time_to_first_token)
-                    else:
-                        request_count_dict[id][
-                            "time_to_first_token"
-                        ] = request_count_dict[id]["time_to_first_token"][
-                            : self.routing_args.max_latency_list_size - 1
-                        ] + [
-                            time_to_first_token
-                        ]
-
-                if precise_minute not in request_count_dict[id]:
-                    request_count_dict[id][precise_minute] = {}
-
-                ## TPM
-                request_count_dict[id][precise_minute]["tpm"] = (
-                    request_count_dict[id][precise_minute].get("tpm", 0) + total_tokens
-                )
+            latency_key = f"{model_group}_map"
+            latency, time_to_first_token, total_tokens = self._get_latency_values(
+                kwargs, response_obj, start_time, end_time
+            )
 
-                ## RPM
-                request_count_dict[id][precise_minute]["rpm"] = (
-                    request_count_dict[id][precise_minute].get("rpm", 0) + 1
+            # ------------
+            # Update usage
+            # ------------
+            parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
+            request_count_dict = (
+                await self.router_cache.async_get_cache(
+                    key=latency_key,
+                    parent_otel_span=parent_otel_span,
+                    local_only=True,
                 )
+                or {}
+            )
+            self._update_deployment_stats(
+                request_count_dict=request_count_dict,
+                id=id,
+                latency=latency,
+                time_to_first_token=time_to_first_token,
+                total_tokens=total_tokens,
+            )
+            await self.router_cache.async_set_cache(
+                key=latency_key, value=request_count_dict, ttl=self.routing_args.ttl
+            )  # reset map within window
 
-                await self.router_cache.async_set_cache(
-                    key=latency_key, value=request_count_dict, ttl=self.routing_args.ttl
-                )  # reset map within window
-
-                ### TESTING ###
-                if self.test_flag:
-                    self.logged_success += 1
+            ### TESTING ###
+            if self.test_flag:
+                self.logged_success += 1
         except Exception as e:
             verbose_logger.exception(
                 "litellm.router_strategy.lowest_latency.py::async_log_success_event(): Exception occured - {}".format(
@@ -411,7 +312,20 @@ class LowestLatencyLoggingHandler(CustomLogger):
             )
             pass
 
-    def _get_available_deployments(  # noqa: PLR0915
+    @staticmethod
+    def _get_average_latency(deployment_stats: dict, field: str) -> Optional[float]:
+        """
+        Return the moving average of a latency field. Falls back to the mean of the samples, for stats written without averages.
+        """
+        avg_latency = deployment_stats.get(f"avg_{field}")
+        if avg_latency is not None:
+            return avg_latency
+        samples = deployment_stats.get(field)
+        if samples:
+            return sum(samples) / len(samples)
+        return None
+
+    def _get_available_deployments(
         self,
         model_group: str,
         healthy_deployments: list,
@@ -420,132 +334,98 @@ class LowestLatencyLoggingHandler(CustomLogger):
         request_kwargs: Optional[Dict] = None,
         request_count_dict: Optional[Dict] = None,
     ):
-        """Common logic for both sync and async get_available_deployments"""
-
-        # -----------------------
-        # Find lowest used model
-        # ----------------------
-        _latency_per_deployment = {}
-        lowest_latency = float("inf")
-
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        current_hour = datetime.now().strftime("%H")
-        current_minute = datetime.now().strftime("%M")
-        precise_minute = f"{current_date}-{current_hour}-{current_minute}"
-
-        deployment = None
+        """
+        Common logic for both sync and async get_available_deployments
 
+        Single pass over the healthy deployments, reading the precomputed stats of each deployment.
+        Deployments at their tpm / rpm limit for the current minute are skipped. The request is not tokenized.
+        """
         if request_count_dict is None:  # base case
             return
 
-        all_deployments = request_count_dict
-        for d in healthy_deployments:
-            ## if healthy deployment not yet used
-            if d["model_info"]["id"] not in all_deployments:
-                all_deployments[d["model_info"]["id"]] = {
-                    "latency": [0],
-                    precise_minute: {"tpm": 0, "rpm": 0},
-                }
-
-        try:
-            input_tokens = token_counter(messages=messages, text=input)
-        except Exception:
-            input_tokens = 0
-
-        # randomly sample from all_deployments, incase all deployments have latency=0.0
-        _items = all_deployments.items()
-
-        _all_deployments = random.sample(list(_items), len(_items))
-        all_deployments = dict(_all_deployments)
-        ### GET AVAILABLE DEPLOYMENTS ### filter out any deployments > tpm/rpm limits
-
-        potential_deployments = []
-        for item, item_map in all_deployments.items():
-            ## get the item from model list
-            _deployment = None
-            for m in healthy_deployments:
-                if item == m["model_info"]["id"]:
-                    _deployment = m
-
-            if _deployment is None:
-                continue  # skip to next one
-
-            _deployment_tpm = (
-                _deployment.get("tpm", None)
-                or _deployment.get("litellm_params", {}).get("tpm", None)
-                or _deployment.get("model_info", {}).get("tpm", None)
-                or float("inf")
-            )
+        precise_minute = self._get_precise_minute()
+        use_time_to_first_token = (
+            request_kwargs is not None and request_kwargs.get("stream", None) is True
+        )
 
-            _deployment_rpm = (
-                _deployment.get("rpm", None)
-                or _deployment.get("litellm_params", {}).get("rpm", None)
-                or _deployment.get("model_info", {}).get("rpm", None)
-                or float("inf")
-            )
-            item_latency = item_map.get("latency", [])
-            item_ttft_latency = item_map.get("time_to_first_token", [])
-            item_rpm = item_map.get(precise_minute, {}).get("rpm", 0)
-            item_tpm = item_map.get(precise_minute, {}).get("tpm", 0)
-
-            # get average latency or average ttft (depending on streaming/non-streaming)
-            total: float = 0.0
-            if (
-                request_kwargs is not None
-                and request_kwargs.get("stream", None) is not None
-                and request_kwargs["stream"] is True
-                and len(item_ttft_latency) > 0
-            ):
-                for _call_latency in item_ttft_latency:
-                    if isinstance(_call_latency, float):
-                        total += _call_latency
+        _latency_per_deployment = {}
+        potential_deployments: List[Tuple[Dict, float]] = []
+        lowest_latency = float("inf")
+        for _deployment in healthy_deployments:
+            deployment_stats = request_count_dict.get(_deployment["model_info"]["id"])
+            if deployment_stats is None:
+                ## healthy deployment not yet used
+                item_latency = 0.0
+                item_tpm = 0
+                item_rpm = 0
             else:
-                for _call_latency in item_latency:
-                    if isinstance(_call_latency, float):
-                        total += _call_latency
-            item_latency = total / len(item_latency)
+                # get average latency or average ttft (depending on streaming/non-streaming)
+                average_latency: Optional[float] = None
+                if use_time_to_first_token:
+                    average_latency = self._get_average_latency(
+                        deployment_stats, "time_to_first_token"
+                    )
+                if average_latency is None:
+                    average_latency = self._get_average_latency(
+                        deployment_stats, "latency"
+                    )
+                # no latency recorded yet - treat like a healthy deployment not yet used
+                item_latency = average_latency if average_latency is not None else 0.0
+                if deployment_stats.get("minute") == precise_minute:
+                    item_tpm = deployment_stats.get("tpm", 0)
+                    item_rpm = deployment_stats.get("rpm", 0)
+                else:
+                    item_tpm = 0
+                    item_rpm = 0
+
+            _litellm_params = _deployment.get("litellm_params", {})
+            _model_info = _deployment.get("model_info", {})
 
             # -------------- #
             # Debugging Logic
             # -------------- #
             # We use _latency_per_deployment to log to langfuse, slack - this is not used to make a decision on routing
             # this helps a user to debug why the router picked a specfic deployment      #
-            _deployment_api_base = _deployment.get("litellm_params", {}).get(
-                "api_base", ""
-            )
+            _deployment_api_base = _litellm_params.get("api_base", "")
             if _deployment_api_base is not None:
                 _latency_per_deployment[_deployment_api_base] = item_latency
             # -------------- #
             # End of Debugging Logic
             # -------------- #
 
-            if (
-                item_tpm + input_tokens > _deployment_tpm
-                or item_rpm + 1 > _deployment_rpm
-            ):  # if user passed in tpm / rpm in the model_list
-                continue
-            else:
-                potential_deployments.append((_deployment, item_latency))
+            if item_rpm > 0 or item_tpm > 0:
+                _deployment_tpm = (
+                    _deployment.get("tpm", None)
+                    or _litellm_params.get("tpm", None)
+                    or _model_info.get("tpm", None)
+                    or float("inf")
+                )
+                _deployment_rpm = (
+                    _deployment.get("rpm", None)
+                    or _litellm_params.get("rpm", None)
+                    or _model_info.get("rpm", None)
+                    or float("inf")
+                )
+                if (
+                    item_tpm >= _deployment_tpm or item_rpm + 1 > _deployment_rpm
+                ):  # if user passed in tpm / rpm in the model_list
+                    continue
+
+            potential_deployments.append((_deployment, item_latency))
+            if item_latency < lowest_latency:
+                lowest_latency = item_latency
 
         if len(potential_deployments) == 0:
             return None
 
-        # Sort potential deployments by latency
-        sorted_deployments = sorted(potential_deployments, key=lambda x: x[1])
-
-        # Find lowest latency deployment
-        lowest_latency = sorted_deployments[0][1]
-
         # Find deployments within buffer of lowest latency
         buffer = self.routing_args.lowest_latency_buffer * lowest_latency
-
         valid_deployments = [
-            x for x in sorted_deployments if x[1] <= lowest_latency + buffer
+            x[0] for x in potential_deployments if x[1] <= lowest_latency + buffer
         ]
 
-        # Pick a random deployment from valid deployments
-        random_valid_deployment = random.choice(valid_deployments)
-        deployment = random_valid_deployment[0]
+        # Pick a random deployment from valid deployments - e.g. when all deployments have latency=0.0
+        deployment = random.choice(valid_deployments)
         metadata_field = self._select_metadata_field(request_kwargs)
         if request_kwargs is not None and metadata_field in request_kwargs:
             request_kwargs[metadata_field][
@@ -4,10 +4,10 @@ import traceback
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 
-from litellm import token_counter
 from litellm._logging import verbose_router_logger
 from litellm.caching.caching import DualCache
 from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.token_counter import get_request_token_count
 from litellm.types.utils import LiteLLMPydanticObjectBase
 from litellm.utils import print_verbose
 
@@ -161,6 +161,7 @@ class LowestTPMLoggingHandler(CustomLogger):
         healthy_deployments: list,
         messages: Optional[List[Dict[str, str]]] = None,
         input: Optional[Union[str, List]] = None,
+        request_kwargs: Optional[Dict] = None,
     ):
         """
         Returns a deployment with the lowest TPM/RPM usage.
@@ -180,7 +181,9 @@ class LowestTPMLoggingHandler(CustomLogger):
             f"tpm_key={tpm_key}, tpm_dict: {tpm_dict}, rpm_dict: {rpm_dict}"
         )
         try:
-            input_tokens = token_counter(messages=messages, text=input)
+            input_tokens = get_request_token_count(
+                request_kwargs=request_kwargs, messages=messages, text=input
+            )
         except Exception:
             input_tokens = 0
         verbose_router_logger.debug(f"input_tokens={input_tokens}")
@@ -6,11 +6,11 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 import httpx
 
 import litellm
-from litellm import token_counter
 from litellm._logging import verbose_logger, verbose_router_logger
 from litellm.caching.caching import DualCache
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.core_helpers import _get_parent_otel_span_from_kwargs
+from litellm.litellm_core_utils.token_counter import get_request_token_count
 from litellm.types.router import RouterErrors
 from litellm.types.utils import LiteLLMPydanticObjectBase, StandardLoggingPayload
 from litellm.utils import get_utc_datetime, print_verbose
@@ -391,6 +391,7 @@ class LowestTPMLoggingHandler_v2(BaseRoutingStrategy, CustomLogger):
         rpm_values: Optional[list],
         messages: Optional[List[Dict[str, str]]] = None,
         input: Optional[Union[str, List]] = None,
+        request_kwargs: Optional[Dict] = None,
     ) -> Optional[dict]:
         """
         Common checks for get available deployment, across sync + async implementations
@@ -408,7 +409,9 @@ class LowestTPMLoggingHandler_v2(BaseRoutingStrategy, CustomLogger):
             rpm_dict[rpm_keys[idx].split(":")[0]] = rpm_values[idx]
 
         try:
-            input_tokens = token_counter(messages=messages, text=input)
+            input_tokens = get_request_token_count(
+                request_kwargs=request_kwargs, messages=messages, text=input
+            )
         except Exception:
             input_tokens = 0
         verbose_router_logger.debug(f"input_tokens={input_tokens}")
@@ -448,6 +451,7 @@ class LowestTPMLoggingHandler_v2(BaseRoutingStrategy, CustomLogger):
         healthy_deployments: list,
         messages: Optional[List[Dict[str, str]]] = None,
         input: Optional[Union[str, List]] = None,
+        request_kwargs: Optional[Dict] = None,
     ):
         """
         Async implementation of get deployments.
@@ -498,6 +502,7 @@ class LowestTPMLoggingHandler_v2(BaseRoutingStrategy, CustomLogger):
             rpm_values=rpm_values,
             messages=messages,
             input=input,
+            request_kwargs=request_kwargs,
         )
 
         try:
@@ -570,6 +575,7 @@ class LowestTPMLoggingHandler_v2(BaseRoutingStrategy, CustomLogger):
         messages: Optional[List[Dict[str, str]]] = None,
         input: Optional[Union[str, List]] = None,
         parent_otel_span: Optional[Span] = None,
+        request_kwargs: Optional[Dict] = None,
     ):
         """
         Returns a deployment with the lowest TPM/RPM usage.
@@ -611,6 +617,7 @@ class LowestTPMLoggingHandler_v2(BaseRoutingStrategy, CustomLogger):
             rpm_values=rpm_values,
             messages=messages,
             input=input,
+            request_kwargs=request_kwargs,
         )
 
         try:
@@ -1,15 +1,29 @@
 """
 Wrapper around router cache. Meant to handle model cooldown logic
+
+Cooldowns are written to the router cache (in-memory + redis, if set) and kept in a local index of
+model id -> (expires at, cooldown value). The index answers "which deployments are cooling down" in one pass over the
+model ids, without building cache keys or reading the cache:
+- no redis: only this instance writes cooldowns, the index is always complete
+- redis + `push_updates`: cooldowns are published on a redis channel and applied by every other instance. A model id is
+  read from redis once, then kept up to date by the pushed updates (read again if updates may have been missed)
+- redis without `push_updates`: cooldowns set by other instances are read from the cache on every lookup
 """
 
+import asyncio
 import time
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 
 from typing_extensions import TypedDict
 
 from litellm import verbose_logger
+from litellm._uuid import uuid
+from litellm.caching.cache_invalidation import CACHE_INVALIDATION_MAX_TRACKED_PUBLISHERS
 from litellm.caching.caching import DualCache
+from litellm.caching.dual_cache import LimitedSizeOrderedDict
 from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.caching.pubsub import PubSubChannel, RedisPubSubChannel
+from litellm.constants import ROUTER_COOLDOWN_UPDATES_CHANNEL
 from litellm.litellm_core_utils.sensitive_data_masker import SensitiveDataMasker
 
 if TYPE_CHECKING:
@@ -27,11 +41,33 @@ class CooldownCacheValue(TypedDict):
     cooldown_time: float
 
 
+COOLDOWN_UPDATE_MESSAGE_VERSION = 1
+
+
 class CooldownCache:
-    def __init__(self, cache: DualCache, default_cooldown_time: float):
+    def __init__(
+        self,
+        cache: DualCache,
+        default_cooldown_time: float,
+        push_updates: bool = False,
+    ):
         self.cache = cache
         self.default_cooldown_time = default_cooldown_time
         self.in_memory_cache = InMemoryCache()
+        self.push_updates = push_updates
+        self.cooldown_channel: Optional[PubSubChannel] = None
+        self.instance_id = uuid.uuid4().hex
+        self._cooldowns: Dict[str, Tuple[float, CooldownCacheValue]] = {}
+        """model id -> (expires at, cooldown value), for cooldowns set on / pushed to this instance"""
+        self._synced_model_ids: Set[str] = set()
+        """model ids whose cooldowns are all in `_cooldowns` (push updates)"""
+        self._seq = 0
+        self._last_seq_by_publisher: LimitedSizeOrderedDict = LimitedSizeOrderedDict(
+            max_size=CACHE_INVALIDATION_MAX_TRACKED_PUBLISHERS
+        )
+        self._publish_tasks: Set[asyncio.Task] = set()
+        # cooldowns are published 1 at a time - so subscribers receive them in `seq` order, without gaps
+        self._publish_lock: Optional[asyncio.Lock] = None
         # Initialize the masker with custom settings for exception strings
         self.exception_masker = SensitiveDataMasker(
             visible_prefix=50,  # Show first 50 characters
@@ -95,6 +131,12 @@ class CooldownCache:
                 key=cooldown_key,
                 ttl=_cooldown_time,
             )
+            self._set_local_cooldown(
+                model_id=model_id, value=cooldown_data, ttl=_cooldown_time
+            )
+            self._publish_cooldown(
+                model_id=model_id, value=cooldown_data, ttl=_cooldown_time
+            )
         except Exception as e:
             verbose_logger.error(
                 "CooldownCache::add_deployment_to_cooldown - Exception occurred - {}".format(
@@ -103,6 +145,47 @@ class CooldownCache:
             )
             raise e
 
+    async def async_add_deployment_to_cooldown(
+        self,
+        model_id: str,
+        original_exception: Exception,
+        exception_status: int,
+        cooldown_time: Optional[float],
+    ) -> None:
+        """
+        `add_deployment_to_cooldown`, without blocking the event loop on the redis write
+        """
+        try:
+            _cooldown_time = cooldown_time
+            if _cooldown_time is None:
+                _cooldown_time = self.default_cooldown_time
+
+            cooldown_key, cooldown_data = self._common_add_cooldown_logic(
+                model_id=model_id,
+                original_exception=original_exception,
+                exception_status=exception_status,
+                cooldown_time=_cooldown_time,
+            )
+
+            await self.cache.async_set_cache(
+                value=cooldown_data,
+                key=cooldown_key,
+                ttl=_cooldown_time,
+            )
+            self._set_local_cooldown(
+                model_id=model_id, value=cooldown_data, ttl=_cooldown_time
+            )
+            self._publish_cooldown(
+                model_id=model_id, value=cooldown_data, ttl=_cooldown_time
+            )
+        except Exception as e:
+            verbose_logger.error(
+                "CooldownCache::async_add_deployment_to_cooldown - Exception occurred - {}".format(
+                    str(e)
+                )
+            )
+            raise e
+
     @staticmethod
     def get_cooldown_cache_key(model_id: str) -> str:
         return f"deployment:{model_id}:cooldown"
@@ -110,6 +193,30 @@ class CooldownCache:
     async def async_get_active_cooldowns(
         self, model_ids: List[str], parent_otel_span: Optional[Span]
     ) -> List[Tuple[str, CooldownCacheValue]]:
+        if self.cache.redis_cache is None:
+            return self._get_local_active_cooldowns(model_ids=model_ids)[0]
+
+        if self.push_updates:
+            await self._async_subscribe_to_cooldown_updates()
+        if self._is_receiving_cooldown_updates():
+            local_cooldowns, unsynced_model_ids = self._get_local_active_cooldowns(
+                model_ids=model_ids, synced_model_ids=self._synced_model_ids
+            )
+            if unsynced_model_ids:
+                redis_results = await self.cache.redis_cache.async_batch_get_cache(
+                    key_list=[
+                        CooldownCache.get_cooldown_cache_key(model_id)
+                        for model_id in unsynced_model_ids
+                    ],
+                    parent_otel_span=parent_otel_span,
+                )
+                local_cooldowns.extend(
+                    self._sync_cooldowns_from_redis(
+                        model_ids=unsynced_model_ids, results=redis_results
+                    )
+                )
+            return local_cooldowns
+
         # Generate the keys for the deployments
         keys = [
             CooldownCache.get_cooldown_cache_key(model_id) for model_id in model_ids
@@ -139,6 +246,28 @@ class CooldownCache:
     def get_active_cooldowns(
         self, model_ids: List[str], parent_otel_span: Optional[Span]
     ) -> List[Tuple[str, CooldownCacheValue]]:
+        if self.cache.redis_cache is None:
+            return self._get_local_active_cooldowns(model_ids=model_ids)[0]
+
+        if self._is_receiving_cooldown_updates():
+            local_cooldowns, unsynced_model_ids = self._get_local_active_cooldowns(
+                model_ids=model_ids, synced_model_ids=self._synced_model_ids
+            )
+            if unsynced_model_ids:
+                redis_results = self.cache.redis_cache.batch_get_cache(
+                    key_list=[
+                        CooldownCache.get_cooldown_cache_key(model_id)
+                        for model_id in unsynced_model_ids
+                    ],
+                    parent_otel_span=parent_otel_span,
+                )
+                local_cooldowns.extend(
+                    self._sync_cooldowns_from_redis(
+                        model_ids=unsynced_model_ids, results=redis_results
+                    )
+                )
+            return local_cooldowns
+
         # Generate the keys for the deployments
         keys = [f"deployment:{model_id}:cooldown" for model_id in model_ids]
         # Retrieve the values for the keys using mget
@@ -147,7 +276,7 @@ class CooldownCache:
             or []
         )
 
-        active_cooldowns = []
+        active_cooldowns: List[Tuple[str, CooldownCacheValue]] = []
         # Process the results
         for model_id, result in zip(model_ids, results):
             if result and isinstance(result, dict):
@@ -160,27 +289,187 @@ class CooldownCache:
         self, model_ids: List[str], parent_otel_span: Optional[Span]
     ) -> float:
         """Return min cooldown time required for a group of model id's."""
-
-        # Generate the keys for the deployments
-        keys = [f"deployment:{model_id}:cooldown" for model_id in model_ids]
-
-        # Retrieve the values for the keys using mget
-        results = (
-            self.cache.batch_get_cache(keys=keys, parent_otel_span=parent_otel_span)
-            or []
+        active_cooldowns = self.get_active_cooldowns(
+            model_ids=model_ids, parent_otel_span=parent_otel_span
         )
 
         min_cooldown_time: Optional[float] = None
-        # Process the results
-        for model_id, result in zip(model_ids, results):
+        for _, cooldown_cache_value in active_cooldowns:
+            if min_cooldown_time is None:
+                min_cooldown_time = cooldown_cache_value["cooldown_time"]
+            elif cooldown_cache_value["cooldown_time"] < min_cooldown_time:
+                min_cooldown_time = cooldown_cache_value["cooldown_time"]
+
+        return min_cooldown_time or self.default_cooldown_time
+
+    ##########################################################
+    # Local cooldown index + push updates
+    ##########################################################
+
+    def _get_local_active_cooldowns(
+        self, model_ids: List[str], synced_model_ids: Optional[Set[str]] = None
+    ) -> Tuple[List[Tuple[str, CooldownCacheValue]], List[str]]:
+        """
+        One pass over `model_ids` -> (active cooldowns in the local index, model ids not in `synced_model_ids`)
+
+        Expired cooldowns are removed from the index.
+        """
+        active_cooldowns: List[Tuple[str, CooldownCacheValue]] = []
+        unsynced_model_ids: List[str] = []
+        cooldowns = self._cooldowns
+        if not cooldowns and synced_model_ids is None:
+            return active_cooldowns, unsynced_model_ids
+
+        now = time.time()
+        for model_id in model_ids:
+            cooldown = cooldowns.get(model_id)
+            if cooldown is not None:
+                if cooldown[0] > now:
+                    active_cooldowns.append((model_id, cooldown[1]))
+                    continue
+                del cooldowns[model_id]
+            if synced_model_ids is not None and model_id not in synced_model_ids:
+                unsynced_model_ids.append(model_id)
+        return active_cooldowns, unsynced_model_ids
+
+    def _set_local_cooldown(
+        self, model_id: str, value: CooldownCacheValue, ttl: float
+    ) -> None:
+        expires_at = time.time() + ttl
+        cooldown = self._cooldowns.get(model_id)
+        if cooldown is None or cooldown[0] < expires_at:
+            self._cooldowns[model_id] = (expires_at, value)
+
+    def _sync_cooldowns_from_redis(
+        self, model_ids: List[str], results: dict
+    ) -> List[Tuple[str, CooldownCacheValue]]:
+        """
+        Add the cooldowns read from redis to the local index. Model ids missing from `results` (redis error) stay
+        unsynced.
+        """
+        active_cooldowns: List[Tuple[str, CooldownCacheValue]] = []
+        now = time.time()
+        for model_id in model_ids:
+            key = CooldownCache.get_cooldown_cache_key(model_id)
+            if key not in results:
+                continue
+            self._synced_model_ids.add(model_id)
+            result = results[key]
             if result and isinstance(result, dict):
                 cooldown_cache_value = CooldownCacheValue(**result)  # type: ignore
-                if min_cooldown_time is None:
-                    min_cooldown_time = cooldown_cache_value["cooldown_time"]
-                elif cooldown_cache_value["cooldown_time"] < min_cooldown_time:
-                    min_cooldown_time = cooldown_cache_value["cooldown_time"]
+                expires_at = (
+                    cooldown_cache_value["timestamp"]
+                    + cooldown_cache_value["cooldown_time"]
+                )
+                if expires_at > now:
+                    self._set_local_cooldown(
+                        model_id=model_id,
+                        value=cooldown_cache_value,
+                        ttl=expires_at - now,
+                    )
+                    active_cooldowns.append((model_id, cooldown_cache_value))
+        return active_cooldowns
 
-        return min_cooldown_time or self.default_cooldown_time
+    def _is_receiving_cooldown_updates(self) -> bool:
+        return self.cooldown_channel is not None and self.cooldown_channel.is_subscribed
+
+    async def _async_subscribe_to_cooldown_updates(self) -> None:
+        """
+        Subscribe to cooldown updates - or subscribe again, if the listener stopped. Lookups read redis while not
+        subscribed.
+        """
+        if self.cache.redis_cache is None:
+            return
+        if self.cooldown_channel is None:
+            self.cooldown_channel = RedisPubSubChannel(
+                redis_cache=self.cache.redis_cache,
+                channel=ROUTER_COOLDOWN_UPDATES_CHANNEL,
+            )
+        elif self.cooldown_channel.is_subscribed:
+            return
+        else:
+            # updates published while not subscribed are missed
+            self._reset_synced_model_ids()
+        await self.cooldown_channel.subscribe(
+            on_message=self._handle_cooldown_update,
+            on_reset=self._reset_synced_model_ids,
+        )
+
+    def _publish_cooldown(
+        self, model_id: str, value: CooldownCacheValue, ttl: float
+    ) -> None:
+        if self.cooldown_channel is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # other instances read it from redis once updates resume
+            return
+        task = loop.create_task(
+            self._async_publish_cooldown(model_id=model_id, value=value, ttl=ttl)
+        )
+        self._publish_tasks.add(task)
+        task.add_done_callback(self._publish_tasks.discard)
+
+    async def _async_publish_cooldown(
+        self, model_id: str, value: CooldownCacheValue, ttl: float
+    ) -> None:
+        if self.cooldown_channel is None:
+            return
+        if self._publish_lock is None:
+            # created on first use - the cooldown cache is created outside of the event loop
+            self._publish_lock = asyncio.Lock()
+        async with self._publish_lock:
+            seq = self._seq + 1
+            try:
+                await self.cooldown_channel.publish(
+                    {
+                        "version": COOLDOWN_UPDATE_MESSAGE_VERSION,
+                        "publisher": self.instance_id,
+                        "seq": seq,
+                        "model_id": model_id,
+                        "value": value,
+                        "ttl": ttl,
+                    }
+                )
+            except Exception as e:
+                verbose_logger.warning(
+                    "CooldownCache - unable to publish cooldown for model id %s. Error - %s",
+                    model_id,
+                    str(e),
+                )
+                return
+            # only count published messages - a failed publish isn't a gap subscribers re-sync on
+            self._seq = seq
+
+    def _handle_cooldown_update(self, message: Any) -> None:
+        if (
+            not isinstance(message, dict)
+            or message.get("version") != COOLDOWN_UPDATE_MESSAGE_VERSION
+        ):
+            self._reset_synced_model_ids()
+            return
+        publisher = message.get("publisher")
+        if publisher == self.instance_id:
+            return
+
+        seq = message.get("seq")
+        last_seq = self._last_seq_by_publisher.get(publisher)
+        self._last_seq_by_publisher[publisher] = seq
+        if last_seq is not None and seq != last_seq + 1:
+            # missed a cooldown from this publisher
+            self._reset_synced_model_ids()
+
+        self._set_local_cooldown(
+            model_id=message["model_id"],
+            value=CooldownCacheValue(**message["value"]),  # type: ignore
+            ttl=message["ttl"],
+        )
+
+    def _reset_synced_model_ids(self) -> None:
+        """Cooldown updates may have been missed - read every model id from redis again on its next lookup"""
+        verbose_logger.debug("CooldownCache - re-syncing cooldowns from redis")
+        self._synced_model_ids.clear()
 
 
 # Usage example:
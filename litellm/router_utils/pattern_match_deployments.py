@@ -2,10 +2,9 @@
 Class to handle llm wildcard routing and regex pattern matching
 """
 
-import copy
 import re
-from re import Match
-from typing import Dict, List, Optional, Tuple
+from re import Match, Pattern
+from typing import Dict, List, Optional, Set, Tuple
 
 from litellm import get_llm_provider
 from litellm._logging import verbose_router_logger
@@ -49,6 +48,65 @@ class PatternUtils:
         )
 
 
+class PatternPrefixIndex:
+    """
+    Precompiled matching index over the patterns of a PatternMatchRouter.
+
+    Patterns are matched with `re.match`, i.e. anchored at the start of the request.
+    So a pattern can only match a request that starts with the pattern's literal prefix (the part before the first '*').
+
+    The literal prefixes are stored in a trie - walking the request through the trie returns the few candidate patterns,
+    which are then checked in specificity order with their precompiled regex.
+    """
+
+    _TERMINAL = ""  # trie key holding the pattern ranks that end at a node. Never a valid char key.
+
+    def __init__(
+        self,
+        patterns: Dict[str, List[Dict]],
+        literal_prefixes: Dict[str, str],
+    ):
+        # patterns sorted by specificity - a pattern's position in this list is its rank
+        self.sorted_patterns: List[Tuple[str, Pattern, List[Dict]]] = [
+            (regex, re.compile(regex), deployments)
+            for regex, deployments in PatternUtils.sorted_patterns(patterns)
+        ]
+        self.trie: Dict = {}
+        for rank, (regex, _, _) in enumerate(self.sorted_patterns):
+            node = self.trie
+            # unknown prefix (e.g. pattern set directly on `.patterns`) -> always a candidate
+            for char in literal_prefixes.get(regex, ""):
+                node = node.setdefault(char, {})
+            node.setdefault(self._TERMINAL, []).append(rank)
+
+    def get_candidate_ranks(self, request: str) -> List[int]:
+        """
+        Return the ranks of all patterns whose literal prefix is a prefix of the request, most specific first
+        """
+        node = self.trie
+        candidate_ranks: List[int] = list(node.get(self._TERMINAL, []))
+        for char in request:
+            child = node.get(char)
+            if child is None:
+                break
+            node = child
+            candidate_ranks.extend(node.get(self._TERMINAL, []))
+        candidate_ranks.sort()
+        return candidate_ranks
+
+    def match(
+        self, request: str, allowed_patterns: Optional[Set[str]] = None
+    ) -> Optional[Tuple[Match, List[Dict]]]:
+        for rank in self.get_candidate_ranks(request):
+            regex, compiled_regex, deployments = self.sorted_patterns[rank]
+            if allowed_patterns is not None and regex not in allowed_patterns:
+                continue
+            pattern_match = compiled_regex.match(request)
+            if pattern_match:
+                return pattern_match, deployments
+        return None
+
+
 class PatternMatchRouter:
     """
     Class to handle llm wildcard routing and regex pattern matching
@@ -60,6 +118,10 @@ class PatternMatchRouter:
 
     def __init__(self):
         self.patterns: Dict[str, List] = {}
+        self._literal_prefixes: Dict[str, str] = {}  # regex -> literal prefix of the wildcard pattern
+        # precompiled matching index, rebuilt lazily after `patterns` changes
+        self._pattern_index: Optional[PatternPrefixIndex] = None
+        self._indexed_patterns: Optional[Dict[str, List]] = None
 
     def add_pattern(self, pattern: str, llm_deployment: Dict):
         """
@@ -74,6 +136,19 @@ class PatternMatchRouter:
         if regex not in self.patterns:
             self.patterns[regex] = []
         self.patterns[regex].append(llm_deployment)
+        self._literal_prefixes[regex] = pattern.split("*", 1)[0]
+        self._pattern_index = None
+
+    def _get_pattern_index(self) -> PatternPrefixIndex:
+        """
+        Return the matching index, rebuilding it only when deployments were added or `patterns` was replaced
+        """
+        if self._pattern_index is None or self._indexed_patterns is not self.patterns:
+            self._pattern_index = PatternPrefixIndex(
+                patterns=self.patterns, literal_prefixes=self._literal_prefixes
+            )
+            self._indexed_patterns = self.patterns
+        return self._pattern_index
 
     def _pattern_to_regex(self, pattern: str) -> str:
         """
@@ -104,7 +179,9 @@ class PatternMatchRouter:
     ) -> List[Dict]:
         new_deployments = []
         for deployment in deployments:
-            new_deployment = copy.deepcopy(deployment)
+            # Shallow copy with nested litellm_params copy (100x+ faster than deepcopy)
+            new_deployment = deployment.copy()
+            new_deployment["litellm_params"] = deployment["litellm_params"].copy()
             new_deployment["litellm_params"][
                 "model"
             ] = PatternMatchRouter.set_deployment_model_name(
@@ -121,7 +198,7 @@ class PatternMatchRouter:
         """
         Route a requested model to the corresponding llm deployments based on the regex pattern
 
-        loop through all the patterns and find the matching pattern
+        look up the candidate patterns in the precompiled index and find the most specific matching pattern
         if a pattern is found, return the corresponding llm deployments
         if no pattern is found, return None
 
@@ -135,23 +212,19 @@ class PatternMatchRouter:
             if request is None:
                 return None
 
-            sorted_patterns = PatternUtils.sorted_patterns(self.patterns)
             regex_filtered_model_names = (
-                [self._pattern_to_regex(m) for m in filtered_model_names]
+                {self._pattern_to_regex(m) for m in filtered_model_names}
                 if filtered_model_names is not None
-                else []
+                else None
+            )
+            result = self._get_pattern_index().match(
+                request=request, allowed_patterns=regex_filtered_model_names
             )
-            for pattern, llm_deployments in sorted_patterns:
-                if (
-                    filtered_model_names is not None
-                    and pattern not in regex_filtered_model_names
-                ):
-                    continue
-                pattern_match = re.match(pattern, request)
-                if pattern_match:
-                    return self._return_pattern_matched_deployments(
-                        matched_pattern=pattern_match, deployments=llm_deployments
-                    )
+            if result is not None:
+                pattern_match, llm_deployments = result
+                return self._return_pattern_matched_deployments(
+                    matched_pattern=pattern_match, deployments=llm_deployments
+                )
         except Exception as e:
             verbose_router_logger.debug(f"Error in PatternMatchRouter.route: {str(e)}")
 
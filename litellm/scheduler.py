@@ -1,12 +1,26 @@
+import asyncio
 import enum
 import heapq
-from typing import Optional
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from pydantic import BaseModel
 
 from litellm import print_verbose
+from litellm._logging import verbose_router_logger
 from litellm.caching.caching import DualCache, RedisCache
-from litellm.constants import DEFAULT_IN_MEMORY_TTL, DEFAULT_POLLING_INTERVAL
+from litellm.caching.pubsub import PubSubChannel, RedisPubSubChannel
+from litellm.constants import (
+    DEFAULT_IN_MEMORY_TTL,
+    DEFAULT_POLLING_INTERVAL,
+    SCHEDULER_PRIORITY_AGING_SECONDS,
+    SCHEDULER_REDIS_QUEUE_TTL_SECONDS,
+    SCHEDULER_RELEASE_CHANNEL,
+)
+from litellm.types.scheduler import SchedulerModelGroupQueueStatus
+
+GetHealthyDeployments = Callable[[], Awaitable[list]]
 
 
 class SchedulerCacheKeys(enum.Enum):
@@ -22,16 +36,88 @@ class FlowItem(BaseModel):
     model_name: str
 
 
+class ModelGroupQueue:
+    """
+    In-process priority queue for 1 model group.
+
+    - heap entries are [score, sequence_number, request_id]. `score` is the request's priority, aged by the time it
+      was queued (see `Scheduler._get_score`) - requests with the same score are served FIFO
+    - each queued request has an asyncio future, resolved when it's the request's turn. No polling per request.
+    """
+
+    def __init__(self):
+        self.heap: List[list] = []
+        self.entries: Dict[str, Tuple[int, list]] = {}  # request_id -> (priority, heap entry)
+        self.waiters: Dict[str, asyncio.Future] = {}  # request_id -> future
+        self.in_flight: Set[str] = set()  # requests released while no healthy deployments
+        self.get_healthy_deployments: Optional[GetHealthyDeployments] = None
+        """health check of the latest waiting request - used by the release loop"""
+        self.release_task: Optional[asyncio.Task] = None
+        self.release_event: Optional[asyncio.Event] = None
+        """set to wake the release loop before `polling_interval` is up"""
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def push(
+        self, priority: int, score: float, sequence_number: int, request_id: str
+    ) -> None:
+        entry = [score, sequence_number, request_id]
+        self.entries[request_id] = (priority, entry)
+        heapq.heappush(self.heap, entry)
+
+    def remove(self, request_id: str) -> None:
+        """
+        Lazily remove a request - the heap entry is marked removed, and dropped when it reaches the top of the heap
+        """
+        queued = self.entries.pop(request_id, None)
+        if queued is not None:
+            queued[1][-1] = None
+        self.waiters.pop(request_id, None)
+        # compact the heap once removed entries dominate it, so it stays O(queued requests)
+        if len(self.heap) > 2 * len(self.entries) + 64:
+            self.heap = [entry for entry in self.heap if entry[-1] is not None]
+            heapq.heapify(self.heap)
+
+    def peek(self) -> Optional[str]:
+        while self.heap and self.heap[0][-1] is None:
+            heapq.heappop(self.heap)
+        if self.heap:
+            return self.heap[0][-1]
+        return None
+
+    def pop(self) -> Optional[str]:
+        request_id = self.peek()
+        if request_id is not None:
+            heapq.heappop(self.heap)
+            self.entries.pop(request_id, None)
+        return request_id
+
+
 class Scheduler:
+    """
+    Priority queue per model group, for `Router.schedule_acompletion`.
+
+    - healthy deployments available: the request is processed immediately
+    - else: 1 queued request of the model group is released every `polling_interval` - or as soon as the released
+      requests are done - in priority order. With `SCHEDULER_PRIORITY_AGING_SECONDS` set, waiting requests gain 1
+      priority level per that many seconds waited, so low priority requests aren't starved under sustained load.
+    - `redis_cache` set: the queue order is shared by every instance - queued requests are kept in a redis sorted set
+      per model group. An instance releasing a request pops it from the sorted set (ZPOPMIN), and publishes the release
+      on redis pub/sub if the request is queued on another instance.
+    """
+
     cache: DualCache
 
     def __init__(
         self,
         polling_interval: Optional[float] = None,
         redis_cache: Optional[RedisCache] = None,
+        priority_aging_seconds: float = SCHEDULER_PRIORITY_AGING_SECONDS,
     ):
         """
-        polling_interval: float or null - frequency of polling queue. Default is 3ms.
+        polling_interval: float or null - with no healthy deployments, 1 queued request is released per interval. Default is 30ms.
+        priority_aging_seconds: a queued request gains 1 priority level per this many seconds waited. 0 = strict priority (default).
         """
         self.queue: list = []
         default_in_memory_ttl: Optional[float] = None
@@ -43,17 +129,349 @@ class Scheduler:
         )
         self.polling_interval = (
             polling_interval or DEFAULT_POLLING_INTERVAL
-        )  # default to 3ms
+        )  # default to 30ms
+        self.priority_aging_seconds = priority_aging_seconds
+
+        self.model_group_queues: Dict[str, ModelGroupQueue] = {}
+        self._sequence_number = itertools.count()
+
+        self.redis_cache = redis_cache
+        self.release_channel: Optional[PubSubChannel] = None
+        if redis_cache is not None:
+            self.release_channel = RedisPubSubChannel(
+                redis_cache=redis_cache, channel=SCHEDULER_RELEASE_CHANNEL
+            )
+        self._release_channel_subscribed = False
+        self._background_tasks: Set[asyncio.Task] = set()
+
+    def _get_model_group_queue(self, model_name: str) -> ModelGroupQueue:
+        model_group_queue = self.model_group_queues.get(model_name)
+        if model_group_queue is None:
+            model_group_queue = self.model_group_queues[model_name] = ModelGroupQueue()
+        return model_group_queue
+
+    def _get_score(self, priority: int, enqueued_at: float) -> float:
+        """
+        Lower is served first. With aging, a request's priority counts as `priority_aging_seconds` seconds of waiting
+        per level - i.e. its effective priority improves by 1 level per `priority_aging_seconds` waited.
+        """
+        if self.priority_aging_seconds > 0:
+            return priority * self.priority_aging_seconds + enqueued_at
+        return priority * 1e10 + enqueued_at  # strict priority, FIFO within a priority
 
     async def add_request(self, request: FlowItem):
         # We use the priority directly, as lower values indicate higher priority
-        # get the queue
-        queue = await self.get_queue(model_name=request.model_name)
-        # update the queue
-        heapq.heappush(queue, (request.priority, request.request_id))
+        model_group_queue = self._get_model_group_queue(request.model_name)
+        score = self._get_score(priority=request.priority, enqueued_at=time.time())
+        model_group_queue.push(
+            priority=request.priority,
+            score=score,
+            sequence_number=next(self._sequence_number),
+            request_id=request.request_id,
+        )
+        model_group_queue.waiters[request.request_id] = (
+            asyncio.get_running_loop().create_future()
+        )
+        if self.redis_cache is not None:
+            await self._subscribe_to_releases()
+            await self._redis_add(
+                model_name=request.model_name, scores={request.request_id: score}
+            )
+
+    async def wait_for_turn(
+        self,
+        request: FlowItem,
+        get_healthy_deployments: GetHealthyDeployments,
+        timeout: float,
+    ) -> bool:
+        """
+        Wait until the request can be processed. The request must have been added with `add_request`.
+
+        - If healthy deployments are available, the request is processed immediately, and any waiting requests are woken up.
+        - Else, 1 request is released every `polling_interval` (sooner once no released request is in flight), in
+          priority order. Deployments are re-checked before each release - once healthy, every waiting request is
+          woken up.
+
+        Returns:
+        - True: request can be processed. The caller must call `release` once the request is done.
+        - False: timed out waiting in the queue
+        """
+        model_group_queue = self._get_model_group_queue(request.model_name)
+        healthy_deployments = await get_healthy_deployments()
+        if len(healthy_deployments) > 0:
+            await self._wake_all(
+                model_name=request.model_name, model_group_queue=model_group_queue
+            )
+            return True
+
+        future = model_group_queue.waiters.get(request.request_id)
+        if future is None:  # not queued, or already woken up
+            return request.request_id not in model_group_queue.entries
+        model_group_queue.get_healthy_deployments = get_healthy_deployments
+        self._start_release_loop(
+            model_name=request.model_name, model_group_queue=model_group_queue
+        )
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            if future.done():  # released right as the timeout fired
+                return True
+            await self._remove(
+                model_name=request.model_name,
+                model_group_queue=model_group_queue,
+                request_ids=[request.request_id],
+            )
+            return False
+        except asyncio.CancelledError:
+            await self._remove(
+                model_name=request.model_name,
+                model_group_queue=model_group_queue,
+                request_ids=[request.request_id],
+            )
+            model_group_queue.in_flight.discard(request.request_id)
+            raise
 
-        # save the queue
-        await self.save_queue(queue=queue, model_name=request.model_name)
+    async def release(
+        self,
+        request: FlowItem,
+        get_healthy_deployments: Optional[GetHealthyDeployments] = None,
+    ) -> None:
+        """
+        Mark a request processed after `wait_for_turn` as done.
+
+        get_healthy_deployments: only called if requests are waiting. If deployments are healthy again, all waiting requests are woken up.
+        """
+        model_group_queue = self._get_model_group_queue(request.model_name)
+        model_group_queue.in_flight.discard(request.request_id)
+        if len(model_group_queue.in_flight) == 0:
+            # nothing in flight - no need to wait for the rest of the polling interval to release the next request
+            self._notify_release_loop(model_group_queue)
+        if len(model_group_queue.waiters) > 0 and get_healthy_deployments is not None:
+            healthy_deployments = await get_healthy_deployments()
+            if len(healthy_deployments) > 0:
+                await self._wake_all(
+                    model_name=request.model_name, model_group_queue=model_group_queue
+                )
+
+    def _resolve(self, model_group_queue: ModelGroupQueue, request_id: str) -> None:
+        future = model_group_queue.waiters.pop(request_id, None)
+        model_group_queue.remove(request_id)
+        if future is not None and not future.done():
+            model_group_queue.in_flight.add(request_id)
+            print_verbose(f"Scheduler - released request_id={request_id}")
+            future.set_result(True)
+
+    async def _wake_all(
+        self, model_name: str, model_group_queue: ModelGroupQueue
+    ) -> None:
+        """Healthy deployments available - every queued request of the model group can be processed"""
+        request_ids = list(model_group_queue.entries.keys())
+        for request_id in request_ids:
+            future = model_group_queue.waiters.pop(request_id, None)
+            model_group_queue.remove(request_id)
+            if future is not None and not future.done():
+                future.set_result(True)
+        self._notify_release_loop(model_group_queue)
+        if request_ids and self.redis_cache is not None:
+            await self._redis_remove(model_name=model_name, request_ids=request_ids)
+
+    async def _remove(
+        self, model_name: str, model_group_queue: ModelGroupQueue, request_ids: List[str]
+    ) -> None:
+        for request_id in request_ids:
+            model_group_queue.remove(request_id)
+        self._notify_release_loop(model_group_queue)
+        if self.redis_cache is not None:
+            await self._redis_remove(model_name=model_name, request_ids=request_ids)
+
+    ##########################################################
+    # Release loop - 1 request per polling_interval, woken early by `release_event`
+    ##########################################################
+
+    def _start_release_loop(
+        self, model_name: str, model_group_queue: ModelGroupQueue
+    ) -> None:
+        if model_group_queue.release_task is None or model_group_queue.release_task.done():
+            model_group_queue.release_event = asyncio.Event()
+            model_group_queue.release_task = asyncio.create_task(
+                self._release_loop(
+                    model_name=model_name, model_group_queue=model_group_queue
+                )
+            )
+
+    async def _release_loop(
+        self, model_name: str, model_group_queue: ModelGroupQueue
+    ) -> None:
+        while len(model_group_queue.waiters) > 0:
+            try:
+                get_healthy_deployments = model_group_queue.get_healthy_deployments
+                if (
+                    get_healthy_deployments is not None
+                    and len(await get_healthy_deployments()) > 0
+                ):
+                    await self._wake_all(
+                        model_name=model_name, model_group_queue=model_group_queue
+                    )
+                else:
+                    await self._release_next(
+                        model_name=model_name, model_group_queue=model_group_queue
+                    )
+            except Exception as e:
+                verbose_router_logger.exception(
+                    "Scheduler - error releasing queued requests for model_group=%s: %s",
+                    model_name,
+                    str(e),
+                )
+            await self._wait_for_release_event(model_group_queue)
+
+    async def _wait_for_release_event(self, model_group_queue: ModelGroupQueue) -> None:
+        """
+        Until the queue changes (requests done / removed / woken up) - at most `polling_interval`
+        """
+        release_event = model_group_queue.release_event
+        if release_event is None:
+            await asyncio.sleep(self.polling_interval)
+            return
+        try:
+            await asyncio.wait_for(release_event.wait(), timeout=self.polling_interval)
+        except asyncio.TimeoutError:
+            pass
+        release_event.clear()
+
+    @staticmethod
+    def _notify_release_loop(model_group_queue: ModelGroupQueue) -> None:
+        if model_group_queue.release_event is not None:
+            model_group_queue.release_event.set()
+
+    async def _release_next(
+        self, model_name: str, model_group_queue: ModelGroupQueue
+    ) -> None:
+        if self.redis_cache is not None:
+            request_id = await self._redis_pop(model_name=model_name)
+            if request_id is not None:
+                if request_id in model_group_queue.waiters:
+                    self._resolve(model_group_queue=model_group_queue, request_id=request_id)
+                else:
+                    await self._publish_release(
+                        model_name=model_name, request_id=request_id
+                    )
+                return
+            # redis queue empty / unreachable - release this instance's next request
+
+        request_id = model_group_queue.peek()
+        if request_id is not None:
+            self._resolve(model_group_queue=model_group_queue, request_id=request_id)
+
+    ##########################################################
+    # Redis queue - shared across instances
+    ##########################################################
+
+    def _get_redis_queue_key(self, model_name: str) -> str:
+        key = "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
+        if self.redis_cache is not None:
+            key = self.redis_cache.check_and_fix_namespace(key=key)
+        return key
+
+    async def _redis_add(self, model_name: str, scores: Dict[str, float]) -> None:
+        if self.redis_cache is None or not scores:
+            return
+        key = self._get_redis_queue_key(model_name)
+        try:
+            client: Any = self.redis_cache.init_async_client()
+            await client.zadd(key, scores, nx=True)
+            await client.expire(key, SCHEDULER_REDIS_QUEUE_TTL_SECONDS)
+        except Exception as e:
+            verbose_router_logger.warning(
+                "Scheduler - unable to add requests to redis queue %s: %s", key, str(e)
+            )
+
+    async def _redis_remove(self, model_name: str, request_ids: List[str]) -> None:
+        if self.redis_cache is None or not request_ids:
+            return
+        key = self._get_redis_queue_key(model_name)
+        try:
+            client: Any = self.redis_cache.init_async_client()
+            await client.zrem(key, *request_ids)
+        except Exception as e:
+            verbose_router_logger.warning(
+                "Scheduler - unable to remove requests from redis queue %s: %s",
+                key,
+                str(e),
+            )
+
+    async def _redis_pop(self, model_name: str) -> Optional[str]:
+        if self.redis_cache is None:
+            return None
+        key = self._get_redis_queue_key(model_name)
+        try:
+            client: Any = self.redis_cache.init_async_client()
+            popped = await client.zpopmin(key, 1)
+        except Exception as e:
+            verbose_router_logger.warning(
+                "Scheduler - unable to pop from redis queue %s: %s", key, str(e)
+            )
+            return None
+        if not popped:
+            return None
+        request_id = popped[0][0]
+        if isinstance(request_id, bytes):
+            request_id = request_id.decode("utf-8")
+        return request_id
+
+    async def _subscribe_to_releases(self) -> None:
+        if self.release_channel is None or self._release_channel_subscribed:
+            return
+        self._release_channel_subscribed = True
+        await self.release_channel.subscribe(
+            on_message=self._handle_release_message,
+            on_reset=self._requeue_waiting_requests,
+        )
+
+    async def _publish_release(self, model_name: str, request_id: str) -> None:
+        if self.release_channel is None:
+            return
+        try:
+            await self.release_channel.publish(
+                {"model_name": model_name, "request_id": request_id}
+            )
+        except Exception as e:
+            verbose_router_logger.warning(
+                "Scheduler - unable to publish release of request_id=%s: %s",
+                request_id,
+                str(e),
+            )
+
+    def _handle_release_message(self, message: Any) -> None:
+        if not isinstance(message, dict):
+            return
+        model_group_queue = self.model_group_queues.get(message.get("model_name", ""))
+        request_id = message.get("request_id")
+        if model_group_queue is not None and request_id in model_group_queue.waiters:
+            self._resolve(model_group_queue=model_group_queue, request_id=request_id)
+
+    def _requeue_waiting_requests(self) -> None:
+        """
+        Release messages may have been missed (pub/sub reconnect) - put this instance's waiting requests back in the
+        redis queue, so they're released again
+        """
+        for model_name, model_group_queue in self.model_group_queues.items():
+            scores = {
+                request_id: model_group_queue.entries[request_id][1][0]
+                for request_id in model_group_queue.waiters
+                if request_id in model_group_queue.entries
+            }
+            if scores:
+                task = asyncio.create_task(
+                    self._redis_add(model_name=model_name, scores=scores)
+                )
+                # keep a reference until done - the event loop only keeps a weak reference to tasks
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
+    ##########################################################
+    # Polling API (kept for existing callers)
+    ##########################################################
 
     async def poll(self, id: str, model_name: str, health_deployments: list) -> bool:
         """
@@ -67,70 +485,82 @@ class Scheduler:
             * If no healthy deployments available
             * AND request not at the top of queue
         """
-        queue = await self.get_queue(model_name=model_name)
-        if not queue:
+        model_group_queue = self._get_model_group_queue(model_name)
+        if len(model_group_queue) == 0:
             raise Exception(
-                "Incorrectly setup. Queue is invalid. Queue={}".format(queue)
+                "Incorrectly setup. Queue is invalid. Queue={}".format(
+                    await self.get_queue(model_name=model_name)
+                )
             )
 
-        # ------------
-        # Setup values
-        # ------------
-
         print_verbose(f"len(health_deployments): {len(health_deployments)}")
         if len(health_deployments) == 0:
-            print_verbose(f"queue: {queue}, seeking id={id}")
             # Check if the id is at the top of the heap
-            if queue[0][1] == id:
+            if model_group_queue.peek() == id:
                 # Remove the item from the queue
-                heapq.heappop(queue)
+                model_group_queue.pop()
+                model_group_queue.waiters.pop(id, None)
                 print_verbose(f"Popped id: {id}")
                 return True
             else:
                 return False
 
+        model_group_queue.remove(id)
         return True
 
     async def peek(self, id: str, model_name: str, health_deployments: list) -> bool:
         """Return if the id is at the top of the queue. Don't pop the value from heap."""
-        queue = await self.get_queue(model_name=model_name)
-        if not queue:
+        model_group_queue = self._get_model_group_queue(model_name)
+        if len(model_group_queue) == 0:
             raise Exception(
-                "Incorrectly setup. Queue is invalid. Queue={}".format(queue)
+                "Incorrectly setup. Queue is invalid. Queue={}".format(
+                    await self.get_queue(model_name=model_name)
+                )
             )
 
-        # ------------
-        # Setup values
-        # ------------
-
         # Check if the id is at the top of the heap
-        if queue[0][1] == id:
-            return True
-
-        return False
+        return model_group_queue.peek() == id
 
-    def get_queue_status(self):
-        """Get the status of items in the queue"""
-        return self.queue
+    def get_queue_status(self) -> Dict[str, SchedulerModelGroupQueueStatus]:
+        """Get the queue depth of each model group, by priority"""
+        queue_status: Dict[str, SchedulerModelGroupQueueStatus] = {}
+        for model_name, model_group_queue in self.model_group_queues.items():
+            queue_depth_by_priority: Dict[int, int] = {}
+            for priority, _ in model_group_queue.entries.values():
+                queue_depth_by_priority[priority] = (
+                    queue_depth_by_priority.get(priority, 0) + 1
+                )
+            queue_status[model_name] = SchedulerModelGroupQueueStatus(
+                queue_depth=len(model_group_queue),
+                queue_depth_by_priority=queue_depth_by_priority,
+                waiting_requests=len(model_group_queue.waiters),
+                in_flight_requests=len(model_group_queue.in_flight),
+            )
+        return queue_status
 
     async def get_queue(self, model_name: str) -> list:
         """
-        Return a queue for that specific model group
+        Return a queue for that specific model group, as a list of (priority, request_id) in release order
         """
-        if self.cache is not None:
-            _cache_key = "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
-            response = await self.cache.async_get_cache(key=_cache_key)
-            if response is None or not isinstance(response, list):
-                return []
-            elif isinstance(response, list):
-                return response
-        return self.queue
+        model_group_queue = self.model_group_queues.get(model_name)
+        if model_group_queue is None:
+            return []
+        queued = sorted(model_group_queue.entries.values(), key=lambda item: item[1])
+        return [(priority, entry[-1]) for priority, entry in queued]
 
     async def save_queue(self, queue: list, model_name: str) -> None:
         """
-        Save the updated queue of the model group
+        Replace the queue of the model group with a list of (priority, request_id)
         """
-        if self.cache is not None:
-            _cache_key = "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
-            await self.cache.async_set_cache(key=_cache_key, value=queue)
+        model_group_queue = self._get_model_group_queue(model_name)
+        for request_id in list(model_group_queue.entries.keys()):
+            model_group_queue.remove(request_id)
+        enqueued_at = time.time()
+        for priority, request_id in queue:
+            model_group_queue.push(
+                priority=priority,
+                score=self._get_score(priority=priority, enqueued_at=enqueued_at),
+                sequence_number=next(self._sequence_number),
+                request_id=request_id,
+            )
         return None
@@ -50,6 +50,19 @@ class RedisPipelineSetOperation(TypedDict):
     ttl: Optional[int]
 
 
+class InMemoryCacheStats(TypedDict):
+    """
+    TypeDict for the hit / miss / eviction counters of an InMemoryCache
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    num_items: int
+    size_in_bytes: int
+
+
 DynamicCacheControl = TypedDict(
     "DynamicCacheControl",
     {
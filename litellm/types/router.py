@@ -692,6 +692,9 @@ class RouterGeneralSettings(BaseModel):
     pass_through_all_models: bool = Field(
         default=False
     )  # if passed a model not llm_router model list, pass through the request to litellm.acompletion/embedding
+    push_cooldown_updates: bool = Field(
+        default=False
+    )  # publish deployment cooldowns on redis pub/sub, instead of every router reading them from redis on each request
 
 
 class RouterRateLimitErrorBasic(ValueError):
@@ -1,7 +1,17 @@
 from enum import Enum
+from typing import Dict
+
+from typing_extensions import TypedDict
 
 
 class DefaultPriorities(Enum):
     High = 0
     Medium = 128
     Low = 255
+
+
+class SchedulerModelGroupQueueStatus(TypedDict):
+    queue_depth: int
+    queue_depth_by_priority: Dict[int, int]
+    waiting_requests: int
+    in_flight_requests: int
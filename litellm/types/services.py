@@ -38,6 +38,8 @@ class ServiceTypes(str, enum.Enum):
     # spend update queue - current spend of key, user, team
     IN_MEMORY_SPEND_UPDATE_QUEUE = "in_memory_spend_update_queue"
     REDIS_SPEND_UPDATE_QUEUE = "redis_spend_update_queue"
+    # spend log queue - rows of LiteLLM_SpendLogs waiting to be written
+    IN_MEMORY_SPEND_LOG_QUEUE = "in_memory_spend_log_queue"
 
 
 class ServiceConfig(TypedDict):
@@ -91,6 +93,9 @@ DEFAULT_SERVICE_CONFIGS = {
         "metrics": [ServiceMetrics.GAUGE]
     },
     ServiceTypes.REDIS_SPEND_UPDATE_QUEUE.value: {"metrics": [ServiceMetrics.GAUGE]},
+    ServiceTypes.IN_MEMORY_SPEND_LOG_QUEUE.value: {
+        "metrics": [ServiceMetrics.GAUGE]
+    },
 }
 
 
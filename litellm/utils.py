@@ -110,6 +110,7 @@ from litellm.litellm_core_utils.get_llm_provider_logic import (
     _is_non_openai_azure_model,
     get_llm_provider,
 )
+from litellm.litellm_core_utils.get_model_cost_map import model_cost_map_refresher
 from litellm.litellm_core_utils.get_supported_openai_params import (
     get_supported_openai_params,
 )
@@ -131,6 +132,10 @@ from litellm.litellm_core_utils.llm_response_utils.get_headers import (
 from litellm.litellm_core_utils.llm_response_utils.response_metadata import (
     ResponseMetadata,
 )
+from litellm.litellm_core_utils.model_info_index import (
+    ModelInfoLookup,
+    model_info_index,
+)
 from litellm.litellm_core_utils.prompt_templates.common_utils import (
     _parse_content_for_reasoning,
 )
@@ -868,7 +873,8 @@ async def _client_async_logging_helper(
         GLOBAL_LOGGING_WORKER.ensure_initialized_and_enqueue(
             async_coroutine=logging_obj.async_success_handler(
                 result=result, start_time=start_time, end_time=end_time
-            )
+            ),
+            ordering_key=logging_obj.litellm_call_id,
         )
 
         ################################################
@@ -2345,7 +2351,10 @@ def register_model(model_cost: Union[str, dict]):  # noqa: PLR0915
             model_cost_key = key
         ## override / add new keys to the existing model cost dictionary
         updated_dictionary = _update_dictionary(existing_model, value)
-        litellm.model_cost.setdefault(model_cost_key, {}).update(updated_dictionary)
+        model_cost_map_refresher.register_model_cost(
+            model_cost_key=model_cost_key, model_info=updated_dictionary
+        )
+        model_info_index.invalidate([model_cost_key])
         verbose_logger.debug(
             f"added/updated model={model_cost_key} in litellm.model_cost: {model_cost_key}"
         )
@@ -4802,9 +4811,10 @@ def _get_model_info_helper(  # noqa: PLR0915
     Helper for 'get_model_info'. Separated out to avoid infinite loop caused by returning 'supported_openai_param's
     """
     try:
-        azure_llms = {**litellm.azure_llms, **litellm.azure_embedding_models}
-        if model in azure_llms:
-            model = azure_llms[model]
+        if model in litellm.azure_embedding_models:
+            model = litellm.azure_embedding_models[model]
+        elif model in litellm.azure_llms:
+            model = litellm.azure_llms[model]
         if custom_llm_provider is not None and custom_llm_provider == "vertex_ai_beta":
             custom_llm_provider = "vertex_ai"
         if custom_llm_provider is not None and custom_llm_provider == "vertex_ai":
@@ -4815,6 +4825,23 @@ def _get_model_info_helper(  # noqa: PLR0915
             elif model + "@latest" in litellm.vertex_ai_ai21_models:
                 model = model + "@latest"
         ##########################
+        model_cost = litellm.model_cost
+        lookup_custom_llm_provider = custom_llm_provider
+        lookup = model_info_index.get_lookup(
+            model_cost=model_cost, model=model, custom_llm_provider=custom_llm_provider
+        )
+        if lookup is not None:
+            if lookup.key is None:
+                custom_llm_provider = lookup.custom_llm_provider
+                raise ValueError(
+                    "This model isn't mapped yet. Add it here - https://github.com/BerriAI/litellm/blob/main/model_prices_and_context_window.json"
+                )
+            indexed_model_info = model_info_index.get_model_info(
+                model_cost=model_cost, key=lookup.key
+            )
+            if indexed_model_info is not None:
+                return indexed_model_info
+        ##########################
         potential_model_names = _get_potential_model_names(
             model=model, custom_llm_provider=custom_llm_provider
         )
@@ -4907,6 +4934,23 @@ def _get_model_info_helper(  # noqa: PLR0915
                 ):
                     _model_info = None
 
+            lookup = ModelInfoLookup(
+                key=key if _model_info is not None else None,
+                custom_llm_provider=custom_llm_provider,
+                potential_model_names=(
+                    combined_model_name,
+                    model,
+                    combined_stripped_model_name,
+                    stripped_model_name,
+                    split_model,
+                ),
+            )
+            model_info_index.add_lookup(
+                model_cost=model_cost,
+                model=model,
+                custom_llm_provider=lookup_custom_llm_provider,
+                lookup=lookup,
+            )
             if _model_info is None or key is None:
                 raise ValueError(
                     "This model isn't mapped yet. Add it here - https://github.com/BerriAI/litellm/blob/main/model_prices_and_context_window.json"
@@ -4936,7 +4980,7 @@ def _get_model_info_helper(  # noqa: PLR0915
                 )
                 _output_cost_per_token = 0
 
-            return ModelInfoBase(
+            model_info = ModelInfoBase(
                 key=key,
                 max_tokens=_model_info.get("max_tokens", None),
                 max_input_tokens=_model_info.get("max_input_tokens", None),
@@ -5060,6 +5104,12 @@ def _get_model_info_helper(  # noqa: PLR0915
                     "annotation_cost_per_page", None
                 ),
             )
+            # without a litellm_provider, the model info depends on the requested provider
+            if "litellm_provider" in _model_info:
+                model_info_index.add_model_info(
+                    model_cost=model_cost, key=key, model_info=model_info
+                )
+            return model_info
     except Exception as e:
         verbose_logger.debug(f"Error getting model info: {e}")
         if "OllamaError" in str(e):
@@ -6437,7 +6487,7 @@ class AvailableModelsCache(InMemoryCache):
         """Get cached model info"""
         # Check if environment has changed
         if litellm_params is None and self._check_env_changed():
-            self.cache_dict.clear()
+            self.flush_cache()
             return None
 
         cache_key = self._get_cache_key(custom_llm_provider, litellm_params)
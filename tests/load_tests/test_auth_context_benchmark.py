@@ -0,0 +1,244 @@
+"""
+Virtual key auth lookups: per-object (key, user, team, team member, end user - 1 cache / db call each) vs `get_auth_context`
+(1 cache batch get, else 1 joined query).
+
+- cold: nothing cached
+- redis warm: new instance - in-memory cache empty, objects cached in redis (key objects aren't json - in-memory only)
+- warm: everything in the in-memory cache
+
+Simulated redis / db latency per round trip.
+
+Run with `pytest tests/load_tests/test_auth_context_benchmark.py -s`
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.dual_cache import DualCache
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.proxy._types import (
+    LiteLLM_EndUserTable,
+    LiteLLM_TeamMembership,
+    LiteLLM_TeamTable,
+    LiteLLM_UserTable,
+    LiteLLM_VerificationTokenView,
+)
+from litellm.proxy.auth.auth_checks import (
+    get_end_user_object,
+    get_key_object,
+    get_team_object,
+    get_user_object,
+)
+from litellm.proxy.auth.auth_context import get_auth_context
+
+NUM_REQUESTS = 50
+REDIS_LATENCY = 0.001  # 1ms per round trip
+DB_LATENCY = 0.005  # 5ms per query
+PHASES = ("cold", "redis warm", "warm")
+
+
+class FakeRedisCache:
+    def __init__(self):
+        self.store: dict = {}
+        self.round_trips = 0
+
+    async def _round_trip(self):
+        self.round_trips += 1
+        await asyncio.sleep(REDIS_LATENCY)
+
+    def _set(self, key, value):
+        try:
+            self.store[key] = json.dumps(value)
+        except TypeError:  # like RedisCache, non-json values aren't stored
+            pass
+
+    async def async_get_cache(self, key, parent_otel_span=None, **kwargs):
+        await self._round_trip()
+        value = self.store.get(key)
+        return json.loads(value) if value is not None else None
+
+    async def async_batch_get_cache(self, key_list, parent_otel_span=None, **kwargs):
+        await self._round_trip()
+        return {
+            key: json.loads(self.store[key]) if key in self.store else None
+            for key in key_list
+        }
+
+    async def async_set_cache(self, key, value, **kwargs):
+        await self._round_trip()
+        self._set(key, value)
+
+    async def async_set_cache_pipeline(self, cache_list, ttl=None, **kwargs):
+        await self._round_trip()
+        for key, value in cache_list:
+            self._set(key, value)
+
+
+class FakePrismaClient:
+    def __init__(self):
+        self.queries = 0
+        self.db = MagicMock()
+        self.db.query_first = AsyncMock(side_effect=self._query_first)
+        self.db.litellm_usertable.find_unique = AsyncMock(
+            side_effect=self._find_user
+        )
+        self.db.litellm_teamtable.find_unique = AsyncMock(
+            side_effect=self._find_team
+        )
+        self.db.litellm_teammembership.find_first = AsyncMock(
+            side_effect=self._find_team_membership
+        )
+        self.db.litellm_endusertable.find_unique = AsyncMock(
+            side_effect=self._find_end_user
+        )
+
+    async def _query(self):
+        self.queries += 1
+        await asyncio.sleep(DB_LATENCY)
+
+    async def get_data(self, token, **kwargs):
+        await self._query()
+        i = token.split("-")[-1]
+        return LiteLLM_VerificationTokenView(
+            token=token, user_id=f"user-{i}", team_id=f"team-{i}", team_member_spend=0.0
+        )
+
+    async def _find_user(self, where, **kwargs):
+        await self._query()
+        return LiteLLM_UserTable(user_id=where["user_id"])
+
+    async def _find_team(self, where, **kwargs):
+        await self._query()
+        return LiteLLM_TeamTable(team_id=where["team_id"])
+
+    async def _find_team_membership(self, where, **kwargs):
+        await self._query()
+        return LiteLLM_TeamMembership(**where, litellm_budget_table=None)
+
+    async def _find_end_user(self, where, **kwargs):
+        await self._query()
+        return LiteLLM_EndUserTable(user_id=where["user_id"], blocked=False)
+
+    async def _query_first(self, query, hashed_token, end_user_id):
+        await self._query()
+        i = hashed_token.split("-")[-1]
+        return {
+            "token": hashed_token,
+            "user_id": f"user-{i}",
+            "team_id": f"team-{i}",
+            "team_member_spend": 0.0,
+            "team_models": [],
+            "team_blocked": False,
+            "team_members_with_roles": None,
+            "auth_context_user": {"user_id": f"user-{i}"},
+            "auth_context_team": {"team_id": f"team-{i}"},
+            "auth_context_team_membership": {
+                "user_id": f"user-{i}",
+                "team_id": f"team-{i}",
+            },
+            "auth_context_end_user": {"user_id": end_user_id, "blocked": False},
+        }
+
+
+async def _per_object_auth(i: int, prisma_client, cache: DualCache):
+    key = await get_key_object(
+        hashed_token=f"token-{i}", prisma_client=prisma_client, user_api_key_cache=cache
+    )
+    await get_user_object(
+        user_id=key.user_id,
+        prisma_client=prisma_client,
+        user_api_key_cache=cache,
+        user_id_upsert=False,
+    )
+    await get_team_object(
+        team_id=key.team_id, prisma_client=prisma_client, user_api_key_cache=cache
+    )
+    team_member_cache_key = f"{key.team_id}_{key.user_id}"
+    if await cache.async_get_cache(key=team_member_cache_key) is None:
+        team_membership = await prisma_client.db.litellm_teammembership.find_first(
+            where={"user_id": key.user_id, "team_id": key.team_id}
+        )
+        await cache.async_set_cache(
+            key=team_member_cache_key, value=team_membership, ttl=5
+        )
+    await get_end_user_object(
+        end_user_id=f"end-user-{i}",
+        prisma_client=prisma_client,
+        user_api_key_cache=cache,
+        route="/chat/completions",
+    )
+
+
+async def _auth_context_auth(i: int, prisma_client, cache: DualCache):
+    await get_auth_context(
+        hashed_token=f"token-{i}",
+        end_user_id=f"end-user-{i}",
+        prisma_client=prisma_client,
+        user_api_key_cache=cache,
+    )
+    # the existing lookups, served from the in-memory cache
+    await _per_object_auth(i, prisma_client, cache)
+
+
+def _new_cache(redis_cache: FakeRedisCache) -> DualCache:
+    return DualCache(
+        in_memory_cache=InMemoryCache(max_size_in_memory=10_000),
+        redis_cache=redis_cache,  # type: ignore
+    )
+
+
+async def _run(auth_fn, run_id: str):
+    redis_cache = FakeRedisCache()
+    prisma_client = FakePrismaClient()
+    results = {}
+    cache = _new_cache(redis_cache)
+    for phase in PHASES:
+        if phase != "warm":
+            cache = _new_cache(redis_cache)  # new instance
+        redis_cache.round_trips = 0
+        prisma_client.queries = 0
+        start = time.perf_counter()
+        for i in range(NUM_REQUESTS):
+            await auth_fn(f"{run_id}-{i}", prisma_client, cache)
+        results[phase] = (
+            (time.perf_counter() - start) / NUM_REQUESTS * 1000,
+            prisma_client.queries / NUM_REQUESTS,
+            redis_cache.round_trips / NUM_REQUESTS,
+        )
+    return results
+
+
+@pytest.mark.asyncio
+async def test_auth_context_benchmark():
+    per_object = await _run(_per_object_auth, "per-object")
+    auth_context = await _run(_auth_context_auth, "auth-context")
+
+    print(
+        f"\n{NUM_REQUESTS} requests, {REDIS_LATENCY * 1000:.0f}ms redis / {DB_LATENCY * 1000:.0f}ms db latency"
+    )
+    for phase in PHASES:
+        for name, results in (
+            ("per-object lookups", per_object),
+            ("get_auth_context", auth_context),
+        ):
+            ms, queries, round_trips = results[phase]
+            print(
+                f"{phase:>10} | {name:<18} | {ms:6.2f} ms/request | "
+                f"{queries:.1f} db queries | {round_trips:.1f} redis round trips"
+            )
+
+    assert auth_context["cold"][1] == 1
+    assert auth_context["cold"][0] < per_object["cold"][0]
+    assert auth_context["redis warm"][1] == 1
+    assert auth_context["redis warm"][0] < per_object["redis warm"][0]
+    assert auth_context["warm"][1:] == (0, 0)
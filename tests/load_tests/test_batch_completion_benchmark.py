@@ -0,0 +1,105 @@
+"""
+batch_completion (one thread + sync client call per prompt) vs abatch_completion (asyncio, shared async client).
+
+Runs against a local mock OpenAI server (uvicorn, in a background thread) that answers every
+/chat/completions request after a fixed latency.
+
+Run with `pytest tests/load_tests/test_batch_completion_benchmark.py -s`
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm import abatch_completion, batch_completion
+
+NUM_PROMPTS = 500
+SERVER_LATENCY_SECONDS = 0.05
+
+MOCK_RESPONSE = {
+    "id": "chatcmpl-123",
+    "object": "chat.completion",
+    "created": 1677652288,
+    "model": "gpt-4o-mini",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hello there"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 9, "completion_tokens": 2, "total_tokens": 11},
+}
+
+
+@pytest.fixture(scope="module")
+def mock_openai_server():
+    uvicorn = pytest.importorskip("uvicorn")
+    from fastapi import FastAPI
+
+    app = FastAPI()
+
+    @app.post("/chat/completions")
+    async def chat_completions():
+        await asyncio.sleep(SERVER_LATENCY_SECONDS)
+        return MOCK_RESPONSE
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="error")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{port}"
+    server.should_exit = True
+    thread.join()
+
+
+def _messages():
+    return [[{"role": "user", "content": f"prompt {i}"}] for i in range(NUM_PROMPTS)]
+
+
+def test_batch_completion_throughput(monkeypatch, mock_openai_server):
+    # same transport (httpx) for both runs
+    monkeypatch.setattr(litellm, "disable_aiohttp_transport", True)
+    kwargs = {
+        "model": "openai/gpt-4o-mini",
+        "api_base": mock_openai_server,
+        "api_key": "sk-1234",
+    }
+
+    start = time.perf_counter()
+    thread_responses = batch_completion(messages=_messages(), **kwargs)
+    thread_seconds = time.perf_counter() - start
+
+    async def run_async():
+        start = time.perf_counter()
+        responses = await abatch_completion(
+            messages=_messages(), max_concurrency=100, **kwargs
+        )
+        return responses, time.perf_counter() - start
+
+    async_responses, async_seconds = asyncio.run(run_async())
+
+    assert all(isinstance(r, litellm.ModelResponse) for r in thread_responses)
+    assert all(isinstance(r, litellm.ModelResponse) for r in async_responses)
+    print(
+        f"\n{NUM_PROMPTS} prompts, {SERVER_LATENCY_SECONDS * 1000:.0f}ms server latency: "
+        f"batch_completion (threads) {thread_seconds:.2f}s ({NUM_PROMPTS / thread_seconds:.0f} req/s), "
+        f"abatch_completion (max_concurrency=100) {async_seconds:.2f}s ({NUM_PROMPTS / async_seconds:.0f} req/s)"
+    )
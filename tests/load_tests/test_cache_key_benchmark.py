@@ -0,0 +1,76 @@
+"""
+Cache.get_cache_key over message sizes.
+
+The cache key is hashed incrementally as params are serialized, and for multi-turn conversations the hash state after
+the previous turn is reused, so each turn only hashes its new messages. The digest is the same as hashing the
+concatenated `"{param}: {value}"` string.
+
+Run with `pytest tests/load_tests/test_cache_key_benchmark.py -s`
+"""
+
+import hashlib
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.cache_key_hasher import message_prefix_hash_cache
+from litellm.caching.caching import Cache
+
+NUM_TURNS = 50
+NUM_REPEATS = 5
+
+
+def _get_concatenated_cache_key(**kwargs) -> str:
+    cache_key = ""
+    for param, value in kwargs.items():
+        cache_key += f"{str(param)}: {str(value)}"
+    return hashlib.sha256(cache_key.encode()).hexdigest()
+
+
+def _time_conversation(get_cache_key, conversation: list) -> float:
+    """time to compute the cache key of every turn of the conversation"""
+    start = time.perf_counter()
+    for turn in range(1, len(conversation) + 1):
+        get_cache_key(model="gpt-4o", messages=conversation[:turn], temperature=0.2)
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("message_size", [100, 10_000, 100_000])
+def test_cache_key_multi_turn_conversation(message_size):
+    cache = Cache()
+    # ~4 chars per token - 100_000 chars is a ~25k token message
+    conversation = [
+        {
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": f"{i} " + "lorem ipsum " * (message_size // 12),
+        }
+        for i in range(NUM_TURNS)
+    ]
+
+    concatenated_time = min(
+        _time_conversation(_get_concatenated_cache_key, conversation)
+        for _ in range(NUM_REPEATS)
+    )
+    incremental_times = []
+    for _ in range(NUM_REPEATS):
+        message_prefix_hash_cache.clear()
+        incremental_times.append(_time_conversation(cache.get_cache_key, conversation))
+    incremental_time = min(incremental_times)
+
+    print(
+        f"\n{NUM_TURNS} turns, {message_size:,} chars per message - concatenated: "
+        f"{concatenated_time * 1000:,.2f} ms, incremental: {incremental_time * 1000:,.2f} ms"
+    )
+    assert cache.get_cache_key(
+        model="gpt-4o", messages=conversation, temperature=0.2
+    ) == _get_concatenated_cache_key(
+        model="gpt-4o", messages=conversation, temperature=0.2
+    )
+    if message_size >= 10_000:
+        assert incremental_time < concatenated_time
@@ -0,0 +1,127 @@
+"""
+Cost of `CooldownCache.async_get_active_cooldowns` - called with every deployment id on each routing decision - with
+5k deployments, 5 of them cooling down.
+
+- cache read: redis set, no push updates - builds a key per deployment, batch gets them from the in-memory cache
+  (+ redis every batch cache window)
+- local index, push updates: redis set, cooldowns pushed by other instances
+- local index, no redis
+
+Simulated redis latency per `mget`.
+
+Run with `pytest tests/load_tests/test_cooldown_cache_benchmark.py -s`
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.pubsub import InMemoryPubSubChannel
+from litellm.caching.dual_cache import DualCache
+from litellm.router_utils.cooldown_cache import CooldownCache
+
+NUM_DEPLOYMENTS = 5000
+NUM_COOLDOWNS = 5
+NUM_LOOKUPS = 200
+REDIS_LATENCY = 0.001  # 1ms per mget
+
+
+class FakeRedisCache:
+    def __init__(self):
+        self.cache: dict = {}
+        self.mget_count = 0
+
+    def set_cache(self, key, value, **kwargs):
+        self.cache[key] = value
+
+    async def async_batch_get_cache(self, key_list, **kwargs):
+        self.mget_count += 1
+        await asyncio.sleep(REDIS_LATENCY)
+        return {key: self.cache.get(key) for key in key_list}
+
+
+async def _cooldown_cache(redis_cache, push_updates: bool) -> CooldownCache:
+    cooldown_cache = CooldownCache(
+        cache=DualCache(redis_cache=redis_cache),  # type: ignore
+        default_cooldown_time=60.0,
+        push_updates=push_updates,
+    )
+    if push_updates:
+        cooldown_cache.cooldown_channel = InMemoryPubSubChannel(
+            channel="benchmark-cooldown-updates"
+        )
+        await cooldown_cache.cooldown_channel.subscribe(
+            on_message=cooldown_cache._handle_cooldown_update,
+            on_reset=cooldown_cache._reset_synced_model_ids,
+        )
+    return cooldown_cache
+
+
+async def _timed_lookups(cooldown_cache: CooldownCache, model_ids: list):
+    start = time.perf_counter()
+    for _ in range(NUM_LOOKUPS):
+        active_cooldowns = await cooldown_cache.async_get_active_cooldowns(
+            model_ids=model_ids, parent_otel_span=None
+        )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return active_cooldowns, elapsed_ms / NUM_LOOKUPS
+
+
+@pytest.mark.asyncio
+async def test_cooldown_cache_benchmark():
+    model_ids = [f"deployment-{i}" for i in range(NUM_DEPLOYMENTS)]
+    cooled_down = model_ids[:: NUM_DEPLOYMENTS // NUM_COOLDOWNS]
+
+    results = []
+    for name, use_redis, push_updates in (
+        ("cache read", True, False),
+        ("local index, push", True, True),
+        ("local index, no redis", False, False),
+    ):
+        redis_cache = FakeRedisCache() if use_redis else None
+        cooldown_cache = await _cooldown_cache(redis_cache, push_updates)
+        # another instance sets the cooldowns
+        publisher = await _cooldown_cache(redis_cache, push_updates)
+        if redis_cache is None:
+            publisher = cooldown_cache
+        await cooldown_cache.async_get_active_cooldowns(model_ids, None)  # warm up
+        for model_id in cooled_down:
+            publisher.add_deployment_to_cooldown(
+                model_id=model_id,
+                original_exception=Exception("rate limited"),
+                exception_status=429,
+                cooldown_time=60.0,
+            )
+        await asyncio.gather(*publisher._publish_tasks)
+
+        active_cooldowns, ms_per_lookup = await _timed_lookups(
+            cooldown_cache, model_ids
+        )
+        results.append(
+            (
+                name,
+                ms_per_lookup,
+                redis_cache.mget_count if redis_cache is not None else 0,
+            )
+        )
+        assert sorted(model_id for model_id, _ in active_cooldowns) == sorted(
+            cooled_down
+        )
+        for channel_owner in (cooldown_cache, publisher):
+            if channel_owner.cooldown_channel is not None:
+                await channel_owner.cooldown_channel.close()
+
+    print(
+        f"\n{NUM_DEPLOYMENTS} deployments, {NUM_COOLDOWNS} cooling down, {NUM_LOOKUPS} lookups"
+    )
+    for name, ms_per_lookup, mget_count in results:
+        print(
+            f"{name:<22} | {ms_per_lookup:8.3f} ms / lookup | {mget_count:>4} redis mgets"
+        )
@@ -0,0 +1,191 @@
+"""
+Spend update write path benchmark.
+
+- Daily spend rows are written with 1 `INSERT ... ON CONFLICT DO UPDATE` per batch, instead of 1 upsert per row.
+  sqlite stands in for postgres here - both support the same upsert syntax.
+- Spend updates are aggregated at enqueue time, so the in-memory queues hold O(entities), not O(requests).
+
+Run with `pytest tests/load_tests/test_db_spend_update_benchmark.py -s`
+"""
+
+import os
+import re
+import sqlite3
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.proxy._types import Litellm_EntityType
+from litellm.proxy.db.db_spend_update_writer import DBSpendUpdateWriter
+from litellm.proxy.db.db_transaction_queue.daily_spend_update_queue import (
+    DailySpendUpdateQueue,
+)
+from litellm.proxy.db.db_transaction_queue.spend_update_queue import SpendUpdateQueue
+
+NUM_ROWS = 2_000
+NUM_UPDATES = 20_000
+NUM_ENTITIES = 50
+DB_ROUND_TRIP_LATENCY = 0.0005  # 0.5ms, same-region postgres
+
+COLUMNS = [
+    "user_id",
+    "date",
+    "api_key",
+    "model",
+    "custom_llm_provider",
+    "mcp_namespaced_tool_name",
+    "model_group",
+    "prompt_tokens",
+    "completion_tokens",
+    "cache_read_input_tokens",
+    "cache_creation_input_tokens",
+    "spend",
+    "api_requests",
+    "successful_requests",
+    "failed_requests",
+]
+INCREMENT_COLUMNS = COLUMNS[7:]
+
+
+def _create_table() -> sqlite3.Connection:
+    connection = sqlite3.connect(":memory:")
+    connection.execute(
+        'CREATE TABLE "LiteLLM_DailyUserSpend" ('
+        "id TEXT PRIMARY KEY, user_id TEXT, date TEXT, api_key TEXT, model TEXT, custom_llm_provider TEXT, "
+        "mcp_namespaced_tool_name TEXT, model_group TEXT, prompt_tokens INTEGER, completion_tokens INTEGER, "
+        "cache_read_input_tokens INTEGER, cache_creation_input_tokens INTEGER, spend REAL, api_requests INTEGER, "
+        "successful_requests INTEGER, failed_requests INTEGER, updated_at TEXT, "
+        "UNIQUE (user_id, date, api_key, model, custom_llm_provider, mcp_namespaced_tool_name))"
+    )
+    return connection
+
+
+def _make_transactions() -> list:
+    return [
+        {
+            "user_id": f"user{i}",
+            "date": "2025-01-01",
+            "api_key": "sk-hashed",
+            "model": "gpt-4o",
+            "model_group": "gpt-4o",
+            "custom_llm_provider": "openai",
+            "prompt_tokens": 10,
+            "completion_tokens": 20,
+            "cache_read_input_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "spend": 0.01,
+            "api_requests": 1,
+            "successful_requests": 1,
+            "failed_requests": 0,
+        }
+        for i in range(NUM_ROWS)
+    ]
+
+
+def _row_by_row_upsert(connection: sqlite3.Connection, transactions: list) -> int:
+    query = (
+        f'INSERT INTO "LiteLLM_DailyUserSpend" (id, {", ".join(COLUMNS)}, updated_at) '
+        f"VALUES (?, {', '.join('?' for _ in COLUMNS)}, CURRENT_TIMESTAMP) "
+        "ON CONFLICT (user_id, date, api_key, model, custom_llm_provider, mcp_namespaced_tool_name) "
+        f"DO UPDATE SET {', '.join(f'{c} = {c} + EXCLUDED.{c}' for c in INCREMENT_COLUMNS)}"
+    )
+    for i, transaction in enumerate(transactions):
+        row = {**transaction, "mcp_namespaced_tool_name": ""}
+        connection.execute(query, [str(i), *(row[c] for c in COLUMNS)])
+    connection.commit()
+    return len(transactions)
+
+
+def _bulk_upsert(connection: sqlite3.Connection, transactions: list) -> int:
+    query, params = DBSpendUpdateWriter._get_daily_spend_bulk_upsert_query(
+        table_name="LiteLLM_DailyUserSpend",
+        entity_id_field="user_id",
+        daily_spend_transactions=transactions,
+    )
+    # postgres `$1::text` placeholders -> sqlite `?`, params are numbered in order
+    connection.execute(re.sub(r"\$\d+::\w+", "?", query), params)
+    connection.commit()
+    return 1
+
+
+def test_daily_spend_bulk_upsert():
+    transactions = _make_transactions()
+
+    row_by_row_connection = _create_table()
+    start = time.perf_counter()
+    row_by_row_round_trips = _row_by_row_upsert(row_by_row_connection, transactions)
+    row_by_row_time = time.perf_counter() - start
+
+    bulk_connection = _create_table()
+    start = time.perf_counter()
+    bulk_round_trips = _bulk_upsert(bulk_connection, transactions)
+    # second batch hits the conflict path
+    bulk_round_trips += _bulk_upsert(bulk_connection, transactions)
+    bulk_time = (time.perf_counter() - start) / 2
+    bulk_round_trips //= 2
+
+    # in-process sqlite has no network round trips - add them back, each statement is 1 round trip to postgres
+    row_by_row_total = row_by_row_time + row_by_row_round_trips * DB_ROUND_TRIP_LATENCY
+    bulk_total = bulk_time + bulk_round_trips * DB_ROUND_TRIP_LATENCY
+    print(
+        f"{NUM_ROWS} rows - row by row upsert: {row_by_row_round_trips} round trips, "
+        f"{row_by_row_time * 1000:,.1f} ms + network = {row_by_row_total * 1000:,.1f} ms; "
+        f"bulk upsert: {bulk_round_trips} round trip, "
+        f"{bulk_time * 1000:,.1f} ms + network = {bulk_total * 1000:,.1f} ms"
+    )
+    assert bulk_total < row_by_row_total
+    spend, api_requests = bulk_connection.execute(
+        'SELECT SUM(spend), SUM(api_requests) FROM "LiteLLM_DailyUserSpend"'
+    ).fetchone()
+    assert api_requests == 2 * NUM_ROWS
+    assert spend == pytest.approx(2 * NUM_ROWS * 0.01)
+
+
+@pytest.mark.asyncio
+async def test_spend_update_queue_size():
+    spend_update_queue = SpendUpdateQueue()
+    daily_spend_update_queue = DailySpendUpdateQueue()
+
+    start = time.perf_counter()
+    for i in range(NUM_UPDATES):
+        user_id = f"user{i % NUM_ENTITIES}"
+        await spend_update_queue.add_update(
+            {
+                "entity_type": Litellm_EntityType.USER,
+                "entity_id": user_id,
+                "response_cost": 0.01,
+            }
+        )
+        await daily_spend_update_queue.add_update(
+            {
+                f"{user_id}_2025-01-01_sk-hashed_gpt-4o_openai": {
+                    "spend": 0.01,
+                    "prompt_tokens": 10,
+                    "completion_tokens": 20,
+                    "api_requests": 1,
+                    "successful_requests": 1,
+                    "failed_requests": 0,
+                }
+            }
+        )
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{NUM_UPDATES} updates in {elapsed * 1000:,.1f} ms - spend queue size: "
+        f"{spend_update_queue.update_queue.qsize()}, daily spend queue size: "
+        f"{daily_spend_update_queue.update_queue.qsize()}"
+    )
+    assert spend_update_queue.update_queue.qsize() == NUM_ENTITIES
+    assert daily_spend_update_queue.update_queue.qsize() == NUM_ENTITIES
+
+    aggregated = (
+        await spend_update_queue.flush_and_get_aggregated_db_spend_update_transactions()
+    )
+    assert sum(aggregated["user_list_transactions"].values()) == pytest.approx(
+        NUM_UPDATES * 0.01
+    )
@@ -0,0 +1,58 @@
+"""
+Per-call latency of `get_llm_provider` with and without the memoized provider resolution.
+
+Without the memo (`max_size=0`), every call re-runs the provider prefix / model name routing against the
+prebuilt tables. With it, repeat (model, custom_llm_provider) pairs only pay for the model list freshness check
+and the api_base + api key handling.
+
+Run with `pytest tests/load_tests/test_get_llm_provider_benchmark.py -s`
+"""
+
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.get_llm_provider_logic import (
+    get_llm_provider,
+    llm_provider_resolver,
+)
+
+NUM_CALLS = 50000
+MODELS = [
+    ("gpt-4o", None),
+    ("claude-3-5-sonnet-20240620", None),
+    ("gemini/gemini-1.5-flash", None),
+    ("bedrock/anthropic.claude-3-5-sonnet-20240620-v1:0", None),
+    ("gpt-4o", "azure"),
+    ("cohere/command-r", None),
+]
+
+
+def _us_per_call(fn) -> float:
+    start = time.perf_counter()
+    for i in range(NUM_CALLS):
+        model, custom_llm_provider = MODELS[i % len(MODELS)]
+        fn(model=model, custom_llm_provider=custom_llm_provider)
+    return (time.perf_counter() - start) / NUM_CALLS * 1e6
+
+
+def test_get_llm_provider_latency():
+    get_llm_provider(model="gpt-4o")  # build the provider / model tables
+
+    for name, fn in {
+        "LLMProviderResolver.resolve": llm_provider_resolver.resolve,
+        "get_llm_provider": get_llm_provider,
+    }.items():
+        with patch.object(llm_provider_resolver, "max_size", 0):
+            without_memo = _us_per_call(fn)
+        with_memo = _us_per_call(fn)
+        print(
+            f"\n{name}: {without_memo:.2f}us/call without memo, "
+            f"{with_memo:.2f}us/call with memo ({without_memo / with_memo:.1f}x)"
+        )
+    assert len(llm_provider_resolver._resolutions) >= len(MODELS)
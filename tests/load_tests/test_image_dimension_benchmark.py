@@ -0,0 +1,170 @@
+"""
+Image token counting for high detail image URLs - full download vs Range probe + cache + parallel async prefetch.
+
+The image server is simulated (httpx.MockTransport) with a fixed round trip time + bandwidth, so the numbers are
+reproducible without network access.
+
+Run with `pytest tests/load_tests/test_image_dimension_benchmark.py -s`
+"""
+
+import asyncio
+import os
+import struct
+import sys
+import time
+from unittest.mock import patch
+
+import httpx
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils import token_counter as token_counter_module
+from litellm.litellm_core_utils.token_counter import (
+    ImageDimensionCache,
+    _get_image_dimensions_from_bytes,
+    async_prefetch_image_dimensions,
+    token_counter,
+)
+from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
+
+ROUND_TRIP_SECONDS = 0.02
+BYTES_PER_SECOND = 50 * 1024 * 1024
+IMAGE_SIZE = 2 * 1024 * 1024
+NUM_IMAGES = 10
+
+IMAGE = (
+    b"\x89PNG\r\n\x1a\n"
+    + b"\x00\x00\x00\rIHDR"
+    + struct.pack(">LL", 2048, 1536)
+    + b"\x00" * IMAGE_SIZE
+)
+URLS = [f"https://example.com/image-{i}.png" for i in range(NUM_IMAGES)]
+MESSAGES = [
+    {
+        "role": "user",
+        "content": [{"type": "text", "text": "Describe these images."}]
+        + [{"type": "image_url", "image_url": {"url": url, "detail": "high"}} for url in URLS],
+    }
+]
+
+
+def _response(request: httpx.Request):
+    range_header = request.headers.get("range")
+    if range_header is not None:
+        start, end = range_header.split("=")[1].split("-")
+        body = IMAGE[int(start) : int(end) + 1]
+        return 206, body
+    return 200, IMAGE
+
+
+def _sync_handler(request: httpx.Request) -> httpx.Response:
+    status_code, body = _response(request)
+    time.sleep(ROUND_TRIP_SECONDS + len(body) / BYTES_PER_SECOND)
+    return httpx.Response(status_code, content=body)
+
+
+async def _async_handler(request: httpx.Request) -> httpx.Response:
+    status_code, body = _response(request)
+    await asyncio.sleep(ROUND_TRIP_SECONDS + len(body) / BYTES_PER_SECOND)
+    return httpx.Response(status_code, content=body)
+
+
+sync_client = HTTPHandler(client=httpx.Client(transport=httpx.MockTransport(_sync_handler)))
+async_client = AsyncHTTPHandler()
+async_client.client = httpx.AsyncClient(transport=httpx.MockTransport(_async_handler))
+
+
+def _ms(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def test_image_dimension_probe():
+    def full_download(data: str):
+        return _get_image_dimensions_from_bytes(sync_client.get(data).read())
+
+    with patch.object(
+        token_counter_module, "image_dimension_cache", ImageDimensionCache()
+    ), patch.object(
+        token_counter_module, "_get_httpx_client", return_value=sync_client
+    ), patch.object(
+        token_counter_module, "get_async_httpx_client", return_value=async_client
+    ):
+        # clear the per-message token count cache between runs, only the image dimension lookups are measured
+        token_counter_module.message_token_count_cache.clear()
+        with patch.object(token_counter_module, "get_image_dimensions", full_download):
+            full_download_ms = _ms(lambda: token_counter(model="gpt-4o", messages=MESSAGES))
+        token_counter_module.message_token_count_cache.clear()
+        range_probe_ms = _ms(lambda: token_counter(model="gpt-4o", messages=MESSAGES))
+        token_counter_module.message_token_count_cache.clear()
+        cached_ms = _ms(lambda: token_counter(model="gpt-4o", messages=MESSAGES))
+
+        token_counter_module.image_dimension_cache = ImageDimensionCache()
+        token_counter_module.message_token_count_cache.clear()
+
+        async def prefetch_and_count():
+            await async_prefetch_image_dimensions(MESSAGES)
+            return token_counter(model="gpt-4o", messages=MESSAGES)
+
+        async_prefetch_ms = _ms(lambda: asyncio.run(prefetch_and_count()))
+
+    print(
+        f"\n{NUM_IMAGES} x {IMAGE_SIZE // 1024}KB images, {ROUND_TRIP_SECONDS * 1000:.0f}ms RTT: "
+        f"full download {full_download_ms:.0f}ms, Range probe {range_probe_ms:.0f}ms, "
+        f"cached {cached_ms:.2f}ms, parallel async prefetch {async_prefetch_ms:.0f}ms"
+    )
+    assert range_probe_ms < full_download_ms
+    assert async_prefetch_ms < range_probe_ms
+
+
+def test_image_token_counting_on_event_loop():
+    """
+    Longest event loop stall while counting tokens for a request with uncached image URLs
+    """
+
+    async def max_loop_lag_ms(count) -> float:
+        max_lag = 0.0
+        done = False
+
+        async def monitor():
+            nonlocal max_lag
+            while not done:
+                start = time.perf_counter()
+                await asyncio.sleep(0.001)
+                max_lag = max(max_lag, time.perf_counter() - start - 0.001)
+
+        monitor_task = asyncio.create_task(monitor())
+        await asyncio.sleep(0.01)
+        count()
+        await asyncio.sleep(0.01)
+        done = True
+        await monitor_task
+        return max_lag * 1000
+
+    def blocking_get_image_dimensions(data: str):
+        return _get_image_dimensions_from_bytes(sync_client.get(data).read())
+
+    with patch.object(
+        token_counter_module, "image_dimension_cache", ImageDimensionCache()
+    ), patch.object(
+        token_counter_module, "get_async_httpx_client", return_value=async_client
+    ):
+        token_counter_module.message_token_count_cache.clear()
+        with patch.object(
+            token_counter_module, "get_image_dimensions", blocking_get_image_dimensions
+        ):
+            blocking_lag_ms = asyncio.run(
+                max_loop_lag_ms(lambda: token_counter(model="gpt-4o", messages=MESSAGES))
+            )
+        token_counter_module.message_token_count_cache.clear()
+        non_blocking_lag_ms = asyncio.run(
+            max_loop_lag_ms(lambda: token_counter(model="gpt-4o", messages=MESSAGES))
+        )
+
+    print(
+        f"\nmax event loop lag: {blocking_lag_ms:.0f}ms blocking fetch, {non_blocking_lag_ms:.1f}ms background probe"
+    )
+    assert non_blocking_lag_ms < blocking_lag_ms
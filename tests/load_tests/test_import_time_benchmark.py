@@ -0,0 +1,76 @@
+"""
+`import litellm` time + memory, with provider configs imported lazily.
+
+Compares `import litellm` against `import litellm` + loading every lazily imported provider config - the cost every
+process paid on import when they were imported eagerly.
+
+Run with `pytest tests/load_tests/test_import_time_benchmark.py -s`
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+NUM_RUNS = 5
+
+_IMPORT_SCRIPT = """
+import json, resource, sys, time
+start = time.perf_counter()
+import litellm
+if {load_all_provider_configs}:
+    from litellm._lazy_imports import LAZY_PROVIDER_CONFIG_INSTANCES, LAZY_PROVIDER_CONFIGS
+    for name in list(LAZY_PROVIDER_CONFIGS) + list(LAZY_PROVIDER_CONFIG_INSTANCES):
+        getattr(litellm, name)
+import_time = time.perf_counter() - start
+max_rss_mb = None
+try:  # on linux ru_maxrss is kept across exec - it can be the parent's (pytest's) peak
+    with open("/proc/self/status") as f:
+        max_rss_mb = next(int(line.split()[1]) / 1024 for line in f if line.startswith("VmHWM:"))
+except OSError:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    max_rss_mb = max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+print(json.dumps({{
+    "import_time": import_time,
+    "rss_mb": max_rss_mb,
+    "num_modules": len(sys.modules),
+}}))
+"""
+
+
+def _measure_import(load_all_provider_configs: bool) -> dict:
+    runs = []
+    for _ in range(NUM_RUNS):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                _IMPORT_SCRIPT.format(
+                    load_all_provider_configs=load_all_provider_configs
+                ),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        runs.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return {
+        "import_time": statistics.median(run["import_time"] for run in runs),
+        "rss_mb": statistics.median(run["rss_mb"] for run in runs),
+        "num_modules": runs[0]["num_modules"],
+    }
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses the resource module")
+def test_import_time():
+    lazy = _measure_import(load_all_provider_configs=False)
+    eager = _measure_import(load_all_provider_configs=True)
+
+    for name, result in [("lazy provider configs", lazy), ("all provider configs", eager)]:
+        print(
+            f"\n{name}: {result['import_time'] * 1000:,.0f} ms, "
+            f"{result['rss_mb']:,.1f} MB max RSS, {result['num_modules']} modules"
+        )
+    assert lazy["num_modules"] < eager["num_modules"]
@@ -0,0 +1,198 @@
+"""
+Microbenchmark for InMemoryCache.
+
+Compares the LRU + timing wheel engine against the previous heap-based engine
+(reproduced below as `HeapInMemoryCache`) on the access patterns used by the
+rate limiter, the auth cache and the router:
+    - hot keys that are overwritten on every request
+    - increments on a small set of counters
+    - a full cache with a steady stream of new keys
+
+Run with `pytest tests/load_tests/test_in_memory_cache_benchmark.py -s`
+"""
+
+import heapq
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Tuple
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.in_memory_cache import InMemoryCache
+
+
+class HeapInMemoryCache:
+    """
+    The previous InMemoryCache engine - dict + ttl dict + expiration heap, evicting by earliest expiration.
+
+    Kept as it was (including the per-set size check and the json.loads attempt on every read), so the
+    benchmark compares against what `InMemoryCache` actually did before.
+    """
+
+    def __init__(
+        self,
+        max_size_in_memory: int = 200,
+        default_ttl: int = 600,
+        max_size_per_item: int = 1024,
+    ):
+        self.max_size_in_memory = max_size_in_memory
+        self.default_ttl = default_ttl
+        self.max_size_per_item = max_size_per_item
+        self.cache_dict: dict = {}
+        self.ttl_dict: dict = {}
+        self.expiration_heap: list = []
+
+    def check_value_size(self, value) -> bool:
+        try:
+            if (
+                isinstance(value, (bool, int, float, str))
+                and len(str(value)) < self.max_size_per_item * 1024
+            ):
+                return True
+            if isinstance(value, bytes):
+                return sys.getsizeof(value) / 1024 <= self.max_size_per_item
+            if hasattr(value, "__sizeof__"):
+                return value.__sizeof__() / 1024 <= self.max_size_per_item
+            value = json.dumps(value, default=str)
+            return sys.getsizeof(value) / 1024 <= self.max_size_per_item
+        except Exception:
+            return False
+
+    def _remove_key(self, key):
+        self.cache_dict.pop(key, None)
+        self.ttl_dict.pop(key, None)
+
+    def evict_cache(self):
+        current_time = time.time()
+        while self.expiration_heap:
+            expiration_time, key = self.expiration_heap[0]
+            if expiration_time != self.ttl_dict.get(key):
+                heapq.heappop(self.expiration_heap)
+            elif expiration_time <= current_time:
+                heapq.heappop(self.expiration_heap)
+                self._remove_key(key)
+            else:
+                break
+        while len(self.cache_dict) >= self.max_size_in_memory:
+            expiration_time, key = heapq.heappop(self.expiration_heap)
+            if self.ttl_dict.get(key) == expiration_time:
+                self._remove_key(key)
+
+    def allow_ttl_override(self, key) -> bool:
+        ttl_time = self.ttl_dict.get(key)
+        if ttl_time is None:
+            return True
+        elif float(ttl_time) < time.time():
+            return True
+        return False
+
+    def set_cache(self, key, value, **kwargs):
+        if self.max_size_in_memory == 0:
+            return
+        if len(self.cache_dict) >= self.max_size_in_memory:
+            self.evict_cache()
+        if not self.check_value_size(value):
+            return
+        self.cache_dict[key] = value
+        if self.allow_ttl_override(key):
+            if "ttl" in kwargs and kwargs["ttl"] is not None:
+                self.ttl_dict[key] = time.time() + float(kwargs["ttl"])
+            else:
+                self.ttl_dict[key] = time.time() + self.default_ttl
+            heapq.heappush(self.expiration_heap, (self.ttl_dict[key], key))
+
+    def evict_element_if_expired(self, key) -> bool:
+        if key in self.ttl_dict and time.time() > self.ttl_dict[key]:
+            self._remove_key(key)
+            return True
+        return False
+
+    def get_cache(self, key, **kwargs):
+        if key in self.cache_dict:
+            if self.evict_element_if_expired(key):
+                return None
+            original_cached_response = self.cache_dict[key]
+            try:
+                return json.loads(original_cached_response)
+            except Exception:
+                return original_cached_response
+        return None
+
+    def increment_cache(self, key, value: int, **kwargs) -> int:
+        value = (self.get_cache(key=key) or 0) + value
+        self.set_cache(key, value, **kwargs)
+        return value
+
+
+NUM_OPERATIONS = 200_000
+NUM_RUNS = 5
+
+
+def _time_it(fn: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _compare(workload: Callable[[Any], None]) -> Tuple[float, float]:
+    """
+    Best of NUM_RUNS runs per engine, alternating engines so scheduling noise hits both alike
+    """
+    heap_time = lru_time = float("inf")
+    for _ in range(NUM_RUNS):
+        heap_time = min(heap_time, _time_it(lambda: workload(HeapInMemoryCache())))
+        lru_time = min(lru_time, _time_it(lambda: workload(InMemoryCache())))
+    return heap_time, lru_time
+
+
+def _hot_key_workload(cache) -> None:
+    for i in range(NUM_OPERATIONS):
+        key = f"key_{i % 50}"
+        cache.set_cache(key=key, value=i, ttl=60)
+        cache.get_cache(key=key)
+
+
+def _increment_workload(cache) -> None:
+    for i in range(NUM_OPERATIONS):
+        cache.increment_cache(key=f"counter_{i % 10}", value=1, ttl=60)
+
+
+def _full_cache_workload(cache) -> None:
+    for i in range(NUM_OPERATIONS):
+        cache.set_cache(key=f"key_{i}", value=i, ttl=60)
+
+
+def test_in_memory_cache_benchmark():
+    results = {}
+    for name, workload in [
+        ("hot keys (set + get)", _hot_key_workload),
+        ("increment", _increment_workload),
+        ("full cache (new keys)", _full_cache_workload),
+    ]:
+        heap_time, lru_time = _compare(workload)
+        results[name] = (heap_time, lru_time)
+        print(
+            f"{name}: heap={NUM_OPERATIONS / heap_time:,.0f} ops/s, "
+            f"lru+timing wheel={NUM_OPERATIONS / lru_time:,.0f} ops/s"
+        )
+
+    # read / overwrite heavy paths (rate limiter counters, auth objects) must be clearly faster than the previous engine
+    for name in ["hot keys (set + get)", "increment"]:
+        heap_time, lru_time = results[name]
+        assert heap_time / lru_time >= 1.1, name
+
+
+def test_in_memory_cache_memory_bounded_under_overwrites():
+    """
+    The heap engine accumulates stale heap entries when keys are re-set after expiry; the timing wheel holds 1 entry per key.
+    """
+    cache = InMemoryCache(max_size_in_memory=100)
+    for i in range(NUM_OPERATIONS):
+        cache.set_cache(key=f"key_{i % 100}", value=i, ttl=0)
+
+    assert sum(len(bucket) for bucket in cache._timing_wheel.values()) <= 100
+    assert len(cache.cache_dict) <= 100
@@ -0,0 +1,70 @@
+"""
+v3 rate limiter without Redis - DualCache window/counter keys vs the in-process counter store.
+
+Replays 1 second of traffic at 10k RPS (simulated clock), 5 descriptors per request (key, user, team, end user,
+model per key), through `should_rate_limit`.
+
+Run with `pytest tests/load_tests/test_in_memory_rate_limiter_benchmark.py -s`
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.caching import DualCache
+from litellm.proxy.hooks.parallel_request_limiter_v3 import (
+    _PROXY_MaxParallelRequestsHandler_v3,
+)
+from litellm.proxy.utils import InternalUsageCache
+
+REQUESTS_PER_SECOND = 10_000
+NUM_KEYS = 100
+
+
+def _descriptors(i: int):
+    key = i % NUM_KEYS
+    return [
+        {"key": "api_key", "value": f"sk-{key}", "rate_limit": {"requests_per_unit": 1000, "tokens_per_unit": 100000}},
+        {"key": "user", "value": f"user-{key % 50}", "rate_limit": {"requests_per_unit": 2000}},
+        {"key": "team", "value": f"team-{key % 10}", "rate_limit": {"requests_per_unit": 5000}},
+        {"key": "end_user", "value": f"end-user-{i % 1000}", "rate_limit": {"requests_per_unit": 100}},
+        {"key": "model_per_key", "value": f"sk-{key}:gpt-4o", "rate_limit": {"requests_per_unit": 1000}},
+    ]
+
+
+async def _replay(handler, clock) -> float:
+    start = time.perf_counter()
+    for i in range(REQUESTS_PER_SECOND):
+        clock[0] += timedelta(seconds=1 / REQUESTS_PER_SECOND)
+        await handler.should_rate_limit(descriptors=_descriptors(i))
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize(
+    "algorithm", [None, "fixed_window", "sliding_window", "token_bucket"]
+)
+def test_rate_limiter_10k_rps(monkeypatch, algorithm):
+    if algorithm is None:
+        monkeypatch.delenv("LITELLM_RATE_LIMIT_ALGORITHM", raising=False)
+    else:
+        monkeypatch.setenv("LITELLM_RATE_LIMIT_ALGORITHM", algorithm)
+    clock = [datetime.now()]
+    handler = _PROXY_MaxParallelRequestsHandler_v3(
+        internal_usage_cache=InternalUsageCache(DualCache()),
+        time_provider=lambda: clock[0],
+    )
+
+    elapsed = asyncio.run(_replay(handler, clock))
+
+    print(
+        f"\n{algorithm or 'DualCache (default)'}: {REQUESTS_PER_SECOND} requests x 5 descriptors in {elapsed * 1000:.0f}ms - "
+        f"{elapsed / REQUESTS_PER_SECOND * 1e6:.1f}us/request, {REQUESTS_PER_SECOND / elapsed:,.0f} requests/s on one core"
+    )
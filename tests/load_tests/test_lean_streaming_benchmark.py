@@ -0,0 +1,97 @@
+"""
+Chunks/sec benchmark for CustomStreamWrapper - lean streaming vs. the default chunk_creator path.
+
+Streams OpenAI sdk chunks (as returned by the openai provider) through the wrapper.
+
+Run with `pytest tests/load_tests/test_lean_streaming_benchmark.py -s`
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from openai.types.chat import ChatCompletionChunk
+
+import litellm
+from litellm.litellm_core_utils.litellm_logging import Logging
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.utils import ModelResponseListIterator
+
+NUM_CHUNKS = 1_000
+NUM_STREAMS = 4
+
+
+def _make_chunks() -> list:
+    chunks = [
+        ChatCompletionChunk(
+            id="chatcmpl-123",
+            created=1744771912,
+            model="gpt-4o-2024-08-06",
+            object="chat.completion.chunk",
+            choices=[
+                {
+                    "index": 0,
+                    "delta": {"role": "assistant", "content": f" token{i}"},
+                    "finish_reason": None,
+                }
+            ],
+        )
+        for i in range(NUM_CHUNKS)
+    ]
+    chunks.append(
+        ChatCompletionChunk(
+            id="chatcmpl-123",
+            created=1744771912,
+            model="gpt-4o-2024-08-06",
+            object="chat.completion.chunk",
+            choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}],
+        )
+    )
+    return chunks
+
+
+async def _consume_stream(chunks: list) -> float:
+    logging_obj = Logging(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "Hey"}],
+        stream=True,
+        call_type="acompletion",
+        start_time=time.time(),
+        litellm_call_id="12345",
+        function_id="1245",
+    )
+    response = CustomStreamWrapper(
+        completion_stream=ModelResponseListIterator(model_responses=chunks),
+        model="gpt-4o",
+        custom_llm_provider="openai",
+        logging_obj=logging_obj,
+    )
+    start = time.perf_counter()
+    async for _ in response:
+        pass
+    return time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+async def test_lean_streaming_benchmark(monkeypatch):
+    results = {}
+    for lean_streaming in [False, True]:
+        monkeypatch.setattr(litellm, "lean_streaming", lean_streaming)
+        elapsed = 0.0
+        for _ in range(NUM_STREAMS):
+            elapsed += await _consume_stream(_make_chunks())
+        results[lean_streaming] = elapsed
+        print(
+            f"lean_streaming={lean_streaming}: "
+            f"{NUM_CHUNKS * NUM_STREAMS / elapsed:,.0f} chunks/s"
+        )
+    await asyncio.sleep(0.1)  # let logging tasks finish
+
+    assert results[True] < results[False]
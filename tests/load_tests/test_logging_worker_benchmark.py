@@ -0,0 +1,85 @@
+"""
+Callback isolation benchmark for the LoggingWorker.
+
+A slow success callback (~50ms per log) runs next to a fast one. Each callback class gets its own logging worker
+queue, so the fast callback keeps up with the request rate instead of waiting behind the slow one.
+
+Run with `pytest tests/load_tests/test_logging_worker_benchmark.py -s`
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.logging_worker import GLOBAL_LOGGING_WORKER
+
+NUM_REQUESTS = 50
+SLOW_CALLBACK_LATENCY = 0.05
+
+
+class FastLogger(CustomLogger):
+    def __init__(self):
+        self.logged_at = []
+        super().__init__()
+
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        self.logged_at.append(time.perf_counter())
+
+
+class SlowLogger(CustomLogger):
+    def __init__(self):
+        self.logged_at = []
+        super().__init__()
+
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
+        await asyncio.sleep(SLOW_CALLBACK_LATENCY)
+        self.logged_at.append(time.perf_counter())
+
+
+@pytest.mark.asyncio
+async def test_slow_callback_does_not_stall_fast_callback(monkeypatch):
+    fast_logger = FastLogger()
+    slow_logger = SlowLogger()
+    monkeypatch.setattr(litellm, "callbacks", [slow_logger, fast_logger])
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            litellm.acompletion(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": "Hey"}],
+                mock_response="Hello",
+            )
+            for _ in range(NUM_REQUESTS)
+        )
+    )
+    requests_done = time.perf_counter()
+
+    while len(fast_logger.logged_at) < NUM_REQUESTS:
+        await asyncio.sleep(0.01)
+    fast_done = time.perf_counter()
+    await GLOBAL_LOGGING_WORKER.flush()
+    slow_done = time.perf_counter()
+
+    metrics = GLOBAL_LOGGING_WORKER.get_queue_metrics()
+    print(
+        f"{NUM_REQUESTS} requests in {(requests_done - start) * 1000:,.0f} ms - "
+        f"FastLogger done after {(fast_done - start) * 1000:,.0f} ms, "
+        f"SlowLogger done after {(slow_done - start) * 1000:,.0f} ms"
+    )
+    for queue_name in ["FastLogger", "SlowLogger"]:
+        print(f"{queue_name}: {metrics[queue_name]}")
+
+    assert len(slow_logger.logged_at) == NUM_REQUESTS
+    # with a single shared queue, the fast callback would finish after the slow one - NUM_REQUESTS * 50ms
+    assert fast_done - start < NUM_REQUESTS * SLOW_CALLBACK_LATENCY / 2
+    assert max(fast_logger.logged_at) < max(slow_logger.logged_at)
@@ -0,0 +1,135 @@
+"""
+Benchmark for lowest-latency routing with 500 deployments in 1 model group.
+
+Compares routing on the precomputed per-deployment stats against the previous selection
+(reproduced below as `legacy_get_available_deployments`), which shuffled all deployments,
+matched each one with a nested loop over the healthy deployments, and tokenized the request.
+
+Run with `pytest tests/load_tests/test_lowest_latency_routing_benchmark.py -s`
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm import token_counter
+from litellm.caching.caching import DualCache
+from litellm.router_strategy.lowest_latency import LowestLatencyLoggingHandler
+
+NUM_DEPLOYMENTS = 500
+NUM_REQUESTS = 200
+MODEL_GROUP = "gpt-4o"
+MESSAGES = [{"role": "user", "content": "Summarize the following text. " * 50}]
+
+
+def legacy_get_available_deployments(
+    healthy_deployments: list, messages: list, request_count_dict: dict
+):
+    """
+    The previous `_get_available_deployments`, without the debugging + buffer logic.
+    """
+    precise_minute = f"{datetime.now().strftime('%Y-%m-%d')}-{datetime.now().strftime('%H')}-{datetime.now().strftime('%M')}"
+    all_deployments = request_count_dict
+    for d in healthy_deployments:
+        if d["model_info"]["id"] not in all_deployments:
+            all_deployments[d["model_info"]["id"]] = {
+                "latency": [0],
+                precise_minute: {"tpm": 0, "rpm": 0},
+            }
+    input_tokens = token_counter(messages=messages)
+    _items = all_deployments.items()
+    all_deployments = dict(random.sample(list(_items), len(_items)))
+    potential_deployments = []
+    for item, item_map in all_deployments.items():
+        _deployment = None
+        for m in healthy_deployments:
+            if item == m["model_info"]["id"]:
+                _deployment = m
+        if _deployment is None:
+            continue
+        _deployment_tpm = _deployment.get("model_info", {}).get("tpm") or float("inf")
+        _deployment_rpm = _deployment.get("model_info", {}).get("rpm") or float("inf")
+        item_latency = item_map.get("latency", [])
+        total = sum(x for x in item_latency if isinstance(x, float))
+        item_rpm = item_map.get(precise_minute, {}).get("rpm", 0)
+        item_tpm = item_map.get(precise_minute, {}).get("tpm", 0)
+        if (
+            item_tpm + input_tokens > _deployment_tpm
+            or item_rpm + 1 > _deployment_rpm
+        ):
+            continue
+        potential_deployments.append((_deployment, total / len(item_latency)))
+    return sorted(potential_deployments, key=lambda x: x[1])[0][0]
+
+
+def _setup():
+    healthy_deployments = [
+        {
+            "model_name": MODEL_GROUP,
+            "litellm_params": {
+                "model": "openai/gpt-4o",
+                "api_base": f"https://endpoint-{i}.example.com",
+            },
+            "model_info": {"id": str(i)},
+        }
+        for i in range(NUM_DEPLOYMENTS)
+    ]
+    handler = LowestLatencyLoggingHandler(router_cache=DualCache())
+    for i in range(NUM_DEPLOYMENTS):
+        for _ in range(3):
+            handler.log_success_event(
+                kwargs={
+                    "litellm_params": {
+                        "metadata": {"model_group": MODEL_GROUP},
+                        "model_info": {"id": str(i)},
+                    }
+                },
+                response_obj=litellm.ModelResponse(
+                    usage=litellm.Usage(
+                        prompt_tokens=10, completion_tokens=10, total_tokens=20
+                    )
+                ),
+                start_time=0.0,
+                end_time=random.uniform(0.5, 5.0),
+            )
+    return handler, healthy_deployments
+
+
+def test_lowest_latency_routing_benchmark():
+    handler, healthy_deployments = _setup()
+    request_count_dict = handler.router_cache.get_cache(key=f"{MODEL_GROUP}_map")
+    legacy_request_count_dict = {
+        id: {"latency": list(stats["latency"])}
+        for id, stats in request_count_dict.items()
+    }
+
+    start = time.perf_counter()
+    for _ in range(NUM_REQUESTS):
+        legacy_get_available_deployments(
+            healthy_deployments=healthy_deployments,
+            messages=MESSAGES,
+            request_count_dict=legacy_request_count_dict,
+        )
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(NUM_REQUESTS):
+        handler.get_available_deployments(
+            model_group=MODEL_GROUP,
+            healthy_deployments=healthy_deployments,
+            messages=MESSAGES,
+        )
+    new_time = time.perf_counter() - start
+
+    print(
+        f"{NUM_DEPLOYMENTS} deployments: legacy={NUM_REQUESTS / legacy_time:,.0f} routes/s, "
+        f"precomputed stats={NUM_REQUESTS / new_time:,.0f} routes/s"
+    )
+    assert new_time < legacy_time
@@ -0,0 +1,83 @@
+"""
+Time to load `litellm.model_cost` at startup, with the remote map unreachable (offline) and reachable (online).
+
+Before: `get_model_cost_map` fetches the remote map synchronously - offline, startup waits for the full timeout.
+After: the last fetched map (or the bundled backup) is loaded from disk, the remote map is refreshed in the background.
+
+Run with `pytest tests/load_tests/test_model_cost_map_startup_benchmark.py -s`
+"""
+
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.get_model_cost_map import (
+    ModelCostMapRefresher,
+    get_bundled_model_cost_map,
+    get_model_cost_map,
+)
+
+URL = "https://example.com/model_prices_and_context_window.json"
+OFFLINE_TIMEOUT = 2.0  # blackholed network - the request hangs until it times out
+ONLINE_LATENCY = 0.3  # download of the ~1MB remote map
+REMOTE_MODEL_COST = get_bundled_model_cost_map()
+
+
+def _offline_get(*args, **kwargs):
+    time.sleep(OFFLINE_TIMEOUT)
+    raise httpx.ConnectTimeout("timed out")
+
+
+def _online_get(url, headers=None, **kwargs):
+    time.sleep(ONLINE_LATENCY)
+    if headers and headers.get("If-None-Match") == '"v1"':
+        return httpx.Response(304, request=httpx.Request("GET", url))
+    return httpx.Response(
+        200,
+        json=REMOTE_MODEL_COST,
+        headers={"etag": '"v1"'},
+        request=httpx.Request("GET", url),
+    )
+
+
+def _time_ms(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+@pytest.fixture(autouse=True)
+def remote_model_cost_map(monkeypatch):
+    monkeypatch.delenv("LITELLM_LOCAL_MODEL_COST_MAP", raising=False)
+
+
+@pytest.mark.parametrize(
+    "network, fake_get", [("offline", _offline_get), ("online", _online_get)]
+)
+def test_model_cost_map_startup_time(network, fake_get, tmp_path):
+    with patch("httpx.get", side_effect=fake_get):
+        blocking_ms = _time_ms(lambda: get_model_cost_map(url=URL))
+
+        cold_refresher = ModelCostMapRefresher(cache_dir=str(tmp_path))
+        cold_ms = _time_ms(lambda: cold_refresher.load(url=URL))
+        cold_refresher.wait()
+
+        warm_refresher = ModelCostMapRefresher(cache_dir=str(tmp_path))
+        warm_ms = _time_ms(lambda: warm_refresher.load(url=URL))
+        warm_refresher.wait()
+
+    print(
+        f"\n{network}: blocking fetch {blocking_ms:,.1f} ms | "
+        f"non-blocking, no disk cache {cold_ms:,.1f} ms | "
+        f"non-blocking, disk cache {warm_ms:,.1f} ms"
+    )
+    assert cold_ms < blocking_ms
+    assert warm_ms < blocking_ms
@@ -0,0 +1,74 @@
+"""
+Throughput of `get_model_info` / `completion_cost` with and without the model info index.
+
+Without the index, every call generates the potential model names, probes `litellm.model_cost` with each and rebuilds
+the `ModelInfoBase`. With the index, repeat lookups return a copy of the prebuilt `ModelInfoBase`.
+
+Run with `pytest tests/load_tests/test_model_info_index_benchmark.py -s`
+"""
+
+import os
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.model_info_index import ModelInfoIndex
+from litellm.utils import _get_model_info_helper
+
+NUM_CALLS = 20000
+MODELS = [
+    ("gpt-4o", None),
+    ("gpt-4o-mini", "openai"),
+    ("claude-3-5-sonnet-20240620", "anthropic"),
+    ("anthropic.claude-3-5-sonnet-20240620-v1:0", "bedrock"),
+    ("gemini/gemini-1.5-flash-001", None),
+    ("groq/llama-3.1-8b-instant", None),
+]
+
+
+def _calls_per_second(fn, num_calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(num_calls):
+        fn(*MODELS[i % len(MODELS)])
+    return num_calls / (time.perf_counter() - start)
+
+
+def _completion_cost(model, custom_llm_provider):
+    response = litellm.ModelResponse(
+        model=model,
+        usage=litellm.Usage(prompt_tokens=100, completion_tokens=20, total_tokens=120),
+    )
+    return litellm.completion_cost(
+        completion_response=response,
+        model=model,
+        custom_llm_provider=custom_llm_provider,
+    )
+
+
+def test_model_info_index_throughput():
+    benchmarks = {
+        "_get_model_info_helper": (
+            lambda model, provider: _get_model_info_helper(model, provider),
+            NUM_CALLS,
+        ),
+        "get_model_info": (
+            lambda model, provider: litellm.get_model_info(model, provider),
+            NUM_CALLS // 4,
+        ),
+        "completion_cost": (_completion_cost, NUM_CALLS // 10),
+    }
+    for name, (fn, num_calls) in benchmarks.items():
+        with patch.object(ModelInfoIndex, "get_lookup", return_value=None):
+            without_index = _calls_per_second(fn, num_calls)
+        with_index = _calls_per_second(fn, num_calls)
+        print(
+            f"\n{name}: {without_index:,.0f} calls/s without index, "
+            f"{with_index:,.0f} calls/s with index ({with_index / without_index:.1f}x)"
+        )
+        if name == "_get_model_info_helper":
+            assert with_index > without_index
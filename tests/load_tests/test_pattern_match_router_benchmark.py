@@ -0,0 +1,85 @@
+"""
+Benchmark for PatternMatchRouter.route with 1k wildcard patterns.
+
+Compares the precompiled prefix index against re-sorting + `re.match` over every pattern
+(what `route` used to do on every request).
+
+Run with `pytest tests/load_tests/test_pattern_match_router_benchmark.py -s`
+"""
+
+import copy
+import os
+import re
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.router_utils.pattern_match_deployments import (
+    PatternMatchRouter,
+    PatternUtils,
+)
+
+NUM_PATTERNS = 1_000
+NUM_REQUESTS = 200
+
+
+def _build_router() -> PatternMatchRouter:
+    router = PatternMatchRouter()
+    for i in range(NUM_PATTERNS):
+        router.add_pattern(
+            f"provider-{i}/*",
+            {
+                "model_name": f"provider-{i}/*",
+                "litellm_params": {"model": f"provider-{i}/*", "api_key": "sk-1234"},
+                "model_info": {"id": str(i)},
+            },
+        )
+    return router
+
+
+def _linear_scan_route(router: PatternMatchRouter, request: str):
+    for pattern, llm_deployments in PatternUtils.sorted_patterns(router.patterns):
+        pattern_match = re.match(pattern, request)
+        if pattern_match:
+            new_deployments = []
+            for deployment in llm_deployments:
+                new_deployment = copy.deepcopy(deployment)
+                new_deployment["litellm_params"][
+                    "model"
+                ] = PatternMatchRouter.set_deployment_model_name(
+                    matched_pattern=pattern_match,
+                    litellm_deployment_litellm_model=deployment["litellm_params"][
+                        "model"
+                    ],
+                )
+                new_deployments.append(new_deployment)
+            return new_deployments
+    return None
+
+
+def test_pattern_match_router_benchmark():
+    router = _build_router()
+    requests = [f"provider-{i % NUM_PATTERNS}/model-{i}" for i in range(NUM_REQUESTS)]
+
+    start = time.perf_counter()
+    for request in requests:
+        assert _linear_scan_route(router, request) is not None
+    linear_scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for request in requests:
+        assert router.route(request) is not None
+    index_time = time.perf_counter() - start
+
+    print(
+        f"{NUM_PATTERNS} patterns: linear scan={NUM_REQUESTS / linear_scan_time:,.0f} routes/s, "
+        f"prefix index={NUM_REQUESTS / index_time:,.0f} routes/s"
+    )
+    assert index_time < linear_scan_time
+
+    # same results as the linear scan
+    for request in requests[:100]:
+        assert router.route(request) == _linear_scan_route(router, request)
@@ -0,0 +1,125 @@
+"""
+Cost of the periodic router reload from the DB (`ProxyConfig._update_llm_router`) with 5k DB models.
+
+- first reload: router built from the DB models
+- no changes: DB poll returns the same models
+- 10 changed: 10 models updated in the DB since the last poll
+
+Run with `pytest tests/load_tests/test_router_reload_benchmark.py -s`
+"""
+
+import gc
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+import litellm.proxy.proxy_server
+from litellm.proxy.common_utils.encrypt_decrypt_utils import encrypt_value_helper
+from litellm.proxy.proxy_server import ProxyConfig
+
+NUM_MODELS = 5000
+NUM_CHANGED = 10
+NUM_POLLS = 3
+
+
+class DBModel(BaseModel):
+    model_id: str
+    model_name: str
+    litellm_params: dict
+    model_info: Optional[dict]
+    updated_at: datetime
+
+    model_config = ConfigDict(protected_namespaces=())
+
+
+def _db_models(version_by_model: dict) -> list:
+    """fresh rows, like every `find_many`"""
+    return [
+        DBModel(
+            model_id=f"model-{i}",
+            model_name=f"model-group-{i % 50}",
+            litellm_params=dict(_encrypted_litellm_params[i][version_by_model.get(i, 0)]),
+            model_info={"id": f"model-{i}"},
+            updated_at=datetime(2025, 1, 1, version_by_model.get(i, 0)),
+        )
+        for i in range(NUM_MODELS)
+    ]
+
+
+_encrypted_litellm_params: dict = {}
+
+
+def _encrypt_litellm_params():
+    for i in range(NUM_MODELS):
+        _encrypted_litellm_params[i] = [
+            {
+                "model": encrypt_value_helper(f"openai/gpt-4o-{i}-{version}"),
+                "api_key": encrypt_value_helper(f"sk-{i}"),
+                "api_base": encrypt_value_helper(f"https://api-{i}.example.com/v1"),
+            }
+            for version in range(NUM_POLLS + 1)
+        ]
+
+
+async def _timed_reload(proxy_config: ProxyConfig, db_models: list) -> float:
+    gc.collect()  # don't time collections of garbage left by the previous reload
+    start = time.perf_counter()
+    await proxy_config._update_llm_router(
+        new_models=db_models, proxy_logging_obj=MagicMock()
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+@pytest.mark.asyncio
+async def test_router_reload_benchmark(monkeypatch):
+    monkeypatch.setattr(litellm.proxy.proxy_server, "master_key", "sk-1234")
+    monkeypatch.setattr(litellm.proxy.proxy_server, "llm_router", None)
+    monkeypatch.setattr(litellm.proxy.proxy_server, "prisma_client", None)
+    _encrypt_litellm_params()
+
+    proxy_config = ProxyConfig()
+
+    async def _get_config(*args, **kwargs):
+        return {}
+
+    monkeypatch.setattr(proxy_config, "get_config", _get_config)
+    monkeypatch.setattr(litellm.proxy.proxy_server, "proxy_config", proxy_config)
+
+    version_by_model: dict = {}
+    first_ms = await _timed_reload(proxy_config, _db_models(version_by_model))
+
+    unchanged_ms = []
+    for _ in range(NUM_POLLS):
+        unchanged_ms.append(
+            await _timed_reload(proxy_config, _db_models(version_by_model))
+        )
+
+    changed_ms = []
+    for poll in range(1, NUM_POLLS + 1):
+        for i in range(NUM_CHANGED):
+            version_by_model[i * 7] = poll
+        changed_ms.append(
+            await _timed_reload(proxy_config, _db_models(version_by_model))
+        )
+
+    llm_router = litellm.proxy.proxy_server.llm_router
+    print(f"\n{NUM_MODELS} db models")
+    print(f"first reload       | {first_ms:8.1f} ms")
+    print(f"no changes         | {sum(unchanged_ms) / NUM_POLLS:8.1f} ms / reload")
+    print(f"{NUM_CHANGED} changed         | {sum(changed_ms) / NUM_POLLS:8.1f} ms / reload")
+
+    assert len(llm_router.model_list) == NUM_MODELS
+    for i in range(NUM_CHANGED):
+        deployment = llm_router.get_deployment(model_id=f"model-{i * 7}")
+        assert deployment.litellm_params.model == f"openai/gpt-4o-{i * 7}-{NUM_POLLS}"
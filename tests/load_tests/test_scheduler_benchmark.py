@@ -0,0 +1,72 @@
+"""
+Benchmark for the Scheduler.
+
+Queues requests for a model group with no healthy deployments, for `WAIT_SECONDS`, then makes deployments healthy.
+The previous scheduler polled the queue every polling interval per waiting request - the health check count grew with
+(queued requests x wait time / polling interval). Now each request checks health once when it starts waiting, and the
+model group's release loop once per polling interval.
+
+Run with `pytest tests/load_tests/test_scheduler_benchmark.py -s`
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.scheduler import FlowItem, Scheduler
+
+NUM_REQUESTS = 2_000
+POLLING_INTERVAL = 0.03
+WAIT_SECONDS = 1.0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_drain_benchmark():
+    scheduler = Scheduler(polling_interval=POLLING_INTERVAL)
+    healthy_deployments: list = []
+    health_checks = {"count": 0}
+
+    async def get_healthy_deployments() -> list:
+        health_checks["count"] += 1
+        return healthy_deployments
+
+    async def make_request(item: FlowItem) -> None:
+        await scheduler.add_request(item)
+        assert await scheduler.wait_for_turn(
+            request=item, get_healthy_deployments=get_healthy_deployments, timeout=60
+        )
+        await asyncio.sleep(0)  # simulate the llm call
+        await scheduler.release(
+            request=item, get_healthy_deployments=get_healthy_deployments
+        )
+
+    async def deployments_recover() -> None:
+        await asyncio.sleep(WAIT_SECONDS)
+        healthy_deployments.append({"model_name": "gpt-4o"})
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        deployments_recover(),
+        *[
+            make_request(
+                FlowItem(priority=i % 256, request_id=str(i), model_name="gpt-4o")
+            )
+            for i in range(NUM_REQUESTS)
+        ],
+    )
+    elapsed = time.perf_counter() - start
+
+    polling_health_checks = int(NUM_REQUESTS * WAIT_SECONDS / POLLING_INTERVAL)
+    print(
+        f"\n{NUM_REQUESTS} requests queued for {WAIT_SECONDS}s, drained in {elapsed:.3f}s - "
+        f"{health_checks['count']} health checks (polling: ~{polling_health_checks})"
+    )
+    assert health_checks["count"] <= 3 * NUM_REQUESTS
+    assert scheduler.get_queue_status()["gpt-4o"]["queue_depth"] == 0
@@ -0,0 +1,103 @@
+"""
+Spend log flush under sustained load: previous list buffer (1000 logs / interval, sequential batches of 100, flushed logs
+removed by re-slicing the list) vs `SpendLogQueue` (drains the backlog with adaptive batches and parallel writers).
+
+Simulated db latency per `create_many` call.
+
+Run with `pytest tests/load_tests/test_spend_log_queue_benchmark.py -s`
+"""
+
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.proxy.db.db_transaction_queue.spend_log_queue import SpendLogQueue
+from litellm.proxy.utils import ProxyUpdateSpend
+
+NUM_INTERVALS = 10
+LOGS_PER_INTERVAL = 3000
+DB_LATENCY_PER_CALL = 0.005  # 5ms per create_many
+DB_LATENCY_PER_ROW = 0.00001  # 10us per row
+
+
+async def _create_many(data, **kwargs):
+    await asyncio.sleep(DB_LATENCY_PER_CALL + DB_LATENCY_PER_ROW * len(data))
+
+
+def _prisma_client(spend_log_transactions) -> MagicMock:
+    prisma_client = MagicMock()
+    prisma_client.spend_log_transactions = spend_log_transactions
+    prisma_client.jsonify_object = lambda obj: obj
+    prisma_client.db.litellm_spendlogs.create_many = _create_many
+    return prisma_client
+
+
+async def _list_flush(prisma_client):
+    """the previous update_spend_logs write path"""
+    BATCH_SIZE = 100
+    MAX_LOGS_PER_INTERVAL = 1000
+    logs_to_process = prisma_client.spend_log_transactions[:MAX_LOGS_PER_INTERVAL]
+    for j in range(0, len(logs_to_process), BATCH_SIZE):
+        batch = logs_to_process[j : j + BATCH_SIZE]
+        await prisma_client.db.litellm_spendlogs.create_many(
+            data=[prisma_client.jsonify_object({**entry}) for entry in batch],
+            skip_duplicates=True,
+        )
+    prisma_client.spend_log_transactions = prisma_client.spend_log_transactions[
+        len(logs_to_process) :
+    ]
+
+
+async def _queue_flush(prisma_client):
+    await ProxyUpdateSpend.update_spend_logs(
+        n_retry_times=0,
+        prisma_client=prisma_client,
+        db_writer_client=None,
+        proxy_logging_obj=MagicMock(),
+    )
+
+
+async def _run(prisma_client, flush_fn):
+    flush_seconds = 0.0
+    for interval in range(NUM_INTERVALS):
+        for i in range(LOGS_PER_INTERVAL):
+            prisma_client.spend_log_transactions.append(
+                {"request_id": f"{interval}-{i}", "spend": 0.1}
+            )
+        start = time.perf_counter()
+        await flush_fn(prisma_client)
+        flush_seconds += time.perf_counter() - start
+    return len(prisma_client.spend_log_transactions), flush_seconds
+
+
+@pytest.mark.asyncio
+async def test_spend_log_queue_benchmark():
+    list_backlog, list_seconds = await _run(_prisma_client([]), _list_flush)
+    queue_backlog, queue_seconds = await _run(
+        _prisma_client(SpendLogQueue()), _queue_flush
+    )
+
+    print(
+        f"\n{NUM_INTERVALS} intervals, {LOGS_PER_INTERVAL} logs / interval, "
+        f"{DB_LATENCY_PER_CALL * 1000:.0f}ms + {DB_LATENCY_PER_ROW * 1e6:.0f}us / row db latency"
+    )
+    for name, backlog, seconds in (
+        ("list buffer", list_backlog, list_seconds),
+        ("SpendLogQueue", queue_backlog, queue_seconds),
+    ):
+        written = NUM_INTERVALS * LOGS_PER_INTERVAL - backlog
+        print(
+            f"{name:<14} | backlog after {NUM_INTERVALS} intervals: {backlog:>6} | "
+            f"{written / (seconds or 1):>8.0f} logs written / s of flush time"
+        )
+
+    assert list_backlog == NUM_INTERVALS * (LOGS_PER_INTERVAL - 1000)
+    assert queue_backlog == 0
@@ -0,0 +1,151 @@
+"""
+Memory + end-of-stream latency benchmark for assembling the complete streaming response.
+
+CustomStreamWrapper folds each chunk into a `StreamingResponseAccumulator` as it's returned, instead of keeping
+every chunk alive and walking the list at the end of the stream.
+
+Run with `pytest tests/load_tests/test_stream_assembly_benchmark.py -s`
+"""
+
+import asyncio
+import gc
+import os
+import sys
+import time
+import tracemalloc
+import weakref
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from openai.types.chat import ChatCompletionChunk
+
+import litellm
+from litellm.litellm_core_utils.litellm_logging import Logging
+from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+    StreamingResponseAccumulator,
+)
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.types.utils import ModelResponseStream
+
+NUM_CHUNKS = 5_000
+
+
+def _make_chunk(i: int, num_chunks: int = NUM_CHUNKS) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id="chatcmpl-123",
+        created=1744771912,
+        model="gpt-4o-2024-08-06",
+        object="chat.completion.chunk",
+        choices=[
+            {
+                "index": 0,
+                "delta": {"role": "assistant", "content": f" token{i}"},
+                "finish_reason": "stop" if i == num_chunks - 1 else None,
+            }
+        ],
+    )
+
+
+async def _provider_stream(num_chunks: int):
+    for i in range(num_chunks):
+        yield _make_chunk(i, num_chunks=num_chunks)
+
+
+def _make_stream_wrapper(num_chunks: int) -> CustomStreamWrapper:
+    logging_obj = Logging(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "Hey"}],
+        stream=True,
+        call_type="acompletion",
+        start_time=time.time(),
+        litellm_call_id="12345",
+        function_id="1245",
+    )
+    return CustomStreamWrapper(
+        completion_stream=_provider_stream(num_chunks=num_chunks),
+        model="gpt-4o",
+        custom_llm_provider="openai",
+        logging_obj=logging_obj,
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_wrapper_does_not_retain_chunks(monkeypatch):
+    monkeypatch.setattr(litellm, "lean_streaming", False)
+    num_chunks = 500
+    response = _make_stream_wrapper(num_chunks=num_chunks)
+    returned_chunks = []
+    async for chunk in response:
+        if len(returned_chunks) < 10:
+            returned_chunks.append(weakref.ref(chunk))
+    await asyncio.sleep(0.1)  # let logging tasks finish
+
+    gc.collect()
+    assert all(chunk_ref() is None for chunk_ref in returned_chunks)
+
+    complete_response = response.build_complete_streaming_response()
+    assert complete_response is not None
+    assert complete_response.choices[0].message.content == "".join(  # type: ignore
+        f" token{i}" for i in range(num_chunks)
+    )
+
+
+def test_stream_assembly_memory():
+    """
+    Memory held for the complete response grows with the generated text, not with the number of chunks.
+    """
+    tracemalloc.start()
+    retained_chunks = []
+    for i in range(NUM_CHUNKS):
+        retained_chunks.append(ModelResponseStream(**_make_chunk(i).model_dump()))
+    chunk_list_memory, _ = tracemalloc.get_traced_memory()
+    del retained_chunks
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    accumulator = StreamingResponseAccumulator()
+    for i in range(NUM_CHUNKS):
+        accumulator.add_chunk(ModelResponseStream(**_make_chunk(i).model_dump()))
+    accumulator_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{NUM_CHUNKS} chunks held: chunk list={chunk_list_memory / 1024:,.0f} KiB, "
+        f"accumulator={accumulator_memory / 1024:,.0f} KiB"
+    )
+    assert accumulator_memory * 5 < chunk_list_memory
+
+
+def test_stream_assembly_end_of_stream_latency():
+    """
+    Folding chunks as they arrive leaves O(1) work at the end of the stream, vs. walking the full list of chunks.
+    """
+    chunks = [
+        ModelResponseStream(**_make_chunk(i).model_dump()) for i in range(NUM_CHUNKS)
+    ]
+
+    start = time.perf_counter()
+    list_response = litellm.stream_chunk_builder(chunks=chunks)
+    list_time = time.perf_counter() - start
+
+    accumulator = StreamingResponseAccumulator()
+    for chunk in chunks:
+        accumulator.add_chunk(chunk)
+    start = time.perf_counter()
+    incremental_response = accumulator.build_model_response()
+    incremental_time = time.perf_counter() - start
+
+    print(
+        f"end of stream: chunk list={list_time * 1000:,.2f} ms, "
+        f"incremental={incremental_time * 1000:,.2f} ms"
+    )
+    assert list_response is not None
+    assert (
+        incremental_response.choices[0].message.content  # type: ignore
+        == list_response.choices[0].message.content  # type: ignore
+    )
+    assert incremental_time < list_time
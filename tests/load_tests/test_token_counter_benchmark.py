@@ -0,0 +1,128 @@
+"""
+Speed + accuracy of `token_counter` with the per-message cache, the per-request memo and the approximate estimator.
+
+- multi-turn: a 20-turn conversation, counted after every turn. Without the cache, every turn re-tokenizes the whole
+  conversation. With it, only the new messages are tokenized.
+- per-request: one request counted 3x (pre-call checks, routing, ...) - with `get_request_token_count` it's counted once.
+- estimator: `estimate_token_count` vs `token_counter`, speed + relative error per kind of text.
+
+Run with `pytest tests/load_tests/test_token_counter_benchmark.py -s`
+"""
+
+import inspect
+import json
+import os
+import sys
+import time
+import uuid
+from unittest.mock import patch
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils import token_counter as token_counter_module
+from litellm.litellm_core_utils.token_counter import (
+    MessageTokenCountCache,
+    estimate_token_count,
+    get_request_token_count,
+    message_token_count_cache,
+    token_counter,
+)
+from tests.large_text import text as large_text
+
+NUM_TURNS = 20
+NUM_REQUESTS = 50
+
+TEXTS = {
+    "prose": large_text[:20000],
+    "code": inspect.getsource(token_counter_module)[:20000],
+    "json": json.dumps(dict(list(litellm.model_cost.items())[:40]))[:20000],
+    "chinese": "大型语言模型可以回答问题、总结文档并编写代码。" * 200,
+}
+
+
+def _conversation(num_turns: int) -> list:
+    sentences = large_text.split(". ")
+    messages = [{"role": "system", "content": "You are a helpful assistant."}]
+    for turn in range(num_turns):
+        messages.append({"role": "user", "content": ". ".join(sentences[turn * 8 : turn * 8 + 4])})
+        messages.append({"role": "assistant", "content": ". ".join(sentences[turn * 8 + 4 : turn * 8 + 8])})
+    return messages
+
+
+def _ms(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def test_multi_turn_token_counter():
+    conversation = _conversation(NUM_TURNS)
+
+    def count_every_turn():
+        for turn in range(1, NUM_TURNS + 1):
+            token_counter(model="gpt-4o", messages=conversation[: 2 * turn + 1])
+
+    with patch.object(MessageTokenCountCache, "get", return_value=None):
+        without_cache = _ms(count_every_turn)
+    message_token_count_cache.clear()
+    with_cache = _ms(count_every_turn)
+
+    print(
+        f"\nmulti-turn ({NUM_TURNS} turns): {without_cache:.1f}ms without message cache, "
+        f"{with_cache:.1f}ms with message cache ({without_cache / with_cache:.1f}x)"
+    )
+    assert with_cache < without_cache
+
+
+def test_per_request_token_count():
+    messages = _conversation(4)
+
+    def count_requests(memoized: bool):
+        for _ in range(NUM_REQUESTS):
+            request_kwargs = {"litellm_trace_id": str(uuid.uuid4()), "metadata": {}}
+            request_messages = [dict(message) for message in messages]
+            for _ in range(3):
+                if memoized:
+                    get_request_token_count(
+                        request_kwargs=request_kwargs, messages=request_messages
+                    )
+                else:
+                    token_counter(messages=request_messages)
+
+    with patch.object(MessageTokenCountCache, "get", return_value=None):
+        without_memo = _ms(lambda: count_requests(memoized=False))
+        with_memo = _ms(lambda: count_requests(memoized=True))
+    message_token_count_cache.clear()
+    with_memo_and_cache = _ms(lambda: count_requests(memoized=True))
+
+    print(
+        f"\nper-request ({NUM_REQUESTS} requests, counted 3x each): {without_memo:.1f}ms without memo, "
+        f"{with_memo:.1f}ms with memo, {with_memo_and_cache:.1f}ms with memo + message cache"
+    )
+    assert with_memo < without_memo
+
+
+def test_estimator_accuracy_and_speed(monkeypatch):
+    # exact counts only calibrate the estimator when it's used for routing
+    monkeypatch.setattr(litellm, "use_token_count_estimator_for_routing", True)
+    # calibrate on the first half of each text, measure on the second half
+    for content in TEXTS.values():
+        token_counter(model="gpt-4o", text=content[: len(content) // 2])
+
+    for name, content in TEXTS.items():
+        messages = [{"role": "user", "content": content[len(content) // 2 :]}]
+        # estimate before the exact count - exact counts calibrate the estimator
+        estimate_ms = _ms(lambda: estimate_token_count(model="gpt-4o", messages=messages))
+        estimate = estimate_token_count(model="gpt-4o", messages=messages)
+        with patch.object(MessageTokenCountCache, "get", return_value=None):
+            exact_ms = _ms(lambda: token_counter(model="gpt-4o", messages=messages))
+        exact = token_counter(model="gpt-4o", messages=messages)
+        error = abs(estimate - exact) / exact
+        print(
+            f"\nestimator [{name}]: exact={exact} ({exact_ms:.2f}ms), estimate={estimate} ({estimate_ms:.3f}ms), "
+            f"error={error:.1%}"
+        )
+        assert estimate_ms < exact_ms
@@ -689,22 +689,20 @@ def test_stream_chunk_builder_openai_audio_output_usage():
 
 def test_stream_chunk_builder_empty_initial_chunk():
     from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
-        ChunkProcessor,
+        StreamingResponseAccumulator,
     )
+    from litellm.types.utils import ModelResponseStream
 
-    chunks = [
-        {"id": ""},
-        {"id": "1"},
-        {"id": "1"},
-    ]
+    accumulator = StreamingResponseAccumulator()
+    for chunk_id in ["", "1", "1"]:
+        accumulator.add_chunk(ModelResponseStream(id=chunk_id))
 
-    id = ChunkProcessor._get_chunk_id(chunks)
-    assert id == "1"
+    assert accumulator.build_model_response().id == "1"
 
 
 def test_stream_chunk_builder_tool_calls_list():
     from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
-        ChunkProcessor,
+        StreamingResponseAccumulator,
     )
     from litellm.types.utils import (
         ChatCompletionMessageToolCall,
@@ -814,9 +812,11 @@ def test_stream_chunk_builder_tool_calls_list():
         ),
     ]
 
-    processor = ChunkProcessor(chunks=chunks)
+    accumulator = StreamingResponseAccumulator()
+    for chunk in chunks:
+        accumulator.add_chunk(chunk)
 
-    tool_calls = processor.get_combined_tool_content(tool_call_chunks=chunks)
+    tool_calls = accumulator.build_model_response().choices[0].message.tool_calls
     print(f"tool_calls: {tool_calls}")
     assert len(tool_calls) == 3
 
@@ -1653,7 +1653,7 @@ async def test_spend_logs_cleanup_after_error():
 
     # Verify the first batch was removed from spend_log_transactions
     assert (
-        mock_client.spend_log_transactions == original_logs[100:]
+        list(mock_client.spend_log_transactions) == original_logs[100:]
     ), "Should remove processed logs even after error"
 
 
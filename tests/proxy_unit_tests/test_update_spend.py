@@ -282,7 +282,8 @@ async def test_update_spend_logs_multiple_batches_with_failure():
     await update_spend(prisma_client, None, proxy_logging_obj)
 
     # Verify
-    assert create_many_mock.call_count == 6  # 4 batches + 2 retries for failed batch
+    # 4 batches + 1 retry of the failed batch - batches that were written aren't re-sent
+    assert create_many_mock.call_count == 5
 
     # Verify all batches were processed
     all_processed_logs = []
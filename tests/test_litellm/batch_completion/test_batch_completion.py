@@ -0,0 +1,145 @@
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.batch_completion.main import (
+    abatch_completion,
+    abatch_completion_iter,
+    abatch_completion_models,
+    abatch_completion_models_all_responses,
+)
+
+
+def _messages(num_requests: int):
+    return [[{"role": "user", "content": f"prompt-{i}"}] for i in range(num_requests)]
+
+
+@pytest.mark.asyncio
+async def test_abatch_completion_returns_results_in_order():
+    responses = await abatch_completion(
+        model="gpt-4o-mini",
+        messages=_messages(5),
+        mock_response="hello",
+    )
+
+    assert len(responses) == 5
+    assert all(
+        response.choices[0].message.content == "hello" for response in responses
+    )
+
+
+@pytest.mark.asyncio
+async def test_abatch_completion_returns_exceptions():
+    async def mock_acompletion(**kwargs):
+        if kwargs["messages"][0]["content"] == "prompt-1":
+            raise ValueError("bad request")
+        return kwargs["messages"][0]["content"]
+
+    with patch.object(litellm, "acompletion", side_effect=mock_acompletion):
+        responses = await abatch_completion(model="gpt-4o-mini", messages=_messages(3))
+
+    assert responses[0] == "prompt-0"
+    assert isinstance(responses[1], ValueError)
+    assert responses[2] == "prompt-2"
+
+
+@pytest.mark.asyncio
+async def test_abatch_completion_iter_yields_in_completion_order():
+    async def mock_acompletion(**kwargs):
+        index = int(kwargs["messages"][0]["content"].split("-")[1])
+        await asyncio.sleep(0.01 * (3 - index))
+        return index
+
+    with patch.object(litellm, "acompletion", side_effect=mock_acompletion):
+        results = [
+            result
+            async for result in abatch_completion_iter(
+                model="gpt-4o-mini", messages=_messages(3)
+            )
+        ]
+
+    assert results == [(2, 2), (1, 1), (0, 0)]
+
+
+@pytest.mark.asyncio
+async def test_abatch_completion_concurrency_limits():
+    running = {"openai": 0, "anthropic": 0}
+    max_running = {"openai": 0, "anthropic": 0, "total": 0}
+
+    async def mock_acompletion(**kwargs):
+        provider = "anthropic" if kwargs["model"].startswith("anthropic/") else "openai"
+        running[provider] += 1
+        max_running[provider] = max(max_running[provider], running[provider])
+        max_running["total"] = max(max_running["total"], sum(running.values()))
+        await asyncio.sleep(0.01)
+        running[provider] -= 1
+
+    with patch.object(litellm, "acompletion", side_effect=mock_acompletion):
+        await asyncio.gather(
+            abatch_completion(
+                model="gpt-4o-mini",
+                messages=_messages(20),
+                max_concurrency=5,
+            ),
+            abatch_completion(
+                model="anthropic/claude-3-5-sonnet-20240620",
+                messages=_messages(20),
+                max_concurrency=5,
+                max_concurrency_per_provider={"anthropic": 2},
+            ),
+        )
+
+    assert max_running["openai"] == 5
+    assert max_running["anthropic"] == 2
+
+
+@pytest.mark.asyncio
+async def test_abatch_completion_iter_cancels_remaining_requests():
+    cancelled = []
+
+    async def mock_acompletion(**kwargs):
+        if kwargs["messages"][0]["content"] == "prompt-0":
+            return "fast"
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(kwargs["messages"][0]["content"])
+            raise
+
+    with patch.object(litellm, "acompletion", side_effect=mock_acompletion):
+        iterator = abatch_completion_iter(model="gpt-4o-mini", messages=_messages(3))
+        assert await iterator.__anext__() == (0, "fast")
+        await iterator.aclose()
+        await asyncio.sleep(0)
+
+    assert sorted(cancelled) == ["prompt-1", "prompt-2"]
+
+
+@pytest.mark.asyncio
+async def test_abatch_completion_models():
+    async def mock_acompletion(**kwargs):
+        if kwargs["model"] == "model-0":
+            raise ValueError("model-0 failed")
+        if kwargs["model"] == "model-2":
+            await asyncio.sleep(0.05)
+        return kwargs["model"]
+
+    messages = [{"role": "user", "content": "hi"}]
+    with patch.object(litellm, "acompletion", side_effect=mock_acompletion):
+        response = await abatch_completion_models(
+            models=["model-0", "model-1", "model-2"], messages=messages
+        )
+        assert response == "model-1"
+
+        responses = await abatch_completion_models_all_responses(
+            models=["model-0", "model-1", "model-2"], messages=messages
+        )
+        assert responses == ["model-1", "model-2"]
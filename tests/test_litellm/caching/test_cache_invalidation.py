@@ -0,0 +1,134 @@
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.cache_invalidation import CacheInvalidator
+from litellm.caching.dual_cache import DualCache
+from litellm.caching.pubsub import InMemoryPubSubChannel
+
+
+async def _make_instances(channel: str, count: int = 2):
+    caches = []
+    for _ in range(count):
+        cache = DualCache()
+        cache.cache_invalidator = CacheInvalidator(
+            cache=cache, channel=InMemoryPubSubChannel(channel=channel)
+        )
+        await cache.cache_invalidator.start()
+        await cache.async_set_cache(key="key-1", value="value-1")
+        await cache.async_set_cache(key="key-2", value="value-2")
+        caches.append(cache)
+    return caches
+
+
+@pytest.mark.asyncio
+async def test_invalidate_evicts_keys_on_every_instance():
+    cache_a, cache_b = await _make_instances(channel="test-evict")
+
+    await cache_a.async_invalidate_cache(keys=["key-1"])
+
+    for cache in (cache_a, cache_b):
+        assert await cache.async_get_cache(key="key-1") is None
+        assert await cache.async_get_cache(key="key-2") == "value-2"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_skip_local():
+    cache_a, cache_b = await _make_instances(channel="test-skip-local")
+
+    await cache_a.async_set_cache(key="key-1", value="updated")
+    await cache_a.async_invalidate_cache(keys=["key-1"], skip_local=True)
+
+    assert await cache_a.async_get_cache(key="key-1") == "updated"
+    assert await cache_b.async_get_cache(key="key-1") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidate_without_invalidator_is_local():
+    cache = DualCache()
+    await cache.async_set_cache(key="key-1", value="value-1")
+
+    await cache.async_invalidate_cache(keys=["key-1"])
+
+    assert await cache.async_get_cache(key="key-1") is None
+
+
+@pytest.mark.asyncio
+async def test_missed_message_flushes_in_memory_cache():
+    cache_a, cache_b = await _make_instances(channel="test-missed")
+    assert cache_b.cache_invalidator is not None
+
+    await cache_a.async_invalidate_cache(keys=["key-1"])
+    # publisher seq jumps - a message was lost
+    cache_b.cache_invalidator._handle_message(
+        {
+            "version": 1,
+            "publisher": cache_a.cache_invalidator.instance_id,
+            "seq": 5,
+            "keys": ["key-1"],
+        }
+    )
+    assert await cache_b.async_get_cache(key="key-2") is None
+
+    # unknown message version
+    await cache_b.async_set_cache(key="key-2", value="value-2")
+    cache_b.cache_invalidator._handle_message({"version": 2, "keys": []})
+    assert await cache_b.async_get_cache(key="key-2") is None
+
+
+@pytest.mark.asyncio
+async def test_stopped_instance_stops_receiving():
+    cache_a, cache_b = await _make_instances(channel="test-stop")
+    await cache_b.cache_invalidator.stop()
+
+    await cache_a.async_invalidate_cache(keys=["key-1"])
+
+    assert await cache_b.async_get_cache(key="key-1") == "value-1"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_invalidations_are_published_in_seq_order():
+    """
+    A slow publish can't be overtaken by the next invalidation - subscribers would see a gap in `seq` and flush
+    """
+    channel = MagicMock()
+    published = []
+
+    async def _publish(message: dict):
+        await asyncio.sleep(0.02 if message["keys"] == ["key-1"] else 0)
+        published.append(message["seq"])
+
+    channel.publish = AsyncMock(side_effect=_publish)
+    cache_invalidator = CacheInvalidator(cache=DualCache(), channel=channel)
+
+    await asyncio.gather(
+        cache_invalidator.invalidate(keys=["key-1"]),
+        cache_invalidator.invalidate(keys=["key-2"]),
+    )
+
+    assert published == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_does_not_skip_seq():
+    cache_a, cache_b = await _make_instances(channel="test-failed-publish")
+    publish = cache_a.cache_invalidator.channel.publish
+    cache_a.cache_invalidator.channel.publish = AsyncMock(
+        side_effect=ConnectionError("connection lost")
+    )
+    await cache_a.async_invalidate_cache(keys=["key-1"])
+
+    cache_a.cache_invalidator.channel.publish = publish
+    await cache_a.async_invalidate_cache(keys=["key-1"])
+    await cache_a.async_invalidate_cache(keys=["key-1"])
+
+    # no gap in `seq` - cache_b only evicted key-1, instead of flushing
+    assert await cache_b.async_get_cache(key="key-1") is None
+    assert await cache_b.async_get_cache(key="key-2") == "value-2"
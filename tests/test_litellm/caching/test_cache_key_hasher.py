@@ -0,0 +1,141 @@
+import hashlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.cache_key_hasher import (
+    CACHE_KEY_MESSAGE_PREFIX_MIN_LENGTH,
+    message_prefix_hash_cache,
+)
+from litellm.caching.caching import Cache
+
+LONG_CONTENT = "a" * CACHE_KEY_MESSAGE_PREFIX_MIN_LENGTH
+
+
+@pytest.fixture(autouse=True)
+def clear_message_prefix_hash_cache():
+    message_prefix_hash_cache.clear()
+    yield
+    message_prefix_hash_cache.clear()
+
+
+def _get_concatenated_cache_key(**kwargs) -> str:
+    """cache key as it was computed before incremental hashing - keys must stay stable across versions"""
+    cache_key = ""
+    for param, value in kwargs.items():
+        cache_key += f"{str(param)}: {str(value)}"
+    return hashlib.sha256(cache_key.encode()).hexdigest()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {
+            "model": "gpt-4o",
+            "messages": [
+                {"role": "system", "content": "You are a helpful assistant ü"},
+                {"role": "user", "content": [{"type": "text", "text": "Hey"}]},
+            ],
+            "temperature": 0.2,
+        },
+        {"model": "gpt-4o", "messages": [], "max_tokens": 10},
+        {"model": "text-embedding-3-small", "input": ["hello", "world"]},
+        {
+            "model": "gpt-4o",
+            "messages": [{"role": "user", "content": LONG_CONTENT}],
+        },
+    ],
+)
+def test_cache_key_matches_concatenated_cache_key(kwargs):
+    cache = Cache()
+    assert cache.get_cache_key(**kwargs) == _get_concatenated_cache_key(**kwargs)
+    # second call is served from the message prefix cache
+    assert cache.get_cache_key(**kwargs) == _get_concatenated_cache_key(**kwargs)
+
+
+def test_multi_turn_conversation_reuses_message_prefix(monkeypatch):
+    cache = Cache()
+    messages = [{"role": "user", "content": LONG_CONTENT}]
+    cache.get_cache_key(model="gpt-4o", messages=messages)
+
+    messages = messages + [
+        {"role": "assistant", "content": "Hello"},
+        {"role": "user", "content": "How are you?"},
+    ]
+    serialized_messages = []
+    original_repr = repr
+
+    def _spy_repr(obj):
+        serialized_messages.append(obj)
+        return original_repr(obj)
+
+    monkeypatch.setattr("builtins.repr", _spy_repr)
+    cache_key = cache.get_cache_key(model="gpt-4o", messages=messages)
+    monkeypatch.undo()
+
+    assert cache_key == _get_concatenated_cache_key(model="gpt-4o", messages=messages)
+    assert messages[0] not in serialized_messages
+
+
+def test_mutated_message_is_rehashed():
+    cache = Cache()
+    messages = [
+        {"role": "user", "content": LONG_CONTENT},
+        {"role": "user", "content": [{"type": "text", "text": "Hey"}]},
+    ]
+    cache_key = cache.get_cache_key(model="gpt-4o", messages=messages)
+
+    messages[1]["content"][0]["text"] = "Bye"
+    mutated_cache_key = cache.get_cache_key(model="gpt-4o", messages=messages)
+    assert mutated_cache_key != cache_key
+    assert mutated_cache_key == _get_concatenated_cache_key(
+        model="gpt-4o", messages=messages
+    )
+
+    messages[0]["content"] = LONG_CONTENT + "b"
+    assert cache.get_cache_key(
+        model="gpt-4o", messages=messages
+    ) == _get_concatenated_cache_key(model="gpt-4o", messages=messages)
+
+
+def test_message_prefix_depends_on_preceding_params():
+    cache = Cache()
+    messages = [{"role": "user", "content": LONG_CONTENT}]
+
+    gpt_4o_cache_key = cache.get_cache_key(model="gpt-4o", messages=messages)
+    gpt_4o_mini_cache_key = cache.get_cache_key(model="gpt-4o-mini", messages=messages)
+
+    assert gpt_4o_cache_key != gpt_4o_mini_cache_key
+    assert gpt_4o_mini_cache_key == _get_concatenated_cache_key(
+        model="gpt-4o-mini", messages=messages
+    )
+
+
+@pytest.mark.parametrize("mutated_value", [True, 1.0])
+def test_message_value_replaced_with_equal_value_of_other_type_is_rehashed(
+    mutated_value,
+):
+    """
+    `1 == True == 1.0`, but they serialize differently - the cached prefix must not be reused
+    """
+    cache = Cache()
+    messages = [
+        {"role": "user", "content": LONG_CONTENT, "index": 1},
+        {"role": "user", "content": [{"type": "text", "text": "Hey", "index": 1}]},
+    ]
+    cache.get_cache_key(model="gpt-4o", messages=messages)
+
+    messages[0]["index"] = mutated_value
+    assert cache.get_cache_key(
+        model="gpt-4o", messages=messages
+    ) == _get_concatenated_cache_key(model="gpt-4o", messages=messages)
+
+    messages[1]["content"][0]["index"] = mutated_value
+    assert cache.get_cache_key(
+        model="gpt-4o", messages=messages
+    ) == _get_concatenated_cache_key(model="gpt-4o", messages=messages)
@@ -0,0 +1,140 @@
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.dual_cache import DualCache, LimitedSizeOrderedDict
+from litellm.caching.redis_cache import RedisCache
+
+
+def _make_dual_cache(redis_values: dict, latency: float = 0.01):
+    redis_cache = MagicMock(spec=RedisCache)
+
+    async def _async_batch_get_cache(key_list, parent_otel_span=None):
+        await asyncio.sleep(latency)
+        return {key: redis_values.get(key) for key in key_list}
+
+    redis_cache.async_batch_get_cache = AsyncMock(side_effect=_async_batch_get_cache)
+    return DualCache(redis_cache=redis_cache), redis_cache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batch_gets_for_same_keys_share_one_redis_call():
+    dual_cache, redis_cache = _make_dual_cache({"key1": "value1", "key2": "value2"})
+
+    results = await asyncio.gather(
+        *(dual_cache.async_batch_get_cache(["key1", "key2"]) for _ in range(10))
+    )
+
+    assert results == [["value1", "value2"]] * 10
+    assert redis_cache.async_batch_get_cache.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batch_gets_are_merged_into_one_mget():
+    dual_cache, redis_cache = _make_dual_cache({"key1": "value1", "key3": "value3"})
+
+    results = await asyncio.gather(
+        dual_cache.async_batch_get_cache(["key1", "key2"]),
+        dual_cache.async_batch_get_cache(["key3"]),
+        dual_cache.async_batch_get_cache(["key2", "key3"]),
+    )
+
+    assert results == [["value1", None], ["value3"], [None, "value3"]]
+    redis_cache.async_batch_get_cache.assert_called_once()
+    assert redis_cache.async_batch_get_cache.call_args.args[0] == [
+        "key1",
+        "key2",
+        "key3",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_get_joins_in_flight_redis_call():
+    dual_cache, redis_cache = _make_dual_cache({"key1": "value1"}, latency=0.05)
+
+    first_call = asyncio.create_task(dual_cache.async_batch_get_cache(["key1"]))
+    await asyncio.sleep(0.01)  # first MGET is in flight
+    second_result = await dual_cache.async_batch_get_cache(["key1"])
+
+    assert await first_call == ["value1"]
+    assert second_result == ["value1"]
+    assert redis_cache.async_batch_get_cache.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_get_negative_caching():
+    """
+    Keys missing from Redis are not re-queried within `redis_batch_cache_expiry`, found keys are served from memory
+    """
+    dual_cache, redis_cache = _make_dual_cache({"key1": "value1"})
+
+    assert await dual_cache.async_batch_get_cache(["key1", "missing"]) == [
+        "value1",
+        None,
+    ]
+    assert "missing" in dual_cache.last_redis_batch_access_time
+    assert "key1" not in dual_cache.last_redis_batch_access_time
+
+    assert await dual_cache.async_batch_get_cache(["key1", "missing"]) == [
+        "value1",
+        None,
+    ]
+    assert redis_cache.async_batch_get_cache.call_count == 1
+
+    dual_cache.last_redis_batch_access_time["missing"] -= (
+        dual_cache.redis_batch_cache_expiry
+    )
+    await dual_cache.async_batch_get_cache(["missing"])
+    assert redis_cache.async_batch_get_cache.call_count == 2
+    assert redis_cache.async_batch_get_cache.call_args.args[0] == ["missing"]
+
+
+@pytest.mark.asyncio
+async def test_batch_get_redis_error_is_shared_by_waiting_callers():
+    dual_cache, redis_cache = _make_dual_cache({})
+    redis_cache.async_batch_get_cache.side_effect = Exception("redis down")
+
+    results = await asyncio.gather(
+        dual_cache.async_batch_get_cache(["key1"]),
+        dual_cache.async_batch_get_cache(["key1"]),
+    )
+
+    assert results == [None, None]
+    assert redis_cache.async_batch_get_cache.call_count == 1
+
+    # next batch get is not blocked by the failed one
+    redis_cache.async_batch_get_cache.side_effect = None
+    redis_cache.async_batch_get_cache.return_value = {"key1": "value1"}
+    assert await dual_cache.async_batch_get_cache(["key1"]) == ["value1"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_redis_call():
+    dual_cache, redis_cache = _make_dual_cache({"key1": "value1"}, latency=0.05)
+
+    cancelled_call = asyncio.create_task(dual_cache.async_batch_get_cache(["key1"]))
+    other_call = asyncio.create_task(dual_cache.async_batch_get_cache(["key1"]))
+    await asyncio.sleep(0.01)
+    cancelled_call.cancel()
+
+    assert await other_call == ["value1"]
+    assert redis_cache.async_batch_get_cache.call_count == 1
+
+
+def test_limited_size_ordered_dict_update_does_not_evict():
+    limited_dict = LimitedSizeOrderedDict(max_size=2)
+    limited_dict["key1"] = 1
+    limited_dict["key2"] = 2
+
+    limited_dict["key2"] = 3
+    assert dict(limited_dict) == {"key1": 1, "key2": 3}
+
+    limited_dict["key3"] = 4
+    assert dict(limited_dict) == {"key2": 3, "key3": 4}
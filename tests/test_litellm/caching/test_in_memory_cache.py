@@ -188,14 +188,155 @@ def test_in_memory_cache_eviction_order():
     assert "new_item" in in_memory_cache.cache_dict
 
 
-def test_in_memory_cache_heap_size_staus_bounded():
+def test_in_memory_cache_timing_wheel_size_stays_bounded():
     """
-    Test that the expiration_heap does not grow unbounded when the same key is updated repeaatedly.
+    Test that the expiration timing wheel does not grow unbounded when the same key is updated repeatedly.
     """
     in_memory_cache = InMemoryCache(max_size_in_memory=10)
 
     for i in range(1_000):
         in_memory_cache.set_cache(key="hot_key", value=f"value_{i}", ttl=60)
 
-    # Expiration heap should only have 1 entry
-    assert len(in_memory_cache.expiration_heap) == 1
+    # Timing wheel should only have 1 entry
+    assert (
+        sum(len(bucket) for bucket in in_memory_cache._timing_wheel.values()) == 1
+    )
+
+
+def test_in_memory_cache_lru_eviction():
+    """
+    Test that reading a key marks it as recently used, so it survives eviction.
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=2)
+
+    in_memory_cache.set_cache(key="key_a", value="value_a", ttl=100)
+    in_memory_cache.set_cache(key="key_b", value="value_b", ttl=200)
+
+    assert in_memory_cache.get_cache(key="key_a") == "value_a"
+
+    in_memory_cache.set_cache(key="key_c", value="value_c", ttl=300)
+
+    assert "key_a" in in_memory_cache.cache_dict
+    assert "key_b" not in in_memory_cache.cache_dict
+    assert "key_c" in in_memory_cache.cache_dict
+    assert in_memory_cache.get_cache_stats()["evictions"] == 1
+
+
+def test_in_memory_cache_max_size_in_bytes():
+    """
+    Test that the total size of the cache is bounded by max_size_in_bytes, and size is tracked on overwrite / delete.
+    """
+    value = "a" * 1000
+    value_size = sys.getsizeof(value)
+    in_memory_cache = InMemoryCache(
+        max_size_in_memory=100, max_size_in_bytes=value_size * 3
+    )
+
+    for i in range(5):
+        in_memory_cache.set_cache(key=f"key_{i}", value=value)
+
+    assert len(in_memory_cache.cache_dict) == 3
+    assert in_memory_cache.get_cache_stats()["size_in_bytes"] == value_size * 3
+    assert "key_0" not in in_memory_cache.cache_dict
+    assert "key_1" not in in_memory_cache.cache_dict
+
+    # overwriting a key does not double count its size
+    in_memory_cache.set_cache(key="key_4", value=value)
+    assert in_memory_cache.get_cache_stats()["size_in_bytes"] == value_size * 3
+
+    in_memory_cache.delete_cache(key="key_4")
+    assert in_memory_cache.get_cache_stats()["size_in_bytes"] == value_size * 2
+
+
+def test_in_memory_cache_large_objects_fit_max_size_per_item():
+    """
+    Test that max_size_per_item checks the shallow size, so large router / auth objects are still cached.
+    """
+    in_memory_cache = InMemoryCache()
+    # e.g. a `{model_group}_map` with 1000 deployments
+    model_group_map = {
+        f"deployment-{i}": {
+            "model_name": "gpt-4o",
+            "litellm_params": {"model": "azure/gpt-4o", "api_base": "a" * 1000},
+        }
+        for i in range(1000)
+    }
+    in_memory_cache.set_cache(key="gpt-4o_map", value=model_group_map)
+    assert in_memory_cache.get_cache(key="gpt-4o_map") is model_group_map
+
+    # large flat values are still rejected
+    in_memory_cache = InMemoryCache(max_size_per_item=1)
+    in_memory_cache.set_cache(key="key", value="a" * 10_000)
+    assert in_memory_cache.get_cache(key="key") is None
+
+
+def test_in_memory_cache_max_size_in_bytes_counts_nested_values():
+    """
+    Test that max_size_in_bytes counts the items of containers / pydantic fields, not only the container.
+    """
+    from pydantic import BaseModel
+
+    class Deployment(BaseModel):
+        api_base: str
+
+    value = [{"api_base": "a" * 10_000} for _ in range(100)]
+    in_memory_cache = InMemoryCache(max_size_in_bytes=10_000_000)
+    value_size = in_memory_cache._get_value_size_in_bytes(value)
+    assert value_size > 100 * 10_000
+    assert value_size < 1.1 * 100 * sys.getsizeof("a" * 10_000) + 100 * 1000
+
+    assert in_memory_cache._get_value_size_in_bytes(
+        Deployment(api_base="a" * 10_000)
+    ) > 10_000
+
+    in_memory_cache = InMemoryCache(max_size_in_bytes=value_size * 2)
+    for i in range(3):
+        in_memory_cache.set_cache(key=f"key_{i}", value=value)
+    assert len(in_memory_cache.cache_dict) == 2
+    assert in_memory_cache.get_cache_stats()["size_in_bytes"] <= value_size * 2
+
+
+def test_in_memory_cache_overwrite_when_full_does_not_evict():
+    """
+    Test that updating an existing key in a full cache does not evict another key.
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=2)
+
+    in_memory_cache.set_cache(key="key_a", value="value_a")
+    in_memory_cache.set_cache(key="key_b", value="value_b")
+    in_memory_cache.set_cache(key="key_a", value="value_a_2")
+
+    assert in_memory_cache.get_cache(key="key_a") == "value_a_2"
+    assert in_memory_cache.get_cache(key="key_b") == "value_b"
+    assert in_memory_cache.get_cache_stats()["evictions"] == 0
+
+
+def test_in_memory_cache_stats():
+    in_memory_cache = InMemoryCache()
+
+    in_memory_cache.set_cache(key="key_a", value="value_a")
+    in_memory_cache.get_cache(key="key_a")
+    in_memory_cache.get_cache(key="key_a")
+    in_memory_cache.get_cache(key="missing_key")
+
+    stats = in_memory_cache.get_cache_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["num_items"] == 1
+
+
+def test_in_memory_cache_timing_wheel_sweeps_expired_keys():
+    """
+    Test that expired keys are removed by the timing wheel without being read.
+    """
+    in_memory_cache = InMemoryCache()
+    in_memory_cache.set_cache(key="short_lived", value="value", ttl=1)
+    in_memory_cache.set_cache(key="long_lived", value="value", ttl=600)
+
+    with patch("time.time", return_value=time.time() + 5):
+        in_memory_cache.set_cache(key="new_key", value="value")
+
+    assert "short_lived" not in in_memory_cache.cache_dict
+    assert "short_lived" not in in_memory_cache.ttl_dict
+    assert "long_lived" in in_memory_cache.cache_dict
+    assert in_memory_cache.get_cache_stats()["expirations"] == 1
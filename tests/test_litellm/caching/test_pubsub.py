@@ -0,0 +1,120 @@
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.pubsub import InMemoryPubSubChannel, RedisPubSubChannel
+
+
+@pytest.mark.asyncio
+async def test_in_memory_channel_delivers_to_subscribers_of_same_channel():
+    publisher = InMemoryPubSubChannel(channel="test-in-memory")
+    subscriber = InMemoryPubSubChannel(channel="test-in-memory")
+    other_channel_subscriber = InMemoryPubSubChannel(channel="test-in-memory-other")
+    on_message = MagicMock()
+    other_on_message = MagicMock()
+    await subscriber.subscribe(on_message=on_message, on_reset=MagicMock())
+    await other_channel_subscriber.subscribe(
+        on_message=other_on_message, on_reset=MagicMock()
+    )
+
+    await publisher.publish({"keys": ["key-1"]})
+    await subscriber.close()
+    await publisher.publish({"keys": ["key-2"]})
+    await other_channel_subscriber.close()
+
+    on_message.assert_called_once_with({"keys": ["key-1"]})
+    other_on_message.assert_not_called()
+    assert subscriber.is_subscribed is False
+
+
+@pytest.mark.asyncio
+async def test_redis_channel_publish_and_reconnect(monkeypatch):
+    monkeypatch.setattr(
+        sys.modules["litellm.caching.pubsub"],
+        "REDIS_PUBSUB_MIN_RECONNECT_BACKOFF_SECONDS",
+        0.01,
+    )
+    delivered = asyncio.Event()
+    messages = [
+        {"type": "message", "data": json.dumps({"keys": ["key-1"]})},
+        ConnectionError("connection lost"),
+        {"type": "message", "data": json.dumps({"keys": ["key-2"]})},
+    ]
+
+    async def _get_message(**kwargs):
+        if not messages:
+            delivered.set()
+            await asyncio.sleep(0.01)
+            return None
+        message = messages.pop(0)
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+    pubsub = MagicMock()
+    pubsub.subscribe = AsyncMock()
+    pubsub.reset = AsyncMock()
+    pubsub.get_message = AsyncMock(side_effect=_get_message)
+    client = MagicMock()
+    client.pubsub.return_value = pubsub
+    client.publish = AsyncMock()
+    redis_cache = MagicMock()
+    redis_cache.init_async_client.return_value = client
+
+    channel = RedisPubSubChannel(redis_cache=redis_cache, channel="test")
+    on_message = MagicMock()
+    on_reset = MagicMock()
+    await channel.subscribe(on_message=on_message, on_reset=on_reset)
+    await asyncio.wait_for(delivered.wait(), timeout=5)
+    await channel.publish({"keys": ["key-3"]})
+    await channel.close()
+
+    assert [c.args[0] for c in on_message.call_args_list] == [
+        {"keys": ["key-1"]},
+        {"keys": ["key-2"]},
+    ]
+    on_reset.assert_called_once()  # re-subscribed after the disconnect
+    assert pubsub.subscribe.await_count == 2
+    client.publish.assert_awaited_once_with("test", json.dumps({"keys": ["key-3"]}))
+
+
+@pytest.mark.asyncio
+async def test_redis_channel_stopped_listener_is_not_subscribed():
+    async def _get_message(**kwargs):
+        await asyncio.sleep(0.01)
+        return None
+
+    pubsub = MagicMock()
+    pubsub.subscribe = AsyncMock()
+    pubsub.reset = AsyncMock()
+    pubsub.get_message = AsyncMock(side_effect=_get_message)
+    client = MagicMock()
+    client.pubsub.return_value = pubsub
+    redis_cache = MagicMock()
+    redis_cache.init_async_client.return_value = client
+
+    channel = RedisPubSubChannel(redis_cache=redis_cache, channel="test")
+    on_reset = MagicMock()
+    await channel.subscribe(on_message=MagicMock(), on_reset=on_reset)
+    while not channel.is_subscribed:
+        await asyncio.sleep(0.01)
+
+    # the listener task dies, e.g. cancelled on shutdown of its event loop
+    channel._listen_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await channel._listen_task
+    assert channel.is_subscribed is False
+
+    await channel.subscribe(on_message=MagicMock(), on_reset=on_reset)
+    while not channel.is_subscribed:
+        await asyncio.sleep(0.01)
+    on_reset.assert_called_once()  # messages published while stopped are lost
+    await channel.close()
@@ -44,7 +44,8 @@ class TestLangfuseInMemoryCache:
             expired_time = time.time() - 1  # Already expired
             self.cache.cache_dict["test_key"] = mock_logger
             self.cache.ttl_dict["test_key"] = expired_time
-            self.cache.expiration_heap = [(expired_time, "test_key")]
+            self.cache._add_key_to_timing_wheel("test_key", expired_time)
+            self.cache._last_swept_tick = int(expired_time) - 1
 
             initial_count = litellm.initialized_langfuse_clients
 
@@ -0,0 +1,86 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.get_llm_provider_logic import (
+    LLMProviderResolver,
+    get_llm_provider,
+    llm_provider_resolver,
+)
+
+
+@pytest.mark.parametrize(
+    "model, custom_llm_provider, expected",
+    [
+        ("gpt-4o", None, ("gpt-4o", "openai")),
+        ("ft:gpt-4o:my-org:custom:id", None, ("ft:gpt-4o:my-org:custom:id", "openai")),
+        ("claude-3-5-sonnet-20240620", None, ("claude-3-5-sonnet-20240620", "anthropic")),
+        ("cohere/command-r", None, ("command-r", "cohere_chat")),
+        ("azure/command-r-plus", None, ("azure/command-r-plus", "openai")),
+        ("gpt-4o", "azure", ("gpt-4o", "azure")),
+        ("bedrock/anthropic.claude-v2", None, ("anthropic.claude-v2", "bedrock")),
+        (
+            "meta/llama-2-70b-chat:" + "a" * 64,
+            None,
+            ("meta/llama-2-70b-chat:" + "a" * 64, "replicate"),
+        ),
+        ("bytez/my-model", None, ("my-model", "bytez")),
+        ("*", None, ("*", "openai")),
+    ],
+)
+def test_get_llm_provider_resolution(model, custom_llm_provider, expected):
+    for _ in range(2):  # 2nd call is memoized
+        resolved_model, resolved_provider, _, _ = get_llm_provider(
+            model=model, custom_llm_provider=custom_llm_provider
+        )
+        assert (resolved_model, resolved_provider) == expected
+
+
+def test_memoized_resolution_still_reads_env(monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "key-1")
+    assert get_llm_provider(model="groq/llama3-8b-8192")[2] == "key-1"
+
+    monkeypatch.setenv("GROQ_API_KEY", "key-2")
+    assert get_llm_provider(model="groq/llama3-8b-8192")[2] == "key-2"
+
+
+def test_unknown_model_raises():
+    for _ in range(2):
+        with pytest.raises(litellm.exceptions.BadRequestError):
+            get_llm_provider(model="my-unknown-model-1234")
+
+
+def test_resolver_rebuilds_when_model_list_changes(monkeypatch):
+    with pytest.raises(litellm.exceptions.BadRequestError):
+        get_llm_provider(model="my-new-anthropic-model")
+
+    monkeypatch.setattr(
+        litellm, "anthropic_models", litellm.anthropic_models | {"my-new-anthropic-model"}
+    )
+    assert get_llm_provider(model="my-new-anthropic-model")[1] == "anthropic"
+
+    litellm.anthropic_models.add("my-other-anthropic-model")
+    assert get_llm_provider(model="my-other-anthropic-model")[1] == "anthropic"
+
+
+def test_resolver_is_bounded():
+    resolver = LLMProviderResolver(max_size=2)
+    for model in ["gpt-4o", "gpt-4o-mini", "gpt-4"]:
+        resolver.resolve(model=model, custom_llm_provider=None)
+
+    assert list(resolver._resolutions.keys()) == [
+        ("gpt-4o-mini", None),
+        ("gpt-4", None),
+    ]
+
+
+def test_resolution_is_shared():
+    first = llm_provider_resolver.resolve(model="gpt-4o", custom_llm_provider=None)
+    second = llm_provider_resolver.resolve(model="gpt-4o", custom_llm_provider=None)
+    assert first is second
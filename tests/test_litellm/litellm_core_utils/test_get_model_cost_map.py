@@ -0,0 +1,185 @@
+import json
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.get_model_cost_map import (
+    ModelCostMapDiskCache,
+    ModelCostMapRefresher,
+    get_bundled_model_cost_map,
+)
+
+URL = "https://example.com/model_prices_and_context_window.json"
+REMOTE_MODEL_COST = {
+    "remote-model": {"litellm_provider": "test-provider", "mode": "chat"}
+}
+
+
+def _make_response(status_code: int, json_data=None, etag=None) -> httpx.Response:
+    return httpx.Response(
+        status_code=status_code,
+        json=json_data,
+        headers={"etag": etag} if etag else {},
+        request=httpx.Request("GET", URL),
+    )
+
+
+@pytest.fixture(autouse=True)
+def remote_model_cost_map(monkeypatch):
+    monkeypatch.delenv("LITELLM_LOCAL_MODEL_COST_MAP", raising=False)
+    monkeypatch.setattr(litellm, "model_cost", litellm.model_cost)
+
+
+def test_load_with_local_model_cost_map_does_not_refresh(monkeypatch, tmp_path):
+    monkeypatch.setenv("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    refresher = ModelCostMapRefresher(cache_dir=str(tmp_path))
+
+    with patch("httpx.get") as mock_get:
+        model_cost = refresher.load(url=URL)
+
+    assert model_cost == get_bundled_model_cost_map()
+    assert refresher.refresh_thread is None
+    mock_get.assert_not_called()
+
+
+def test_load_does_not_wait_for_remote_map(tmp_path):
+    refresher = ModelCostMapRefresher(cache_dir=str(tmp_path))
+    release_response = threading.Event()
+
+    def _slow_get(*args, **kwargs):
+        release_response.wait(timeout=5)
+        return _make_response(200, REMOTE_MODEL_COST, etag='"v1"')
+
+    with patch("httpx.get", side_effect=_slow_get):
+        litellm.model_cost = refresher.load(url=URL)
+        assert litellm.model_cost == get_bundled_model_cost_map()
+
+        release_response.set()
+        assert refresher.wait(timeout=5)
+
+    assert litellm.model_cost == REMOTE_MODEL_COST
+    assert ModelCostMapDiskCache(url=URL, cache_dir=str(tmp_path)).load() == (
+        '"v1"',
+        REMOTE_MODEL_COST,
+    )
+
+
+def test_load_uses_disk_cache_and_sends_etag(tmp_path):
+    ModelCostMapDiskCache(url=URL, cache_dir=str(tmp_path)).save(
+        etag='"v1"', model_cost=REMOTE_MODEL_COST
+    )
+    refresher = ModelCostMapRefresher(cache_dir=str(tmp_path))
+
+    with patch("httpx.get", return_value=_make_response(304)) as mock_get:
+        litellm.model_cost = refresher.load(url=URL)
+        assert refresher.wait(timeout=5)
+
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    assert litellm.model_cost == REMOTE_MODEL_COST
+
+
+def test_failed_refresh_keeps_loaded_map(tmp_path):
+    refresher = ModelCostMapRefresher(cache_dir=str(tmp_path))
+
+    with patch("httpx.get", side_effect=httpx.ConnectError("offline")):
+        loaded_model_cost = refresher.load(url=URL)
+        litellm.model_cost = loaded_model_cost
+        assert refresher.wait(timeout=5)
+
+    assert litellm.model_cost is loaded_model_cost
+    assert ModelCostMapDiskCache(url=URL, cache_dir=str(tmp_path)).load() is None
+
+
+def test_refresh_keeps_registered_models(tmp_path):
+    refresher = ModelCostMapRefresher(cache_dir=str(tmp_path))
+
+    with patch("threading.Thread"):
+        litellm.model_cost = refresher.load(url=URL)
+    refresher.register_model_cost(
+        model_cost_key="my-custom-model",
+        model_info={"litellm_provider": "test-provider", "input_cost_per_token": 1},
+    )
+
+    with patch(
+        "httpx.get", return_value=_make_response(200, dict(REMOTE_MODEL_COST))
+    ):
+        refresher._refresh(url=URL)
+
+    assert litellm.model_cost["remote-model"] == REMOTE_MODEL_COST["remote-model"]
+    assert litellm.model_cost["my-custom-model"]["input_cost_per_token"] == 1
+
+
+def test_refresh_replaces_model_lists_without_mutating_them(monkeypatch, tmp_path):
+    for name in (
+        "anthropic_models",
+        "model_list",
+        "model_list_set",
+        "models_by_provider",
+    ):
+        monkeypatch.setattr(litellm, name, getattr(litellm, name))
+    refresher = ModelCostMapRefresher(cache_dir=str(tmp_path))
+    with patch("threading.Thread"):
+        litellm.model_cost = refresher.load(url=URL)
+    anthropic_models = litellm.anthropic_models
+    model_list = litellm.model_list
+    models_by_provider = litellm.models_by_provider
+    remote_model_cost = {
+        **litellm.model_cost,
+        "claude-from-remote-map": {"litellm_provider": "anthropic", "mode": "chat"},
+    }
+
+    with patch("httpx.get", return_value=_make_response(200, remote_model_cost)):
+        refresher._refresh(url=URL)
+
+    assert "claude-from-remote-map" in litellm.anthropic_models
+    assert "claude-from-remote-map" in litellm.model_list
+    assert "claude-from-remote-map" in litellm.model_list_set
+    assert "claude-from-remote-map" in litellm.models_by_provider["anthropic"]
+    # readers holding the previous objects are not affected
+    assert "claude-from-remote-map" not in anthropic_models
+    assert "claude-from-remote-map" not in model_list
+    assert "claude-from-remote-map" not in models_by_provider["anthropic"]
+
+
+def test_refresh_is_dropped_if_model_cost_was_replaced(tmp_path):
+    refresher = ModelCostMapRefresher(cache_dir=str(tmp_path))
+
+    with patch("threading.Thread"):
+        litellm.model_cost = refresher.load(url=URL)
+    reloaded_model_cost = {"reloaded-model": {"litellm_provider": "test-provider"}}
+    litellm.model_cost = reloaded_model_cost
+
+    with patch("httpx.get", return_value=_make_response(200, REMOTE_MODEL_COST)):
+        refresher._refresh(url=URL)
+
+    assert litellm.model_cost is reloaded_model_cost
+
+
+def test_disk_cache_ignores_invalid_file(tmp_path):
+    disk_cache = ModelCostMapDiskCache(url=URL, cache_dir=str(tmp_path))
+    assert disk_cache.cache_file is not None
+    with open(disk_cache.cache_file, "w") as f:
+        f.write('{"etag": "v1", "model_cost": {')
+
+    assert disk_cache.load() is None
+
+    with open(disk_cache.cache_file, "w") as f:
+        json.dump({"etag": "v1", "model_cost": {}}, f)
+    assert disk_cache.load() is None
+
+
+def test_disk_cache_disabled_with_empty_cache_dir():
+    disk_cache = ModelCostMapDiskCache(url=URL, cache_dir="")
+    disk_cache.save(etag='"v1"', model_cost=REMOTE_MODEL_COST)
+
+    assert disk_cache.cache_file is None
+    assert disk_cache.load() is None
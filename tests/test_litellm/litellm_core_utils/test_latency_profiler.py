@@ -0,0 +1,106 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.latency_profiler import (
+    EVENT_LOOP_LAG_STAGE,
+    LatencyHistogram,
+    LatencyProfiler,
+)
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for _ in range(90):
+        histogram.record(1_500_000)  # 1.5ms
+    for _ in range(10):
+        histogram.record(40_000_000)  # 40ms
+
+    summary = histogram.summary()
+    assert summary["count"] == 100
+    assert summary["max_ms"] == 40
+    assert summary["mean_ms"] == pytest.approx(5.35)
+    # estimated from the bucket upper bound (<= 2x the real value)
+    assert 1.5 <= summary["p50_ms"] <= 3
+    assert 1.5 <= summary["p90_ms"] <= 3
+    assert summary["p99_ms"] == 40
+
+
+@pytest.mark.asyncio
+async def test_profile_stage_only_records_when_enabled():
+    profiler = LatencyProfiler()
+
+    @profiler.profile_stage("routing")
+    async def get_deployment():
+        await asyncio.sleep(0.01)
+        return "deployment"
+
+    assert await get_deployment() == "deployment"
+    assert profiler.histograms == {}
+
+    profiler.enabled = True
+    assert await get_deployment() == "deployment"
+    assert await profiler.time_awaitable("provider_call", get_deployment()) == (
+        "deployment"
+    )
+
+    summaries = profiler.get_stage_summaries()
+    assert summaries["routing"]["count"] == 2
+    assert summaries["provider_call"]["count"] == 1
+    assert summaries["provider_call"]["max_ms"] >= 10
+
+
+@pytest.mark.asyncio
+async def test_profile_stage_records_failures():
+    profiler = LatencyProfiler()
+    profiler.enabled = True
+
+    @profiler.profile_stage("auth")
+    async def auth():
+        raise ValueError("invalid key")
+
+    with pytest.raises(ValueError):
+        await auth()
+    assert profiler.histograms["auth"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_event_loop_lag_monitor():
+    profiler = LatencyProfiler(event_loop_lag_interval=0.01)
+    profiler.enable()
+    await asyncio.sleep(0.02)
+    time.sleep(0.05)  # block the event loop
+    await asyncio.sleep(0.03)
+    profiler.disable()
+
+    lag = profiler.get_stage_summaries()[EVENT_LOOP_LAG_STAGE]
+    assert lag["count"] >= 2
+    assert lag["max_ms"] >= 30
+
+
+@pytest.mark.asyncio
+async def test_profile_cpu():
+    profiler = LatencyProfiler()
+
+    async def busy():
+        for _ in range(5):
+            sum(i * i for i in range(10_000))
+            await asyncio.sleep(0.001)
+
+    task = asyncio.create_task(busy())
+    report_task = asyncio.create_task(profiler.profile_cpu(seconds=0.05, top_n=10))
+    await asyncio.sleep(0)
+    with pytest.raises(ValueError):
+        await profiler.profile_cpu(seconds=0.01)
+
+    report = await report_task
+    await task
+    assert "busy" in report
+    assert "function calls" in report
@@ -1,7 +1,7 @@
 import json
 import os
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -11,6 +11,7 @@ sys.path.insert(
 
 import time
 
+import litellm
 from litellm.constants import SENTRY_DENYLIST, SENTRY_PII_DENYLIST
 from litellm.litellm_core_utils.litellm_logging import Logging as LitellmLogging
 from litellm.litellm_core_utils.litellm_logging import set_callbacks
@@ -223,6 +224,90 @@ async def test_logging_non_streaming_request():
         assert standard_logging_object["stream"] is not True
 
 
+@pytest.mark.asyncio
+async def test_slow_failure_callback_does_not_block_other_failure_callbacks():
+    """
+    Failure callbacks get 1 logging worker queue per callback, like the success callbacks
+    """
+    import asyncio
+
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.litellm_core_utils.logging_worker import GLOBAL_LOGGING_WORKER
+
+    release_slow = asyncio.Event()
+    fast_done = asyncio.Event()
+
+    class SlowFailureLogger(CustomLogger):
+        async def async_log_failure_event(self, kwargs, response_obj, start_time, end_time):
+            await release_slow.wait()
+
+    class FastFailureLogger(CustomLogger):
+        async def async_log_failure_event(self, kwargs, response_obj, start_time, end_time):
+            fast_done.set()
+
+    logging_obj = LitellmLogging(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "Hey"}],
+        stream=False,
+        call_type="acompletion",
+        start_time=time.time(),
+        litellm_call_id="failure-isolation",
+        function_id="1245",
+        dynamic_async_failure_callbacks=[SlowFailureLogger(), FastFailureLogger()],
+    )
+    logging_obj.update_environment_variables(
+        model="gpt-4o", user=None, optional_params={}, litellm_params={}
+    )
+
+    with patch.object(litellm, "_async_failure_callback", []):
+        # run by the logging worker, like the success handler
+        GLOBAL_LOGGING_WORKER.ensure_initialized_and_enqueue(
+            async_coroutine=logging_obj.async_failure_handler(
+                exception=Exception("bad request"), traceback_exception=""
+            )
+        )
+        await asyncio.wait_for(fast_done.wait(), timeout=1.0)
+
+    release_slow.set()
+    await GLOBAL_LOGGING_WORKER.flush()
+
+
+@pytest.mark.asyncio
+async def test_failure_callbacks_awaited_outside_logging_worker():
+    """
+    Called outside the logging worker, the failure callbacks run right away - not on a logging worker queue
+    """
+    from litellm.integrations.custom_logger import CustomLogger
+    from litellm.litellm_core_utils.logging_worker import GLOBAL_LOGGING_WORKER
+
+    failure_logger = CustomLogger()
+    logging_obj = LitellmLogging(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "Hey"}],
+        stream=False,
+        call_type="acompletion",
+        start_time=time.time(),
+        litellm_call_id="failure-outside-worker",
+        function_id="1245",
+        dynamic_async_failure_callbacks=[failure_logger],
+    )
+    logging_obj.update_environment_variables(
+        model="gpt-4o", user=None, optional_params={}, litellm_params={}
+    )
+
+    with patch.object(litellm, "_async_failure_callback", []), patch.object(
+        failure_logger, "async_log_failure_event", new=AsyncMock()
+    ) as mock_async_log_failure_event, patch.object(
+        GLOBAL_LOGGING_WORKER, "enqueue"
+    ) as mock_enqueue:
+        await logging_obj.async_failure_handler(
+            exception=Exception("bad request"), traceback_exception=""
+        )
+
+    mock_async_log_failure_event.assert_awaited_once()
+    mock_enqueue.assert_not_called()
+
+
 def test_get_user_agent_tags():
     from litellm.litellm_core_utils.litellm_logging import StandardLoggingPayloadSetup
 
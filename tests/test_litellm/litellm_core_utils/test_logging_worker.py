@@ -267,3 +267,162 @@ class TestLoggingWorker:
         assert (
             task3_result["context_accessible"] is False
         ), "Task 3 should not have access to context variable"
+
+    @pytest.mark.asyncio
+    async def test_slow_queue_does_not_stall_other_queues(self, logging_worker):
+        """Test that a slow callback queue doesn't delay coroutines on other queues."""
+        slow_started = asyncio.Event()
+        release_slow = asyncio.Event()
+        fast_done = asyncio.Event()
+
+        async def slow_callback():
+            slow_started.set()
+            await release_slow.wait()
+
+        async def fast_callback():
+            fast_done.set()
+
+        logging_worker.enqueue(slow_callback(), queue_name="SlowLogger")
+        await asyncio.wait_for(slow_started.wait(), timeout=1.0)
+        logging_worker.enqueue(fast_callback(), queue_name="FastLogger")
+
+        await asyncio.wait_for(fast_done.wait(), timeout=1.0)
+        metrics = logging_worker.get_queue_metrics()
+        assert metrics["SlowLogger"]["in_flight"] == 1
+        assert metrics["FastLogger"]["processed"] == 1
+
+        release_slow.set()
+        await logging_worker.flush()
+        await logging_worker.stop()
+        assert logging_worker.get_queue_metrics()["SlowLogger"]["processed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_policy(self, logging_worker):
+        """Test that drop_oldest keeps the newest coroutines when a queue is full."""
+        logging_worker.configure_queue(
+            "callback", max_queue_size=2, drop_policy="drop_oldest"
+        )
+        processed = []
+
+        async def log(i: int):
+            processed.append(i)
+
+        with patch("litellm.litellm_core_utils.logging_worker.verbose_logger"):
+            with patch.object(logging_worker, "start"):  # don't process while filling
+                for i in range(5):
+                    logging_worker.enqueue(log(i), queue_name="callback")
+
+        metrics = logging_worker.get_queue_metrics()["callback"]
+        assert metrics["queue_depth"] == 2
+        assert metrics["dropped"] == 3
+        assert metrics["enqueued"] == 2  # the dropped tasks aren't counted as enqueued
+        assert metrics["drop_policy"] == "drop_oldest"
+
+        await logging_worker.clear_queue(queue_name="callback")
+        assert processed == [3, 4]
+        metrics = logging_worker.get_queue_metrics()["callback"]
+        assert metrics["enqueued"] == metrics["processed"] + metrics["queue_depth"]
+
+    @pytest.mark.asyncio
+    async def test_drop_newest_policy(self, logging_worker):
+        """Test that drop_newest (the default) keeps the oldest coroutines when a queue is full."""
+        logging_worker.configure_queue("callback", max_queue_size=2)
+        processed = []
+
+        async def log(i: int):
+            processed.append(i)
+
+        with patch("litellm.litellm_core_utils.logging_worker.verbose_logger"):
+            with patch.object(logging_worker, "start"):
+                for i in range(5):
+                    logging_worker.enqueue(log(i), queue_name="callback")
+
+        metrics = logging_worker.get_queue_metrics()["callback"]
+        assert metrics["dropped"] == 3
+        assert metrics["enqueued"] == 2
+        await logging_worker.clear_queue()
+        assert processed == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_per_queue(self):
+        """Test that a queue runs up to `concurrency` coroutines at a time."""
+        logging_worker = LoggingWorker(timeout=1.0, max_queue_size=10, concurrency=3)
+        running = 0
+        max_running = 0
+
+        async def log():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+
+        for _ in range(6):
+            logging_worker.enqueue(log(), queue_name="callback")
+        await logging_worker.flush()
+        await logging_worker.stop()
+
+        assert max_running == 3
+        assert logging_worker.get_queue_metrics()["callback"]["processed"] == 6
+
+    @pytest.mark.asyncio
+    async def test_same_ordering_key_runs_in_enqueue_order(self):
+        """Test that coroutines of 1 request run one at a time, in enqueue order - also with concurrency > 1."""
+        logging_worker = LoggingWorker(timeout=1.0, max_queue_size=20, concurrency=4)
+        events = []
+
+        async def log(request_id: str, event: str, delay: float):
+            events.append((request_id, event, "start"))
+            await asyncio.sleep(delay)
+            events.append((request_id, event, "end"))
+
+        for request_id in ("request-1", "request-2"):
+            for event, delay in (("pre_call", 0.05), ("stream", 0.01), ("success", 0)):
+                logging_worker.enqueue(
+                    log(request_id, event, delay),
+                    queue_name="callback",
+                    ordering_key=request_id,
+                )
+        await logging_worker.flush()
+        await logging_worker.stop()
+
+        for request_id in ("request-1", "request-2"):
+            assert [e for e in events if e[0] == request_id] == [
+                (request_id, event, stage)
+                for event in ("pre_call", "stream", "success")
+                for stage in ("start", "end")
+            ]
+        # different requests still run concurrently
+        assert events[:2] == [
+            ("request-1", "pre_call", "start"),
+            ("request-2", "pre_call", "start"),
+        ]
+        assert logging_worker._logging_queues["callback"].ordering_tails == {}
+
+    @pytest.mark.asyncio
+    async def test_timed_out_coroutines_are_counted(self):
+        """Test that coroutines exceeding the timeout are counted per queue."""
+        logging_worker = LoggingWorker(timeout=0.05, max_queue_size=10)
+
+        with patch("litellm.litellm_core_utils.logging_worker.verbose_logger"):
+            logging_worker.enqueue(asyncio.sleep(1), queue_name="callback")
+            await logging_worker.flush()
+        await logging_worker.stop()
+
+        metrics = logging_worker.get_queue_metrics()["callback"]
+        assert metrics["timed_out"] == 1
+        assert metrics["processed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_is_running_in_logging_worker(self, logging_worker):
+        """Test that queued coroutines can tell they run on the logging worker."""
+        result = asyncio.get_running_loop().create_future()
+
+        async def log():
+            result.set_result(LoggingWorker.is_running_in_logging_worker())
+
+        assert LoggingWorker.is_running_in_logging_worker() is False
+        logging_worker.start()
+        logging_worker.enqueue(log())
+        assert await asyncio.wait_for(result, timeout=1.0) is True
+        await logging_worker.stop()
@@ -0,0 +1,152 @@
+import copy
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.model_info_index import (
+    ModelInfoIndex,
+    ModelInfoLookup,
+    model_info_index,
+)
+from litellm.utils import _get_model_info_helper
+
+
+@pytest.fixture(autouse=True)
+def local_model_cost(monkeypatch):
+    monkeypatch.setattr(litellm, "model_cost", copy.deepcopy(litellm.model_cost))
+
+
+def test_repeat_lookup_is_served_from_index():
+    model_info = _get_model_info_helper(model="gpt-4o", custom_llm_provider="openai")
+    assert model_info_index.get_lookup(
+        model_cost=litellm.model_cost, model="gpt-4o", custom_llm_provider="openai"
+    ).key == "gpt-4o"
+
+    model_info["input_cost_per_token"] = 100  # callers get a copy
+    indexed_model_info = _get_model_info_helper(
+        model="gpt-4o", custom_llm_provider="openai"
+    )
+    assert (
+        indexed_model_info["input_cost_per_token"]
+        == litellm.model_cost["gpt-4o"]["input_cost_per_token"]
+    )
+
+
+def test_unmapped_model_is_indexed():
+    with pytest.raises(Exception, match="This model isn't mapped yet"):
+        _get_model_info_helper(model="my-unmapped-model", custom_llm_provider="openai")
+    lookup = model_info_index.get_lookup(
+        model_cost=litellm.model_cost,
+        model="my-unmapped-model",
+        custom_llm_provider="openai",
+    )
+    assert lookup is not None and lookup.key is None
+
+    with pytest.raises(Exception, match="This model isn't mapped yet"):
+        _get_model_info_helper(model="my-unmapped-model", custom_llm_provider="openai")
+
+
+def test_register_model_updates_indexed_model():
+    _get_model_info_helper(model="gpt-4o", custom_llm_provider="openai")
+
+    litellm.register_model({"gpt-4o": {"input_cost_per_token": 42}})
+
+    model_info = _get_model_info_helper(model="gpt-4o", custom_llm_provider="openai")
+    assert model_info["input_cost_per_token"] == 42
+
+
+def test_register_model_adds_more_specific_key():
+    with pytest.raises(Exception):
+        _get_model_info_helper(model="my-custom-model", custom_llm_provider="openai")
+
+    litellm.register_model(
+        {
+            "openai/my-custom-model": {
+                "litellm_provider": "openai",
+                "mode": "chat",
+                "input_cost_per_token": 1,
+                "output_cost_per_token": 2,
+            }
+        }
+    )
+
+    model_info = _get_model_info_helper(
+        model="my-custom-model", custom_llm_provider="openai"
+    )
+    assert model_info["key"] == "openai/my-custom-model"
+
+
+def test_in_place_model_cost_edit_is_picked_up():
+    _get_model_info_helper(model="gpt-4o", custom_llm_provider="openai")
+
+    litellm.model_cost["gpt-4o"]["max_input_tokens"] = 7
+
+    model_info = _get_model_info_helper(model="gpt-4o", custom_llm_provider="openai")
+    assert model_info["max_input_tokens"] == 7
+
+
+def test_reassigned_model_cost_resets_index():
+    _get_model_info_helper(model="gpt-4o", custom_llm_provider="openai")
+
+    litellm.model_cost = {
+        "gpt-4o": {"litellm_provider": "openai", "mode": "chat", "max_tokens": 1}
+    }
+
+    model_info = _get_model_info_helper(model="gpt-4o", custom_llm_provider="openai")
+    assert model_info["max_tokens"] == 1
+
+
+def test_invalidate_drops_lookups_that_probed_the_key():
+    index = ModelInfoIndex()
+    model_cost = {"gpt-4o": {"litellm_provider": "openai"}}
+    index.get_lookup(model_cost=model_cost, model="gpt-4o", custom_llm_provider=None)
+    index.add_lookup(
+        model_cost=model_cost,
+        model="my-model",
+        custom_llm_provider="openai",
+        lookup=ModelInfoLookup(
+            key=None,
+            custom_llm_provider="openai",
+            potential_model_names=("openai/my-model", "my-model"),
+        ),
+    )
+
+    index.invalidate(["gpt-4o"])
+    assert index.get_lookup(
+        model_cost=model_cost, model="my-model", custom_llm_provider="openai"
+    )
+
+    index.invalidate(["openai/my-model"])
+    assert (
+        index.get_lookup(
+            model_cost=model_cost, model="my-model", custom_llm_provider="openai"
+        )
+        is None
+    )
+
+
+def test_lookups_are_bounded():
+    index = ModelInfoIndex(max_size=2)
+    model_cost = {"gpt-4o": {"litellm_provider": "openai"}}
+    index.get_lookup(model_cost=model_cost, model="gpt-4o", custom_llm_provider=None)
+    for model in ["model-1", "model-2", "model-3"]:
+        index.add_lookup(
+            model_cost=model_cost,
+            model=model,
+            custom_llm_provider=None,
+            lookup=ModelInfoLookup(
+                key=None, custom_llm_provider=None, potential_model_names=(model,)
+            ),
+        )
+
+    assert [
+        index.get_lookup(model_cost=model_cost, model=model, custom_llm_provider=None)
+        is not None
+        for model in ["model-1", "model-2", "model-3"]
+    ] == [False, True, True]
@@ -8,7 +8,10 @@ sys.path.insert(
     0, os.path.abspath("../../..")
 )  # Adds the parent directory to the system path
 
-from litellm.litellm_core_utils.streaming_chunk_builder_utils import ChunkProcessor
+from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+    ChunkProcessor,
+    StreamingResponseAccumulator,
+)
 from litellm.types.utils import (
     ChatCompletionDeltaToolCall,
     ChatCompletionMessageToolCall,
@@ -21,7 +24,7 @@ from litellm.types.utils import (
 )
 
 
-def test_get_combined_tool_content():
+def test_streaming_response_accumulator_tool_calls():
     chunks = [
         ModelResponseStream(
             id="chatcmpl-8478099a-3724-42c7-9194-88d97ffd254b",
@@ -126,9 +129,11 @@ def test_get_combined_tool_content():
             stream_options=None,
         ),
     ]
-    chunk_processor = ChunkProcessor(chunks=chunks)
+    accumulator = StreamingResponseAccumulator()
+    for chunk in chunks:
+        accumulator.add_chunk(chunk)
 
-    tool_calls_list = chunk_processor.get_combined_tool_content(chunks)
+    tool_calls_list = accumulator.build_model_response().choices[0].message.tool_calls
     assert tool_calls_list == [
         ChatCompletionMessageToolCall(
             id="call_m87w",
@@ -325,3 +330,165 @@ def test_stream_chunk_builder_litellm_usage_chunks():
     assert usage.prompt_tokens == 50
     assert usage.completion_tokens == 27
     assert usage.total_tokens == 77
+
+
+def test_streaming_response_accumulator_openai_chunks():
+    """
+    Accumulates openai sdk chunks (attribute access only) into a complete response.
+    """
+    from openai.types.chat import ChatCompletionChunk
+
+    def _chunk(delta: dict, finish_reason=None, usage=None) -> ChatCompletionChunk:
+        return ChatCompletionChunk(
+            id="chatcmpl-123",
+            created=1744771912,
+            model="gpt-4o-2024-08-06",
+            object="chat.completion.chunk",
+            choices=(
+                [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+                if delta is not None
+                else []
+            ),
+            usage=usage,
+        )
+
+    chunks = [
+        _chunk({"role": "assistant", "content": "The weather"}),
+        _chunk({"content": " is"}),
+        _chunk(
+            {
+                "tool_calls": [
+                    {
+                        "index": 0,
+                        "id": "call_1",
+                        "type": "function",
+                        "function": {"name": "get_weather", "arguments": '{"loc'},
+                    }
+                ]
+            }
+        ),
+        _chunk(
+            {"tool_calls": [{"index": 0, "function": {"arguments": 'ation": "SF"}'}}]}
+        ),
+        _chunk({}, finish_reason="tool_calls"),
+        _chunk(
+            None,
+            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        ),
+    ]
+
+    accumulator = StreamingResponseAccumulator()
+    for chunk in chunks:
+        accumulator.add_chunk(chunk)
+    response = accumulator.build_model_response(model="gpt-4o")
+
+    assert response.id == "chatcmpl-123"
+    assert response.model == "gpt-4o"
+    assert response.choices[0].finish_reason == "tool_calls"
+    assert response.choices[0].message.content == "The weather is"
+    tool_call = response.choices[0].message.tool_calls[0]
+    assert tool_call.id == "call_1"
+    assert tool_call.function.name == "get_weather"
+    assert tool_call.function.arguments == '{"location": "SF"}'
+    assert response.usage.prompt_tokens == 10
+    assert response.usage.completion_tokens == 5
+
+
+def test_streaming_response_accumulator_counts_tokens_without_usage():
+    accumulator = StreamingResponseAccumulator()
+    accumulator.add_chunk(
+        ModelResponseStream(
+            id="chatcmpl-123",
+            model="gpt-4o",
+            choices=[
+                StreamingChoices(
+                    index=0,
+                    delta=Delta(content="hello world", reasoning_content="thinking"),
+                    finish_reason="stop",
+                )
+            ],
+        )
+    )
+    response = accumulator.build_model_response(
+        messages=[{"role": "user", "content": "hi"}]
+    )
+
+    assert response.choices[0].message.content == "hello world"
+    assert response.choices[0].message.reasoning_content == "thinking"
+    assert response.usage.prompt_tokens > 0
+    assert response.usage.completion_tokens > 0
+
+
+def test_streaming_response_accumulator_thinking_blocks_audio_and_cache_usage():
+    import base64
+
+    accumulator = StreamingResponseAccumulator()
+    for thinking, audio_data in [("Let me ", b"first"), ("think", b"second")]:
+        accumulator.add_chunk(
+            ModelResponseStream(
+                id="chatcmpl-123",
+                model="claude-sonnet-4",
+                choices=[
+                    StreamingChoices(
+                        index=0,
+                        delta=Delta(
+                            content="hi",
+                            thinking_blocks=[
+                                {
+                                    "type": "thinking",
+                                    "thinking": thinking,
+                                    "signature": "sig",
+                                }
+                            ],
+                            audio={
+                                "id": "audio_1",
+                                "data": base64.b64encode(audio_data).decode(),
+                                "transcript": "hi",
+                            },
+                        ),
+                    )
+                ],
+            )
+        )
+    accumulator.add_chunk(
+        ModelResponseStream(
+            id="chatcmpl-123",
+            model="claude-sonnet-4",
+            choices=[StreamingChoices(index=0, delta=Delta(), finish_reason="stop")],
+            usage=Usage(
+                prompt_tokens=10,
+                completion_tokens=4,
+                total_tokens=14,
+                cache_read_input_tokens=6,
+            ),
+        )
+    )
+
+    response = accumulator.build_model_response()
+
+    message = response.choices[0].message
+    assert message.content == "hihi"
+    assert message.thinking_blocks == [
+        {"type": "thinking", "thinking": "Let me think", "signature": "sig"}
+    ]
+    assert base64.b64decode(message.audio.data) == b"firstsecond"
+    assert message.audio.transcript == "hihi"
+    assert message.audio.id == "audio_1"
+    assert response.usage.prompt_tokens == 10
+    assert response.usage.completion_tokens == 4
+    assert response.usage.prompt_tokens_details.cached_tokens == 6
+    assert accumulator.get_total_usage().total_tokens == 14
+
+
+def test_streaming_response_accumulator_tracks_repeated_content():
+    accumulator = StreamingResponseAccumulator()
+    for content in ["a", "loop", "loop", "loop"]:
+        accumulator.add_chunk(
+            ModelResponseStream(
+                choices=[StreamingChoices(index=0, delta=Delta(content=content))]
+            )
+        )
+
+    assert accumulator.repeated_content == "loop"
+    assert accumulator.repeated_content_count == 3
+    assert accumulator.num_chunks == 4
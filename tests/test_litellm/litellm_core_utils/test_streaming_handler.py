@@ -2,7 +2,7 @@ import json
 import os
 import sys
 import time
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -571,6 +571,319 @@ async def test_streaming_with_usage_and_logging(sync_mode: bool):
         print(mock_log_success_event.call_args.kwargs.keys())
 
 
+@pytest.mark.asyncio
+async def test_streaming_response_is_assembled_incrementally(logging_obj):
+    """
+    The wrapper folds each returned chunk into the complete response, instead of keeping the chunks alive.
+    """
+    response = CustomStreamWrapper(
+        completion_stream=ModelResponseListIterator(model_responses=bedrock_chunks),
+        model="my-random-model",
+        custom_llm_provider="openai",
+        logging_obj=logging_obj,
+    )
+
+    with patch.object(
+        logging_obj, "async_success_handler", new=AsyncMock()
+    ) as mock_async_success_handler, patch.object(logging_obj, "success_handler"):
+        returned_chunks = [chunk async for chunk in response]
+        await asyncio.sleep(0)
+
+    assert not hasattr(response, "chunks")
+    assert response.response_accumulator.num_chunks == len(returned_chunks)
+    mock_async_success_handler.assert_called_once()
+    complete_response = mock_async_success_handler.call_args.args[0]
+    assert complete_response.choices[0].message.content == "".join(
+        chunk.choices[0].delta.content or "" for chunk in returned_chunks
+    )
+    assert (
+        response.build_complete_streaming_response().choices[0].message.content
+        == complete_response.choices[0].message.content
+    )
+
+
+@pytest.mark.asyncio
+async def test_lean_streaming_forwards_provider_chunks(monkeypatch, logging_obj):
+    """
+    In lean streaming mode, `ModelResponseStream` chunks are returned without being rebuilt, and the complete response
+    is assembled for logging.
+    """
+    monkeypatch.setattr(litellm, "lean_streaming", True)
+    final_usage_block = Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+    usage_chunk = ModelResponseStream(
+        id="chatcmpl-c1c6cc2f-75b9-4a24-88b9-4e5aacd0268b",
+        created=1742056047,
+        choices=[
+            StreamingChoices(index=0, delta=Delta(content="!"), finish_reason=None)
+        ],
+        usage=final_usage_block,
+    )
+    test_chunks = bedrock_chunks + [usage_chunk]
+
+    response = CustomStreamWrapper(
+        completion_stream=ModelResponseListIterator(model_responses=test_chunks),
+        model="my-random-model",
+        custom_llm_provider="openai",
+        logging_obj=logging_obj,
+    )
+    assert response.lean_streaming is True
+    logging_obj.model_call_details["custom_llm_provider"] = "openai"
+
+    with patch.object(
+        logging_obj, "async_success_handler", new=AsyncMock()
+    ) as mock_async_success_handler, patch.object(logging_obj, "success_handler"):
+        returned_chunks = [chunk async for chunk in response]
+        await asyncio.sleep(0)
+
+    assert len(returned_chunks) == len(test_chunks)
+    for returned_chunk, test_chunk in zip(returned_chunks, test_chunks):
+        assert returned_chunk is test_chunk
+        assert returned_chunk._hidden_params["custom_llm_provider"] == "openai"
+    # usage is not sent to the client, unless requested
+    assert not hasattr(returned_chunks[-1], "usage")
+
+    mock_async_success_handler.assert_called_once()
+    complete_response = mock_async_success_handler.call_args.args[0]
+    assert complete_response.choices[0].message.content == "I'm Claude, an AI!"
+    assert complete_response.choices[0].finish_reason == "stop"
+    assert complete_response.usage.total_tokens == 15
+
+
+@pytest.mark.asyncio
+async def test_lean_streaming_wraps_openai_sdk_chunks(monkeypatch, logging_obj):
+    """
+    openai sdk `ChatCompletionChunk`s are returned as `ModelResponseStream`, with `_hidden_params`.
+    """
+    from openai.types.chat import ChatCompletionChunk
+
+    monkeypatch.setattr(litellm, "lean_streaming", True)
+    sdk_chunks = [
+        ChatCompletionChunk(
+            id="chatcmpl-123",
+            created=1742056047,
+            model="gpt-4o",
+            object="chat.completion.chunk",
+            choices=[
+                {
+                    "index": 0,
+                    "delta": {"role": "assistant", "content": content},
+                    "finish_reason": finish_reason,
+                }
+            ],
+        )
+        for content, finish_reason in (("Hello", None), (" world", "stop"))
+    ]
+    response = CustomStreamWrapper(
+        completion_stream=ModelResponseListIterator(model_responses=sdk_chunks),
+        model="gpt-4o",
+        custom_llm_provider="openai",
+        logging_obj=logging_obj,
+    )
+    response._hidden_params["api_base"] = "https://api.openai.com"
+    logging_obj.model_call_details["custom_llm_provider"] = "openai"
+
+    with patch.object(
+        logging_obj, "async_success_handler", new=AsyncMock()
+    ) as mock_async_success_handler, patch.object(logging_obj, "success_handler"):
+        returned_chunks = [chunk async for chunk in response]
+        await asyncio.sleep(0)
+
+    assert response.lean_streaming is True
+    assert len(returned_chunks) == 2
+    for returned_chunk in returned_chunks:
+        assert isinstance(returned_chunk, ModelResponseStream)
+        assert returned_chunk._hidden_params["custom_llm_provider"] == "openai"
+        assert returned_chunk._hidden_params["api_base"] == "https://api.openai.com"
+    assert returned_chunks[0].choices[0].delta.content == "Hello"
+    assert returned_chunks[1].choices[0].finish_reason == "stop"
+    complete_response = mock_async_success_handler.call_args.args[0]
+    assert complete_response.choices[0].message.content == "Hello world"
+
+
+def test_lean_streaming_sync_iterator(monkeypatch, logging_obj):
+    """
+    The sync iterator forwards openai sdk chunks in lean streaming mode too, and logs the complete response once
+    """
+    from openai.types.chat import ChatCompletionChunk
+
+    monkeypatch.setattr(litellm, "lean_streaming", True)
+    sdk_chunks = [
+        ChatCompletionChunk(
+            id="chatcmpl-123",
+            created=1742056047,
+            model="gpt-4o",
+            object="chat.completion.chunk",
+            choices=[
+                {
+                    "index": 0,
+                    "delta": {"role": "assistant", "content": content},
+                    "finish_reason": finish_reason,
+                }
+            ],
+        )
+        for content, finish_reason in (("Hello", None), (" world", "stop"))
+    ]
+    response = CustomStreamWrapper(
+        completion_stream=ModelResponseListIterator(model_responses=sdk_chunks),
+        model="gpt-4o",
+        custom_llm_provider="openai",
+        logging_obj=logging_obj,
+    )
+
+    with patch.object(
+        response, "chunk_creator", side_effect=AssertionError("chunk_creator")
+    ), patch(
+        "litellm.litellm_core_utils.streaming_handler.executor"
+    ) as mock_executor:
+        returned_chunks = list(response)
+
+    assert response.lean_streaming is True
+    assert [chunk.choices[0].delta.content for chunk in returned_chunks] == [
+        "Hello",
+        " world",
+    ]
+    mock_executor.submit.assert_called_once()
+    assert mock_executor.submit.call_args.args[0] == logging_obj.success_handler
+    complete_response = mock_executor.submit.call_args.args[1]
+    assert complete_response.choices[0].message.content == "Hello world"
+
+
+@pytest.mark.asyncio
+async def test_lean_streaming_openai_sdk_chunks_skip_model_dump(
+    monkeypatch, logging_obj
+):
+    """
+    openai sdk chunks are converted from their attributes - same chunks as `model_response_creator` builds from
+    `chunk.model_dump()`, without dumping every chunk.
+    """
+    from openai.types.chat import ChatCompletionChunk
+
+    monkeypatch.setattr(litellm, "lean_streaming", True)
+    sdk_chunks = [
+        ChatCompletionChunk(
+            id="chatcmpl-123",
+            created=1742056047,
+            model="gpt-4o",
+            object="chat.completion.chunk",
+            system_fingerprint="fp_123",
+            choices=[
+                {
+                    "index": 0,
+                    "delta": {
+                        "role": "assistant",
+                        "content": "Hello",
+                        "reasoning_content": "thinking",
+                    },
+                    "finish_reason": None,
+                }
+            ],
+        ),
+        ChatCompletionChunk(
+            id="chatcmpl-123",
+            created=1742056047,
+            model="gpt-4o",
+            object="chat.completion.chunk",
+            choices=[
+                {
+                    "index": 0,
+                    "delta": {
+                        "tool_calls": [
+                            {
+                                "index": 0,
+                                "id": "call_1",
+                                "type": "function",
+                                "function": {"name": "get_weather", "arguments": "{}"},
+                            }
+                        ]
+                    },
+                    "finish_reason": "tool_calls",
+                }
+            ],
+        ),
+    ]
+    expected_wrapper = CustomStreamWrapper(
+        completion_stream=None,
+        model="gpt-4o",
+        custom_llm_provider="openai",
+        logging_obj=logging_obj,
+    )
+    expected_chunks = [
+        expected_wrapper.model_response_creator(
+            chunk=sdk_chunk.model_dump(exclude_none=True)
+        )
+        for sdk_chunk in sdk_chunks
+    ]
+
+    response = CustomStreamWrapper(
+        completion_stream=ModelResponseListIterator(model_responses=sdk_chunks),
+        model="gpt-4o",
+        custom_llm_provider="openai",
+        logging_obj=logging_obj,
+    )
+    with patch.object(
+        ChatCompletionChunk, "model_dump", side_effect=AssertionError("model_dump")
+    ), patch.object(
+        response, "model_response_creator", side_effect=AssertionError
+    ), patch.object(
+        logging_obj, "async_success_handler", new=AsyncMock()
+    ), patch.object(
+        logging_obj, "success_handler"
+    ):
+        returned_chunks = [chunk async for chunk in response]
+        await asyncio.sleep(0)
+
+    assert response.lean_streaming is True
+    assert [chunk.model_dump() for chunk in returned_chunks] == [
+        chunk.model_dump() for chunk in expected_chunks
+    ]
+
+
+@pytest.mark.asyncio
+async def test_lean_streaming_falls_back_for_non_openai_chunks(
+    monkeypatch, logging_obj
+):
+    monkeypatch.setattr(litellm, "lean_streaming", True)
+    response = CustomStreamWrapper(
+        completion_stream=ModelResponseListIterator(
+            model_responses=[
+                {
+                    "text": "hello",
+                    "is_finished": True,
+                    "finish_reason": "stop",
+                    "usage": None,
+                    "index": 0,
+                    "tool_use": None,
+                }
+            ]
+        ),
+        model="my-random-model",
+        custom_llm_provider="anthropic",
+        logging_obj=logging_obj,
+    )
+
+    with patch.object(
+        logging_obj, "async_success_handler", new=AsyncMock()
+    ), patch.object(logging_obj, "success_handler"):
+        returned_chunks = [chunk async for chunk in response]
+
+    assert response.lean_streaming is False
+    assert returned_chunks[0].choices[0].delta.content == "hello"
+
+
+def test_lean_streaming_disabled_for_function_call(monkeypatch):
+    monkeypatch.setattr(litellm, "lean_streaming", True)
+    logging_obj = MagicMock()
+    logging_obj.model_call_details = {}
+    logging_obj.optional_params = {"functions": [{"name": "get_weather"}]}
+    response = CustomStreamWrapper(
+        completion_stream=None,
+        model="my-random-model",
+        custom_llm_provider="openai",
+        logging_obj=logging_obj,
+    )
+    assert response.lean_streaming is False
+
+
 def test_streaming_handler_with_stop_chunk(
     initialized_custom_stream_wrapper: CustomStreamWrapper,
 ):
@@ -631,3 +631,388 @@ def test_bad_input_token_counter(model, messages):
         messages=messages,
         default_token_count=1000,
     )
+
+
+def test_message_token_counts_are_cached():
+    """
+    Multi-turn conversations only tokenize the new messages
+    """
+    import tiktoken
+
+    from litellm.litellm_core_utils.token_counter import message_token_count_cache
+
+    message_token_count_cache.clear()
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "What's the weather like in Boston today?"},
+    ]
+    expected = token_counter_new(model="gpt-4o", messages=messages)
+
+    messages = messages + [
+        {"role": "assistant", "content": "It's sunny in Boston today."},
+        {"role": "user", "content": "And tomorrow?"},
+    ]
+    original_encode = tiktoken.Encoding.encode
+    with patch.object(
+        tiktoken.Encoding, "encode", autospec=True, side_effect=original_encode
+    ) as mock_encode:
+        num_tokens = token_counter_new(model="gpt-4o", messages=messages)
+
+    encoded_texts = [call.args[1] for call in mock_encode.call_args_list]
+    assert "You are a helpful assistant." not in encoded_texts
+    assert "And tomorrow?" in encoded_texts
+
+    message_token_count_cache.clear()
+    assert num_tokens == token_counter_new(model="gpt-4o", messages=messages)
+    assert num_tokens > expected
+
+
+def test_estimate_token_count():
+    from litellm.litellm_core_utils.token_counter import (
+        TokenCountEstimator,
+        estimate_token_count,
+        token_count_estimator,
+    )
+
+    messages = [{"role": "user", "content": text[:4000]}]
+    exact = token_counter_new(model="gpt-4o", messages=messages)
+    estimate = estimate_token_count(model="gpt-4o", messages=messages)
+    assert abs(estimate - exact) / exact < 0.25
+
+    # uncalibrated tokenizers use the default bytes / token ratio
+    assert TokenCountEstimator(default_bytes_per_token=4.0).estimate(
+        tokenizer_key=("openai_tokenizer", "unknown"), text="a" * 400
+    ) == 100
+    assert token_count_estimator.get_bytes_per_token(None) == 4.0
+
+
+def test_estimate_token_count_does_not_fetch_images():
+    from litellm.litellm_core_utils.token_counter import estimate_token_count
+
+    with patch(
+        "litellm.litellm_core_utils.token_counter.get_image_dimensions"
+    ) as mock_get_image_dimensions:
+        num_tokens = estimate_token_count(
+            model="gpt-4o",
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": "What's in this image?"},
+                        {
+                            "type": "image_url",
+                            "image_url": {"url": "https://example.com/image.png"},
+                        },
+                    ],
+                }
+            ],
+        )
+    mock_get_image_dimensions.assert_not_called()
+    assert num_tokens > 0
+
+
+def test_get_request_token_count_is_memoized(monkeypatch):
+    from litellm.litellm_core_utils import token_counter as token_counter_module
+    from litellm.litellm_core_utils.token_counter import get_request_token_count
+
+    messages = [{"role": "user", "content": "Hey, how's it going?"}]
+    request_kwargs = {"litellm_trace_id": "trace-1", "metadata": {}}
+    with patch.object(
+        token_counter_module, "token_counter", wraps=token_counter_module.token_counter
+    ) as mock_token_counter:
+        first = get_request_token_count(
+            request_kwargs=request_kwargs, messages=messages
+        )
+        second = get_request_token_count(
+            request_kwargs=request_kwargs, messages=messages
+        )
+        assert first == second == token_counter_new(messages=messages)
+        assert mock_token_counter.call_count == 1
+        # the memo is not written to the (logged) request metadata
+        assert request_kwargs["metadata"] == {}
+
+        # a new request is counted again
+        get_request_token_count(
+            request_kwargs={**request_kwargs, "litellm_trace_id": "trace-2"},
+            messages=messages,
+        )
+        assert mock_token_counter.call_count == 2
+
+        # other input objects under the same trace id are counted again
+        get_request_token_count(
+            request_kwargs=request_kwargs,
+            messages=[{"role": "user", "content": "Something else entirely"}],
+        )
+        assert mock_token_counter.call_count == 3
+
+    monkeypatch.setattr(litellm, "use_token_count_estimator_for_routing", True)
+    with patch.object(
+        token_counter_module,
+        "estimate_token_count",
+        return_value=42,
+    ) as mock_estimate_token_count:
+        assert (
+            get_request_token_count(request_kwargs=request_kwargs, messages=messages)
+            == 42
+        )
+        mock_estimate_token_count.assert_called_once()
+
+
+def test_request_token_count_memo_is_bounded():
+    from litellm.litellm_core_utils.token_counter import RequestTokenCountMemo
+
+    memo = RequestTokenCountMemo(max_size=2)
+    inputs = [[{"role": "user", "content": str(i)}] for i in range(3)]
+    for i, messages in enumerate(inputs):
+        memo.set((f"trace-{i}", "gpt-4o", False), messages=messages, text=None, num_tokens=i)
+
+    assert memo.get(("trace-0", "gpt-4o", False), messages=inputs[0], text=None) is None
+    assert memo.get(("trace-2", "gpt-4o", False), messages=inputs[2], text=None) == 2
+    # the messages list grew since it was counted
+    inputs[2].append({"role": "assistant", "content": "hi"})
+    assert memo.get(("trace-2", "gpt-4o", False), messages=inputs[2], text=None) is None
+
+
+def test_request_token_count_memo_does_not_keep_inputs_alive():
+    import gc
+    import weakref
+
+    from litellm.litellm_core_utils.token_counter import RequestTokenCountMemo
+
+    class Messages(list):  # a plain list can't be weakly referenced
+        pass
+
+    memo = RequestTokenCountMemo(max_size=2)
+    messages = Messages([{"role": "user", "content": "Hello world"}])
+    memo.set(("trace-0", "gpt-4o", False), messages=messages, text=None, num_tokens=3)
+    assert memo.get(("trace-0", "gpt-4o", False), messages=messages, text=None) == 3
+
+    messages_ref = weakref.ref(messages)
+    del messages
+    gc.collect()
+    assert messages_ref() is None
+
+
+def test_estimator_is_only_calibrated_when_enabled(monkeypatch):
+    from litellm.litellm_core_utils import token_counter as token_counter_module
+
+    with patch.object(
+        token_counter_module.token_count_estimator, "calibrate"
+    ) as mock_calibrate:
+        token_counter_new(model="gpt-4o", text="Hello world, calibrate me")
+        mock_calibrate.assert_not_called()
+
+        monkeypatch.setattr(litellm, "use_token_count_estimator_for_routing", True)
+        token_counter_new(model="gpt-4o", text="Hello world, calibrate me")
+        mock_calibrate.assert_called_once()
+
+
+def test_estimator_keeps_a_bounded_number_of_tokenizers():
+    from litellm.litellm_core_utils.token_counter import TokenCountEstimator
+
+    estimator = TokenCountEstimator(default_bytes_per_token=4.0, max_tokenizers=2)
+    for i in range(3):
+        estimator.calibrate(("huggingface_tokenizer", f"model-{i}"), "a" * 100, 50)
+
+    assert len(estimator._samples) == 2
+    assert estimator.get_bytes_per_token(("huggingface_tokenizer", "model-0")) == 4.0
+    assert estimator.get_bytes_per_token(("huggingface_tokenizer", "model-2")) < 4.0
+
+
+def _png_bytes(width: int, height: int, size: int) -> bytes:
+    import struct
+
+    header = b"\x89PNG\r\n\x1a\n" + b"\x00\x00\x00\rIHDR" + struct.pack(">LL", width, height)
+    return header + b"\x00" * (size - len(header))
+
+
+def _jpeg_bytes(width: int, height: int, app1_size: int) -> bytes:
+    """jpeg with a large APP1 (EXIF) segment before the SOF0 segment with the dimensions"""
+    import struct
+
+    app1 = b"\xff\xe1" + struct.pack(">H", app1_size + 2) + b"\x00" * app1_size
+    sof0 = b"\xff\xc0" + struct.pack(">HBHH", 17, 8, height, width) + b"\x00" * 10
+    return b"\xff\xd8" + app1 + sof0 + b"\xff\xd9"
+
+
+def _mock_image_client(image: bytes, requests: list):
+    import httpx
+
+    from litellm.llms.custom_httpx.http_handler import HTTPHandler
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        range_header = request.headers.get("range")
+        if range_header is not None:
+            start, end = range_header.split("=")[1].split("-")
+            return httpx.Response(206, content=image[int(start) : int(end) + 1])
+        return httpx.Response(200, content=image)
+
+    return HTTPHandler(client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+@pytest.fixture
+def image_dimension_cache(monkeypatch):
+    from litellm.litellm_core_utils import token_counter as token_counter_module
+
+    cache = token_counter_module.ImageDimensionCache()
+    monkeypatch.setattr(token_counter_module, "image_dimension_cache", cache)
+    return cache
+
+
+def test_get_image_dimensions_only_fetches_image_header(image_dimension_cache):
+    from litellm.constants import IMAGE_DIMENSION_PROBE_BYTES
+    from litellm.litellm_core_utils.token_counter import get_image_dimensions
+
+    requests: list = []
+    client = _mock_image_client(_png_bytes(1024, 768, size=1_000_000), requests)
+    with patch(
+        "litellm.litellm_core_utils.token_counter._get_httpx_client",
+        return_value=client,
+    ):
+        assert get_image_dimensions(data="https://example.com/image.png") == (1024, 768)
+        assert get_image_dimensions(data="https://example.com/image.png") == (1024, 768)
+
+    assert len(requests) == 1  # second call is served from the cache
+    assert requests[0].headers["range"] == f"bytes=0-{IMAGE_DIMENSION_PROBE_BYTES - 1}"
+
+
+def test_get_image_dimensions_falls_back_to_full_image(image_dimension_cache):
+    from litellm.litellm_core_utils.token_counter import get_image_dimensions
+
+    requests: list = []
+    client = _mock_image_client(_jpeg_bytes(640, 480, app1_size=20_000), requests)
+    with patch(
+        "litellm.litellm_core_utils.token_counter._get_httpx_client",
+        return_value=client,
+    ):
+        assert get_image_dimensions(data="https://example.com/image.jpg") == (640, 480)
+
+    assert [request.headers.get("range") is not None for request in requests] == [
+        True,
+        False,
+    ]
+
+
+def test_get_base64_image_dimensions():
+    import base64
+
+    from litellm.litellm_core_utils.token_counter import get_image_dimensions
+
+    for image, expected in [
+        (_png_bytes(1024, 768, size=100_000), (1024, 768)),
+        (_jpeg_bytes(640, 480, app1_size=20_000), (640, 480)),
+    ]:
+        data = "data:image/png;base64," + base64.b64encode(image).decode()
+        assert get_image_dimensions(data=data) == expected
+
+
+@pytest.mark.asyncio
+async def test_get_image_dimensions_does_not_block_event_loop(image_dimension_cache):
+    import asyncio
+
+    from litellm.constants import DEFAULT_IMAGE_HEIGHT, DEFAULT_IMAGE_WIDTH
+    from litellm.litellm_core_utils.token_counter import get_image_dimensions
+
+    with patch(
+        "litellm.litellm_core_utils.token_counter._fetch_image_dimensions"
+    ) as mock_fetch, patch(
+        "litellm.litellm_core_utils.token_counter._async_fetch_image_dimensions",
+        new=AsyncMock(return_value=(1024, 768)),
+    ) as mock_async_fetch:
+        assert get_image_dimensions(data="https://example.com/image.png") == (
+            DEFAULT_IMAGE_WIDTH,
+            DEFAULT_IMAGE_HEIGHT,
+        )
+        for _ in range(3):  # let the background probe finish
+            await asyncio.sleep(0)
+        assert get_image_dimensions(data="https://example.com/image.png") == (
+            1024,
+            768,
+        )
+
+    mock_fetch.assert_not_called()
+    mock_async_fetch.assert_called_once_with("https://example.com/image.png")
+
+
+@pytest.mark.asyncio
+async def test_message_token_count_not_cached_with_default_image_dimensions(
+    image_dimension_cache,
+):
+    """
+    A count that used the default dimensions while the image is probed isn't cached - the next count is exact
+    """
+    import asyncio
+
+    from litellm.litellm_core_utils.token_counter import message_token_count_cache
+
+    message_token_count_cache.clear()
+    messages = [
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": "https://example.com/image.png",
+                        "detail": "high",
+                    },
+                }
+            ],
+        }
+    ]
+    with patch(
+        "litellm.litellm_core_utils.token_counter._async_fetch_image_dimensions",
+        new=AsyncMock(return_value=(2048, 2048)),
+    ):
+        default_dimensions_count = token_counter_new(model="gpt-4o", messages=messages)
+        for _ in range(3):  # let the background probe finish
+            await asyncio.sleep(0)
+        exact_count = token_counter_new(model="gpt-4o", messages=messages)
+
+    assert exact_count != default_dimensions_count
+    message_token_count_cache.clear()
+    assert token_counter_new(model="gpt-4o", messages=messages) == exact_count
+
+
+@pytest.mark.asyncio
+async def test_async_prefetch_image_dimensions(image_dimension_cache):
+    import asyncio
+
+    from litellm.litellm_core_utils.token_counter import (
+        async_prefetch_image_dimensions,
+        calculate_img_tokens,
+    )
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_async_fetch(url: str):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return (2048, 2048)
+
+    urls = [f"https://example.com/image-{i}.png" for i in range(5)]
+    messages = [
+        {
+            "role": "user",
+            "content": [{"type": "text", "text": "What's in these images?"}]
+            + [
+                {"type": "image_url", "image_url": {"url": url, "detail": "high"}}
+                for url in urls + urls[:2]
+            ],
+        }
+    ]
+    with patch(
+        "litellm.litellm_core_utils.token_counter._async_fetch_image_dimensions",
+        side_effect=mock_async_fetch,
+    ) as mock_fetch:
+        await async_prefetch_image_dimensions(messages)
+
+    assert mock_fetch.call_count == 5
+    assert max_in_flight == 5
+    assert all(image_dimension_cache.get(url) == (2048, 2048) for url in urls)
+    assert calculate_img_tokens(data=urls[0], mode="high") == 765
@@ -705,3 +705,50 @@ async def test_get_tag_objects_batch():
     assert "tag:uncached-1" in cached_keys
     assert "tag:uncached-2" in cached_keys
     assert "tag:uncached-3" in cached_keys
+
+
+@pytest.mark.asyncio
+async def test_cache_key_object_invalidates_other_instances():
+    from litellm.caching.cache_invalidation import CacheInvalidator
+    from litellm.caching.dual_cache import DualCache
+    from litellm.caching.pubsub import InMemoryPubSubChannel
+    from litellm.proxy.auth.auth_checks import (
+        _cache_key_object,
+        _delete_cache_key_object,
+    )
+
+    caches = []
+    for _ in range(2):
+        cache = DualCache()
+        cache.cache_invalidator = CacheInvalidator(
+            cache=cache,
+            channel=InMemoryPubSubChannel(channel="test-auth-checks"),
+        )
+        await cache.cache_invalidator.start()
+        await cache.async_set_cache(
+            key="hashed-token", value=UserAPIKeyAuth(token="hashed-token")
+        )
+        caches.append(cache)
+    cache_a, cache_b = caches
+
+    # key blocked on instance a
+    await _cache_key_object(
+        hashed_token="hashed-token",
+        user_api_key_obj=UserAPIKeyAuth(token="hashed-token", blocked=True),
+        user_api_key_cache=cache_a,
+        proxy_logging_obj=None,
+        invalidate_other_instances=True,
+    )
+    assert (await cache_a.async_get_cache(key="hashed-token")).blocked is True
+    assert await cache_b.async_get_cache(key="hashed-token") is None
+
+    # key deleted on instance b
+    await cache_a.async_set_cache(
+        key="hashed-token", value=UserAPIKeyAuth(token="hashed-token")
+    )
+    await _delete_cache_key_object(
+        hashed_token="hashed-token",
+        user_api_key_cache=cache_b,
+        proxy_logging_obj=None,
+    )
+    assert await cache_a.async_get_cache(key="hashed-token") is None
@@ -0,0 +1,271 @@
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching.dual_cache import DualCache
+from litellm.proxy._types import UserAPIKeyAuth
+from litellm.proxy.auth.auth_checks import (
+    get_end_user_object,
+    get_team_object,
+    get_user_object,
+)
+from litellm.proxy.auth.auth_context import (
+    AUTH_CONTEXT_QUERY,
+    get_auth_context,
+    get_auth_context_cache_key,
+)
+
+HASHED_TOKEN = "hashed-sk-1234"
+
+
+def _auth_context_row(**overrides) -> dict:
+    row = {
+        "token": HASHED_TOKEN,
+        "user_id": "user-1",
+        "team_id": "team-1",
+        "spend": 1.0,
+        "team_models": None,
+        "team_blocked": None,
+        "team_members_with_roles": [{"role": "user", "user_id": "user-1"}],
+        "team_member_spend": 0.5,
+        "auth_context_user": {
+            "user_id": "user-1",
+            "spend": 2.0,
+            "password": "hashed-password",
+        },
+        "auth_context_user_organization_memberships": None,
+        "auth_context_team": {"team_id": "team-1", "spend": 3.0},
+        "auth_context_team_membership": {
+            "user_id": "user-1",
+            "team_id": "team-1",
+            "budget_id": "budget-1",
+            "spend": 0.5,
+        },
+        "auth_context_team_membership_budget": {
+            "budget_id": "budget-1",
+            "max_budget": 10.0,
+        },
+        "auth_context_end_user": {
+            "user_id": "end-user-1",
+            "blocked": False,
+            "budget_id": "budget-2",
+        },
+        "auth_context_end_user_budget": {"budget_id": "budget-2", "rpm_limit": 5},
+    }
+    row.update(overrides)
+    return row
+
+
+def _prisma_client(row) -> MagicMock:
+    prisma_client = MagicMock()
+    prisma_client.db.query_first = AsyncMock(side_effect=lambda *args: row)
+    return prisma_client
+
+
+@pytest.mark.asyncio
+async def test_get_auth_context_cold_loads_everything_in_one_query():
+    cache = DualCache()
+    prisma_client = _prisma_client(_auth_context_row())
+
+    auth_context = await get_auth_context(
+        hashed_token=HASHED_TOKEN,
+        end_user_id="end-user-1",
+        prisma_client=prisma_client,
+        user_api_key_cache=cache,
+    )
+
+    assert auth_context is not None
+    assert auth_context.loaded_from_db is True
+    assert auth_context.key.token == HASHED_TOKEN
+    assert auth_context.user.user_id == "user-1"
+    assert auth_context.team.team_id == "team-1"
+    assert auth_context.team_membership.litellm_budget_table.max_budget == 10.0
+    assert auth_context.end_user.litellm_budget_table.rpm_limit == 5
+    prisma_client.db.query_first.assert_awaited_once_with(
+        AUTH_CONTEXT_QUERY, HASHED_TOKEN, "end-user-1"
+    )
+
+    # the existing lookups are served from the cache
+    assert isinstance(await cache.async_get_cache(key=HASHED_TOKEN), UserAPIKeyAuth)
+    assert (
+        await get_user_object(
+            user_id="user-1",
+            prisma_client=prisma_client,
+            user_api_key_cache=cache,
+            user_id_upsert=False,
+        )
+    ).spend == 2.0
+    assert (
+        await get_team_object(
+            team_id="team-1", prisma_client=prisma_client, user_api_key_cache=cache
+        )
+    ).spend == 3.0
+    assert (
+        await get_end_user_object(
+            end_user_id="end-user-1",
+            prisma_client=prisma_client,
+            user_api_key_cache=cache,
+            route="/chat/completions",
+        )
+    ).user_id == "end-user-1"
+    assert await cache.async_get_cache(key="team-1_user-1") is not None
+    prisma_client.db.litellm_usertable.find_unique.assert_not_called()
+    prisma_client.db.litellm_endusertable.find_unique.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_auth_context_warm_is_one_batch_get():
+    cache = DualCache()
+    prisma_client = _prisma_client(_auth_context_row())
+    await get_auth_context(
+        hashed_token=HASHED_TOKEN,
+        end_user_id="end-user-1",
+        prisma_client=prisma_client,
+        user_api_key_cache=cache,
+    )
+
+    cache.async_batch_get_cache = AsyncMock(wraps=cache.async_batch_get_cache)
+    auth_context = await get_auth_context(
+        hashed_token=HASHED_TOKEN,
+        end_user_id="end-user-1",
+        prisma_client=prisma_client,
+        user_api_key_cache=cache,
+    )
+
+    assert auth_context is not None
+    assert auth_context.loaded_from_db is False
+    assert auth_context.user.user_id == "user-1"
+    assert auth_context.team.team_id == "team-1"
+    assert auth_context.end_user.user_id == "end-user-1"
+    assert cache.async_batch_get_cache.await_count == 1
+    assert set(cache.async_batch_get_cache.call_args.kwargs["keys"]) == {
+        HASHED_TOKEN,
+        "end_user_id:end-user-1",
+        "user-1",
+        "team_id:team-1",
+        "team-1_user-1",
+    }
+    assert prisma_client.db.query_first.await_count == 1
+
+
+
+@pytest.mark.asyncio
+async def test_get_auth_context_remembers_objects_missing_from_db():
+    """
+    a key's user / an end user that isn't in the db is not queried again on the next requests - neither by the auth
+    context, nor by `get_user_object` / `get_end_user_object`
+    """
+    cache = DualCache()
+    prisma_client = _prisma_client(
+        _auth_context_row(
+            user_id="user-missing",
+            team_id=None,
+            auth_context_user=None,
+            auth_context_team=None,
+            auth_context_team_membership=None,
+            auth_context_team_membership_budget=None,
+            auth_context_end_user=None,
+            auth_context_end_user_budget=None,
+        )
+    )
+    prisma_client.db.litellm_usertable.find_unique = AsyncMock(return_value=None)
+    prisma_client.db.litellm_endusertable.find_unique = AsyncMock(return_value=None)
+
+    for _ in range(3):
+        auth_context = await get_auth_context(
+            hashed_token=HASHED_TOKEN,
+            end_user_id="end-user-missing",
+            prisma_client=prisma_client,
+            user_api_key_cache=cache,
+        )
+        assert auth_context is not None
+        assert auth_context.user is None
+        assert auth_context.end_user is None
+
+    assert prisma_client.db.query_first.await_count == 1
+    assert (
+        await get_end_user_object(
+            end_user_id="end-user-missing",
+            prisma_client=prisma_client,
+            user_api_key_cache=cache,
+            route="/chat/completions",
+        )
+        is None
+    )
+    with pytest.raises(Exception):  # user doesn't exist in db
+        await get_user_object(
+            user_id="user-missing",
+            prisma_client=prisma_client,
+            user_api_key_cache=cache,
+            user_id_upsert=False,
+        )
+    prisma_client.db.litellm_usertable.find_unique.assert_not_called()
+    prisma_client.db.litellm_endusertable.find_unique.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_get_auth_context_does_not_overwrite_cached_objects():
+    """
+    cached spend can be ahead of the db - a query for a missing object must not overwrite cached ones
+    """
+    cache = DualCache()
+    prisma_client = _prisma_client(_auth_context_row())
+    await cache.async_set_cache(
+        key=HASHED_TOKEN,
+        value=UserAPIKeyAuth(token=HASHED_TOKEN, user_id="user-1", team_id="team-1"),
+    )
+    await cache.async_set_cache(
+        key="team_id:team-1", value={"team_id": "team-1", "spend": 30.0}
+    )
+
+    auth_context = await get_auth_context(
+        hashed_token=HASHED_TOKEN,
+        end_user_id=None,
+        prisma_client=prisma_client,
+        user_api_key_cache=cache,
+    )
+
+    assert auth_context is not None
+    assert auth_context.user.user_id == "user-1"  # loaded from the db
+    assert auth_context.team.spend == 30.0
+    assert (await cache.async_get_cache(key="team_id:team-1"))["spend"] == 30.0
+    assert (await cache.async_get_cache(key="user-1"))["spend"] == 2.0
+    assert await cache.async_get_cache(key=get_auth_context_cache_key(HASHED_TOKEN)) == {
+        "version": 1,
+        "user_id": "user-1",
+        "team_id": "team-1",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_auth_context_key_not_in_db():
+    auth_context = await get_auth_context(
+        hashed_token=HASHED_TOKEN,
+        end_user_id=None,
+        prisma_client=_prisma_client(None),
+        user_api_key_cache=DualCache(),
+    )
+
+    assert auth_context is not None
+    assert auth_context.loaded_from_db is True
+    assert auth_context.key is None
+
+
+@pytest.mark.asyncio
+async def test_get_auth_context_returns_none_on_error():
+    prisma_client = MagicMock()
+    prisma_client.db.query_first = AsyncMock(side_effect=Exception("db down"))
+
+    auth_context = await get_auth_context(
+        hashed_token=HASHED_TOKEN,
+        end_user_id=None,
+        prisma_client=prisma_client,
+        user_api_key_cache=DualCache(),
+    )
+
+    assert auth_context is None
@@ -0,0 +1,98 @@
+import os
+import sys
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException, Request
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.latency_profiler import latency_profiler
+from litellm.proxy._types import LitellmUserRoles, UserAPIKeyAuth
+from litellm.proxy.auth.route_checks import RouteChecks
+from litellm.proxy.common_utils.debug_utils import (
+    get_cpu_profile,
+    get_latency_profiling_stages,
+    get_logging_worker_stats,
+    reset_latency_profiling_stages,
+)
+
+@pytest.mark.asyncio
+async def test_latency_profiling_stages_endpoint():
+    latency_profiler.reset()
+    latency_profiler.record("auth", 2_000_000)
+
+    response = await get_latency_profiling_stages(_=UserAPIKeyAuth())
+    assert response["stages"]["auth"]["count"] == 1
+
+    await reset_latency_profiling_stages(
+        user_api_key_dict=UserAPIKeyAuth(user_role=LitellmUserRoles.PROXY_ADMIN)
+    )
+    response = await get_latency_profiling_stages(_=UserAPIKeyAuth())
+    assert response["stages"] == {}
+
+
+@pytest.mark.parametrize(
+    "route",
+    [
+        "/debug/profiling/stages",
+        "/debug/profiling/reset",
+        "/debug/profiling/cpu",
+        "/debug/logging-worker",
+    ],
+)
+@pytest.mark.parametrize(
+    "user_role",
+    [LitellmUserRoles.INTERNAL_USER, LitellmUserRoles.PROXY_ADMIN_VIEW_ONLY],
+)
+def test_debug_endpoints_are_admin_only(route, user_role):
+    """`user_api_key_auth` rejects non proxy admins, like for the other /debug routes"""
+    request = MagicMock(spec=Request)
+    request.query_params = {}
+    with pytest.raises(Exception):
+        RouteChecks.non_proxy_admin_allowed_routes_check(
+            user_obj=None,
+            _user_role=user_role.value,
+            route=route,
+            request=request,
+            valid_token=UserAPIKeyAuth(user_role=user_role),
+            request_data={},
+        )
+
+
+@pytest.mark.parametrize(
+    "user_role",
+    [LitellmUserRoles.INTERNAL_USER, LitellmUserRoles.PROXY_ADMIN_VIEW_ONLY],
+)
+@pytest.mark.asyncio
+async def test_changing_latency_profiling_is_proxy_admin_only(user_role):
+    """view-only admins can read the profiling stages, but not reset or run the profiler"""
+    user_api_key_dict = UserAPIKeyAuth(user_role=user_role)
+
+    with pytest.raises(HTTPException) as e:
+        await reset_latency_profiling_stages(user_api_key_dict=user_api_key_dict)
+    assert e.value.status_code == 401
+
+    with pytest.raises(HTTPException) as e:
+        await get_cpu_profile(
+            user_api_key_dict=user_api_key_dict, seconds=0.01, sort_by="tottime", top_n=10
+        )
+    assert e.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_cpu_profile_endpoint():
+    proxy_admin = UserAPIKeyAuth(user_role=LitellmUserRoles.PROXY_ADMIN)
+    response = await get_cpu_profile(
+        user_api_key_dict=proxy_admin, seconds=0.01, sort_by="tottime", top_n=10
+    )
+    assert response.body.decode().startswith(f"worker_pid: {os.getpid()}")
+
+    with pytest.raises(HTTPException) as e:
+        await get_cpu_profile(
+            user_api_key_dict=proxy_admin, seconds=0.01, sort_by="not-a-key", top_n=10
+        )
+    assert e.value.status_code == 400
@@ -476,3 +476,35 @@ async def test_queue_size_reduction_with_large_volume(
     assert result[user2_key]["api_requests"] == 100
     assert result[user2_key]["successful_requests"] == 100
     assert result[user2_key]["failed_requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_updates_for_same_key_are_aggregated_on_add(daily_spend_update_queue):
+    """
+    Queue holds 1 transaction per daily_transaction_key, the caller's payload is not mutated
+    """
+    test_key = "user1_2023-01-01_key123_gpt-4_openai"
+    payload = {
+        "spend": 1.0,
+        "prompt_tokens": 10,
+        "completion_tokens": 5,
+        "api_requests": 1,
+        "successful_requests": 1,
+        "failed_requests": 0,
+    }
+    for _ in range(10):
+        await daily_spend_update_queue.add_update({test_key: payload})
+
+    assert daily_spend_update_queue.update_queue.qsize() == 1
+    assert payload["spend"] == 1.0
+
+    flushed_updates = (
+        await daily_spend_update_queue.flush_all_updates_from_in_memory_queue()
+    )
+    assert flushed_updates[0][test_key]["spend"] == 10.0
+    assert flushed_updates[0][test_key]["prompt_tokens"] == 100
+
+    # updates after the flush start a new transaction
+    await daily_spend_update_queue.add_update({test_key: payload})
+    assert flushed_updates[0][test_key]["spend"] == 10.0
+    assert daily_spend_update_queue.update_queue.qsize() == 1
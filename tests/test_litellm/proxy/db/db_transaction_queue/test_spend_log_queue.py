@@ -0,0 +1,246 @@
+import asyncio
+import os
+import sys
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.constants import (
+    SPEND_LOG_MAX_BATCH_SIZE,
+    SPEND_LOG_MAX_PARALLEL_WRITES,
+    SPEND_LOG_MIN_BATCH_SIZE,
+)
+from litellm.proxy.db.db_transaction_queue.spend_log_queue import SpendLogQueue
+from litellm.proxy.utils import ProxyUpdateSpend
+
+
+def _logs(start: int, end: int):
+    return [{"request_id": str(i)} for i in range(start, end)]
+
+
+def _prisma_client(logs, create_many: AsyncMock) -> MagicMock:
+    prisma_client = MagicMock()
+    prisma_client.spend_log_transactions = SpendLogQueue(logs=logs)
+    prisma_client.jsonify_object = lambda obj: obj
+    prisma_client.db.litellm_spendlogs.create_many = create_many
+    return prisma_client
+
+
+def test_full_queue_drops_oldest_logs():
+    queue = SpendLogQueue(logs=_logs(0, 15), max_size=10, spill_dir=None)
+
+    assert len(queue) == 10
+    assert queue.dropped_count == 5
+    assert list(queue) == _logs(5, 15)
+
+
+def test_full_queue_spills_to_disk(tmp_path):
+    queue = SpendLogQueue(
+        logs=_logs(0, 25), max_size=10, spill_dir=str(tmp_path), spill_segment_size=5
+    )
+
+    assert len(queue) == 25
+    assert queue.dropped_count == 0
+    assert len(os.listdir(tmp_path)) == 3
+    assert list(queue) == _logs(0, 25)
+
+    queue.append({"request_id": "25"})  # queued behind the spilled logs
+    popped = []
+    while len(queue) > 0:
+        popped.extend(queue.pop_batch(4).logs)
+    assert popped == _logs(0, 26)
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_full_queue_spills_to_disk_off_the_event_loop(tmp_path):
+    queue = SpendLogQueue(max_size=10, spill_dir=str(tmp_path), spill_segment_size=5)
+    write_spill_file = SpendLogQueue._write_spill_file
+    write_threads = []
+
+    def _write_spill_file(*args):
+        write_threads.append(threading.current_thread())
+        return write_spill_file(*args)
+
+    with patch.object(
+        SpendLogQueue, "_write_spill_file", new=staticmethod(_write_spill_file)
+    ):
+        for log in _logs(0, 25):
+            queue.append(log)
+        assert list(queue) == _logs(0, 25)  # spill files may still be being written
+        await asyncio.gather(
+            *(write for write, _ in queue._pending_spill_writes.values())
+        )
+
+    assert len(write_threads) == 3
+    assert threading.main_thread() not in write_threads
+    assert len(os.listdir(tmp_path)) == 3
+
+    popped = []
+    while len(queue) > 0:
+        popped.extend((await queue.async_pop_batch(4)).logs)
+    assert popped == _logs(0, 25)
+    assert queue.dropped_count == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_batch_size_adapts_to_backlog_and_latency():
+    queue = SpendLogQueue(logs=_logs(0, 100_000))
+    assert queue.batch_size == SPEND_LOG_MIN_BATCH_SIZE
+
+    for _ in range(10):
+        queue.record_batch_written(latency=0.01)
+    assert queue.batch_size == SPEND_LOG_MAX_BATCH_SIZE
+
+    queue.record_batch_written(latency=60)
+    assert queue.batch_size == SPEND_LOG_MAX_BATCH_SIZE // 2
+    for _ in range(10):
+        queue.record_batch_failed()
+    assert queue.batch_size == SPEND_LOG_MIN_BATCH_SIZE
+
+
+@pytest.mark.asyncio
+async def test_update_spend_logs_bounds_parallel_writes():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _create_many(data, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    create_many = AsyncMock(side_effect=_create_many)
+    prisma_client = _prisma_client(_logs(0, 2000), create_many)
+
+    await ProxyUpdateSpend.update_spend_logs(
+        n_retry_times=0,
+        prisma_client=prisma_client,
+        db_writer_client=None,
+        proxy_logging_obj=MagicMock(),
+    )
+
+    assert len(prisma_client.spend_log_transactions) == 0
+    assert max_in_flight == SPEND_LOG_MAX_PARALLEL_WRITES
+    written = [log for call in create_many.call_args_list for log in call.kwargs["data"]]
+    assert sorted(written, key=lambda log: int(log["request_id"])) == _logs(0, 2000)
+
+
+@pytest.mark.asyncio
+async def test_update_spend_logs_keeps_logs_when_db_unreachable():
+    create_many = AsyncMock(side_effect=httpx.ConnectError("Failed to connect"))
+    prisma_client = _prisma_client(_logs(0, 150), create_many)
+    proxy_logging_obj = MagicMock()
+    proxy_logging_obj.failure_handler = AsyncMock()
+
+    with patch("asyncio.sleep", AsyncMock()):
+        with pytest.raises(httpx.ConnectError):
+            await ProxyUpdateSpend.update_spend_logs(
+                n_retry_times=1,
+                prisma_client=prisma_client,
+                db_writer_client=None,
+                proxy_logging_obj=proxy_logging_obj,
+            )
+
+    assert sorted(
+        prisma_client.spend_log_transactions, key=lambda log: int(log["request_id"])
+    ) == _logs(0, 150)
+
+
+def test_spill_files_are_replayed_after_restart(tmp_path):
+    """
+    spill files of a process that exited are written before the new logs, then deleted
+    """
+    previous_queue = SpendLogQueue(
+        logs=_logs(0, 25), max_size=10, spill_dir=str(tmp_path), spill_segment_size=5
+    )
+    assert len(os.listdir(tmp_path)) == 3
+    del previous_queue  # e.g. the proxy restarted
+
+    queue = SpendLogQueue(
+        logs=_logs(100, 102), max_size=10, spill_dir=str(tmp_path), spill_segment_size=5
+    )
+
+    assert len(queue) == 17
+    popped = []
+    while len(queue) > 0:
+        popped.extend(queue.pop_batch(4).logs)
+    assert popped == _logs(10, 25) + _logs(100, 102)
+    assert os.listdir(tmp_path) == []
+
+
+def test_spill_segment_size_must_fit_in_memory(tmp_path):
+    with pytest.raises(ValueError):
+        SpendLogQueue(max_size=10, spill_dir=str(tmp_path), spill_segment_size=20)
+
+    # not spilling - the segment size isn't used
+    SpendLogQueue(max_size=10, spill_dir=None, spill_segment_size=20)
+
+
+def test_spill_files_larger_than_max_size_are_replayed(tmp_path):
+    """
+    spill files of a run with a larger max_size are loaded once the in-memory buffer is empty
+    """
+    previous_queue = SpendLogQueue(
+        logs=_logs(0, 60), max_size=20, spill_dir=str(tmp_path), spill_segment_size=20
+    )
+    assert len(os.listdir(tmp_path)) == 2
+    del previous_queue  # e.g. the proxy restarted with a smaller max_size
+
+    queue = SpendLogQueue(max_size=10, spill_dir=str(tmp_path), spill_segment_size=5)
+
+    assert len(queue) == 40
+    popped = []
+    while len(queue) > 0:
+        batch = queue.pop_batch(4).logs
+        assert len(batch) > 0
+        popped.extend(batch)
+    assert popped == _logs(20, 60)
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.skipif(os.name != "posix", reason="process liveness check is posix only")
+def test_spill_files_of_running_processes_are_not_replayed(tmp_path):
+    spill_file = tmp_path / f"spend_logs_{os.getppid()}_abc_1.jsonl"
+    spill_file.write_text('{"enqueued_at": 0, "log": {"request_id": "0"}}\n')
+
+    queue = SpendLogQueue(spill_dir=str(tmp_path))
+
+    assert len(queue) == 0
+    assert spill_file.exists()
+
+
+@pytest.mark.asyncio
+async def test_update_spend_logs_requeues_failed_batches_in_order():
+    """
+    parallel writes fail in any order - the logs go back in the queue in the order they were queued
+    """
+
+    async def _create_many(data, **kwargs):
+        # earlier batches fail first
+        await asyncio.sleep(0.01 * (int(data[0]["request_id"]) // 10))
+        raise httpx.ConnectError("Failed to connect")
+
+    create_many = AsyncMock(side_effect=_create_many)
+    prisma_client = _prisma_client(_logs(0, 100), create_many)
+    prisma_client.spend_log_transactions.batch_size = 10
+    proxy_logging_obj = MagicMock()
+    proxy_logging_obj.failure_handler = AsyncMock()
+
+    with pytest.raises(httpx.ConnectError):
+        await ProxyUpdateSpend.update_spend_logs(
+            n_retry_times=0,
+            prisma_client=prisma_client,
+            db_writer_client=None,
+            proxy_logging_obj=proxy_logging_obj,
+        )
+
+    assert create_many.await_count > 1
+    assert list(prisma_client.spend_log_transactions) == _logs(0, 100)
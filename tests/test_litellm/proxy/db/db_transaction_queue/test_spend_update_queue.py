@@ -263,3 +263,32 @@ async def test_queue_size_reduction_with_large_volume(monkeypatch, spend_queue):
     )
     assert aggregated["user_list_transactions"]["user1"] == 200 * 0.5
     assert aggregated["key_list_transactions"]["key1"] == 300 * 1.0
+
+
+@pytest.mark.asyncio
+async def test_updates_for_same_entity_are_aggregated_on_add(spend_queue):
+    """
+    Queue holds 1 item per entity, updates added after a flush are not added to the flushed item
+    """
+    for i in range(100):
+        await spend_queue.add_update(
+            {
+                "entity_type": Litellm_EntityType.USER,
+                "entity_id": f"user{i % 2}",
+                "response_cost": 0.5,
+            }
+        )
+    assert spend_queue.update_queue.qsize() == 2
+
+    flushed_updates = await spend_queue.flush_all_updates_from_in_memory_queue()
+    assert [update["response_cost"] for update in flushed_updates] == [25.0, 25.0]
+
+    await spend_queue.add_update(
+        {
+            "entity_type": Litellm_EntityType.USER,
+            "entity_id": "user0",
+            "response_cost": 1.0,
+        }
+    )
+    assert flushed_updates[0]["response_cost"] == 25.0
+    assert spend_queue.update_queue.qsize() == 1
@@ -8,7 +8,7 @@ sys.path.insert(
 
 
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch, call
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -140,21 +140,17 @@ async def test_update_daily_spend_with_null_entity_id():
 @pytest.mark.asyncio
 async def test_update_daily_spend_sorting():
     """
-    Test that table.upsert is called with events sorted
+    Test that the bulk upsert is called with events sorted
 
     Ensures that writes are sorted between transactions to minimize deadlocks
     """
     # Setup
     mock_prisma_client = MagicMock()
-    mock_batcher = MagicMock()
-    mock_table = MagicMock()
-    mock_prisma_client.db.batch_.return_value.__aenter__.return_value = mock_batcher
-    mock_batcher.litellm_dailyuserspend = mock_table
+    mock_prisma_client.db.execute_raw = AsyncMock()
 
     # Create a 50 transactions with out-of-order entity_ids
     # In reality we sort using multiple fields, but entity_id is sufficient to test sorting
     daily_spend_transactions = {}
-    upsert_calls = []
     for i in range(50):
         daily_spend_transactions[f"test_key_{i}"] = {
             "user_id": f"user{60-i}", # user60 ... user11, reverse order
@@ -169,43 +165,6 @@ async def test_update_daily_spend_sorting():
             "successful_requests": 1,
             "failed_requests": 0,
         }
-        upsert_calls.append(call(
-            where={
-                "user_id_date_api_key_model_custom_llm_provider": {
-                    "user_id": f"user{i+11}", # user11 ... user60, sorted order
-                    "date": "2024-01-01",
-                    "api_key": "test-api-key",
-                    "model": "gpt-4",
-                    "custom_llm_provider": "openai",
-                    "mcp_namespaced_tool_name": "",
-                }
-            },
-            data={
-                "create": {
-                    "user_id": f"user{i+11}",
-                    "date": "2024-01-01",
-                    "api_key": "test-api-key",
-                    "model": "gpt-4",
-                    "model_group": None,
-                    "mcp_namespaced_tool_name": "",
-                    "custom_llm_provider": "openai",
-                    "prompt_tokens": 10,
-                    "completion_tokens": 20,
-                    "spend": 0.1,
-                    "api_requests": 1,
-                    "successful_requests": 1,
-                    "failed_requests": 0,
-                },
-                "update": {
-                    "prompt_tokens": {"increment": 10},
-                    "completion_tokens": {"increment": 20},
-                    "spend": {"increment": 0.1},
-                    "api_requests": {"increment": 1},
-                    "successful_requests": {"increment": 1},
-                    "failed_requests": {"increment": 0},
-                },
-            },
-        ))
 
     # Call the method
     await DBSpendUpdateWriter._update_daily_spend(
@@ -219,8 +178,86 @@ async def test_update_daily_spend_sorting():
         unique_constraint_name="user_id_date_api_key_model_custom_llm_provider",
     )
 
-    # Verify that table.upsert was called
-    mock_table.upsert.assert_has_calls(upsert_calls)
+    # Verify that all rows were written in 1 statement, in sorted order
+    mock_prisma_client.db.execute_raw.assert_called_once()
+    mock_prisma_client.db.batch_.assert_not_called()
+    params = mock_prisma_client.db.execute_raw.call_args.args[1:]
+    user_ids = [param for param in params if str(param).startswith("user")]
+    assert user_ids == [f"user{i+11}" for i in range(50)]  # user11 ... user60
+
+
+def test_get_daily_spend_bulk_upsert_query():
+    """
+    Rows with the same unique key are merged - postgres can't update a row twice in 1 statement
+    """
+    transaction = {
+        "user_id": "user1",
+        "date": "2024-01-01",
+        "api_key": "test-api-key",
+        "model": "gpt-4",
+        "model_group": "gpt-4",
+        "custom_llm_provider": "openai",
+        "prompt_tokens": 10,
+        "completion_tokens": 20,
+        "cache_read_input_tokens": 5,
+        "spend": 0.1,
+        "api_requests": 1,
+        "successful_requests": 1,
+        "failed_requests": 0,
+    }
+    other_user_transaction = {**transaction, "user_id": "user2"}
+
+    query, params = DBSpendUpdateWriter._get_daily_spend_bulk_upsert_query(
+        table_name="LiteLLM_DailyUserSpend",
+        entity_id_field="user_id",
+        daily_spend_transactions=[transaction, other_user_transaction, transaction],
+    )
+
+    assert query.startswith('INSERT INTO "LiteLLM_DailyUserSpend"')
+    assert (
+        'ON CONFLICT ("user_id", "date", "api_key", "model", "custom_llm_provider", "mcp_namespaced_tool_name")'
+        in query
+    )
+    assert (
+        '"spend" = "LiteLLM_DailyUserSpend"."spend" + EXCLUDED."spend"' in query
+    )
+    assert query.count("CURRENT_TIMESTAMP)") == 2  # 1 row per unique key
+
+    num_columns = len(params) // 2
+    user1_row, user2_row = params[:num_columns], params[num_columns:]
+    assert user1_row[1:7] == [
+        "user1",
+        "2024-01-01",
+        "test-api-key",
+        "gpt-4",
+        "openai",
+        "",
+    ]
+    assert user1_row[8:] == [20, 40, 10, 0, 2, 2, 0, 0.2]
+    assert user2_row[1] == "user2"
+    assert user2_row[8:] == [10, 20, 5, 0, 1, 1, 0, 0.1]
+
+
+def test_can_bulk_upsert_daily_spend_transaction_without_custom_llm_provider():
+    """
+    A NULL custom_llm_provider never matches `ON CONFLICT` - these rows keep going through prisma, and stay NULL
+    """
+    transaction = {
+        "user_id": "user1",
+        "date": "2024-01-01",
+        "api_key": "test-api-key",
+        "model": "gpt-4",
+        "custom_llm_provider": "openai",
+    }
+    assert DBSpendUpdateWriter._can_bulk_upsert_daily_spend_transaction(
+        transaction=transaction, entity_id_field="user_id"
+    )
+    assert not DBSpendUpdateWriter._can_bulk_upsert_daily_spend_transaction(
+        transaction={**transaction, "custom_llm_provider": None},
+        entity_id_field="user_id",
+    )
+
+
 # Tag Spend Tracking Tests
 
 
@@ -0,0 +1,84 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.proxy.hooks.in_memory_rate_limiter import InMemoryRateLimitStore
+
+COUNTER_KEY = "{api_key:sk-1234}:requests"
+
+
+def _check(store, algorithm, now, increment=1, limit=10, window_size=10):
+    return store.check_and_increment(
+        counters=[(COUNTER_KEY, algorithm, limit, window_size)],
+        now=now,
+        increment=increment,
+    )[0]
+
+
+def test_fixed_window_resets_after_window():
+    store = InMemoryRateLimitStore()
+    assert _check(store, "fixed_window", now=1000) == 1
+    assert _check(store, "fixed_window", now=1009) == 2
+    assert _check(store, "fixed_window", now=1010) == 1
+
+
+def test_sliding_window_expires_buckets():
+    store = InMemoryRateLimitStore()
+    assert _check(store, "sliding_window", now=1000) == 1
+    assert _check(store, "sliding_window", now=1005) == 2
+    # a fixed window would have reset here, the sliding window still counts the request at t=1005
+    assert _check(store, "sliding_window", now=1010) == 2
+    # only the request at t=1010 is left in the window
+    assert _check(store, "sliding_window", now=1016, increment=0) == 1
+    assert _check(store, "sliding_window", now=1030, increment=0) == 0
+
+
+def test_token_bucket_refills_continuously():
+    store = InMemoryRateLimitStore()
+    for _ in range(10):
+        _check(store, "token_bucket", now=1000)
+    assert _check(store, "token_bucket", now=1000, increment=0) == 10
+    # refill rate = limit / window_size = 1 per second
+    assert _check(store, "token_bucket", now=1004, increment=0) == 6
+    assert _check(store, "token_bucket", now=1100, increment=0) == 0
+
+
+def test_check_and_increment_all_counters():
+    store = InMemoryRateLimitStore()
+    counters = [
+        ("{api_key:sk-1234}:requests", "fixed_window", 10, 60),
+        ("{user:user-1}:requests", "sliding_window", 10, 60),
+        ("{team:team-1}:tokens", "token_bucket", 1000, 60),
+    ]
+    assert store.check_and_increment(counters=counters, now=1000) == [1, 1, 1]
+    assert store.check_and_increment(counters=counters, now=1000) == [2, 2, 2]
+    assert store.check_and_increment(counters=counters, now=1000, increment=0) == [
+        2,
+        2,
+        2,
+    ]
+
+
+@pytest.mark.parametrize("algorithm", ["fixed_window", "sliding_window", "token_bucket"])
+def test_increment_and_get(algorithm):
+    store = InMemoryRateLimitStore()
+    assert store.get(COUNTER_KEY, now=1000) is None
+    store.increment(COUNTER_KEY, 50, algorithm=algorithm, window_size=60, now=1000)
+    store.increment(COUNTER_KEY, 25, algorithm=algorithm, window_size=60, now=1000)
+    assert store.get(COUNTER_KEY, now=1000) == 75
+
+
+def test_expired_counters_are_swept():
+    store = InMemoryRateLimitStore(sweep_interval=60)
+    _check(store, "fixed_window", now=1000)
+    assert len(store._counters) == 1
+
+    store.check_and_increment(
+        counters=[("{api_key:sk-5678}:requests", "fixed_window", 10, 10)], now=1100
+    )
+    assert list(store._counters.keys()) == ["{api_key:sk-5678}:requests"]
@@ -1651,3 +1651,97 @@ async def test_execute_token_increment_script_cluster_compatibility():
             args = call_args[1]['args']
             # Each key should have 2 args (increment_value, ttl)
             assert len(args) == len(keys) * 2, f"Each key should have 2 args, got {len(args)} args for {len(keys)} keys"
+
+
+@pytest.mark.parametrize("algorithm", ["fixed_window", "sliding_window", "token_bucket"])
+@pytest.mark.asyncio
+async def test_in_memory_store_rate_limit_v3(monkeypatch, time_controller, algorithm):
+    """
+    Without Redis, LITELLM_RATE_LIMIT_ALGORITHM keeps the counters in the in-process store
+    """
+    monkeypatch.setenv("LITELLM_RATE_LIMIT_WINDOW_SIZE", "2")
+    monkeypatch.setenv("LITELLM_RATE_LIMIT_ALGORITHM", algorithm)
+    _api_key = hash_token("sk-12345")
+    user_api_key_dict = UserAPIKeyAuth(api_key=_api_key, rpm_limit=3)
+    local_cache = DualCache()
+    parallel_request_handler = _PROXY_MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(local_cache),
+        time_provider=time_controller.now,
+    )
+    assert parallel_request_handler.in_memory_store is not None
+
+    for _ in range(3):
+        await parallel_request_handler.async_pre_call_hook(
+            user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
+        )
+    with pytest.raises(HTTPException) as exc_info:
+        await parallel_request_handler.async_pre_call_hook(
+            user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
+        )
+    assert exc_info.value.status_code == 429
+    assert local_cache.in_memory_cache.cache_dict == {}
+
+    time_controller.advance(5)
+    await parallel_request_handler.async_pre_call_hook(
+        user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
+    )
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_tracks_usage_v3(monkeypatch, time_controller):
+    """
+    Token usage and finished parallel requests are written to the in-process store
+    """
+    monkeypatch.setenv("LITELLM_RATE_LIMIT_ALGORITHM", "sliding_window")
+    _api_key = hash_token("sk-12345")
+    user_api_key_dict = UserAPIKeyAuth(
+        api_key=_api_key, tpm_limit=100, max_parallel_requests=1
+    )
+    local_cache = DualCache()
+    parallel_request_handler = _PROXY_MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(local_cache),
+        time_provider=time_controller.now,
+    )
+    monkeypatch.setattr(parallel_request_handler, "get_rate_limit_type", lambda: "total")
+    tokens_key = parallel_request_handler.create_rate_limit_keys(
+        "api_key", _api_key, "tokens"
+    )
+    max_parallel_requests_key = parallel_request_handler.create_rate_limit_keys(
+        "api_key", _api_key, "max_parallel_requests"
+    )
+
+    await parallel_request_handler.async_pre_call_hook(
+        user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
+    )
+    with pytest.raises(HTTPException):
+        await parallel_request_handler.async_pre_call_hook(
+            user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
+        )
+
+    await parallel_request_handler.async_log_success_event(
+        kwargs={"litellm_params": {"metadata": {"user_api_key": _api_key}}},
+        response_obj=ModelResponse(
+            usage=Usage(prompt_tokens=20, completion_tokens=30, total_tokens=50)
+        ),
+        start_time=datetime.now(),
+        end_time=datetime.now(),
+    )
+    await parallel_request_handler.async_log_failure_event(
+        kwargs={"litellm_params": {"metadata": {"user_api_key": _api_key}}},
+        response_obj=None,
+        start_time=None,
+        end_time=None,
+    )
+
+    assert await parallel_request_handler.async_get_rate_limit_counter(
+        tokens_key
+    ) == 52
+    assert (
+        await parallel_request_handler.async_get_rate_limit_counter(
+            max_parallel_requests_key
+        )
+        == 0
+    )
+    await parallel_request_handler.async_pre_call_hook(
+        user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
+    )
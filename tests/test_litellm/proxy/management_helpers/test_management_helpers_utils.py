@@ -2,7 +2,7 @@ import json
 import os
 import sys
 from litellm._uuid import uuid
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -545,3 +545,28 @@ async def test_attach_object_permission_to_dict_with_none_object_permission_id()
 
     # Verify no database query was made
     mock_prisma_client.db.litellm_objectpermissiontable.find_unique.assert_not_called()
+
+
+def test_delete_customer_id_from_cache_returns_end_user_cache_keys():
+    """
+    Customer updates evict the `end_user_id:{id}` entry - the key end users are cached under - so it is also
+    the key published to other instances.
+    """
+    from litellm.caching.dual_cache import DualCache
+    from litellm.proxy._types import DeleteCustomerRequest
+    from litellm.proxy.management_helpers.utils import (
+        _delete_customer_id_from_cache,
+    )
+
+    user_api_key_cache = DualCache()
+    user_api_key_cache.set_cache(
+        key="end_user_id:customer-1", value={"user_id": "customer-1"}
+    )
+
+    with patch("litellm.proxy.proxy_server.user_api_key_cache", user_api_key_cache):
+        deleted_cache_keys = _delete_customer_id_from_cache(
+            kwargs={"data": DeleteCustomerRequest(user_ids=["customer-1"])}
+        )
+
+    assert "end_user_id:customer-1" in deleted_cache_keys
+    assert user_api_key_cache.get_cache(key="end_user_id:customer-1") is None
@@ -0,0 +1,188 @@
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm import Router
+from litellm.proxy.health_check import (
+    BackgroundHealthCheckResults,
+    _perform_health_check,
+)
+
+
+def _model_list(num_models: int, **model_info):
+    return [
+        {
+            "model_name": f"model-{i}",
+            "litellm_params": {"model": f"openai/model-{i}"},
+            "model_info": {"id": f"id-{i}", **model_info},
+        }
+        for i in range(num_models)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_health_checks_are_bounded():
+    running = 0
+    max_running = 0
+
+    async def mock_ahealth_check(model_params, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"model": model_params["model"]}
+
+    with patch("litellm.ahealth_check", side_effect=mock_ahealth_check):
+        healthy_endpoints, unhealthy_endpoints = await _perform_health_check(
+            _model_list(10), max_concurrency=3
+        )
+
+    assert max_running == 3
+    assert [e["model"] for e in healthy_endpoints] == [
+        f"openai/model-{i}" for i in range(10)
+    ]
+    assert unhealthy_endpoints == []
+
+
+@pytest.mark.asyncio
+async def test_health_check_timeout_does_not_cancel_other_tasks():
+    async def mock_ahealth_check(model_params, **kwargs):
+        await asyncio.sleep(10)
+
+    unrelated_task = asyncio.create_task(asyncio.sleep(0.2))
+    with patch("litellm.ahealth_check", side_effect=mock_ahealth_check):
+        healthy_endpoints, unhealthy_endpoints = await _perform_health_check(
+            _model_list(2, health_check_timeout=0.05)
+        )
+
+    assert healthy_endpoints == []
+    assert [e["error"] for e in unhealthy_endpoints] == ["Timeout exceeded"] * 2
+    assert not unrelated_task.cancelled()
+    await unrelated_task
+
+
+@pytest.mark.asyncio
+async def test_health_check_results_stream_as_they_complete():
+    async def mock_ahealth_check(model_params, **kwargs):
+        if model_params["model"] == "openai/model-0":
+            await asyncio.sleep(0.05)
+            return {"error": "slow deployment failed"}
+        return {}
+
+    completed = []
+
+    async def on_result(model, is_healthy, endpoint_data):
+        completed.append((model["model_info"]["id"], is_healthy))
+
+    with patch("litellm.ahealth_check", side_effect=mock_ahealth_check):
+        await _perform_health_check(_model_list(3), on_result=on_result)
+
+    assert completed[-1] == ("id-0", False)
+    assert sorted(completed[:2]) == [("id-1", True), ("id-2", True)]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_health_check_cancels_its_tasks():
+    started = asyncio.Event()
+    cancelled = []
+
+    async def mock_ahealth_check(model_params, **kwargs):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(model_params["model"])
+            raise
+
+    with patch("litellm.ahealth_check", side_effect=mock_ahealth_check):
+        task = asyncio.create_task(_perform_health_check(_model_list(2)))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+    assert sorted(cancelled) == ["openai/model-0", "openai/model-1"]
+
+
+def test_background_health_check_results():
+    results = BackgroundHealthCheckResults()
+    results.update("id-0", True, {"model": "model-0"})
+    results.update("id-1", False, {"model": "model-1", "error": "failed"})
+    results.update("id-0", False, {"model": "model-0", "error": "failed"})
+    results.prune({"id-0"})
+
+    assert results.get_health_check_results() == {
+        "healthy_endpoints": [],
+        "unhealthy_endpoints": [{"model": "model-0", "error": "failed"}],
+        "healthy_count": 0,
+        "unhealthy_count": 1,
+    }
+
+
+def test_background_health_check_results_are_updated_in_place():
+    results = BackgroundHealthCheckResults()
+    for i in range(5):
+        results.update(f"id-{i}", True, {"model": f"model-{i}"})
+    health_check_results = results.get_health_check_results()
+
+    results.update("id-1", False, {"model": "model-1", "error": "failed"})
+    results.update("id-3", True, {"model": "model-3", "latency": 1})
+    results.prune({"id-1", "id-2", "id-3", "id-4"})
+
+    # same lists - not rebuilt per result
+    healthy_endpoints = results.get_health_check_results()["healthy_endpoints"]
+    assert health_check_results["healthy_endpoints"] is healthy_endpoints
+    assert sorted(healthy_endpoints, key=lambda endpoint: endpoint["model"]) == [
+        {"model": "model-2"},
+        {"model": "model-3", "latency": 1},
+        {"model": "model-4"},
+    ]
+    assert results.get_health_check_results()["unhealthy_endpoints"] == [
+        {"model": "model-1", "error": "failed"}
+    ]
+    assert results.get_health_check_results()["healthy_count"] == 3
+
+
+@pytest.mark.parametrize("health_check_cooldown", [True, False])
+@pytest.mark.asyncio
+async def test_background_health_check_feeds_cooldowns(
+    monkeypatch, health_check_cooldown
+):
+    import litellm.proxy.proxy_server as proxy_server
+
+    router = Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "openai/gpt-4o", "api_key": "sk-1234"},
+                "model_info": {"id": "id-0"},
+            }
+        ]
+    )
+    monkeypatch.setattr(proxy_server, "llm_router", router)
+    monkeypatch.setattr(proxy_server, "health_check_cooldown", health_check_cooldown)
+    monkeypatch.setattr(proxy_server, "health_check_results", {})
+    monkeypatch.setattr(
+        proxy_server, "background_health_check_results", BackgroundHealthCheckResults()
+    )
+
+    await proxy_server._on_background_health_check_result(
+        deployment=router.get_model_list()[0],
+        is_healthy=False,
+        endpoint_data={"model": "openai/gpt-4o", "error": "Invalid API key"},
+    )
+
+    assert proxy_server.health_check_results["unhealthy_count"] == 1
+    active_cooldowns = router.cooldown_cache.get_active_cooldowns(["id-0"], None)
+    assert [model_id for model_id, _ in active_cooldowns] == (
+        ["id-0"] if health_check_cooldown else []
+    )
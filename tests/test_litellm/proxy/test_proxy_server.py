@@ -126,6 +126,58 @@ async def test_initialize_scheduled_jobs_credentials(monkeypatch):
         assert len(mock_scheduler_calls) > 0
 
 
+
+def test_initialize_latency_profiling():
+    """
+    Latency profiling is only started if `general_settings::enable_latency_profiling` is set
+    """
+    from litellm.proxy.proxy_server import ProxyStartupEvent
+
+    with patch("litellm.proxy.proxy_server.latency_profiler") as mock_profiler:
+        ProxyStartupEvent._initialize_latency_profiling(general_settings={})
+        mock_profiler.enable.assert_not_called()
+
+        ProxyStartupEvent._initialize_latency_profiling(
+            general_settings={"enable_latency_profiling": True}
+        )
+        mock_profiler.enable.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_initialize_startup_logging_starts_user_api_key_cache_invalidation():
+    """
+    Startup logging also wires the user api key cache invalidation to the redis cache
+    """
+    from litellm.caching.dual_cache import DualCache
+    from litellm.proxy.proxy_server import ProxyStartupEvent
+
+    mock_proxy_logging = MagicMock()
+    redis_usage_cache = MagicMock()
+    user_api_key_cache = DualCache()
+    general_settings = {"enable_user_api_key_cache_invalidation": True}
+
+    with patch("litellm.proxy.proxy_server.cost_tracking"), patch.object(
+        ProxyStartupEvent,
+        "_initialize_user_api_key_cache_invalidation",
+        new_callable=AsyncMock,
+    ) as mock_initialize_invalidation:
+        await ProxyStartupEvent._initialize_startup_logging(
+            llm_router=None,
+            proxy_logging_obj=mock_proxy_logging,
+            redis_usage_cache=redis_usage_cache,
+            general_settings=general_settings,
+            user_api_key_cache=user_api_key_cache,
+        )
+
+    mock_proxy_logging.startup_event.assert_called_once_with(
+        llm_router=None, redis_usage_cache=redis_usage_cache
+    )
+    mock_initialize_invalidation.assert_awaited_once_with(
+        general_settings=general_settings,
+        redis_usage_cache=redis_usage_cache,
+        user_api_key_cache=user_api_key_cache,
+    )
+
 def test_update_config_fields_deep_merge_db_wins():
     from litellm.proxy.proxy_server import ProxyConfig
 
@@ -2443,3 +2495,86 @@ async def test_init_sso_settings_in_db_empty_settings():
         # Verify empty dictionary
         assert uppercased_settings == {}
 
+
+
+@pytest.mark.asyncio
+async def test_update_llm_router_only_upserts_changed_db_models(monkeypatch):
+    """
+    Periodic reloads only decrypt + upsert DB models that changed since the last reload, and skip unchanged settings.
+    """
+    from types import SimpleNamespace
+
+    import litellm.proxy.proxy_server as proxy_server
+    from litellm.proxy.common_utils.encrypt_decrypt_utils import encrypt_value_helper
+    from litellm.proxy.proxy_server import ProxyConfig
+
+    monkeypatch.setattr(proxy_server, "master_key", "sk-1234")
+    monkeypatch.setattr(proxy_server, "llm_router", None)
+    monkeypatch.setattr(proxy_server, "prisma_client", MagicMock())
+    proxy_server.prisma_client.db.litellm_config.find_first = AsyncMock(
+        return_value=None
+    )
+
+    proxy_config = ProxyConfig()
+
+    async def _get_config(*args, **kwargs):
+        return {"router_settings": {"num_retries": 2}}
+
+    monkeypatch.setattr(proxy_config, "get_config", _get_config)
+
+    encrypted_values: dict = {}  # stored once, like in the db - encryption isn't deterministic
+
+    def _encrypted(value: str) -> str:
+        return encrypted_values.setdefault(value, encrypt_value_helper(value))
+
+    def _db_models(model_by_id: dict) -> list:
+        return [
+            SimpleNamespace(
+                model_id=model_id,
+                model_name="gpt-4o",
+                litellm_params={
+                    "model": _encrypted(model),
+                    "api_key": _encrypted("sk-test"),
+                },
+                model_info={"id": model_id},
+                updated_at=None,
+            )
+            for model_id, model in model_by_id.items()
+        ]
+
+    await proxy_config._update_llm_router(
+        new_models=_db_models({"1": "openai/gpt-4o", "2": "openai/gpt-4o-mini"}),
+        proxy_logging_obj=MagicMock(),
+    )
+    llm_router = proxy_server.llm_router
+    assert llm_router is not None
+    assert llm_router.num_retries == 2
+
+    with patch.object(
+        llm_router, "upsert_deployment", wraps=llm_router.upsert_deployment
+    ) as upsert_deployment, patch.object(
+        llm_router, "update_settings", wraps=llm_router.update_settings
+    ) as update_settings:
+        # unchanged
+        await proxy_config._update_llm_router(
+            new_models=_db_models({"1": "openai/gpt-4o", "2": "openai/gpt-4o-mini"}),
+            proxy_logging_obj=MagicMock(),
+        )
+        upsert_deployment.assert_not_called()
+        update_settings.assert_not_called()
+
+        # 1 updated, 2 deleted, 3 added
+        await proxy_config._update_llm_router(
+            new_models=_db_models({"1": "openai/gpt-4.1", "3": "openai/o3"}),
+            proxy_logging_obj=MagicMock(),
+        )
+        assert [
+            c.kwargs["deployment"].model_info.id
+            for c in upsert_deployment.call_args_list
+        ] == ["1", "3"]
+        update_settings.assert_not_called()
+
+    assert sorted(llm_router.get_model_ids()) == ["1", "3"]
+    assert llm_router.get_deployment(model_id="1").litellm_params.model == (
+        "openai/gpt-4.1"
+    )
@@ -0,0 +1,154 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.caching.caching import DualCache
+from litellm.router_strategy.lowest_latency import LowestLatencyLoggingHandler
+
+MODEL_GROUP = "gpt-4o"
+
+
+def _kwargs(deployment_id: str) -> dict:
+    return {
+        "litellm_params": {
+            "metadata": {"model_group": MODEL_GROUP},
+            "model_info": {"id": deployment_id},
+        }
+    }
+
+
+def _deployment(deployment_id: str, **model_info) -> dict:
+    return {
+        "model_name": MODEL_GROUP,
+        "litellm_params": {"model": "openai/gpt-4o"},
+        "model_info": {"id": deployment_id, **model_info},
+    }
+
+
+def _log(handler: LowestLatencyLoggingHandler, deployment_id: str, latency: float):
+    handler.log_success_event(
+        kwargs=_kwargs(deployment_id),
+        response_obj=litellm.ModelResponse(
+            usage=litellm.Usage(prompt_tokens=10, completion_tokens=1, total_tokens=11)
+        ),
+        start_time=0.0,
+        end_time=latency,
+    )
+
+
+def test_success_event_updates_moving_average():
+    cache = DualCache()
+    handler = LowestLatencyLoggingHandler(
+        router_cache=cache, routing_args={"latency_ewma_alpha": 0.5}
+    )
+
+    _log(handler, "1", 1.0)
+    _log(handler, "1", 3.0)
+
+    deployment_stats = cache.get_cache(key=f"{MODEL_GROUP}_map")["1"]
+    assert deployment_stats["latency"] == [1.0, 3.0]
+    assert deployment_stats["avg_latency"] == 2.0
+    assert deployment_stats["tpm"] == 22
+    assert deployment_stats["rpm"] == 2
+
+
+def test_latency_samples_keep_most_recent():
+    cache = DualCache()
+    handler = LowestLatencyLoggingHandler(
+        router_cache=cache, routing_args={"max_latency_list_size": 3}
+    )
+
+    for latency in [1.0, 2.0, 3.0, 4.0, 5.0]:
+        _log(handler, "1", latency)
+
+    assert cache.get_cache(key=f"{MODEL_GROUP}_map")["1"]["latency"] == [
+        3.0,
+        4.0,
+        5.0,
+    ]
+
+
+def test_usage_resets_on_new_minute():
+    cache = DualCache()
+    handler = LowestLatencyLoggingHandler(router_cache=cache)
+
+    _log(handler, "1", 1.0)
+    with patch.object(handler, "_get_precise_minute", return_value="next-minute"):
+        _log(handler, "1", 1.0)
+
+    deployment_stats = cache.get_cache(key=f"{MODEL_GROUP}_map")["1"]
+    assert deployment_stats["minute"] == "next-minute"
+    assert deployment_stats["rpm"] == 1
+
+
+def test_precise_minute_is_utc():
+    handler = LowestLatencyLoggingHandler(router_cache=DualCache())
+    # 2024-03-10 02:30 UTC - inside a DST change in US timezones
+    with patch("litellm.router_strategy.lowest_latency.time.time", return_value=1710037800.0):
+        assert handler._get_precise_minute() == "2024-03-10-02-30"
+
+
+@pytest.mark.asyncio
+async def test_timeout_penalizes_deployment():
+    cache = DualCache()
+    handler = LowestLatencyLoggingHandler(router_cache=cache)
+    healthy_deployments = [_deployment("1"), _deployment("2")]
+
+    _log(handler, "1", 1.0)
+    _log(handler, "2", 2.0)
+    await handler.async_log_failure_event(
+        kwargs={
+            **_kwargs("1"),
+            "exception": litellm.Timeout(
+                message="timeout", model=MODEL_GROUP, llm_provider="openai"
+            ),
+        },
+        response_obj=None,
+        start_time=0.0,
+        end_time=1.0,
+    )
+
+    deployment = await handler.async_get_available_deployments(
+        model_group=MODEL_GROUP, healthy_deployments=healthy_deployments
+    )
+    assert deployment["model_info"]["id"] == "2"
+
+
+def test_get_available_deployments_skips_rpm_limited_without_tokenizing():
+    cache = DualCache()
+    handler = LowestLatencyLoggingHandler(router_cache=cache)
+    healthy_deployments = [_deployment("1", rpm=1), _deployment("2")]
+
+    _log(handler, "1", 1.0)
+    _log(handler, "2", 2.0)
+
+    with patch("litellm.token_counter") as mock_token_counter:
+        deployment = handler.get_available_deployments(
+            model_group=MODEL_GROUP,
+            healthy_deployments=healthy_deployments,
+            messages=[{"role": "user", "content": "hi"}],
+        )
+    mock_token_counter.assert_not_called()
+    assert deployment["model_info"]["id"] == "2"
+
+
+def test_get_available_deployments_prefers_unused_deployment():
+    cache = DualCache()
+    handler = LowestLatencyLoggingHandler(router_cache=cache)
+    healthy_deployments = [_deployment("1"), _deployment("2")]
+
+    _log(handler, "1", 1.0)
+
+    deployment = handler.get_available_deployments(
+        model_group=MODEL_GROUP, healthy_deployments=healthy_deployments
+    )
+    assert deployment["model_info"]["id"] == "2"
+    # routing does not write placeholder stats for unused deployments
+    assert "2" not in cache.get_cache(key=f"{MODEL_GROUP}_map")
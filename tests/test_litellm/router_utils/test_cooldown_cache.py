@@ -2,15 +2,18 @@
 Unit tests for CooldownCache exception masking functionality
 """
 
+import asyncio
 import os
 import sys
-from unittest.mock import MagicMock
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 # Add the parent directory to the system path
 sys.path.insert(0, os.path.abspath("../../.."))
 
+from litellm.caching.pubsub import InMemoryPubSubChannel
 from litellm.caching.dual_cache import DualCache
 from litellm.caching.in_memory_cache import InMemoryCache
 from litellm.litellm_core_utils.sensitive_data_masker import SensitiveDataMasker
@@ -255,3 +258,212 @@ class TestCooldownCacheExceptionMasking:
         # Should show first 50 characters, then all asterisks
         expected = "A" * 50 + "*" * 50
         assert masked == expected
+
+
+class TestCooldownCacheLocalIndex:
+    """Test suite for the local cooldown index and pushed cooldown updates"""
+
+    @staticmethod
+    def _redis_cache(cooldowns: dict) -> MagicMock:
+        redis_cache = MagicMock()
+
+        async def _async_batch_get_cache(key_list, **kwargs):
+            return {key: cooldowns.get(key) for key in key_list}
+
+        redis_cache.async_batch_get_cache = AsyncMock(
+            side_effect=_async_batch_get_cache
+        )
+        return redis_cache
+
+    @staticmethod
+    async def _push_cooldown_cache(redis_cache: MagicMock) -> CooldownCache:
+        cooldown_cache = CooldownCache(
+            cache=DualCache(redis_cache=redis_cache),
+            default_cooldown_time=60.0,
+            push_updates=True,
+        )
+        cooldown_cache.cooldown_channel = InMemoryPubSubChannel(
+            channel="test-cooldown-updates"
+        )
+        await cooldown_cache.cooldown_channel.subscribe(
+            on_message=cooldown_cache._handle_cooldown_update,
+            on_reset=cooldown_cache._reset_synced_model_ids,
+        )
+        return cooldown_cache
+
+    @pytest.mark.asyncio
+    async def test_without_redis_cooldowns_are_read_from_local_index(self):
+        cooldown_cache = CooldownCache(cache=DualCache(), default_cooldown_time=60.0)
+        model_ids = [f"model-{i}" for i in range(100)]
+
+        with patch.object(
+            cooldown_cache.cache, "async_batch_get_cache", new=AsyncMock()
+        ) as batch_get:
+            assert (
+                await cooldown_cache.async_get_active_cooldowns(model_ids, None) == []
+            )
+            cooldown_cache.add_deployment_to_cooldown(
+                model_id="model-7",
+                original_exception=Exception("rate limited"),
+                exception_status=429,
+                cooldown_time=60.0,
+            )
+            cooldown_cache.add_deployment_to_cooldown(
+                model_id="model-9",
+                original_exception=Exception("rate limited"),
+                exception_status=429,
+                cooldown_time=-1,
+            )
+
+            active_cooldowns = await cooldown_cache.async_get_active_cooldowns(
+                model_ids, None
+            )
+            batch_get.assert_not_called()
+
+        assert [model_id for model_id, _ in active_cooldowns] == ["model-7"]
+        assert active_cooldowns[0][1]["status_code"] == "429"
+        assert cooldown_cache.get_active_cooldowns(model_ids, None) == active_cooldowns
+        assert cooldown_cache.get_min_cooldown(model_ids, None) == 60.0
+        assert "model-9" not in cooldown_cache._cooldowns  # expired, removed
+
+    @pytest.mark.asyncio
+    async def test_cooldowns_pushed_to_other_instances(self):
+        redis_cache = self._redis_cache(cooldowns={})
+        publisher = await self._push_cooldown_cache(redis_cache)
+        subscriber = await self._push_cooldown_cache(redis_cache)
+        model_ids = ["model-1", "model-2", "model-3"]
+
+        try:
+            assert await subscriber.async_get_active_cooldowns(model_ids, None) == []
+            assert redis_cache.async_batch_get_cache.call_count == 1
+
+            publisher.add_deployment_to_cooldown(
+                model_id="model-2",
+                original_exception=Exception("rate limited"),
+                exception_status=429,
+                cooldown_time=60.0,
+            )
+            await asyncio.gather(*publisher._publish_tasks)
+
+            active_cooldowns = await subscriber.async_get_active_cooldowns(
+                model_ids, None
+            )
+            assert [model_id for model_id, _ in active_cooldowns] == ["model-2"]
+            # all model ids synced from redis once, then kept up to date by pushed updates
+            assert redis_cache.async_batch_get_cache.call_count == 1
+        finally:
+            await publisher.cooldown_channel.close()
+            await subscriber.cooldown_channel.close()
+
+    @pytest.mark.asyncio
+    async def test_cooldowns_published_in_seq_order(self):
+        """
+        a failed publish doesn't use up a seq - subscribers would see it as a missed update and re-sync from redis
+        """
+        publisher = await self._push_cooldown_cache(self._redis_cache(cooldowns={}))
+        published = []
+
+        async def _publish(message: dict):
+            if message["model_id"] == "model-2":
+                raise Exception("connection reset")
+            published.append((message["seq"], message["model_id"]))
+
+        try:
+            with patch.object(
+                publisher.cooldown_channel, "publish", new=AsyncMock(side_effect=_publish)
+            ):
+                for model_id in ["model-1", "model-2", "model-3", "model-4"]:
+                    publisher.add_deployment_to_cooldown(
+                        model_id=model_id,
+                        original_exception=Exception("rate limited"),
+                        exception_status=429,
+                        cooldown_time=60.0,
+                    )
+                await asyncio.gather(*publisher._publish_tasks)
+
+            assert published == [(1, "model-1"), (2, "model-3"), (3, "model-4")]
+            assert publisher._seq == 3
+        finally:
+            await publisher.cooldown_channel.close()
+
+    @pytest.mark.asyncio
+    async def test_missed_cooldown_update_resyncs_from_redis(self):
+        cooldown_value = CooldownCacheValue(
+            exception_received="rate limited",
+            status_code="429",
+            timestamp=time.time(),
+            cooldown_time=60.0,
+        )
+        redis_cooldowns = {"deployment:model-1:cooldown": cooldown_value}
+        redis_cache = self._redis_cache(cooldowns=redis_cooldowns)
+        subscriber = await self._push_cooldown_cache(redis_cache)
+        model_ids = ["model-1", "model-2", "model-3"]
+
+        try:
+            active_cooldowns = await subscriber.async_get_active_cooldowns(
+                model_ids, None
+            )
+            assert active_cooldowns == [("model-1", cooldown_value)]
+
+            message = {
+                "version": 1,
+                "publisher": "other-instance",
+                "value": cooldown_value,
+                "ttl": 60.0,
+            }
+            subscriber._handle_cooldown_update(
+                {**message, "seq": 1, "model_id": "model-2"}
+            )
+            assert subscriber._synced_model_ids == set(model_ids)
+
+            # seq 2 (model-3) missed - only in redis
+            redis_cooldowns["deployment:model-3:cooldown"] = cooldown_value
+            subscriber._handle_cooldown_update(
+                {**message, "seq": 3, "model_id": "model-2"}
+            )
+            assert subscriber._synced_model_ids == set()
+
+            active_cooldowns = await subscriber.async_get_active_cooldowns(
+                model_ids, None
+            )
+            assert sorted(model_id for model_id, _ in active_cooldowns) == model_ids
+            assert redis_cache.async_batch_get_cache.call_count == 2
+            assert redis_cache.async_batch_get_cache.call_args.kwargs["key_list"] == [
+                "deployment:model-3:cooldown"
+            ]
+        finally:
+            await subscriber.cooldown_channel.close()
+
+    @pytest.mark.asyncio
+    async def test_stopped_cooldown_updates_resubscribe(self):
+        """
+        if the listener stops, cooldowns aren't served from the stale local index - the next lookup subscribes again
+        and re-syncs from redis
+        """
+        cooldown_value = CooldownCacheValue(
+            exception_received="rate limited",
+            status_code="429",
+            timestamp=time.time(),
+            cooldown_time=60.0,
+        )
+        redis_cooldowns: dict = {}
+        redis_cache = self._redis_cache(cooldowns=redis_cooldowns)
+        subscriber = await self._push_cooldown_cache(redis_cache)
+        model_ids = ["model-1", "model-2", "model-3"]
+
+        try:
+            assert await subscriber.async_get_active_cooldowns(model_ids, None) == []
+            assert subscriber._synced_model_ids == set(model_ids)
+
+            await subscriber.cooldown_channel.close()  # e.g. the listener task was cancelled
+            # set by another instance while not subscribed
+            redis_cooldowns["deployment:model-2:cooldown"] = cooldown_value
+
+            active_cooldowns = await subscriber.async_get_active_cooldowns(
+                model_ids, None
+            )
+            assert active_cooldowns == [("model-2", cooldown_value)]
+            assert subscriber.cooldown_channel.is_subscribed is True
+            assert subscriber._synced_model_ids == set(model_ids)
+        finally:
+            await subscriber.cooldown_channel.close()
@@ -0,0 +1,82 @@
+"""
+Unit tests for the precompiled pattern index in PatternMatchRouter
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../../.."))
+
+from litellm.router_utils.pattern_match_deployments import PatternMatchRouter
+
+
+def _deployment(model_name: str, model: str) -> dict:
+    return {
+        "model_name": model_name,
+        "litellm_params": {"model": model},
+        "model_info": {"id": model_name},
+    }
+
+
+def test_route_returns_most_specific_pattern():
+    router = PatternMatchRouter()
+    router.add_pattern("openai/*", _deployment("openai/*", "openai/*"))
+    router.add_pattern("openai/gpt-*", _deployment("openai/gpt-*", "azure/gpt-*"))
+    router.add_pattern("*meta.llama3*", _deployment("*meta.llama3*", "bedrock/meta.llama3*"))
+
+    result = router.route("openai/gpt-4o")
+    assert result is not None
+    assert result[0]["model_info"]["id"] == "openai/gpt-*"
+    assert result[0]["litellm_params"]["model"] == "azure/gpt-4o"
+
+    result = router.route("openai/o1")
+    assert result is not None
+    assert result[0]["litellm_params"]["model"] == "openai/o1"
+
+    # pattern without a literal prefix is always a candidate
+    result = router.route("hello-meta.llama3-70b")
+    assert result is not None
+    assert result[0]["model_info"]["id"] == "*meta.llama3*"
+
+    assert router.route("anthropic/claude-3") is None
+
+
+def test_route_rebuilds_index_only_when_patterns_change():
+    router = PatternMatchRouter()
+    router.add_pattern("openai/*", _deployment("openai/*", "openai/*"))
+
+    router.route("openai/gpt-4o")
+    index = router._pattern_index
+    router.route("openai/gpt-4o-mini")
+    assert router._pattern_index is index
+
+    router.add_pattern("bedrock/*", _deployment("bedrock/*", "bedrock/*"))
+    assert router.route("bedrock/claude") is not None
+    assert router._pattern_index is not index
+
+
+def test_route_with_filtered_model_names():
+    router = PatternMatchRouter()
+    router.add_pattern("openai/*", _deployment("openai/*", "openai/*"))
+    router.add_pattern("openai/gpt-*", _deployment("openai/gpt-*", "openai/gpt-*"))
+
+    result = router.route("openai/gpt-4o", filtered_model_names=["openai/*"])
+    assert result is not None
+    assert result[0]["model_info"]["id"] == "openai/*"
+
+
+def test_route_does_not_mutate_stored_deployment():
+    router = PatternMatchRouter()
+    deployment = _deployment("openai/*", "openai/*")
+    router.add_pattern("openai/*", deployment)
+
+    result = router.route("openai/gpt-4o")
+    assert result is not None
+    result[0]["litellm_params"]["api_key"] = "sk-1234"
+
+    assert deployment["litellm_params"] == {"model": "openai/*"}
+    assert router.route("openai/gpt-4o-mini")[0]["litellm_params"] == {
+        "model": "openai/gpt-4o-mini"
+    }
@@ -0,0 +1,103 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm._lazy_imports import (
+    LAZY_PROVIDER_CONFIG_INSTANCES,
+    LAZY_PROVIDER_CONFIGS,
+)
+
+# `import litellm` budgets - raise them deliberately, not to make an eager import pass
+MAX_LAZY_PROVIDER_CONFIG_MODULES_LOADED_ON_IMPORT = 50
+MAX_LLMS_MODULES_LOADED_ON_IMPORT = 330
+MAX_RSS_MB_ADDED_BY_IMPORT = 256
+
+_IMPORT_FOOTPRINT_SCRIPT = """
+import json, resource, sys
+
+def max_rss_mb():
+    # on linux ru_maxrss is kept across exec - it can be the parent's (pytest's) peak
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+baseline_rss_mb = max_rss_mb()
+import litellm
+from litellm._lazy_imports import LAZY_PROVIDER_CONFIGS
+
+print(json.dumps({
+    "lazy_modules_loaded": sorted(
+        {module for module, _ in LAZY_PROVIDER_CONFIGS.values() if module in sys.modules}
+    ),
+    "llms_modules_loaded": len([m for m in sys.modules if m.startswith("litellm.llms.")]),
+    "rss_mb_added": max_rss_mb() - baseline_rss_mb,
+}))
+"""
+
+
+@pytest.mark.parametrize(
+    "name", list(LAZY_PROVIDER_CONFIGS) + list(LAZY_PROVIDER_CONFIG_INSTANCES)
+)
+def test_lazy_attribute_resolves(name):
+    value = getattr(litellm, name)
+    assert value is not None
+    assert name in dir(litellm)
+
+
+def test_lazy_attribute_aliases_and_instances():
+    from litellm import AI21Config, GeminiConfig
+
+    assert AI21Config is litellm.AI21ChatConfig
+    assert GeminiConfig is litellm.GoogleAIStudioGeminiConfig
+    assert isinstance(litellm.openAIGPTConfig, litellm.OpenAIGPTConfig)
+    assert litellm.openAIGPTConfig is litellm.openAIGPTConfig
+
+
+def test_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        litellm.NotAProviderConfig  # noqa: B018
+    assert not hasattr(litellm, "NotAProviderConfig")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses the resource module")
+def test_import_footprint_within_budget():
+    """
+    Fails if `import litellm` starts eagerly importing provider configs again, or grows past the memory budget.
+
+    Runs in a clean environment - env vars (e.g. callbacks, caches, otel) can make the import load more.
+    Memory is measured relative to the interpreter before the import - not the absolute peak.
+    """
+    env = {
+        key: os.environ[key] for key in ("PATH", "PYTHONPATH") if key in os.environ
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_FOOTPRINT_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(litellm.__file__))),
+    )
+    footprint = json.loads(result.stdout.strip().splitlines()[-1])
+    print(footprint)
+
+    assert (
+        len(footprint["lazy_modules_loaded"])
+        <= MAX_LAZY_PROVIDER_CONFIG_MODULES_LOADED_ON_IMPORT
+    ), footprint["lazy_modules_loaded"]
+    assert footprint["llms_modules_loaded"] <= MAX_LLMS_MODULES_LOADED_ON_IMPORT
+    assert footprint["rss_mb_added"] <= MAX_RSS_MB_ADDED_BY_IMPORT
@@ -1619,3 +1619,95 @@ def test_add_deployment_model_to_endpoint_for_llm_passthrough_route():
     assert (
         result["endpoint"] == "/model/us.meta.llama3-8b-instruct-v1:0/invoke"
     ), f"Expected '/model/us.meta.llama3-8b-instruct-v1:0/invoke', got '{result['endpoint']}'"
+
+
+@pytest.mark.asyncio
+async def test_router_counts_request_tokens_once():
+    """
+    Pre-call checks + usage-based routing share the request's input token count
+    """
+    from litellm.litellm_core_utils import token_counter as token_counter_module
+
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {
+                    "model": "gpt-4o",
+                    "api_key": "my-fake-key",
+                    "mock_response": "Hello, world!",
+                    "tpm": 100000,
+                },
+            },
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {
+                    "model": "gpt-4o-mini",
+                    "api_key": "my-fake-key",
+                    "mock_response": "Hello, world!",
+                    "tpm": 100000,
+                },
+            },
+        ],
+        routing_strategy="usage-based-routing-v2",
+        enable_pre_call_checks=True,
+    )
+    with patch.object(
+        token_counter_module, "token_counter", wraps=token_counter_module.token_counter
+    ) as mock_token_counter:
+        await router.acompletion(
+            model="gpt-4o", messages=[{"role": "user", "content": "Hey!"}]
+        )
+    assert mock_token_counter.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_router_prefetches_image_dimensions_when_counting_tokens():
+    """
+    Routing that counts input tokens fetches image dimensions first - instead of counting uncached images with the
+    default dimensions
+    """
+    from litellm.litellm_core_utils import token_counter as token_counter_module
+
+    messages = [
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "What's in this image?"},
+                {
+                    "type": "image_url",
+                    "image_url": {
+                        "url": "https://example.com/image.png",
+                        "detail": "high",
+                    },
+                },
+            ],
+        }
+    ]
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "gpt-4o", "api_key": "my-fake-key"},
+            }
+        ],
+        enable_pre_call_checks=True,
+    )
+    with patch.object(
+        token_counter_module.image_dimension_cache,
+        "async_probe",
+        return_value=(1024, 1024),
+    ) as mock_async_probe:
+        await router.async_get_available_deployment(
+            model="gpt-4o", request_kwargs={}, messages=messages
+        )
+    mock_async_probe.assert_called_once_with("https://example.com/image.png")
+
+    router.enable_pre_call_checks = False
+    with patch.object(
+        token_counter_module.image_dimension_cache, "async_probe"
+    ) as mock_async_probe:
+        await router.async_get_available_deployment(
+            model="gpt-4o", request_kwargs={}, messages=messages
+        )
+    mock_async_probe.assert_not_called()
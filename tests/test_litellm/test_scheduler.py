@@ -0,0 +1,362 @@
+"""
+Unit tests for the event-driven Scheduler (workload prioritization)
+"""
+
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm import Router
+from litellm.caching.pubsub import InMemoryPubSubChannel
+from litellm.scheduler import FlowItem, Scheduler
+
+
+def _make_get_healthy_deployments(healthy_deployments: list):
+    calls = {"count": 0}
+
+    async def get_healthy_deployments() -> list:
+        calls["count"] += 1
+        return healthy_deployments
+
+    return get_healthy_deployments, calls
+
+
+@pytest.mark.asyncio
+async def test_wait_for_turn_with_healthy_deployments_does_not_grow_queue():
+    scheduler = Scheduler()
+    get_healthy_deployments, _ = _make_get_healthy_deployments([{"key": "value"}])
+
+    for i in range(500):
+        item = FlowItem(priority=0, request_id=str(i), model_name="gpt-4o")
+        await scheduler.add_request(item)
+        assert (
+            await scheduler.wait_for_turn(
+                request=item,
+                get_healthy_deployments=get_healthy_deployments,
+                timeout=1,
+            )
+            is True
+        )
+        await scheduler.release(request=item)
+
+    assert scheduler.get_queue_status()["gpt-4o"]["queue_depth"] == 0
+    assert len(scheduler.model_group_queues["gpt-4o"].heap) < 200
+
+
+@pytest.mark.asyncio
+async def test_wait_for_turn_releases_by_priority_without_healthy_deployments():
+    """
+    With no healthy deployments, requests are released 1 per polling interval - highest priority (lowest value) first, FIFO within a priority.
+    """
+    scheduler = Scheduler()
+    get_healthy_deployments, _ = _make_get_healthy_deployments([])
+    processed_order = []
+
+    async def make_request(item: FlowItem):
+        await scheduler.add_request(item)
+        assert await scheduler.wait_for_turn(
+            request=item, get_healthy_deployments=get_healthy_deployments, timeout=5
+        )
+        processed_order.append(item.request_id)
+        await asyncio.sleep(0.01)
+        await scheduler.release(
+            request=item, get_healthy_deployments=get_healthy_deployments
+        )
+
+    # first request holds the model group, the others queue up behind it
+    first = asyncio.create_task(
+        make_request(FlowItem(priority=0, request_id="first", model_name="gpt-4o"))
+    )
+    await asyncio.sleep(0)
+    items = [
+        FlowItem(priority=128, request_id="medium-1", model_name="gpt-4o"),
+        FlowItem(priority=255, request_id="low", model_name="gpt-4o"),
+        FlowItem(priority=0, request_id="high", model_name="gpt-4o"),
+        FlowItem(priority=128, request_id="medium-2", model_name="gpt-4o"),
+    ]
+    await asyncio.gather(first, *[make_request(item) for item in items])
+
+    assert processed_order == ["first", "high", "medium-1", "medium-2", "low"]
+
+
+@pytest.mark.asyncio
+async def test_release_wakes_all_waiters_once_deployments_are_healthy():
+    scheduler = Scheduler()
+    healthy_deployments: list = []
+    get_healthy_deployments, _ = _make_get_healthy_deployments(healthy_deployments)
+
+    holder = FlowItem(priority=0, request_id="holder", model_name="gpt-4o")
+    await scheduler.add_request(holder)
+    assert await scheduler.wait_for_turn(
+        request=holder, get_healthy_deployments=get_healthy_deployments, timeout=1
+    )
+
+    waiters = []
+    for i in range(10):
+        item = FlowItem(priority=0, request_id=str(i), model_name="gpt-4o")
+        await scheduler.add_request(item)
+        waiters.append(
+            asyncio.create_task(
+                scheduler.wait_for_turn(
+                    request=item,
+                    get_healthy_deployments=get_healthy_deployments,
+                    timeout=5,
+                )
+            )
+        )
+    await asyncio.sleep(0.01)
+    assert scheduler.get_queue_status()["gpt-4o"]["waiting_requests"] == 10
+
+    healthy_deployments.append({"key": "value"})
+    await scheduler.release(
+        request=holder, get_healthy_deployments=get_healthy_deployments
+    )
+
+    assert all(await asyncio.gather(*waiters))
+    assert scheduler.get_queue_status()["gpt-4o"]["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_for_turn_timeout_removes_request():
+    scheduler = Scheduler(polling_interval=1)
+    get_healthy_deployments, _ = _make_get_healthy_deployments([])
+
+    holder = FlowItem(priority=0, request_id="holder", model_name="gpt-4o")
+    await scheduler.add_request(holder)
+    assert await scheduler.wait_for_turn(
+        request=holder, get_healthy_deployments=get_healthy_deployments, timeout=1
+    )
+
+    item = FlowItem(priority=0, request_id="timeout", model_name="gpt-4o")
+    await scheduler.add_request(item)
+    assert (
+        await scheduler.wait_for_turn(
+            request=item, get_healthy_deployments=get_healthy_deployments, timeout=0.05
+        )
+        is False
+    )
+    assert await scheduler.get_queue(model_name="gpt-4o") == []
+
+
+@pytest.mark.asyncio
+async def test_periodic_release_without_healthy_deployments():
+    """
+    With no healthy deployments, a request is released every polling interval - even while released requests are still in flight.
+    """
+    scheduler = Scheduler(polling_interval=0.01)
+    get_healthy_deployments, _ = _make_get_healthy_deployments([])
+
+    items = [FlowItem(priority=0, request_id=str(i), model_name="gpt-4o") for i in range(5)]
+    for item in items:
+        await scheduler.add_request(item)
+    results = await asyncio.gather(
+        *[
+            scheduler.wait_for_turn(
+                request=item, get_healthy_deployments=get_healthy_deployments, timeout=5
+            )
+            for item in items
+        ]
+    )
+
+    assert all(results)
+    assert scheduler.get_queue_status()["gpt-4o"]["in_flight_requests"] == 5
+
+
+@pytest.mark.asyncio
+async def test_next_request_released_once_in_flight_requests_are_done():
+    """
+    The release loop doesn't wait for the rest of the polling interval once no released request is in flight
+    """
+    scheduler = Scheduler(polling_interval=10)
+    get_healthy_deployments, _ = _make_get_healthy_deployments([])
+
+    first = FlowItem(priority=0, request_id="first", model_name="gpt-4o")
+    await scheduler.add_request(first)
+    assert await scheduler.wait_for_turn(
+        request=first, get_healthy_deployments=get_healthy_deployments, timeout=1
+    )
+
+    second = FlowItem(priority=0, request_id="second", model_name="gpt-4o")
+    await scheduler.add_request(second)
+    waiter = asyncio.create_task(
+        scheduler.wait_for_turn(
+            request=second, get_healthy_deployments=get_healthy_deployments, timeout=5
+        )
+    )
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    await scheduler.release(request=first, get_healthy_deployments=get_healthy_deployments)
+    assert await asyncio.wait_for(waiter, timeout=1) is True
+
+    # queue empty - the loop stops once the last request is done
+    await scheduler.release(request=second, get_healthy_deployments=get_healthy_deployments)
+    release_task = scheduler.model_group_queues["gpt-4o"].release_task
+    assert release_task is not None
+    await asyncio.wait_for(release_task, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_priority_aging_prevents_starvation():
+    """
+    A low priority request that waited long enough is served before newer high priority requests.
+    """
+    scheduler = Scheduler(priority_aging_seconds=0.01)
+    await scheduler.add_request(FlowItem(priority=10, request_id="low", model_name="a"))
+    with patch("litellm.scheduler.time.time", return_value=time.time() + 1):
+        await scheduler.add_request(
+            FlowItem(priority=0, request_id="high", model_name="a")
+        )
+    assert [request_id for _, request_id in await scheduler.get_queue("a")] == [
+        "low",
+        "high",
+    ]
+
+    # aging is opt-in - strict priority by default
+    strict_scheduler = Scheduler()
+    assert strict_scheduler.priority_aging_seconds == 0
+    await strict_scheduler.add_request(
+        FlowItem(priority=10, request_id="low", model_name="a")
+    )
+    with patch("litellm.scheduler.time.time", return_value=time.time() + 1):
+        await strict_scheduler.add_request(
+            FlowItem(priority=0, request_id="high", model_name="a")
+        )
+    assert [request_id for _, request_id in await strict_scheduler.get_queue("a")] == [
+        "high",
+        "low",
+    ]
+
+
+class FakeRedisSortedSets:
+    """zadd / zrem / zpopmin / expire of a redis client"""
+
+    def __init__(self):
+        self.sorted_sets: dict = {}
+
+    async def zadd(self, key, mapping, nx=False):
+        sorted_set = self.sorted_sets.setdefault(key, {})
+        for member, score in mapping.items():
+            if not (nx and member in sorted_set):
+                sorted_set[member] = score
+
+    async def zrem(self, key, *members):
+        for member in members:
+            self.sorted_sets.get(key, {}).pop(member, None)
+
+    async def zpopmin(self, key, count):
+        sorted_set = self.sorted_sets.get(key, {})
+        popped = sorted(sorted_set.items(), key=lambda item: item[1])[:count]
+        for member, _ in popped:
+            del sorted_set[member]
+        return [(member.encode(), score) for member, score in popped]
+
+    async def expire(self, key, ttl):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_redis_queue_is_shared_across_instances():
+    """
+    With redis, requests are released in the global priority order - an instance releases the requests queued on
+    another instance through pub/sub.
+    """
+    redis_client = FakeRedisSortedSets()
+    redis_cache = MagicMock()
+    redis_cache.init_async_client.return_value = redis_client
+    redis_cache.check_and_fix_namespace.side_effect = lambda key: key
+
+    channel_name = "test-scheduler-released"
+    instances = []
+    for _ in range(2):
+        scheduler = Scheduler(polling_interval=0.01, redis_cache=redis_cache)
+        scheduler.release_channel = InMemoryPubSubChannel(channel_name)
+        instances.append(scheduler)
+    instance_a, instance_b = instances
+    get_healthy_deployments, _ = _make_get_healthy_deployments([])
+
+    try:
+        low = FlowItem(priority=255, request_id="low", model_name="gpt-4o")
+        high = FlowItem(priority=0, request_id="high", model_name="gpt-4o")
+        await instance_a.add_request(low)
+        await instance_b.add_request(high)
+        assert set(redis_client.sorted_sets["scheduler:queue:gpt-4o"]) == {"low", "high"}
+
+        processed_order = []
+
+        async def wait(scheduler: Scheduler, item: FlowItem):
+            assert await scheduler.wait_for_turn(
+                request=item, get_healthy_deployments=get_healthy_deployments, timeout=5
+            )
+            processed_order.append(item.request_id)
+
+        # releases follow the shared redis order, whichever instance pops the request
+        await asyncio.gather(wait(instance_a, low), wait(instance_b, high))
+
+        assert processed_order == ["high", "low"]
+        assert redis_client.sorted_sets["scheduler:queue:gpt-4o"] == {}
+    finally:
+        for scheduler in instances:
+            await scheduler.release_channel.close()
+
+
+@pytest.mark.asyncio
+async def test_get_queue_status_by_priority():
+    scheduler = Scheduler()
+    await scheduler.add_request(FlowItem(priority=0, request_id="1", model_name="a"))
+    await scheduler.add_request(FlowItem(priority=0, request_id="2", model_name="a"))
+    await scheduler.add_request(FlowItem(priority=255, request_id="3", model_name="a"))
+    await scheduler.add_request(FlowItem(priority=128, request_id="4", model_name="b"))
+
+    queue_status = scheduler.get_queue_status()
+    assert queue_status["a"]["queue_depth"] == 3
+    assert queue_status["a"]["queue_depth_by_priority"] == {0: 2, 255: 1}
+    assert queue_status["b"]["queue_depth_by_priority"] == {128: 1}
+
+
+@pytest.mark.asyncio
+async def test_router_schedule_acompletion():
+    router = Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "gpt-4o", "api_key": "fake-key"},
+            }
+        ],
+        timeout=5,
+    )
+
+    async def mock_acompletion(model, messages, **kwargs):
+        await asyncio.sleep(0.001)
+        return litellm.ModelResponse()
+
+    with patch.object(router, "acompletion", side_effect=mock_acompletion):
+        responses = await asyncio.gather(
+            *[
+                router.schedule_acompletion(
+                    model="gpt-4o",
+                    messages=[{"role": "user", "content": "hi"}],
+                    priority=i % 3,
+                )
+                for i in range(10)
+            ]
+        )
+
+    for response in responses:
+        assert (
+            response._hidden_params["additional_headers"][
+                "x-litellm-request-prioritization-used"
+            ]
+            is True
+        )
+    assert router.scheduler.get_queue_status()["gpt-4o"]["queue_depth"] == 0
+    assert router.scheduler.get_queue_status()["gpt-4o"]["in_flight_requests"] == 0